@@ -0,0 +1,66 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+from __future__ import absolute_import
+
+import awkward as ak
+
+from . import datasets
+
+
+class ArrayBuilderFill(object):
+    "Fill rates of the ArrayBuilder, driven from Python."
+
+    params = ["small", "long"]
+    param_names = ["shape"]
+    # filling from Python takes seconds for "long"
+    timeout = 300
+
+    def setup(self, shape):
+        self.objects = datasets.python_objects(shape)
+        self.numbers = ak.to_list(datasets.jagged(shape))
+
+    def time_numbers(self, shape):
+        builder = ak.ArrayBuilder()
+        for sublist in self.numbers:
+            builder.begin_list()
+            for x in sublist:
+                builder.real(x)
+            builder.end_list()
+        builder.snapshot()
+
+    def time_records(self, shape):
+        builder = ak.ArrayBuilder()
+        for sublist in self.objects:
+            with builder.list():
+                for item in sublist:
+                    with builder.record():
+                        builder.field("x").real(item["x"])
+                        builder.field("y").real(item["y"])
+                        builder.field("q").integer(item["q"])
+        builder.snapshot()
+
+
+class FromPython(object):
+    "Conversions between arrays, Python objects, and JSON text."
+
+    params = datasets.shape_names
+    param_names = ["shape"]
+    timeout = 300
+
+    def setup(self, shape):
+        self.objects = datasets.python_objects(shape)
+        self.array = datasets.records(shape)
+        self.json_lines = datasets.json_lines(shape)
+        self.json_array = "[" + self.json_lines.replace("\n", ",") + "]"
+
+    def time_from_iter(self, shape):
+        ak.from_iter(self.objects)
+
+    def time_to_list(self, shape):
+        ak.to_list(self.array)
+
+    def time_from_json(self, shape):
+        ak.from_json(self.json_array)
+
+    def time_from_json_lines(self, shape):
+        ak.from_json(self.json_lines)
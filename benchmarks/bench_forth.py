@@ -0,0 +1,102 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+from __future__ import absolute_import
+
+import numpy as np
+
+import awkward.forth
+
+from . import datasets
+
+
+class ForthThroughput(object):
+    """
+    AwkwardForth reading a list-of-numbers stream into offsets and content,
+    once with one instruction per item and once with a bulk (`#`) read per list,
+    each with and without the bytecode optimizer (which fuses the per-item loop
+    into a bulk read).
+    """
+
+    params = (datasets.shape_names, ["per_item", "bulk"], [False, True])
+    param_names = ["shape", "program", "optimize"]
+
+    programs = {
+        "per_item": """
+input counts input values
+output offsets int64 output content float32
+0 offsets <- stack
+counts len 4 / 0 do
+  counts i-> stack dup offsets +<- stack
+  0 do values f-> content loop
+loop
+""",
+        "bulk": """
+input counts input values
+output offsets int64 output content float32
+0 offsets <- stack
+counts len 4 / 0 do
+  counts i-> stack dup offsets +<- stack
+  values #f-> content
+loop
+""",
+    }
+
+    def setup(self, shape, program, optimize):
+        counts = datasets.counts(shape)
+        values = np.random.RandomState(12346).normal(0, 10, counts.sum())
+        self.inputs = {
+            "counts": counts.astype(np.int32),
+            "values": values.astype(np.float32),
+        }
+        self.vm = awkward.forth.ForthMachine64(
+            self.programs[program], optimize=optimize
+        )
+
+    def time_run(self, shape, program, optimize):
+        self.vm.run(self.inputs)
+
+    def track_values_per_second(self, shape, program, optimize):
+        self.vm.count_reset()
+        self.vm.run(self.inputs)
+        return len(self.inputs["values"]) / (self.vm.count_nanoseconds * 1e-9)
+
+    def track_instructions(self, shape, program, optimize):
+        self.vm.count_reset()
+        self.vm.run(self.inputs)
+        return self.vm.count_instructions
+
+    track_values_per_second.unit = "values/s"
+    track_instructions.unit = "instructions"
+
+
+class ForthParallel(object):
+    """
+    The bulk program of ForthThroughput over the same data split into 64
+    independent chunks, run with ForthMachine.run_parallel.
+    """
+
+    params = (datasets.shape_names, [1, 2, 4, 0])
+    param_names = ["shape", "threads"]
+
+    def setup(self, shape, threads):
+        counts = datasets.counts(shape).astype(np.int32)
+        values = np.random.RandomState(12346).normal(0, 10, counts.sum())
+        values = values.astype(np.float32)
+        stops = np.cumsum(counts)
+        self.input_sets = []
+        for chunk in np.array_split(np.arange(len(counts)), 64):
+            if len(chunk) != 0:
+                start = stops[chunk[0]] - counts[chunk[0]]
+                self.input_sets.append(
+                    {
+                        "counts": counts[chunk],
+                        "values": values[start : stops[chunk[-1]]],
+                    }
+                )
+        self.vm = awkward.forth.ForthMachine64(ForthThroughput.programs["bulk"])
+
+    def time_run_parallel(self, shape, threads):
+        self.vm.run_parallel(self.input_sets, num_threads=threads, offsets=["offsets"])
+
+    def time_run_parallel_partitioned(self, shape, threads):
+        self.vm.run_parallel(self.input_sets, num_threads=threads, partitioned=True)
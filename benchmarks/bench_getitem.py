@@ -0,0 +1,74 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+from __future__ import absolute_import
+
+import numpy as np
+
+import awkward as ak
+
+from . import datasets
+
+
+class JaggedGetitem(object):
+    "Slices of jagged arrays (the getitem_next paths of Slice.cpp)."
+
+    params = datasets.shape_names
+    param_names = ["shape"]
+
+    def setup(self, shape):
+        self.array = datasets.jagged(shape)
+        self.nonempty = self.array[ak.num(self.array) > 0]
+        self.outer_mask = np.random.RandomState(1).uniform(0, 1, len(self.array)) < 0.5
+        self.outer_index = np.random.RandomState(2).randint(
+            0, len(self.array), len(self.array)
+        )
+        self.inner_mask = self.array > 0
+        self.inner_index = ak.argsort(self.array)
+        self.records = datasets.records(shape)
+
+    def time_first_item(self, shape):
+        self.nonempty[:, 0]
+
+    def time_range(self, shape):
+        self.array[:, 1:]
+
+    def time_reversed(self, shape):
+        self.array[:, ::-1]
+
+    def time_outer_mask(self, shape):
+        self.array[self.outer_mask]
+
+    def time_outer_index(self, shape):
+        self.array[self.outer_index]
+
+    def time_jagged_mask(self, shape):
+        self.array[self.inner_mask]
+
+    def time_jagged_index(self, shape):
+        self.array[self.inner_index]
+
+    def time_field(self, shape):
+        self.records["x"]
+
+    def time_field_and_range(self, shape):
+        self.records[:, 1:, "x"]
+
+
+class DoublyJaggedGetitem(object):
+    "Slices through two levels of variable-length lists."
+
+    params = datasets.shape_names
+    param_names = ["shape"]
+
+    def setup(self, shape):
+        self.array = datasets.doubly_jagged(shape)
+        self.inner_mask = self.array > 0
+
+    def time_range_range(self, shape):
+        self.array[:, 1:, :-1]
+
+    def time_newaxis(self, shape):
+        self.array[:, np.newaxis, 1:]
+
+    def time_jagged_mask(self, shape):
+        self.array[self.inner_mask]
@@ -0,0 +1,21 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+from __future__ import absolute_import
+
+
+class Import(object):
+    """
+    Time for a fresh interpreter to 'import awkward', which is paid by every
+    short-lived process. NumPy, which it has to import, is timed for reference.
+    """
+
+    timeout = 120
+
+    def timeraw_import_numpy(self):
+        return "import numpy"
+
+    def timeraw_import_awkward(self):
+        return "import awkward"
+
+    def timeraw_import_awkward_and_use(self):
+        return "import awkward; awkward.Array([[1, 2, 3], [], [4, 5]]).tolist()"
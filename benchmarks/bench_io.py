@@ -0,0 +1,106 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+from __future__ import absolute_import
+
+import os
+import shutil
+import tempfile
+
+import awkward as ak
+
+from . import datasets
+
+
+class Buffers(object):
+    "Round-trips through ak.to_buffers/ak.from_buffers, with and without codecs."
+
+    params = (datasets.shape_names, ["none", "zlib"])
+    param_names = ["shape", "compression"]
+
+    def setup(self, shape, compression):
+        self.array = datasets.records(shape)
+        self.compression = None if compression == "none" else compression
+        self.form, self.length, self.container = ak.to_buffers(
+            self.array, compression=self.compression
+        )
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, "array.awkward")
+        ak.to_buffers_file(self.array, self.path, compression=self.compression)
+
+    def teardown(self, shape, compression):
+        shutil.rmtree(self.directory)
+
+    def time_to_buffers(self, shape, compression):
+        ak.to_buffers(self.array, compression=self.compression)
+
+    def time_from_buffers(self, shape, compression):
+        ak.from_buffers(
+            self.form,
+            self.length,
+            self.container,
+            compressed=self.compression is not None,
+        )
+
+    def time_to_buffers_file(self, shape, compression):
+        ak.to_buffers_file(self.array, self.path, compression=self.compression)
+
+    def time_from_buffers_file(self, shape, compression):
+        ak.from_buffers_file(self.path)
+
+
+class Arrow(object):
+    "Conversions to and from Apache Arrow (requires pyarrow)."
+
+    params = datasets.shape_names
+    param_names = ["shape"]
+
+    def setup(self, shape):
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            raise NotImplementedError("pyarrow is not installed")
+        self.array = datasets.records(shape)
+        self.optional = datasets.optional(shape)
+        self.arrow = ak.to_arrow(self.array)
+        self.arrow_optional = ak.to_arrow(self.optional)
+
+    def time_to_arrow(self, shape):
+        ak.to_arrow(self.array)
+
+    def time_from_arrow(self, shape):
+        ak.from_arrow(self.arrow)
+
+    def time_to_arrow_optional(self, shape):
+        ak.to_arrow(self.optional)
+
+    def time_from_arrow_optional(self, shape):
+        ak.from_arrow(self.arrow_optional)
+
+
+class Parquet(object):
+    "Writing and reading Parquet files, one column per field (requires pyarrow)."
+
+    params = datasets.shape_names
+    param_names = ["shape"]
+
+    def setup(self, shape):
+        try:
+            import pyarrow.parquet  # noqa: F401
+        except ImportError:
+            raise NotImplementedError("pyarrow.parquet is not installed")
+        self.array = datasets.columns(shape)
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, "array.parquet")
+        ak.to_parquet(self.array, self.path)
+
+    def teardown(self, shape):
+        shutil.rmtree(self.directory)
+
+    def time_to_parquet(self, shape):
+        ak.to_parquet(self.array, self.path)
+
+    def time_from_parquet(self, shape):
+        ak.from_parquet(self.path)
+
+    def time_from_parquet_lazy(self, shape):
+        ak.materialized(ak.from_parquet(self.path, lazy=True))
@@ -0,0 +1,51 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+from __future__ import absolute_import
+
+import awkward as ak
+
+from . import datasets
+
+
+class Reducers(object):
+    "Reducers at the innermost axis, the outermost axis, and over everything."
+
+    params = (datasets.shape_names, ["sum", "max", "count", "argmax", "any"])
+    param_names = ["shape", "reducer"]
+
+    def setup(self, shape, reducer):
+        self.array = datasets.jagged(shape)
+        self.doubly = datasets.doubly_jagged(shape)
+        self.reducer = getattr(ak, reducer)
+
+    def time_axis_inner(self, shape, reducer):
+        self.reducer(self.array, axis=-1)
+
+    def time_axis_outer(self, shape, reducer):
+        self.reducer(self.array, axis=0)
+
+    def time_axis_middle(self, shape, reducer):
+        self.reducer(self.doubly, axis=1)
+
+
+class ReducersAllValues(object):
+    "Reducers and statistics that combine all values (axis=None)."
+
+    params = datasets.shape_names
+    param_names = ["shape"]
+
+    def setup(self, shape):
+        self.array = datasets.jagged(shape)
+        self.optional = datasets.optional(shape)
+
+    def time_sum(self, shape):
+        ak.sum(self.array)
+
+    def time_mean(self, shape):
+        ak.mean(self.array)
+
+    def time_std_inner(self, shape):
+        ak.std(self.array, axis=-1)
+
+    def time_sum_optional(self, shape):
+        ak.sum(self.optional, axis=-1)
@@ -0,0 +1,79 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+from __future__ import absolute_import
+
+import awkward as ak
+
+from . import datasets
+
+
+class Combinatorics(object):
+    "Combinations within lists and Cartesian products between lists."
+
+    # combinatorics grow quadratically with list length, so "long" is omitted
+    params = ["small", "short"]
+    param_names = ["shape"]
+
+    def setup(self, shape):
+        self.array = datasets.records(shape)
+        self.other = datasets.jagged(shape, seed=54321)
+
+    def time_combinations(self, shape):
+        ak.combinations(self.array, 2)
+
+    def time_argcombinations(self, shape):
+        ak.argcombinations(self.array, 2)
+
+    def time_cartesian(self, shape):
+        ak.cartesian([self.array, self.other])
+
+    def time_cartesian_nested(self, shape):
+        ak.cartesian([self.array, self.other], nested=True)
+
+
+class Restructuring(object):
+    "Flattening, unflattening, zipping, and concatenation."
+
+    params = datasets.shape_names
+    param_names = ["shape"]
+
+    def setup(self, shape):
+        self.array = datasets.jagged(shape)
+        self.flat = ak.flatten(self.array)
+        self.counts = ak.num(self.array)
+        self.doubly = datasets.doubly_jagged(shape)
+        self.records = datasets.records(shape)
+        self.optional = datasets.optional(shape)
+
+    def time_flatten(self, shape):
+        ak.flatten(self.array)
+
+    def time_flatten_inner(self, shape):
+        ak.flatten(self.doubly, axis=2)
+
+    def time_flatten_none(self, shape):
+        ak.flatten(self.array, axis=None)
+
+    def time_unflatten(self, shape):
+        ak.unflatten(self.flat, self.counts)
+
+    def time_num(self, shape):
+        ak.num(self.array)
+
+    def time_zip(self, shape):
+        ak.zip({"a": self.array, "b": self.array})
+
+    def time_concatenate_inner(self, shape):
+        ak.concatenate([self.array, self.array], axis=1)
+
+    def time_fill_none(self, shape):
+        ak.fill_none(self.optional, 0.0, axis=-1)
+
+    def time_pad_none(self, shape):
+        ak.pad_none(self.array, 3, clip=True)
+
+    def time_sort(self, shape):
+        ak.sort(self.array)
+
+    def time_packed(self, shape):
+        ak.packed(self.records[:, ::2])
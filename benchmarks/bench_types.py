@@ -0,0 +1,26 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+from __future__ import absolute_import
+
+import awkward as ak
+import awkward._typeparser.parser
+
+from . import datasets
+
+
+class FromDatashape(object):
+    "Parsing type strings, for the first time and again."
+
+    params = ["jagged", "records", "optional"]
+    param_names = ["dataset"]
+
+    def setup(self, dataset):
+        self.typestr = str(getattr(datasets, dataset)("small").type)
+        ak.types.from_datashape(self.typestr, high_level=True)
+
+    def time_first(self, dataset):
+        awkward._typeparser.parser._parse_cache.clear()
+        ak.types.from_datashape(self.typestr, high_level=True)
+
+    def time_repeated(self, dataset):
+        ak.types.from_datashape(self.typestr, high_level=True)
@@ -0,0 +1,86 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+"""
+Generated datasets for the benchmarks.
+
+Every dataset is derived from a fixed random seed, so that results from
+different commits measure the same data. The shapes are chosen to stress
+different parts of the implementation with a similar total number of values:
+
+   * "small": few short lists, dominated by per-call overhead;
+   * "short": many lists with about 2 items each, dominated by offsets;
+   * "long": fewer lists with about 100 items each, dominated by content.
+"""
+
+from __future__ import absolute_import
+
+import json
+
+import numpy as np
+
+import awkward as ak
+
+# (number of lists, mean number of items per list)
+shapes = {
+    "small": (1000, 5),
+    "short": (500000, 2),
+    "long": (10000, 100),
+}
+
+shape_names = sorted(shapes)
+
+
+def counts(shape, seed=12345):
+    length, mean = shapes[shape]
+    return np.random.RandomState(seed).poisson(mean, length).astype(np.int64)
+
+
+def jagged(shape, dtype=np.float64, seed=12345):
+    "A `var * float64` array (or another `dtype`)."
+    c = counts(shape, seed)
+    content = np.random.RandomState(seed + 1).normal(0, 10, c.sum()).astype(dtype)
+    return ak.unflatten(content, c)
+
+
+def doubly_jagged(shape, seed=12345):
+    "A `var * var * float64` array with the same number of values as `jagged`."
+    inner = jagged(shape, seed=seed)
+    outer = np.random.RandomState(seed + 2).poisson(2, len(inner) // 2 + 1)
+    stops = np.minimum(np.cumsum(outer), len(inner))
+    stops[-1] = len(inner)
+    outer = np.diff(np.concatenate([[0], stops]))
+    return ak.unflatten(inner, outer)
+
+
+def records(shape, seed=12345):
+    "A `var * {x: float64, y: float64, q: int32}` array of particle-like records."
+    c = counts(shape, seed)
+    random = np.random.RandomState(seed + 3)
+    x = random.normal(0, 10, c.sum())
+    y = random.normal(0, 10, c.sum())
+    q = random.randint(-1, 2, c.sum()).astype(np.int32)
+    return ak.unflatten(ak.zip({"x": x, "y": y, "q": q}), c)
+
+
+def columns(shape, seed=12345):
+    "The `records` dataset as a record of lists, `{x: var * float64, ...}`."
+    array = records(shape, seed)
+    return ak.zip({x: array[x] for x in ak.fields(array)}, depth_limit=1)
+
+
+def optional(shape, seed=12345):
+    "A `var * ?float64` array with about 10% missing values."
+    array = jagged(shape, seed=seed)
+    flat = ak.flatten(array)
+    missing = np.random.RandomState(seed + 4).uniform(0, 1, len(flat)) < 0.1
+    return ak.unflatten(ak.mask(flat, ~missing), ak.num(array))
+
+
+def python_objects(shape, seed=12345):
+    "The `records` dataset as Python lists and dicts (for builders)."
+    return ak.to_list(records(shape, seed))
+
+
+def json_lines(shape, seed=12345):
+    "The `records` dataset as JSON, one record per line."
+    return "\n".join(json.dumps(x) for x in python_objects(shape, seed))
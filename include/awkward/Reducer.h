@@ -36,6 +36,25 @@ namespace awkward {
     virtual bool
       returns_positions() const;
 
+    /// @brief Apply the reducer algorithm to contiguous segments of an
+    /// array, delimited by `offsets`, instead of groups given by `parents`.
+    ///
+    /// @param dtype The type of the values in `data`.
+    /// @param data The array to reduce.
+    /// @param offsets Positions in `data` where each segment starts and
+    /// stops: segment `i` is `data[offsets[i]:offsets[i + 1]]`.
+    /// @param outlength The length of the output array (equal to the number
+    /// of segments).
+    ///
+    /// Returns `nullptr` if this reducer has no segmented algorithm for
+    /// `dtype`, in which case the caller has to make `parents` and use the
+    /// `apply_*` methods.
+    virtual const std::shared_ptr<void>
+      apply_segmented(util::dtype dtype,
+                      const void* data,
+                      const Index64& offsets,
+                      int64_t outlength) const;
+
     /// @brief Apply the reducer algorithm to an array of boolean values.
     ///
     /// @param data The array to reduce.
@@ -257,6 +276,13 @@ namespace awkward {
     util::dtype
       return_dtype(util::dtype given_dtype) const override;
 
+    /// @copydoc Reducer::apply_segmented()
+    const std::shared_ptr<void>
+      apply_segmented(util::dtype dtype,
+                      const void* data,
+                      const Index64& offsets,
+                      int64_t outlength) const override;
+
     const std::shared_ptr<void>
       apply_bool(const bool* data,
                  const Index64& parents,
@@ -460,6 +486,13 @@ namespace awkward {
     util::dtype
       return_dtype(util::dtype given_dtype) const override;
 
+    /// @copydoc Reducer::apply_segmented()
+    const std::shared_ptr<void>
+      apply_segmented(util::dtype dtype,
+                      const void* data,
+                      const Index64& offsets,
+                      int64_t outlength) const override;
+
     const std::shared_ptr<void>
       apply_bool(const bool* data,
                  const Index64& parents,
@@ -873,6 +906,13 @@ namespace awkward {
     util::dtype
       preferred_dtype() const override;
 
+    /// @copydoc Reducer::apply_segmented()
+    const std::shared_ptr<void>
+      apply_segmented(util::dtype dtype,
+                      const void* data,
+                      const Index64& offsets,
+                      int64_t outlength) const override;
+
     const std::shared_ptr<void>
       apply_bool(const bool* data,
                  const Index64& parents,
@@ -985,6 +1025,13 @@ namespace awkward {
     util::dtype
       preferred_dtype() const override;
 
+    /// @copydoc Reducer::apply_segmented()
+    const std::shared_ptr<void>
+      apply_segmented(util::dtype dtype,
+                      const void* data,
+                      const Index64& offsets,
+                      int64_t outlength) const override;
+
     const std::shared_ptr<void>
       apply_bool(const bool* data,
                  const Index64& parents,
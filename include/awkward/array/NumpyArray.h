@@ -465,6 +465,20 @@ namespace awkward {
                   bool mask,
                   bool keepdims) const override;
 
+    /// @brief Reduces contiguous segments of this one-dimensional array,
+    /// delimited by `offsets`, without making a `parents` index (the fast
+    /// path of {@link ListOffsetArrayOf#reduce_next ListOffsetArray::reduce_next}
+    /// at `axis=-1`).
+    ///
+    /// Returns `nullptr` if this array is not one-dimensional and contiguous
+    /// or if the Reducer has no segmented algorithm for its dtype, in which
+    /// case #reduce_next has to be used instead.
+    const ContentPtr
+      reduce_segmented(const Reducer& reducer,
+                       const Index64& offsets,
+                       bool mask,
+                       bool keepdims) const;
+
     const ContentPtr
       sort_next(int64_t negaxis,
                 const Index64& starts,
@@ -66,6 +66,16 @@ namespace awkward {
     const ContentPtr
       snapshot() const;
 
+    /// @brief Turns the accumulated data from `start` (inclusive) to `stop`
+    /// (exclusive) into a Content array.
+    ///
+    /// Unlike slicing a #snapshot, the work is proportional to
+    /// `stop - start`, even for types such as unions that #snapshot has to
+    /// rearrange, so that periodically taking the newly appended entries
+    /// is not quadratic in the total length.
+    const ContentPtr
+      snapshot_range(int64_t start, int64_t stop) const;
+
     /// @brief Returns the element at a given position in the array, handling
     /// negative indexing and bounds-checking like Python.
     ///
@@ -116,6 +126,21 @@ namespace awkward {
     void
       real(double x);
 
+    /// @brief Adds `length` boolean values from `x` to the accumulated
+    /// data with a bulk copy where the type allows it.
+    void
+      booleans(const bool* x, int64_t length);
+
+    /// @brief Adds `length` integer values from `x` to the accumulated
+    /// data with a bulk copy where the type allows it.
+    void
+      integers(const int64_t* x, int64_t length);
+
+    /// @brief Adds `length` real values from `x` to the accumulated data
+    /// with a bulk copy where the type allows it.
+    void
+      reals(const double* x, int64_t length);
+
     /// @brief Adds a complex value `x` to the accumulated data.
     void
       complex(std::complex<double> x);
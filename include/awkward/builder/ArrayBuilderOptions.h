@@ -19,7 +19,9 @@ namespace awkward {
     /// @param resize The factor with which a GrowableBuffer is resized
     /// when its {@link GrowableBuffer#length length} reaches its
     /// {@link GrowableBuffer#reserved reserved}.
-    ArrayBuilderOptions(int64_t initial, double resize);
+    /// @param chunked If `true`, a GrowableBuffer grows by adding panels
+    /// (see #chunked) instead of reallocating and copying.
+    ArrayBuilderOptions(int64_t initial, double resize, bool chunked = false);
 
     /// @brief The initial number of
     /// {@link GrowableBuffer#reserved reserved} entries for a GrowableBuffer.
@@ -32,11 +34,20 @@ namespace awkward {
     double
       resize() const;
 
+    /// @brief If `true`, a full GrowableBuffer allocates a new panel for
+    /// subsequent data instead of reallocating and copying everything; the
+    /// panels are concatenated only once, when a contiguous
+    /// {@link GrowableBuffer#ptr ptr} is requested.
+    bool
+      chunked() const;
+
   private:
     /// See #initial.
     int64_t initial_;
     /// See #resize.
     double resize_;
+    /// See #chunked.
+    bool chunked_;
   };
 }
 
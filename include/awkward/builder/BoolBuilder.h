@@ -45,6 +45,9 @@ namespace awkward {
     const ContentPtr
       snapshot() const override;
 
+    const ContentPtr
+      snapshot_range(int64_t start, int64_t stop) const override;
+
     /// @copydoc Builder::active()
     ///
     /// A BoolBuilder is never active.
@@ -63,6 +66,9 @@ namespace awkward {
     const BuilderPtr
       real(double x) override;
 
+    const BuilderPtr
+      booleans(const bool* x, int64_t length) override;
+
     const BuilderPtr
       complex(std::complex<double> x) override;
 
@@ -53,6 +53,17 @@ namespace awkward {
     virtual const ContentPtr
       snapshot() const = 0;
 
+    /// @brief Turns the accumulated data from `start` (inclusive) to `stop`
+    /// (exclusive) into a Content array, with work proportional to
+    /// `stop - start` rather than #length.
+    ///
+    /// The default implementation slices a #snapshot, which is enough for
+    /// nodes whose #snapshot is a constant-time operation; nodes that
+    /// rearrange their data in #snapshot (e.g. unions) or hold a
+    /// GrowableBuffer (which may be in chunked panels) override it.
+    virtual const ContentPtr
+      snapshot_range(int64_t start, int64_t stop) const;
+
     /// @brief If `true`, this node has started but has not finished a
     /// multi-step command (e.g. `beginX ... endX`).
     virtual bool
@@ -74,6 +85,29 @@ namespace awkward {
     virtual const BuilderPtr
       real(double x) = 0;
 
+    /// @brief Adds `length` boolean values from `x` to the accumulated
+    /// data, as though #boolean had been called for each of them.
+    ///
+    /// The default implementation calls #boolean until this node is
+    /// replaced, then passes the rest to the replacement; nodes that hold
+    /// a buffer of this type override it with a bulk copy.
+    virtual const BuilderPtr
+      booleans(const bool* x, int64_t length);
+
+    /// @brief Adds `length` integer values from `x` to the accumulated
+    /// data, as though #integer had been called for each of them.
+    ///
+    /// See #booleans for the default implementation.
+    virtual const BuilderPtr
+      integers(const int64_t* x, int64_t length);
+
+    /// @brief Adds `length` real values from `x` to the accumulated data,
+    /// as though #real had been called for each of them.
+    ///
+    /// See #booleans for the default implementation.
+    virtual const BuilderPtr
+      reals(const double* x, int64_t length);
+
     /// @brief Adds a complex value `x` to the accumulated data.
     virtual const BuilderPtr
       complex(std::complex<double> x) = 0;
@@ -59,6 +59,9 @@ namespace awkward {
     const ContentPtr
       snapshot() const override;
 
+    const ContentPtr
+      snapshot_range(int64_t start, int64_t stop) const override;
+
     /// @copydoc Builder::active()
     ///
     /// A Complex128Builder is never active.
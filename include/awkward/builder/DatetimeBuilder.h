@@ -43,6 +43,9 @@ namespace awkward {
     const ContentPtr
       snapshot() const override;
 
+    const ContentPtr
+      snapshot_range(int64_t start, int64_t stop) const override;
+
     /// @copydoc Builder::active()
     ///
     /// A DatetimeBuilder is never active.
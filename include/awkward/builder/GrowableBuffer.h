@@ -8,6 +8,7 @@
 #include "awkward/Index.h"
 
 #include <memory>
+#include <vector>
 
 namespace awkward {
   /// @class GrowableBuffer
@@ -38,6 +39,16 @@ namespace awkward {
   /// delete or take advantage of. However, many operations require buffers
   /// to be rewritten; under normal circumstances, it would soon be replaced
   /// by a more appropriately sized buffer.
+  ///
+  /// If {@link ArrayBuilderOptions#chunked ArrayBuilderOptions::chunked},
+  /// a full buffer is not reallocated: subsequent data go into a new panel
+  /// that is `resize - 1` times the total reservation (but at least
+  /// {@link ArrayBuilderOptions#initial ArrayBuilderOptions::initial}),
+  /// and the panels are only concatenated into one buffer when the
+  /// GrowableBuffer needs to be contiguous (#set_length, #set_reserved).
+  /// This avoids copying the data at every growth step and keeps the peak
+  /// memory close to the final size. Snapshots (#ptr, #ptr_range) copy
+  /// the panels they need without changing the GrowableBuffer.
   template <typename T>
   class LIBAWKWARD_EXPORT_SYMBOL GrowableBuffer {
   public:
@@ -101,9 +112,21 @@ namespace awkward {
     GrowableBuffer(const ArrayBuilderOptions& options);
 
     /// @brief Reference-counted pointer to the array buffer.
+    ///
+    /// If the data are in more than one panel, this is a new buffer
+    /// containing a copy of all of them; the panels are not changed.
     const std::shared_ptr<T>
       ptr() const;
 
+    /// @brief Reference-counted pointer to the elements from `start`
+    /// (inclusive) to `stop` (exclusive).
+    ///
+    /// If the range is in a single panel, the pointer shares that panel's
+    /// buffer; otherwise, only the panels that overlap the range are copied
+    /// into a new buffer.
+    const std::shared_ptr<T>
+      ptr_range(int64_t start, int64_t stop) const;
+
     /// @brief Currently used number of elements.
     ///
     /// Although the #length increments every time #append is called,
@@ -151,20 +174,61 @@ namespace awkward {
     void
       append(T datum);
 
+    /// @brief Inserts `length` elements from `data` into the array with a
+    /// bulk copy, reallocating (or adding a panel) at most once.
+    ///
+    /// This increases the #length by `length`.
+    void
+      extend(const T* data, int64_t length);
+
     /// @brief Returns the element at a given position in the array, without
     /// handling negative indexing or bounds-checking.
     T
       getitem_at_nowrap(int64_t at) const;
 
   private:
+    /// @brief Concatenates all #panels_ and the current panel into one
+    /// buffer with at least `minreserved` slots.
+    void
+      concatenate(int64_t minreserved);
+
     const ArrayBuilderOptions options_;
-    // @brief See #ptr.
+    // @brief See #ptr; in chunked mode, the current (last) panel.
     std::shared_ptr<T> ptr_;
     // @brief See #length.
     int64_t length_;
-    // @brief See #reserved.
+    // @brief See #reserved; in chunked mode, the total over all panels.
     int64_t reserved_;
+    // @brief In chunked mode, the full panels before #ptr_.
+    std::vector<std::shared_ptr<T>> panels_;
+    // @brief The number of elements in each of #panels_.
+    std::vector<int64_t> panel_lengths_;
+    // @brief The total number of elements in #panels_.
+    int64_t panels_length_;
   };
+
+  /// @brief Memory used by all GrowableBuffers in this process, for
+  /// measuring the cost of building arrays.
+  struct LIBAWKWARD_EXPORT_SYMBOL GrowableBufferStats {
+    /// @brief Bytes currently allocated (including buffers that are now
+    /// owned by snapshots).
+    int64_t current_bytes;
+    /// @brief Largest value of #current_bytes since the last reset.
+    int64_t peak_bytes;
+    /// @brief Number of times data were copied into a new buffer.
+    int64_t copies;
+    /// @brief Total number of bytes copied.
+    int64_t copied_bytes;
+  };
+
+  /// @brief Returns the current GrowableBufferStats.
+  LIBAWKWARD_EXPORT_SYMBOL GrowableBufferStats
+    growablebuffer_stats();
+
+  /// @brief Sets the GrowableBufferStats' `peak_bytes` to its
+  /// `current_bytes` and its `copies` and `copied_bytes` to zero.
+  LIBAWKWARD_EXPORT_SYMBOL void
+    reset_growablebuffer_stats();
 }
 
 #endif // AWKWARD_GROWABLEBUFFER_H_
@@ -46,6 +46,9 @@ namespace awkward {
     const ContentPtr
       snapshot() const override;
 
+    const ContentPtr
+      snapshot_range(int64_t start, int64_t stop) const override;
+
     /// @copydoc Builder::active()
     ///
     /// A Int64Builder is never active.
@@ -64,6 +67,9 @@ namespace awkward {
     const BuilderPtr
       real(double x) override;
 
+    const BuilderPtr
+      integers(const int64_t* x, int64_t length) override;
+
     const BuilderPtr
       complex(std::complex<double> x) override;
 
@@ -51,6 +51,9 @@ namespace awkward {
     const ContentPtr
       snapshot() const override;
 
+    const ContentPtr
+      snapshot_range(int64_t start, int64_t stop) const override;
+
     /// @copydoc Builder::active()
     ///
     /// Calling #beginlist makes a ListBuilder active; #endlist makes it
@@ -70,6 +73,15 @@ namespace awkward {
     const BuilderPtr
       real(double x) override;
 
+    const BuilderPtr
+      booleans(const bool* x, int64_t length) override;
+
+    const BuilderPtr
+      integers(const int64_t* x, int64_t length) override;
+
+    const BuilderPtr
+      reals(const double* x, int64_t length) override;
+
     const BuilderPtr
       complex(std::complex<double> x) override;
 
@@ -69,6 +69,9 @@ namespace awkward {
     const ContentPtr
       snapshot() const override;
 
+    const ContentPtr
+      snapshot_range(int64_t start, int64_t stop) const override;
+
     /// @copydoc Builder::active()
     ///
     /// Calling #beginrecord makes a RecordBuilder active; #endrecord makes it
@@ -88,6 +91,15 @@ namespace awkward {
     const BuilderPtr
       real(double x) override;
 
+    const BuilderPtr
+      booleans(const bool* x, int64_t length) override;
+
+    const BuilderPtr
+      integers(const int64_t* x, int64_t length) override;
+
+    const BuilderPtr
+      reals(const double* x, int64_t length) override;
+
     const BuilderPtr
       complex(std::complex<double> x) override;
 
@@ -16,6 +16,16 @@
 #include "awkward/forth/ForthOutputBuffer.h"
 
 namespace awkward {
+  /// @brief The outcome of running a program over one set of inputs in
+  /// ForthMachineOf::run_parallel.
+  template <typename T>
+  struct ForthRunResultOf {
+    /// @brief The error that stopped the run (`none` if it finished).
+    util::ForthError error;
+    /// @brief The output buffers, in the order of ForthMachineOf::output_index.
+    std::vector<std::shared_ptr<ForthOutputBuffer>> outputs;
+  };
+
   /// @class ForthMachine
   ///
   /// @brief HERE
@@ -31,7 +41,8 @@ namespace awkward {
                    int64_t stack_max_depth=1024,
                    int64_t recursion_max_depth=1024,
                    int64_t output_initial_size=1024,
-                   double output_resize_factor=1.5);
+                   double output_resize_factor=1.5,
+                   bool optimize=false);
 
     ~ForthMachineOf();
 
@@ -75,6 +86,12 @@ namespace awkward {
     double
       output_resize_factor() const noexcept;
 
+    /// @brief If true, the bytecode has been through the peephole optimizer,
+    /// which folds constants and fuses common instruction sequences into
+    /// superinstructions.
+    bool
+      optimize() const noexcept;
+
     /// @brief HERE
     const std::vector<T>
       stack() const;
@@ -242,6 +259,35 @@ namespace awkward {
     util::ForthError
       resume();
 
+    /// @brief Runs this machine's program once for each set of inputs in
+    /// `input_sets`, on up to `num_threads` threads (`0` uses
+    /// `std::thread::hardware_concurrency()`), and returns the results in
+    /// the same order.
+    ///
+    /// Each thread compiles its own machine from #source, so this machine's
+    /// state is not used or changed, and no Python objects are touched: the
+    /// caller can release the GIL. The inputs of different sets must not
+    /// share writable memory.
+    ///
+    /// If a run ends in an error that is not in `ignore`, no new runs are
+    /// started and the exception from #maybe_throw for the first such run
+    /// (in input order) is rethrown after all threads have finished.
+    const std::vector<ForthRunResultOf<T>>
+      run_parallel(
+        const std::vector<std::map<std::string, std::shared_ptr<ForthInputBuffer>>>& input_sets,
+        int64_t num_threads,
+        const std::set<util::ForthError>& ignore) const;
+
+    /// @brief Concatenates the outputs of several runs (from #run_parallel)
+    /// into one buffer per output, in the order of #output_index.
+    ///
+    /// The outputs named in `offsets` are treated as offsets: each run's
+    /// first item is dropped and the rest are shifted to continue from the
+    /// previous run's last item.
+    const std::vector<std::shared_ptr<ForthOutputBuffer>>
+      concatenate_outputs(const std::vector<ForthRunResultOf<T>>& results,
+                          const std::set<std::string>& offsets) const;
+
     /// @brief HERE
     util::ForthError
       call(const std::string& name);
@@ -336,6 +382,10 @@ namespace awkward {
     }
 
   private:
+    /// @brief A new, empty buffer for the output at `index`.
+    const std::shared_ptr<ForthOutputBuffer>
+      new_output(IndexTypeOf<int64_t> index, int64_t initial) const;
+
     /// @brief HERE
     bool
     segment_nonempty(int64_t segment_position) const;
@@ -373,6 +423,11 @@ namespace awkward {
             int64_t exitdepth,
             int64_t dodepth);
 
+    /// @brief Folds constants and fuses common instruction sequences in
+    /// every segment of the compiled bytecode.
+    void
+      optimize_bytecodes();
+
     /// @brief HERE
     void
       internal_run(bool single_step, int64_t recursion_target_depth_top); // noexcept
@@ -535,6 +590,7 @@ namespace awkward {
     std::string source_;
     int64_t output_initial_size_;
     double output_resize_factor_;
+    bool optimize_;
 
     T* stack_buffer_;
     int64_t stack_depth_;
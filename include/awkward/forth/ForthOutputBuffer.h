@@ -75,6 +75,16 @@ namespace awkward {
     virtual const Index64
       toIndex64() const = 0;
 
+    /// @brief Appends all of the items in `other`, which must be a buffer
+    /// of the same type.
+    ///
+    /// If `as_offsets`, both buffers are treated as offsets: the first item
+    /// of `other` is dropped and the rest are shifted to continue from the
+    /// last item of this buffer, so that the lists they describe follow one
+    /// another.
+    virtual void
+      append(const ForthOutputBuffer& other, bool as_offsets) = 0;
+
     /// @brief HERE
     virtual void
       write_one_bool(bool value, bool byteswap) noexcept = 0;
@@ -222,6 +232,9 @@ namespace awkward {
     const Index64
       toIndex64() const override;
 
+    void
+      append(const ForthOutputBuffer& other, bool as_offsets) override;
+
     void
       write_one_bool(bool value, bool byteswap) noexcept override;
 
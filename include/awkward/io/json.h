@@ -13,6 +13,8 @@
 namespace awkward {
   class Content;
   using ContentPtr    = std::shared_ptr<Content>;
+  class Form;
+  using FormPtr       = std::shared_ptr<Form>;
 
   /// @class ToJson
   ///
@@ -366,6 +368,115 @@ namespace awkward {
                  const char* infinity_string = nullptr,
                  const char* minus_infinity_string = nullptr);
 
+  /// @brief Convert a JSON-encoded string into a Content array whose
+  /// structure is given by a Form, filling its buffers directly.
+  ///
+  /// Record fields that are not in the Form are skipped, missing fields
+  /// of option-type are filled with None, and any other mismatch between
+  /// the JSON and the Form raises an error. Each option-type node is built
+  /// as the type in the Form (except that a mask over an EmptyForm is an
+  /// IndexedOptionArray64); an UnmaskedForm does not accept None. Integers
+  /// that don't fit in the Form's dtype raise an error.
+  ///
+  /// If the Form is a RecordForm and the JSON is a single record, that
+  /// Record is returned, as in FromJsonString without a Form.
+  ///
+  /// @param source Null-terminated string containing either a single JSON
+  /// array of items or a sequence of concatenated JSON items.
+  /// @param form The Form of the output array.
+  /// @param options Configuration options for the initial size and growth
+  /// of the buffers.
+  /// @param nan_string user-defined string for a not-a-number (NaN) value
+  /// representation in JSON format
+  /// @param infinity_string user-defined string for a positive infinity
+  /// representation in JSON format
+  /// @param minus_infinity_string user-defined string for a negative
+  /// infinity representation in JSON format
+  LIBAWKWARD_EXPORT_SYMBOL const ContentPtr
+    FromJsonString(const char* source,
+                   const FormPtr& form,
+                   const ArrayBuilderOptions& options,
+                   const char* nan_string = nullptr,
+                   const char* infinity_string = nullptr,
+                   const char* minus_infinity_string = nullptr);
+
+  /// @brief Convert a JSON-encoded file into a Content array whose
+  /// structure is given by a Form, filling its buffers directly.
+  ///
+  /// See the FromJsonString that takes a Form for details.
+  ///
+  /// @param source C file handle to a file containing either a single JSON
+  /// array of items or a sequence of concatenated JSON items.
+  /// @param form The Form of the output array.
+  /// @param options Configuration options for the initial size and growth
+  /// of the buffers.
+  /// @param buffersize Number of bytes for an intermediate buffer.
+  /// @param nan_string user-defined string for a not-a-number (NaN) value
+  /// representation in JSON format
+  /// @param infinity_string user-defined string for a positive infinity
+  /// representation in JSON format
+  /// @param minus_infinity_string user-defined string for a negative
+  /// infinity representation in JSON format
+  LIBAWKWARD_EXPORT_SYMBOL const ContentPtr
+    FromJsonFile(FILE* source,
+                 const FormPtr& form,
+                 const ArrayBuilderOptions& options,
+                 int64_t buffersize,
+                 const char* nan_string = nullptr,
+                 const char* infinity_string = nullptr,
+                 const char* minus_infinity_string = nullptr);
+
+  /// @class FromJsonIterator
+  ///
+  /// @brief Parses a stream of concatenated (e.g. newline-delimited) JSON
+  /// values in bounded chunks, so that the whole input never has to be in
+  /// memory at once.
+  ///
+  /// Each call to #next returns the next chunk as a Content whose entries
+  /// are the top-level JSON values; the builder's buffers are released
+  /// between chunks. The source (string or `FILE*`) is borrowed and must
+  /// outlive the iterator.
+  class LIBAWKWARD_EXPORT_SYMBOL FromJsonIterator {
+  public:
+    /// @brief Creates a FromJsonIterator over a null-terminated string.
+    FromJsonIterator(const char* source,
+                     const ArrayBuilderOptions& options,
+                     const char* nan_string = nullptr,
+                     const char* infinity_string = nullptr,
+                     const char* minus_infinity_string = nullptr);
+
+    /// @brief Creates a FromJsonIterator over an open file, reading it
+    /// through a buffer of `buffersize` bytes.
+    FromJsonIterator(FILE* source,
+                     const ArrayBuilderOptions& options,
+                     int64_t buffersize,
+                     const char* nan_string = nullptr,
+                     const char* infinity_string = nullptr,
+                     const char* minus_infinity_string = nullptr);
+
+    FromJsonIterator(const FromJsonIterator&) = delete;
+
+    FromJsonIterator&
+      operator=(const FromJsonIterator&) = delete;
+
+    ~FromJsonIterator();
+
+    /// @brief Parses values until `max_records` values have been read or
+    /// at least `max_bytes` have been consumed (limits less than 1 are
+    /// ignored), returning them as one Content, or nullptr if the source
+    /// is exhausted.
+    const ContentPtr
+      next(int64_t max_records, int64_t max_bytes);
+
+    /// @brief Number of bytes consumed from the source so far.
+    int64_t
+      bytes_read() const;
+
+    class Impl;
+  private:
+    Impl* impl_;
+  };
+
 }
 
 #endif // AWKWARD_IO_JSON_H_
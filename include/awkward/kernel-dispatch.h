@@ -9,6 +9,8 @@
 #include "awkward/kernels.h"
 
 #include <sstream>
+#include <string>
+#include <vector>
 
 #ifndef _MSC_VER
   #include "dlfcn.h"
@@ -162,6 +164,99 @@ namespace awkward {
         kernel::lib ptr_lib,
         const std::string& cache_key);
 
+    /// @brief Sets the number of threads that the embarrassingly parallel
+    /// CPU kernels may split their work across.
+    ///
+    /// A value of `1` (the default) runs every kernel serially in the
+    /// calling thread; `0` uses `std::thread::hardware_concurrency()`.
+    void
+      set_parallel_threads(int64_t num_threads);
+
+    /// @brief The number of threads that the embarrassingly parallel CPU
+    /// kernels may split their work across (`1` means serial).
+    int64_t
+      parallel_threads();
+
+    /// @brief Sets the minimum number of items (outer lists, carried
+    /// elements, filled values) a CPU kernel must process before it is
+    /// split across threads; smaller calls stay serial.
+    void
+      set_parallel_threshold(int64_t threshold);
+
+    /// @brief The minimum number of items a CPU kernel must process before
+    /// it is split across threads.
+    int64_t
+      parallel_threshold();
+
+    /// @brief Totals for one kernel, accumulated while #profiling is on.
+    struct KernelProfileCounts {
+      /// @brief Name of the `awkward_*` kernel function.
+      std::string name;
+      /// @brief Number of calls through the CPU dispatch.
+      int64_t calls;
+      /// @brief Sum of the calls' length arguments (the number of items
+      /// each call iterates over, such as `length` or `lenparents`).
+      int64_t elements;
+      /// @brief Cumulative wall time of the calls, in nanoseconds.
+      int64_t nanoseconds;
+    };
+
+    /// @brief One kernel call, recorded while #profiling is on.
+    struct KernelProfileEvent {
+      /// @brief Name of the `awkward_*` kernel function.
+      std::string name;
+      /// @brief Small integer identifying the calling thread (in order of
+      /// each thread's first recorded call).
+      int64_t thread;
+      /// @brief Start time in nanoseconds, relative to an arbitrary epoch
+      /// shared by all events.
+      int64_t start;
+      /// @brief Wall time of the call, in nanoseconds.
+      int64_t duration;
+      /// @brief The call's length argument.
+      int64_t elements;
+    };
+
+    /// @brief Turns per-kernel profiling of the CPU dispatch on or off.
+    ///
+    /// While it is off (the default), each dispatch only pays for one
+    /// relaxed atomic load.
+    void
+      set_profiling(bool enabled);
+
+    /// @brief Whether per-kernel profiling is on.
+    bool
+      profiling();
+
+    /// @brief Sets the maximum number of individual calls kept for
+    /// #profile_events; totals in #profile_counts are not limited.
+    void
+      set_profile_max_events(int64_t max_events);
+
+    /// @brief The maximum number of individual calls kept for
+    /// #profile_events.
+    int64_t
+      profile_max_events();
+
+    /// @brief Discards all profiling totals and events.
+    void
+      reset_profile();
+
+    /// @brief Totals per kernel since the last #reset_profile, in no
+    /// particular order.
+    std::vector<KernelProfileCounts>
+      profile_counts();
+
+    /// @brief Individual calls since the last #reset_profile, in the order
+    /// in which they finished, up to #profile_max_events.
+    std::vector<KernelProfileEvent>
+      profile_events();
+
+    /// @brief Number of calls that were counted in #profile_counts but not
+    /// kept in #profile_events because the limit was reached.
+    int64_t
+      profile_events_dropped();
+
     /// @brief Internal Function to allocate an empty array of a given length
     /// with a given type. The `bytelength` parameter is the number of bytes,
     /// so be sure to multiply by sizeof(...) when using this function.
@@ -1597,19 +1692,12 @@ namespace awkward {
       const int64_t* nextparents,
       int64_t nextlen);
 
-    ERROR ListOffsetArray_reduce_nonlocal_findgaps_64(
-      kernel::lib ptr_lib,
-      int64_t* gaps,
-      const int64_t* parents,
-      int64_t lenparents);
-
     ERROR ListOffsetArray_reduce_nonlocal_outstartsstops_64(
       kernel::lib ptr_lib,
       int64_t* outstarts,
       int64_t* outstops,
       const int64_t* distincts,
       int64_t lendistincts,
-      const int64_t* gaps,
       int64_t outlength);
 
     ERROR ListOffsetArray_reduce_nonlocal_nextshifts_64(
@@ -1638,6 +1726,44 @@ namespace awkward {
       int64_t lenparents,
       int64_t outlength);
 
+    ERROR ListOffsetArray_reduce_segmented_count_64(
+      kernel::lib ptr_lib,
+      int64_t* toptr,
+      const int64_t* offsets,
+      int64_t outlength);
+
+    ERROR ListOffsetArray_reduce_segmented_mask_ByteMaskedArray_64(
+      kernel::lib ptr_lib,
+      int8_t* toptr,
+      const int64_t* offsets,
+      int64_t outlength);
+
+    template <typename OUT, typename IN>
+    ERROR ListOffsetArray_reduce_segmented_sum_64(
+      kernel::lib ptr_lib,
+      OUT* toptr,
+      const IN* fromptr,
+      const int64_t* offsets,
+      int64_t outlength);
+
+    template <typename OUT, typename IN>
+    ERROR ListOffsetArray_reduce_segmented_min_64(
+      kernel::lib ptr_lib,
+      OUT* toptr,
+      const IN* fromptr,
+      const int64_t* offsets,
+      int64_t outlength,
+      OUT identity);
+
+    template <typename OUT, typename IN>
+    ERROR ListOffsetArray_reduce_segmented_max_64(
+      kernel::lib ptr_lib,
+      OUT* toptr,
+      const IN* fromptr,
+      const int64_t* offsets,
+      int64_t outlength,
+      OUT identity);
+
     template <typename T>
     ERROR IndexedArray_reduce_next_64(
       kernel::lib ptr_lib,
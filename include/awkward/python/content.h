@@ -59,6 +59,11 @@ parameters2dict(const ak::util::Parameters& in);
 ak::Slice
   toslice(py::object obj);
 
+/// @brief Makes a function that returns the GrowableBufferStats as a dict
+/// and optionally resets them.
+void
+  make_growablebuffer_stats(py::module& m, const std::string& name);
+
 /// @brief Makes an ArrayBuilder class in Python that mirrors the one in C++.
 py::class_<ak::ArrayBuilder>
   make_ArrayBuilder(const py::handle& m, const std::string& name);
@@ -15,5 +15,14 @@ namespace ak = awkward;
 py::enum_<ak::kernel::lib>
   make_lib_enum(const py::handle& m, const std::string& name);
 
+void
+  make_kernel_parallel(py::module& m, const std::string& name);
+
+void
+  make_kernel_profiling(py::module& m, const std::string& name);
+
+void
+  make_kernel_profile(py::module& m, const std::string& name);
+
 
 #endif //AWKWARD_KERNEL_UTILS_H
@@ -2,16 +2,14 @@
 
 from __future__ import absolute_import
 
-import distutils.version
+import sys
 
 # NumPy 1.13.1 introduced NEP13, without which Awkward ufuncs won't work, which
 # would be worse than lacking a feature: it would cause unexpected output.
 # NumPy 1.17.0 introduced NEP18, which is optional (use ak.* instead of np.*).
 import numpy
 
-if distutils.version.LooseVersion(numpy.__version__) < distutils.version.LooseVersion(
-    "1.13.1"
-):
+if numpy.lib.NumpyVersion(numpy.__version__) < "1.13.1":
     raise ImportError("Numpy 1.13.1 or later required")
 
 # NumPy-like alternatives
@@ -24,9 +22,6 @@ import awkward.forms
 import awkward.partition
 
 # internal
-import awkward._v2
-import awkward._cpu_kernels
-import awkward._libawkward
 import awkward._util
 
 # third-party connectors
@@ -35,6 +30,13 @@ import awkward._connect._numba
 import awkward._connect._numexpr
 import awkward._connect._autograd
 
+# caches for lazy arrays
+import awkward.cache
+
+# kernel profiling
+import awkward._profiling
+from awkward._profiling import profiling
+
 # high-level interface
 behavior = {}
 from awkward.highlevel import Array
@@ -61,12 +63,32 @@ __version__ = awkward._ext.__version__
 # call C++ startup function
 awkward._ext.startup()
 
+# start profiling the whole process if AWKWARD_PROFILE is set
+awkward._profiling._startup()
+
 __all__ = [
-    x
-    for x in list(globals())
-    if not x.startswith("_") and x not in ("distutils", "numpy")
+    x for x in list(globals()) if not x.startswith("_") and x not in ("sys", "numpy")
 ]
 
+# internal modules that are only imported when they are first used (to keep
+# 'import awkward' fast): the ctypes kernel and ArrayBuilder libraries and v2
+_lazy_submodules = ("_v2", "_cpu_kernels", "_libawkward")
+
+
+def __getattr__(name):
+    if name in _lazy_submodules:
+        import importlib
+
+        return importlib.import_module("awkward." + name)
+    raise AttributeError("module 'awkward' has no attribute '{0}'".format(name))
+
+
+# module-level __getattr__ requires Python 3.7, so older versions import them all
+if sys.version_info < (3, 7):
+    import awkward._v2
+    import awkward._cpu_kernels
+    import awkward._libawkward
+
 
 def __dir__():
     return __all__
@@ -2,7 +2,6 @@
 
 from __future__ import absolute_import
 
-import distutils.version
 import types
 
 import awkward as ak
@@ -25,9 +24,7 @@ or
     conda install jax jaxlib"""
         )
     else:
-        if not checked_version and distutils.version.LooseVersion(
-            jax.__version__
-        ) < distutils.version.LooseVersion("0.2.7"):
+        if not checked_version and ak._util.version_tuple(jax.__version__) < (0, 2, 7):
             raise ImportError(
                 "Awkward Array can only work with jax 0.2.7 or later "
                 "(you have version {0})".format(jax.__version__)
@@ -2,7 +2,6 @@
 
 from __future__ import absolute_import
 
-import distutils.version
 import types
 
 import awkward as ak
@@ -25,9 +24,7 @@ or
     conda install numba"""
         )
     else:
-        if not checked_version and distutils.version.LooseVersion(
-            numba.__version__
-        ) < distutils.version.LooseVersion("0.50"):
+        if not checked_version and ak._util.version_tuple(numba.__version__) < (0, 50):
             raise ImportError(
                 "Awkward Array can only work with numba 0.50 or later "
                 "(you have version {0})".format(numba.__version__)
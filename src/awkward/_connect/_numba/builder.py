@@ -7,6 +7,7 @@ import numba.core.typing
 import numba.core.typing.ctypes_utils
 
 import awkward as ak
+import awkward._libawkward
 
 numpy = ak.nplike.Numpy.instance()
 
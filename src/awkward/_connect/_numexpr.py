@@ -4,7 +4,6 @@ from __future__ import absolute_import
 
 import warnings
 import sys
-import distutils.version
 import types
 
 import awkward as ak
@@ -27,9 +26,11 @@ or
     conda install numexpr"""
         )
     else:
-        if not checked_version and distutils.version.LooseVersion(
-            numexpr.__version__
-        ) < distutils.version.LooseVersion("2.7.1"):
+        if not checked_version and ak._util.version_tuple(numexpr.__version__) < (
+            2,
+            7,
+            1,
+        ):
             warnings.warn(
                 "Awkward Array is only known to work with numexpr 2.7.1 or later"
                 "(you have version {0})".format(numexpr.__version__),
@@ -0,0 +1,225 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+from __future__ import absolute_import
+
+import atexit
+import json
+import os
+import sys
+import threading
+
+import awkward as ak
+
+_lock = threading.Lock()
+_active = []
+
+
+def _flush():
+    # must be called with _lock held: moves everything recorded in C++ so far
+    # into every active Profile, so that nested profiles each see their span
+    data = ak._ext.kernel_profile(reset=True)
+    for profile in _active:
+        profile._add(data)
+
+
+class Profile(object):
+    """
+    Kernel calls recorded by #ak.profiling.
+
+    The totals per kernel are available as an array of records (#counts) or
+    as a formatted #table, and the individual calls as a Chrome trace
+    (#chrome_trace and #to_chrome_trace), which can be viewed in
+    `chrome://tracing` or https://ui.perfetto.dev.
+    """
+
+    def __init__(self, max_events=None):
+        self._max_events = max_events
+        self._previous = None
+        self._totals = {}
+        self._events = []
+        self._dropped = 0
+
+    def _add(self, data):
+        for name, calls, elements, nanoseconds in data["counts"]:
+            totals = self._totals.setdefault(name, [0, 0, 0])
+            totals[0] += calls
+            totals[1] += elements
+            totals[2] += nanoseconds
+        self._events.extend(data["events"])
+        self._dropped += data["dropped"]
+
+    def __enter__(self):
+        with _lock:
+            _flush()
+            _active.append(self)
+            self._previous = ak._ext.kernel_profiling(True, self._max_events)
+        return self
+
+    def __exit__(self, exception_type, exception_value, traceback):
+        with _lock:
+            _flush()
+            _active.remove(self)
+            ak._ext.kernel_profiling(*self._previous)
+
+    @property
+    def dropped(self):
+        """
+        Number of kernel calls that are included in the totals but not in the
+        trace, because `max_events` was reached.
+        """
+        return self._dropped
+
+    def _sorted_totals(self):
+        return sorted(self._totals.items(), key=lambda x: (-x[1][2], x[0]))
+
+    @property
+    def counts(self):
+        """
+        Totals per kernel as an array of records with fields `kernel` (name
+        of the `awkward_*` function), `calls`, `elements` (sum of the calls'
+        length arguments), and `seconds` (cumulative wall time), sorted from
+        the most to the least time.
+        """
+        return ak.Array(
+            [
+                {
+                    "kernel": name,
+                    "calls": calls,
+                    "elements": elements,
+                    "seconds": nanoseconds * 1e-9,
+                }
+                for name, (calls, elements, nanoseconds) in self._sorted_totals()
+            ]
+        )
+
+    def table(self, limit=None):
+        """
+        Args:
+            limit (None or int): If not None, only show the kernels that took
+                the most time, up to this number.
+
+        Returns the totals per kernel as a formatted table, sorted from the
+        most to the least time.
+        """
+        rows = self._sorted_totals()
+        total = sum(x[2] for _, x in rows)
+        if limit is not None:
+            rows = rows[:limit]
+        width = max([len("kernel")] + [len(name) for name, _ in rows])
+        out = [
+            "{0:<{1}s} {2:>10s} {3:>14s} {4:>12s} {5:>6s} {6:>10s}".format(
+                "kernel", width, "calls", "elements", "time (ms)", "%", "ns/elem"
+            )
+        ]
+        for name, (calls, elements, nanoseconds) in rows:
+            out.append(
+                "{0:<{1}s} {2:10d} {3:14d} {4:12.3f} {5:6.1f} {6:>10s}".format(
+                    name,
+                    width,
+                    calls,
+                    elements,
+                    nanoseconds * 1e-6,
+                    100.0 * nanoseconds / total if total > 0 else 0.0,
+                    "{0:.2f}".format(float(nanoseconds) / elements)
+                    if elements > 0
+                    else "",
+                )
+            )
+        return "\n".join(out)
+
+    def __str__(self):
+        return self.table()
+
+    def __repr__(self):
+        return "<Profile of {0} calls to {1} kernels in {2:.3f} ms>".format(
+            sum(x[0] for x in self._totals.values()),
+            len(self._totals),
+            sum(x[2] for x in self._totals.values()) * 1e-6,
+        )
+
+    def chrome_trace(self):
+        """
+        Returns the individual kernel calls as a JSON-compatible dict in the
+        Chrome trace event format: one complete (`"X"`) event per call, with
+        the number of elements in its `args`.
+        """
+        pid = os.getpid()
+        return {
+            "traceEvents": [
+                {
+                    "name": name,
+                    "cat": "kernel",
+                    "ph": "X",
+                    "ts": start * 1e-3,
+                    "dur": duration * 1e-3,
+                    "pid": pid,
+                    "tid": thread,
+                    "args": {"elements": elements},
+                }
+                for name, thread, start, duration, elements in self._events
+            ],
+            "displayTimeUnit": "ns",
+            "otherData": {"dropped": self._dropped},
+        }
+
+    def to_chrome_trace(self, destination):
+        """
+        Args:
+            destination (str or file-like object): Path or open (text) file to
+                write to.
+
+        Writes #chrome_trace as JSON.
+        """
+        if hasattr(destination, "write"):
+            json.dump(self.chrome_trace(), destination)
+        else:
+            with open(destination, "w") as file:
+                json.dump(self.chrome_trace(), file)
+
+
+def profiling(max_events=None):
+    """
+    Args:
+        max_events (None or int): Maximum number of individual kernel calls
+            to keep for the trace (totals are not limited). If None, the
+            current limit is used (1048576 by default).
+
+    Returns a context manager that records the number of calls, the number of
+    elements, and the wall time of every CPU kernel that runs inside it, in
+    any thread. The #ak._profiling.Profile that it returns can be examined
+    afterward:
+
+        >>> with ak.profiling() as profile:
+        ...     ak.sum(array, axis=1)
+        ...
+        >>> print(profile.table(limit=10))
+        >>> profile.counts[:10]
+        >>> profile.to_chrome_trace("trace.json")
+
+    Profiles can be nested; each records everything within its own span.
+
+    Profiling can also be turned on for a whole process, without changing its
+    code, by setting the `AWKWARD_PROFILE` environment variable before
+    importing `awkward`. If its value ends with `.json`, a Chrome trace is
+    written to that path when the process exits; any other value (except an
+    empty string or `0`) prints the table to stderr at exit.
+
+    Only kernels that run through the CPU dispatch are recorded; time spent
+    in NumPy, Numba, or Python itself is not.
+    """
+    return Profile(max_events)
+
+
+def _profile_at_exit(profile, destination):
+    profile.__exit__(None, None, None)
+    if destination.endswith(".json"):
+        profile.to_chrome_trace(destination)
+    else:
+        sys.stderr.write(profile.table() + "\n")
+
+
+def _startup():
+    destination = os.environ.get("AWKWARD_PROFILE", "")
+    if destination not in ("", "0"):
+        profile = profiling().__enter__()
+        atexit.register(_profile_at_exit, profile, destination)
@@ -2,39 +2,68 @@
 
 from __future__ import absolute_import
 
+import collections
+import copy
 import sys
+import threading
 
 import awkward as ak
 
-from awkward._typeparser.generated_parser import Lark_StandAlone, Transformer
+# The generated parser takes tens of milliseconds to import and to construct,
+# so both are put off until the first type string is parsed, and parse trees
+# are kept for the most recently used type strings.
+_parser = None
+_parse_lock = threading.Lock()
+_parse_cache = collections.OrderedDict()
+_parse_cache_size = 1024
 
 
-class TreeToJson(Transformer):
-    def string(self, s):
-        (s,) = s
-        if sys.version_info[0] == 2:
-            s = s.encode("utf-8")
-        return s[1:-1]
+def _make_parser():
+    from awkward._typeparser.generated_parser import Lark_StandAlone, Transformer
 
-    def number(self, n):
-        (n,) = n
-        if "." in n:
-            return float(n)
-        else:
-            return int(n)
+    class TreeToJson(Transformer):
+        def string(self, s):
+            (s,) = s
+            if sys.version_info[0] == 2:
+                s = s.encode("utf-8")
+            return s[1:-1]
+
+        def number(self, n):
+            (n,) = n
+            if "." in n:
+                return float(n)
+            else:
+                return int(n)
+
+        list_obj = list
+        pair = tuple
+        dict_obj = dict
+
+        def null(self, s):
+            return None
+
+        def true(self, s):
+            return True
 
-    list_obj = list
-    pair = tuple
-    dict_obj = dict
+        def false(self, s):
+            return False
 
-    def null(self, s):
-        return None
+    return Lark_StandAlone(transformer=TreeToJson())
 
-    def true(self, s):
-        return True
 
-    def false(self, s):
-        return False
+def _parse(typestr):
+    global _parser
+    with _parse_lock:
+        try:
+            tree = _parse_cache.pop(typestr)
+        except KeyError:
+            if _parser is None:
+                _parser = _make_parser()
+            tree = _parser.parse(typestr)
+            while len(_parse_cache) >= _parse_cache_size:
+                _parse_cache.popitem(last=False)
+        _parse_cache[typestr] = tree
+        return tree
 
 
 def toast(ptnode, high_level, categorical):
@@ -279,7 +308,8 @@ def toast(ptnode, high_level, categorical):
         )
     elif ptnode.data == "def_option":
         assert len(ptnode.children) == 1
-        return ptnode.children[0]
+        # the caller may add to these parameters; the parse tree is cached
+        return copy.deepcopy(ptnode.children[0])
     elif ptnode.data == "options":
         assert len(ptnode.children) == 1
         return toast(ptnode.children[0], high_level, categorical)
@@ -288,5 +318,6 @@ def toast(ptnode, high_level, categorical):
 
 
 def from_datashape(typestr, high_level=False):
-    parseobj = Lark_StandAlone(transformer=TreeToJson())
-    return toast(parseobj.parse(typestr), high_level, False)
+    # types are mutable (Type.setparameter), so each call builds new ones from
+    # the cached parse tree, which is not modified
+    return toast(_parse(typestr), high_level, False)
@@ -71,6 +71,25 @@ def isstr(x):
         return isinstance(x, str)
 
 
+def version_tuple(version):
+    """
+    Returns the leading numbers of a version string as a tuple of ints, for
+    comparisons like ``version_tuple(numba.__version__) < (0, 50)``.
+
+    (This replaces ``distutils.version.LooseVersion``, which is deprecated and
+    slow to import.)
+    """
+    out = []
+    for part in version.split("."):
+        match = re.match(r"[0-9]+", part)
+        if match is None:
+            break
+        out.append(int(match.group(0)))
+        if match.end() != len(part):
+            break
+    return tuple(out)
+
+
 def exception_suffix(filename):
     line = ""
     if hasattr(sys, "_getframe"):
@@ -1131,15 +1150,19 @@ def broadcast_and_apply(  # noqa: C901
                     break
             nextinputs = ak.partition.partition_as(sample, inputs)
 
-            outputs = []
-            for part_inputs in ak.partition.iterate(sample.numpartitions, nextinputs):
+            def apply_partition(part_inputs):
                 isscalar = []
                 part = apply(broadcast_pack(part_inputs, isscalar), 0, None)
                 assert isinstance(part, tuple)
-                outputs.append(tuple(broadcast_unpack(x, isscalar) for x in part))
+                return tuple(broadcast_unpack(x, isscalar) for x in part)
+
+            outputs = ak.partition.execute(
+                apply_partition,
+                ak.partition.iterate(sample.numpartitions, nextinputs),
+            )
 
             out = ()
-            for i in range(len(part)):
+            for i in range(len(outputs[0])):
                 out = out + (
                     ak.partition.IrregularlyPartitionedArray([x[i] for x in outputs]),
                 )
@@ -1292,7 +1315,7 @@ def transform_child_layouts(transform, layout, depth, user=None, keep_parameters
     # the rest of this is one switch statement
     if isinstance(layout, ak.partition.PartitionedArray):
         return ak.partition.IrregularlyPartitionedArray(
-            [transform(x, depth, user) for x in layout.partitions]
+            ak.partition.execute(lambda x: transform(x, depth, user), layout.partitions)
         )
 
     elif isinstance(layout, ak.layout.NumpyArray):
@@ -0,0 +1,115 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+from __future__ import absolute_import
+
+import collections
+import threading
+
+try:
+    from collections.abc import MutableMapping
+except ImportError:
+    from collections import MutableMapping
+
+import awkward as ak
+
+
+class LRUArrayCache(MutableMapping):
+    """
+    Args:
+        limit_bytes (int): Maximum total number of bytes of arrays to keep.
+
+    A MutableMapping for the `cache` or `lazy_cache` argument of #ak.virtual,
+    #ak.from_parquet, and #ak.from_buffers that keeps materialized arrays
+    only while their total #ak.layout.Content.nbytes is at most `limit_bytes`,
+    evicting the least recently used first.
+
+        >>> cache = ak.cache.LRUArrayCache(100 * 1024**2)
+        >>> events = ak.from_parquet("events.parquet", lazy=True, lazy_cache=cache)
+        >>> ak.sum(events.muons.pt), ak.sum(events.jets.pt)
+        (48719037.0, 93461551.0)
+        >>> cache
+        <LRUArrayCache 97.3 of 100.0 MiB in 12 arrays, 0 hits, 48 misses, 36 evictions>
+
+    An evicted array is only released if nothing else references it; a
+    VirtualArray without a cached value regenerates it when needed. An array
+    larger than `limit_bytes` is not cached at all.
+
+    The numbers of `hits`, `misses` (lookups of keys that are not in the
+    cache), and `evictions` are counted to help choose a `limit_bytes`.
+    """
+
+    def __init__(self, limit_bytes):
+        if limit_bytes < 0:
+            raise ValueError(
+                "limit_bytes must be non-negative, not {0}".format(limit_bytes)
+                + ak._util.exception_suffix(__file__)
+            )
+        self._limit_bytes = limit_bytes
+        self._current_bytes = 0
+        self._data = collections.OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def limit_bytes(self):
+        """
+        Maximum total number of bytes of arrays to keep.
+        """
+        return self._limit_bytes
+
+    @property
+    def current_bytes(self):
+        """
+        Total number of bytes of the arrays in the cache.
+        """
+        return self._current_bytes
+
+    def __repr__(self):
+        return "<LRUArrayCache {0:.1f} of {1:.1f} MiB in {2} arrays, {3} hits, {4} misses, {5} evictions>".format(
+            self._current_bytes / 1024.0 ** 2,
+            self._limit_bytes / 1024.0 ** 2,
+            len(self._data),
+            self.hits,
+            self.misses,
+            self.evictions,
+        )
+
+    def __getitem__(self, key):
+        with self._lock:
+            try:
+                value, nbytes = self._data.pop(key)
+            except KeyError:
+                self.misses += 1
+                raise
+            self._data[key] = (value, nbytes)
+            self.hits += 1
+            return value
+
+    def __setitem__(self, key, value):
+        nbytes = getattr(value, "nbytes", 0)
+        with self._lock:
+            if key in self._data:
+                self._current_bytes -= self._data.pop(key)[1]
+            if nbytes > self._limit_bytes:
+                return
+            self._data[key] = (value, nbytes)
+            self._current_bytes += nbytes
+            while self._current_bytes > self._limit_bytes:
+                _, (_, evicted) = self._data.popitem(last=False)
+                self._current_bytes -= evicted
+                self.evictions += 1
+
+    def __delitem__(self, key):
+        with self._lock:
+            self._current_bytes -= self._data.pop(key)[1]
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def __iter__(self):
+        return iter(list(self._data))
+
+    def __len__(self):
+        return len(self._data)
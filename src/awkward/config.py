@@ -2,9 +2,9 @@
 
 from __future__ import absolute_import
 
+import os
 import sys
 import argparse
-import pkg_resources
 
 if __name__ == "__main__":
     argparser = argparse.ArgumentParser(
@@ -55,8 +55,8 @@ if __name__ == "__main__":
     args = argparser.parse_args()
 
     output = []
-    incdir = pkg_resources.resource_filename("awkward", "include")
-    libdir = pkg_resources.resource_filename("awkward", "")
+    libdir = os.path.dirname(os.path.abspath(__file__))
+    incdir = os.path.join(libdir, "include")
     cpu_kernels = "awkward-cpu-kernels"
     libawkward = "awkward"
 
@@ -78,7 +78,7 @@ if __name__ == "__main__":
 
         if arg == "--static-libs":
             output.append(
-                "-L{0} -l{1}-static -l{2}-static -ldl".format(
+                "-L{0} -l{1}-static -l{2}-static -ldl -lpthread".format(
                     libdir, libawkward, cpu_kernels
                 )
             )
@@ -88,7 +88,9 @@ if __name__ == "__main__":
 
         if arg == "--static-libs-only-l":
             output.append(
-                "-l{0}-static -l{1}-static -ldl".format(libawkward, cpu_kernels)
+                "-l{0}-static -l{1}-static -ldl -lpthread".format(
+                    libawkward, cpu_kernels
+                )
             )
 
         if arg == "--cflags-only-I":
@@ -1458,15 +1458,30 @@ class Array(
 
         return numba.typeof(self._numbaview)
 
-    def __getstate__(self):
-        packed = ak.operations.structure.packed(self.layout, highlevel=False)
-        form, length, container = ak.operations.convert.to_buffers(packed)
+    def _pickle_state(self, protocol):
+        if ak.operations.convert._pickle_packed():
+            layout = ak.operations.structure.packed(self.layout, highlevel=False)
+        else:
+            layout = self.layout
+        form, length, container = ak.operations.convert.to_buffers(layout)
+        container = ak.operations.convert._pickle_container(container, protocol)
         if self._behavior is ak.behavior:
             behavior = None
         else:
             behavior = self._behavior
         return form, length, container, behavior
 
+    def __getstate__(self):
+        return self._pickle_state(None)
+
+    def __reduce_ex__(self, protocol):
+        # protocol 5 can pass the buffers out-of-band, as pickle.PickleBuffer
+        if protocol < 5 or not hasattr(ak.operations.convert.pickle, "PickleBuffer"):
+            return super(Array, self).__reduce_ex__(protocol)
+        import copyreg
+
+        return copyreg.__newobj__, (type(self),), self._pickle_state(protocol)
+
     def __setstate__(self, state):
         if isinstance(state[1], dict):
             form, container, num_partitions, behavior = state
@@ -2055,14 +2070,29 @@ class Record(ak._connect._numpy.NDArrayOperatorsMixin):
 
         return numba.typeof(self._numbaview)
 
-    def __getstate__(self):
-        packed = ak.operations.structure.packed(self._layout, highlevel=False)
-        form, length, container = ak.operations.convert.to_buffers(packed.array)
+    def _pickle_state(self, protocol):
+        if ak.operations.convert._pickle_packed():
+            layout = ak.operations.structure.packed(self._layout, highlevel=False)
+        else:
+            layout = self._layout
+        form, length, container = ak.operations.convert.to_buffers(layout.array)
+        container = ak.operations.convert._pickle_container(container, protocol)
         if self._behavior is ak.behavior:
             behavior = None
         else:
             behavior = self._behavior
-        return form, length, container, behavior, packed.at
+        return form, length, container, behavior, layout.at
+
+    def __getstate__(self):
+        return self._pickle_state(None)
+
+    def __reduce_ex__(self, protocol):
+        # protocol 5 can pass the buffers out-of-band, as pickle.PickleBuffer
+        if protocol < 5 or not hasattr(ak.operations.convert.pickle, "PickleBuffer"):
+            return super(Record, self).__reduce_ex__(protocol)
+        import copyreg
+
+        return copyreg.__newobj__, (type(self),), self._pickle_state(protocol)
 
     def __setstate__(self, state):
         if isinstance(state[1], dict):
@@ -2111,6 +2141,10 @@ class ArrayBuilder(Iterable, Sized):
         resize (float): Resize multiplier for buffers used by
             #ak.layout.ArrayBuilder (see #ak.layout.ArrayBuilderOptions);
             should be strictly greater than 1.
+        chunked (bool): If True, buffers grow by adding panels instead of
+            reallocating and copying, and are concatenated only once per
+            #snapshot. This lowers the peak memory of large builds; see
+            #ak.layout.growablebuffer_stats to measure it.
 
     General tool for building arrays of nested data structures from a sequence
     of commands. Most data types can be constructed by calling commands in the
@@ -2225,8 +2259,10 @@ class ArrayBuilder(Iterable, Sized):
     be considered the "least effort" approach.
     """
 
-    def __init__(self, behavior=None, initial=1024, resize=1.5):
-        self._layout = ak.layout.ArrayBuilder(initial=initial, resize=resize)
+    def __init__(self, behavior=None, initial=1024, resize=1.5, chunked=False):
+        self._layout = ak.layout.ArrayBuilder(
+            initial=initial, resize=resize, chunked=chunked
+        )
         self.behavior = behavior
 
     @classmethod
@@ -2446,6 +2482,28 @@ class ArrayBuilder(Iterable, Sized):
         layout = self._layout.snapshot()
         return ak._util.wrap(layout, self._behavior)
 
+    def incremental_snapshot(self):
+        """
+        Converts the data accumulated since the last call to this method (or
+        since the beginning) into an #ak.Array.
+
+        The cost is proportional to the number of new entries, not to the
+        total, even for data types that #snapshot has to rearrange (unions),
+        so a growing ArrayBuilder can be monitored at regular intervals
+        without quadratic cost. Like #snapshot, the new #ak.Array shares
+        memory with the accumulated data wherever possible.
+
+        This does not affect #snapshot, which always returns all of the
+        accumulated data.
+        """
+        start = getattr(self, "_incremental_start", 0)
+        stop = len(self._layout)
+        if start > stop:
+            start = 0
+        self._incremental_start = stop
+        layout = self._layout.snapshot_range(start, stop)
+        return ak._util.wrap(layout, self._behavior)
+
     def null(self):
         """
         Appends a None value at the current position in the accumulated array.
@@ -2683,19 +2741,47 @@ class ArrayBuilder(Iterable, Sized):
                     "'obj' is an ak.Array" + ak._util.exception_suffix(__file__)
                 )
 
-    def extend(self, obj):
+    def extend(self, obj, counts=None):
         """
         Args:
-            obj (#ak.Array): The Array to concatenate with the data in this
-                ArrayBuilder.
+            obj (#ak.Array or np.ndarray): The Array to concatenate with the
+                data in this ArrayBuilder.
+            counts (None or array of non-negative ints): If not None, `obj`
+                must be a NumPy array and its values are grouped into
+                `len(counts)` lists, the `i`th having `counts[i]` items (like
+                #ak.unflatten).
+
+        If `obj` is an #ak.Array, this appends every value from `obj`, by
+        reference (see #append).
+
+        If `obj` is a NumPy array, this appends every value from `obj`, by
+        copying: one-dimensional arrays of booleans, integers, and
+        floating-point numbers are copied into the builder's buffers in bulk,
+        rather than one Python call per value. For example,
+
+            builder.extend(np.array([1.1, 2.2, 3.3, 4.4, 5.5]), counts=[3, 0, 2])
+
+        is equivalent to (and much faster than)
+
+            for x in [[1.1, 2.2, 3.3], [], [4.4, 5.5]]:
+                builder.append(x)
+
+        Appending a NumPy array inside a record field, as in
+
+            builder.begin_record()
+            builder.field("x").append(np.array([1, 2, 3]))
+            builder.end_record()
 
-        Appends every value from `obj`, by reference (see #append).
+        uses the same bulk copy for the field's list.
         """
-        if isinstance(obj, Array):
+        if isinstance(obj, Array) and counts is None:
             self._layout.extend(obj.layout)
+        elif isinstance(obj, np.ndarray):
+            self._layout.extend_numpy(obj, counts)
         else:
             raise TypeError(
-                "'extend' method requires an ak.Array"
+                "'extend' method requires an ak.Array or a NumPy array "
+                "(with 'counts' only for NumPy arrays)"
                 + ak._util.exception_suffix(__file__)
             )
 
@@ -13,6 +13,7 @@ from awkward._ext import Identities64
 
 from awkward._ext import Iterator
 from awkward._ext import ArrayBuilder
+from awkward._ext import growablebuffer_stats
 from awkward._ext import LayoutBuilder
 from awkward._ext import _PersistentSharedPtr
 
@@ -55,6 +56,9 @@ from awkward._ext import SliceGenerator
 from awkward._ext import ArrayCache
 
 from awkward._ext import kernel_lib
+from awkward._ext import kernel_parallel
+from awkward._ext import kernel_profiling
+from awkward._ext import kernel_profile
 
 
 __all__ = [
@@ -67,6 +71,7 @@ __all__ = [
     "Identities64",
     "Iterator",
     "ArrayBuilder",
+    "growablebuffer_stats",
     "LayoutBuilder",
     "_PersistentSharedPtr",
     "Content",
@@ -97,6 +102,9 @@ __all__ = [
     "SliceGenerator",
     "ArrayCache",
     "kernel_lib",
+    "kernel_parallel",
+    "kernel_profiling",
+    "kernel_profile",
 ]
 
 
@@ -7,8 +7,10 @@ import json
 import collections
 import math
 import os
+import mmap
+import pickle
+import struct
 import threading
-import distutils.version
 import glob
 import re
 
@@ -19,6 +21,11 @@ except ImportError:
     from collections import Iterable, Sized
     from collections import MutableMapping
 
+try:
+    import queue
+except ImportError:
+    import Queue as queue
+
 import awkward as ak
 
 np = ak.nplike.NumpyMetadata.instance()
@@ -935,7 +942,7 @@ def to_list(array):
         return array
 
     elif isinstance(array, ak.highlevel.Array):
-        return [to_list(x) for x in array]
+        return _to_list_layout(array.layout)
 
     elif isinstance(array, ak.highlevel.Record):
         return to_list(array.layout)
@@ -950,27 +957,10 @@ def to_list(array):
         return {n: to_list(x) for n, x in array.fielditems()}
 
     elif isinstance(array, ak.layout.ArrayBuilder):
-        return [to_list(x) for x in array.snapshot()]
-
-    elif isinstance(array, ak.layout.NumpyArray):
-        if array.format.upper().startswith("M"):
-            return (
-                [
-                    x
-                    for x in ak.nplike.of(array)
-                    .asarray(array.view_int64)
-                    .view(array.format)
-                ]
-                # FIXME: .tolist() returns
-                # [[1567416600000000000], [1568367000000000000], [1569096000000000000]]
-                # instead of [numpy.datetime64('2019-09-02T09:30:00'), numpy.datetime64('2019-09-13T09:30:00'), numpy.datetime64('2019-09-21T20:00:00')]
-                # see test_from_pandas() test
-            )
-        else:
-            return ak.nplike.of(array).asarray(array).tolist()
+        return _to_list_layout(array.snapshot())
 
     elif isinstance(array, (ak.layout.Content, ak.partition.PartitionedArray)):
-        return [to_list(x) for x in array]
+        return _to_list_layout(array)
 
     elif isinstance(array, ak._v2.contents.Content):
         import awkward._v2.tmp_for_testing
@@ -990,6 +980,40 @@ def to_list(array):
         )
 
 
+def _to_list_layout(layout):
+    # Content.tolist walks the whole tree in C++, one node at a time, and only
+    # calls back to Python for nodes that it can't convert itself.
+    if isinstance(layout, ak.partition.PartitionedArray):
+        out = []
+        for partition in layout.partitions:
+            out.extend(_to_list_layout(partition))
+        return out
+    else:
+        return layout.tolist(_to_list_fallback)
+
+
+def _to_list_fallback(array):
+    if isinstance(array, ak.layout.NumpyArray):
+        if array.format.upper().startswith("M"):
+            return (
+                [
+                    x
+                    for x in ak.nplike.of(array)
+                    .asarray(array.view_int64)
+                    .view(array.format)
+                ]
+                # FIXME: .tolist() returns
+                # [[1567416600000000000], [1568367000000000000], [1569096000000000000]]
+                # instead of [numpy.datetime64('2019-09-02T09:30:00'), numpy.datetime64('2019-09-13T09:30:00'), numpy.datetime64('2019-09-21T20:00:00')]
+                # see test_from_pandas() test
+            )
+        else:
+            return ak.nplike.of(array).asarray(array).tolist()
+
+    else:
+        return [to_list(x) for x in array]
+
+
 _maybe_json_str = re.compile(r"^\s*(\[|\{|\"|[0-9]|true|false|null)")
 _maybe_json_bytes = re.compile(br"^\s*(\[|\{|\"|[0-9]|true|false|null)")
 
@@ -1005,10 +1029,14 @@ def from_json(
     initial=1024,
     resize=1.5,
     buffersize=65536,
+    form=None,
+    threads=None,
 ):
     """
     Args:
-        source (str): JSON-formatted string or filename to convert into an array.
+        source (str, Path, or iterable of filenames): JSON-formatted string,
+            filename, glob pattern, or list of filenames to convert into an
+            array.
         nan_string (None or str): If not None, strings with this value will be
             interpreted as floating-point NaN values.
         infinity_string (None or str): If not None, strings with this value will
@@ -1028,6 +1056,11 @@ def from_json(
             should be strictly greater than 1.
         buffersize (int): Size (in bytes) of the buffer used by the JSON
             parser.
+        form (None, #ak.forms.Form, or str/dict equivalent): If not None, the
+            form of the output array; the JSON is parsed directly into its
+            buffers instead of discovering its type with an ArrayBuilder.
+        threads (None or int): Number of threads used to parse multiple files
+            concurrently; if None, the number of CPUs.
 
     Converts a JSON string into an Awkward Array.
 
@@ -1037,6 +1070,26 @@ def from_json(
     and deeply nested JSON can be converted, but the output will never have
     regular-typed array lengths.
 
+    If the type of the data is known in advance, passing a `form` is faster
+    and produces exactly that type (including regular dimensions and
+    specific numeric types). Record fields that are not in the `form` are
+    skipped without being converted, missing fields are None if their form
+    is option-type, and any other mismatch raises an error. The `form` may
+    only contain #ak.forms.NumpyForm (without datetimes or complex numbers),
+    list-type, #ak.forms.RecordForm, option-type, and #ak.forms.EmptyForm
+    nodes; an #ak.forms.UnmaskedForm does not accept None, and integers
+    that don't fit in the form's dtype raise an error. As without a `form`,
+    a single JSON record is returned as an #ak.Record if `form` is an
+    #ak.forms.RecordForm; any other single value that is not an array of
+    items becomes an array of length 1.
+
+    If `source` is a list of filenames or a glob pattern that is not itself a
+    filename, each file is parsed in a thread pool (the parser does not hold
+    the Python GIL) and becomes one partition of an
+    #ak.partition.IrregularlyPartitionedArray, so the files are never
+    concatenated. Each file must contain an array: a single JSON array or a
+    sequence of concatenated values (e.g. JSON-lines).
+
     See also #ak.to_json.
     """
 
@@ -1051,31 +1104,111 @@ def from_json(
     ):
         complex_real_string, complex_imag_string = complex_record_fields
 
+    if isinstance(form, str) or (ak._util.py27 and isinstance(form, ak._util.unicode)):
+        form = ak.forms.Form.fromjson(form)
+    elif isinstance(form, dict):
+        form = ak.forms.Form.fromjson(json.dumps(form))
+
     is_path, source = ak._util.regularize_path(source)
 
+    if (
+        not isinstance(source, (str, bytes))
+        and not (ak._util.py27 and isinstance(source, ak._util.unicode))
+        and isinstance(source, Iterable)
+    ):
+        filenames = [ak._util.regularize_path(x)[1] for x in source]
+        if len(filenames) == 0:
+            raise ValueError("no files to read" + ak._util.exception_suffix(__file__))
+    elif (
+        not isinstance(source, bytes)
+        and not os.path.isfile(source)
+        and (is_path or not _maybe_json_str.match(source))
+        and _glob_magic.search(source)
+    ):
+        filenames = sorted(glob.glob(source))
+        if len(filenames) == 0:
+            if ak._util.py27:
+                exc = IOError
+            else:
+                exc = FileNotFoundError
+            raise exc("no files match glob pattern: {0}".format(source))
+    else:
+        filenames = None
+
+    options = {
+        "nan_string": nan_string,
+        "infinity_string": infinity_string,
+        "minus_infinity_string": minus_infinity_string,
+        "initial": initial,
+        "resize": resize,
+        "buffersize": buffersize,
+        "form": form,
+    }
+
+    if filenames is None:
+        layout = _from_json_source(source, is_path, options)
+        if complex_imag_string is not None:
+            layout = _record_to_complex(layout, complex_record_fields)
+
+    else:
+
+        def read(filename):
+            if not os.path.isfile(filename):
+                if ak._util.py27:
+                    exc = IOError
+                else:
+                    exc = FileNotFoundError
+                raise exc("file not found or not a regular file: {0}".format(filename))
+
+            partition = ak._ext.fromjsonfile(filename, **options)
+            if isinstance(partition, ak.layout.Record):
+                partition = partition.array[partition.at : partition.at + 1]
+            elif not isinstance(partition, ak.layout.Content):
+                raise ValueError(
+                    "file does not contain an array: {0}".format(filename)
+                    + ak._util.exception_suffix(__file__)
+                )
+            if complex_imag_string is not None:
+                partition = _record_to_complex(partition, complex_record_fields)
+            return partition
+
+        import multiprocessing.pool
+
+        if threads is None:
+            threads = multiprocessing.cpu_count()
+        threads = min(threads, len(filenames))
+
+        if threads > 1:
+            pool = multiprocessing.pool.ThreadPool(threads)
+            try:
+                partitions = pool.map(read, filenames)
+            finally:
+                pool.terminate()
+                pool.join()
+        else:
+            partitions = [read(x) for x in filenames]
+
+        if len(partitions) == 1:
+            layout = partitions[0]
+        else:
+            layout = ak.partition.IrregularlyPartitionedArray(partitions)
+
+    return ak._util.maybe_wrap(layout, behavior, highlevel)
+
+
+_glob_magic = re.compile(r"[*?[]")
+
+
+def _from_json_source(source, is_path, options):
     if os.path.isfile(source):
-        layout = ak._ext.fromjsonfile(
-            source,
-            nan_string=nan_string,
-            infinity_string=infinity_string,
-            minus_infinity_string=minus_infinity_string,
-            initial=initial,
-            resize=resize,
-            buffersize=buffersize,
-        )
+        return ak._ext.fromjsonfile(source, **options)
+
     elif not is_path and (
         (isinstance(source, bytes) and _maybe_json_bytes.match(source))
         or _maybe_json_str.match(source)
     ):
-        layout = ak._ext.fromjson(
-            source,
-            nan_string=nan_string,
-            infinity_string=infinity_string,
-            minus_infinity_string=minus_infinity_string,
-            initial=initial,
-            resize=resize,
-            buffersize=buffersize,
-        )
+        return ak._ext.fromjson(source, **options)
+
     else:
         if ak._util.py27:
             exc = IOError
@@ -1083,6 +1216,8 @@ def from_json(
             exc = FileNotFoundError
         raise exc("file not found or not a regular file: {0}".format(source))
 
+
+def _record_to_complex(layout, complex_record_fields):
     def getfunction(recordnode):
         if isinstance(recordnode, ak.layout.RecordArray):
             keys = recordnode.keys()
@@ -1108,10 +1243,128 @@ def from_json(
         else:
             return None
 
-    if complex_imag_string is not None:
-        layout = ak._util.recursively_apply(layout, getfunction, pass_depth=False)
+    return ak._util.recursively_apply(layout, getfunction, pass_depth=False)
 
-    return ak._util.maybe_wrap(layout, behavior, highlevel)
+
+def iter_json(
+    source,
+    max_records=None,
+    max_bytes=16777216,
+    nan_string=None,
+    infinity_string=None,
+    minus_infinity_string=None,
+    complex_record_fields=None,
+    highlevel=True,
+    behavior=None,
+    initial=1024,
+    resize=1.5,
+    buffersize=65536,
+):
+    """
+    Args:
+        source (str): JSON-formatted string or filename to convert into arrays.
+        max_records (None or int): If not None, the maximum number of top-level
+            JSON values in each chunk.
+        max_bytes (None or int): If not None, a chunk ends after the first
+            complete JSON value that brings the number of bytes parsed in the
+            chunk to at least this number.
+        nan_string (None or str): If not None, strings with this value will be
+            interpreted as floating-point NaN values.
+        infinity_string (None or str): If not None, strings with this value will
+            be interpreted as floating-point positive infinity values.
+        minus_infinity_string (None or str): If not None, strings with this value
+            will be interpreted as floating-point negative infinity values.
+        complex_record_fields (None or (str, str)): If not None, defines a pair of
+            field names to interpret records as complex numbers.
+        highlevel (bool): If True, yield #ak.Array; otherwise, yield
+            low-level #ak.layout.Content subclasses.
+        behavior (None or dict): Custom #ak.behavior for the output arrays, if
+            high-level.
+        initial (int): Initial size (in bytes) of buffers used by
+            #ak.layout.ArrayBuilder (see #ak.layout.ArrayBuilderOptions).
+        resize (float): Resize multiplier for buffers used by
+            #ak.layout.ArrayBuilder (see #ak.layout.ArrayBuilderOptions);
+            should be strictly greater than 1.
+        buffersize (int): Size (in bytes) of the buffer used by the JSON
+            parser.
+
+    Iterates over a stream of concatenated JSON values, such as a
+    newline-delimited "JSON lines" file, yielding one array per chunk of
+    values. Each top-level JSON value becomes one entry of a chunk, so a
+    file containing a single JSON array yields one chunk of length 1.
+
+    Only one chunk is built at a time and the #ak.layout.ArrayBuilder
+    buffers are released between chunks, so peak memory is bounded by the
+    chunk size (`max_records` and/or `max_bytes`), not by the size of the
+    input. If both limits are None, the whole input is one chunk.
+
+    The chunks can be processed one at a time or combined, without
+    concatenating them, into a partitioned array:
+
+        ak.partitioned(list(ak.iter_json("big.jsonl", max_records=100000)))
+
+    though the types of chunks can differ if, for instance, a field is
+    missing in all of the values in one chunk.
+
+    See also #ak.from_json.
+    """
+    if complex_record_fields is not None and not (
+        isinstance(complex_record_fields, tuple)
+        and len(complex_record_fields) == 2
+        and isinstance(complex_record_fields[0], str)
+        and isinstance(complex_record_fields[1], str)
+    ):
+        complex_record_fields = None
+
+    is_path, source = ak._util.regularize_path(source)
+
+    if os.path.isfile(source):
+        isfile = True
+    elif not is_path and (
+        (isinstance(source, bytes) and _maybe_json_bytes.match(source))
+        or _maybe_json_str.match(source)
+    ):
+        isfile = False
+    else:
+        if ak._util.py27:
+            exc = IOError
+        else:
+            exc = FileNotFoundError
+        raise exc("file not found or not a regular file: {0}".format(source))
+
+    iterator = ak._ext.FromJsonIterator(
+        source,
+        isfile,
+        nan_string=nan_string,
+        infinity_string=infinity_string,
+        minus_infinity_string=minus_infinity_string,
+        initial=initial,
+        resize=resize,
+        buffersize=buffersize,
+    )
+    return _iter_json_chunks(
+        iterator,
+        0 if max_records is None else max_records,
+        0 if max_bytes is None else max_bytes,
+        complex_record_fields,
+        highlevel,
+        behavior,
+    )
+
+
+def _iter_json_chunks(
+    iterator, max_records, max_bytes, complex_record_fields, highlevel, behavior
+):
+    try:
+        while True:
+            layout = iterator.next(max_records, max_bytes)
+            if layout is None:
+                break
+            if complex_record_fields is not None:
+                layout = _record_to_complex(layout, complex_record_fields)
+            yield ak._util.maybe_wrap(layout, behavior, highlevel)
+    finally:
+        iterator.close()
 
 
 def to_json(
@@ -1957,15 +2210,18 @@ or
             )
         )
     else:
-        if distutils.version.LooseVersion(
-            pyarrow.__version__
-        ) < distutils.version.LooseVersion("2.0.0"):
+        if ak._util.version_tuple(pyarrow.__version__) < (2, 0, 0):
             raise ImportError("pyarrow 2.0.0 or later required for {0}".format(name))
         return pyarrow
 
 
 def to_arrow(
-    array, list_to32=False, string_to32=True, bytestring_to32=True, allow_tensor=True
+    array,
+    list_to32=False,
+    string_to32=True,
+    bytestring_to32=True,
+    allow_tensor=True,
+    copy_report=None,
 ):
     """
     Args:
@@ -1979,6 +2235,10 @@ def to_arrow(
         allow_tensor (bool): If True, convert regular-length lists to `pyarrow.lib.Tensor`;
             otherwise, make `pyarrow.lib.ListArray` (generating offsets). This is used
             by #ak.to_parquet, since Parquet files can't contain regular-length tensors.
+        copy_report (None or list): If a list, a `(path, node, reason)` tuple is
+            appended to it for each node whose buffers had to be copied, where
+            `path` is the dot-separated field names leading to the node and `node`
+            is its class name.
 
     Converts an Awkward Array into an Apache Arrow array.
 
@@ -1986,6 +2246,12 @@ def to_arrow(
     manipulations (using the pyarrow library) to build a `pyarrow.ChunkedArray`,
     a `pyarrow.RecordBatch`, or a `pyarrow.Table`.
 
+    Buffers that are already in Arrow's format are passed to Arrow without
+    copying: contiguous non-boolean #ak.layout.NumpyArray, #ak.layout.ListOffsetArray
+    with 32-bit or (if not narrowed to 32 bits) 64-bit offsets, #ak.layout.RecordArray,
+    and #ak.layout.BitMaskedArray with `lsb_order=True` and `valid_when=True`.
+    An empty `copy_report` after the conversion means that it was zero-copy.
+
     Arrow arrays can maintain the distinction between "option-type but no elements are
     missing" and "not option-type" at all levels except the top level. Also, there is
     no distinction between `?union[X, Y, Z]]` type and `union[?X, ?Y, ?Z]` type. Be
@@ -1997,14 +2263,25 @@ def to_arrow(
 
     layout = to_layout(array, allow_record=False, allow_other=False)
 
+    path = []
+
+    def copied(layout, reason):
+        if copy_report is not None:
+            copy_report.append((".".join(path), type(layout).__name__, reason))
+
     def recurse(layout, mask, is_option):
         if isinstance(layout, ak.layout.NumpyArray):
             numpy_arr = numpy.asarray(layout)
             length = len(numpy_arr)
             arrow_type = pyarrow.from_numpy_dtype(numpy_arr.dtype)
 
+            if not numpy_arr.flags["C_CONTIGUOUS"]:
+                copied(layout, "non-contiguous data made contiguous")
+                numpy_arr = numpy.ascontiguousarray(numpy_arr)
+
             if issubclass(numpy_arr.dtype.type, (bool, np.bool_)):
                 if numpy_arr.ndim == 1:
+                    copied(layout, "booleans packed into bits")
                     if len(numpy_arr) % 8 == 0:
                         ready_to_pack = numpy_arr
                     else:
@@ -2127,6 +2404,7 @@ def to_arrow(
             offsets = numpy.asarray(layout.offsets)
 
             if downsize and offsets[-1] <= np.iinfo(np.int32).max:
+                copied(layout, "offsets narrowed to 32 bits")
                 small_layout = ak.layout.ListOffsetArray32(
                     ak.layout.Index32(offsets.astype(np.int32)),
                     layout.content,
@@ -2134,6 +2412,8 @@ def to_arrow(
                 )
                 return recurse(small_layout, mask, is_option)
 
+            if offsets.dtype != np.dtype(np.int64):
+                copied(layout, "offsets widened to 64 bits")
             offsets = numpy.asarray(layout.offsets, dtype=np.int64)
 
             if layout.parameter("__array__") == "bytestring":
@@ -2200,6 +2480,7 @@ def to_arrow(
             return arrow_arr
 
         elif isinstance(layout, ak.layout.RegularArray):
+            copied(layout, "offsets generated")
             return recurse(
                 layout.broadcast_tooffsets64(layout.compact_offsets64()),
                 mask,
@@ -2214,6 +2495,7 @@ def to_arrow(
                 ak.layout.ListArray64,
             ),
         ):
+            copied(layout, "starts and stops compacted into offsets")
             return recurse(
                 layout.broadcast_tooffsets64(layout.compact_offsets64()),
                 mask,
@@ -2221,9 +2503,11 @@ def to_arrow(
             )
 
         elif isinstance(layout, ak.layout.RecordArray):
-            values = [
-                recurse(x[: len(layout)], mask, is_option) for x in layout.contents
-            ]
+            values = []
+            for key, x in zip(layout.keys(), layout.contents):
+                path.append(key)
+                values.append(recurse(x[: len(layout)], mask, is_option))
+                path.pop()
 
             min_list_len = min(map(len, values))
 
@@ -2257,6 +2541,7 @@ def to_arrow(
             index = numpy.asarray(layout.index)
             copied_index = False
             if mask is not None:
+                copied(layout, "mask distributed to the union's contents")
                 bytemask = (
                     numpy.unpackbits(mask)
                     .reshape(-1, 8)[:, ::-1]
@@ -2306,13 +2591,16 @@ def to_arrow(
                 list(range(len(values))),
             )
 
+            if index.dtype != np.dtype(np.int32):
+                copied(layout, "index converted to 32 bits")
+
             return pyarrow.Array.from_buffers(
                 types,
                 len(layout.tags),
                 [
                     None,
                     pyarrow.py_buffer(tags),
-                    pyarrow.py_buffer(index.astype(np.int32)),
+                    pyarrow.py_buffer(index.astype(np.int32, copy=False)),
                 ],
                 children=values,
             )
@@ -2332,6 +2620,7 @@ def to_arrow(
                 if mask is None:
                     return pyarrow.DictionaryArray.from_arrays(index, dictionary)
                 else:
+                    copied(layout, "mask unpacked into bytes")
                     bytemask = (
                         numpy.unpackbits(~mask)
                         .reshape(-1, 8)[:, ::-1]
@@ -2353,10 +2642,14 @@ def to_arrow(
                         return pyarrow.array([None] * len(index)).cast(empty.type)
 
                 elif isinstance(layout_content, ak.layout.RecordArray):
-                    values = [
-                        recurse(x[: len(layout_content)][index], mask, is_option)
-                        for x in layout_content.contents
-                    ]
+                    copied(layout, "fields gathered by index")
+                    values = []
+                    for key, x in zip(layout_content.keys(), layout_content.contents):
+                        path.append(key)
+                        values.append(
+                            recurse(x[: len(layout_content)][index], mask, is_option)
+                        )
+                        path.pop()
 
                     min_list_len = min(map(len, values))
 
@@ -2386,12 +2679,14 @@ def to_arrow(
                         )
 
                 else:
+                    copied(layout, "content gathered by index")
                     return recurse(layout_content[index], mask, is_option)
 
         elif isinstance(
             layout,
             (ak.layout.IndexedOptionArray32, ak.layout.IndexedOptionArray64),
         ):
+            copied(layout, "index converted to a validity bitmap")
             index = numpy.array(layout.index, copy=True)
             nulls = index < 0
             index[nulls] = 0
@@ -2443,11 +2738,13 @@ def to_arrow(
             bitmask = numpy.asarray(layout.mask, dtype=np.uint8)
 
             if layout.lsb_order is False:
+                copied(layout, "bit order reversed")
                 bitmask = numpy.packbits(
                     numpy.unpackbits(bitmask).reshape(-1, 8)[:, ::-1].reshape(-1)
                 )
 
             if layout.valid_when is False:
+                copied(layout, "mask inverted")
                 bitmask = ~bitmask
 
             return recurse(layout.content[: len(layout)], bitmask, True).slice(
@@ -2455,6 +2752,7 @@ def to_arrow(
             )
 
         elif isinstance(layout, ak.layout.ByteMaskedArray):
+            copied(layout, "byte mask packed into bits")
             mask = numpy.asarray(layout.mask, dtype=np.bool_) == layout.valid_when
 
             bytemask = numpy.zeros(
@@ -2494,6 +2792,7 @@ def to_arrow_table(
     list_to32=False,
     string_to32=True,
     bytestring_to32=True,
+    copy_report=None,
 ):
     """
     Args:
@@ -2507,6 +2806,9 @@ def to_arrow_table(
             all others map to Arrow `LargeListType`.
         string_to32 (bool): Same as the above for Arrow `string` and `large_string`.
         bytestring_to32 (bool): Same as the above for Arrow `binary` and `large_binary`.
+        copy_report (None or list): If a list, a `(path, node, reason)` tuple is
+            appended to it for each node whose buffers had to be copied (see
+            #ak.to_arrow).
 
     Converts an Awkward Array into an Apache Arrow table (`pyarrow.Table`).
 
@@ -2536,14 +2838,21 @@ def to_arrow_table(
     pa_arrays = []
     pa_fields = []
     for name, content in zip(names, contents):
+        column_report = None if copy_report is None else []
         pa_arrays.append(
             to_arrow(
                 content,
                 list_to32=list_to32,
                 string_to32=string_to32,
                 bytestring_to32=bytestring_to32,
+                copy_report=column_report,
             )
         )
+        if copy_report is not None:
+            for path, node, reason in column_report:
+                copy_report.append(
+                    (".".join(x for x in (name, path) if x != ""), node, reason)
+                )
         pa_fields.append(
             pyarrow.field(name, pa_arrays[-1].type).with_nullable(
                 isinstance(ak.operations.describe.type(content), ak.types.OptionType)
@@ -2554,7 +2863,7 @@ def to_arrow_table(
     return pyarrow.Table.from_batches([batch])
 
 
-def from_arrow(array, highlevel=True, behavior=None):
+def from_arrow(array, highlevel=True, behavior=None, copy_report=None):
     """
     Args:
         array (`pyarrow.Array`, `pyarrow.ChunkedArray`, `pyarrow.RecordBatch`,
@@ -2564,9 +2873,19 @@ def from_arrow(array, highlevel=True, behavior=None):
             a low-level #ak.layout.Content subclass.
         behavior (None or dict): Custom #ak.behavior for the output array, if
             high-level.
+        copy_report (None or list): If a list, a `(path, node, reason)` tuple is
+            appended to it for each Arrow array whose buffers had to be copied,
+            where `path` is the dot-separated field names leading to the array and
+            `node` is its Arrow type.
 
     Converts an Apache Arrow array into an Awkward Array.
 
+    Buffers of primitive (other than boolean and 32-bit date/time), list, string,
+    and struct arrays and their validity bitmaps are wrapped without copying.
+    Chunked arrays and tables with more than one chunk are concatenated, which
+    copies them. An empty `copy_report` after the conversion means that it was
+    zero-copy.
+
     Arrow arrays can maintain the distinction between "option-type but no elements are
     missing" and "not option-type" at all levels except the top level. Arrow tables
     can maintain the distinction at all levels. However, note that there is no distinction
@@ -2575,7 +2894,9 @@ def from_arrow(array, highlevel=True, behavior=None):
 
     See also #ak.to_arrow, #ak.to_arrow_table.
     """
-    return _from_arrow(array, True, highlevel=highlevel, behavior=behavior)
+    return _from_arrow(
+        array, True, highlevel=highlevel, behavior=behavior, copy_report=copy_report
+    )
 
 
 _pyarrow_to_numpy_dtype = {
@@ -2599,15 +2920,29 @@ _pyarrow_to_numpy_dtype = {
 
 
 def _from_arrow(
-    array, pass_empty_field, struct_only=None, highlevel=True, behavior=None
+    array,
+    pass_empty_field,
+    struct_only=None,
+    highlevel=True,
+    behavior=None,
+    copy_report=None,
 ):
     pyarrow = _import_pyarrow("ak.from_arrow")
 
+    path = []
+
+    def copied(tpe, reason):
+        if copy_report is not None:
+            copy_report.append((".".join(path), str(tpe), reason))
+
     def popbuffers(array, tpe, buffers):
         if isinstance(tpe, pyarrow.lib.DictionaryType):
             index = popbuffers(array.indices, tpe.index_type, buffers)
             content = handle_arrow(array.dictionary)
 
+            if numpy.asarray(index.content).dtype != np.dtype(np.int32):
+                copied(tpe, "index converted to 32 bits")
+
             out = ak.layout.IndexedArray32(
                 ak.layout.Index32(index.content),
                 content,
@@ -2635,7 +2970,9 @@ def _from_arrow(
 
             if struct_only is None:
                 for i in range(tpe.num_fields):
+                    path.append(tpe[i].name)
                     content = popbuffers(array.field(tpe[i].name), tpe[i].type, buffers)
+                    path.pop()
                     if not tpe[i].nullable:
                         content = content.content
                     child_arrays.append(content)
@@ -2713,6 +3050,7 @@ def _from_arrow(
             mask = buffers.pop(0)
             tags = numpy.frombuffer(buffers.pop(0), dtype=np.int8)
             if tpe.mode == "sparse":
+                copied(tpe, "index generated for sparse union")
                 index = numpy.arange(len(tags), dtype=np.int32)
             else:
                 index = numpy.frombuffer(buffers.pop(0), dtype=np.int32)
@@ -2797,6 +3135,7 @@ def _from_arrow(
             assert tpe.num_buffers == 2
             mask = buffers.pop(0)
             data = buffers.pop(0)
+            copied(tpe, "bits unpacked into booleans")
             as_bytes = (
                 numpy.unpackbits(numpy.frombuffer(data, dtype=np.uint8))
                 .reshape(-1, 8)[:, ::-1]
@@ -2810,6 +3149,7 @@ def _from_arrow(
             mask = buffers.pop(0)
             assert tpe.num_fields == 0
             assert mask is None
+            copied(tpe, "index of missing values generated")
             out = ak.layout.IndexedOptionArray64(
                 ak.layout.Index64(numpy.full(len(array), -1, dtype=np.int64)),
                 ak.layout.EmptyArray(),
@@ -2823,6 +3163,7 @@ def _from_arrow(
 
             to64, dt = _pyarrow_to_numpy_dtype.get(str(tpe), (False, None))
             if to64:
+                copied(tpe, "32-bit values widened to 64 bits")
                 data = numpy.frombuffer(data, dtype=np.int32).astype(np.int64)
             if dt is None:
                 dt = tpe.to_pandas_dtype()
@@ -2866,12 +3207,15 @@ def _from_arrow(
             if len(layouts) == 1:
                 return layouts[0]
             else:
+                copied(obj.type, "chunks concatenated")
                 return ak.operations.structure.concatenate(layouts, highlevel=False)
 
         elif isinstance(obj, pyarrow.lib.RecordBatch):
             child_array = []
             for i in range(obj.num_columns):
+                path.append(obj.schema.field(i).name)
                 layout = handle_arrow(obj.column(i))
+                path.pop()
                 if obj.schema.field(i).nullable and not isinstance(
                     layout, ak._util.optiontypes
                 ):
@@ -2883,6 +3227,11 @@ def _from_arrow(
                 return ak.layout.RecordArray(child_array, obj.schema.names)
 
         elif isinstance(obj, pyarrow.lib.Table):
+            for column, name in zip(obj.columns, obj.schema.names):
+                if column.num_chunks > 1:
+                    path.append(name)
+                    copied(column.type, "chunks concatenated")
+                    path.pop()
             batches = obj.combine_chunks().to_batches()
             if len(batches) == 0:
                 # zero-length array with the right type
@@ -2908,6 +3257,7 @@ def _from_arrow(
             if len(chunks) == 1:
                 return chunks[0]
             else:
+                copied("RecordBatch", "chunks concatenated")
                 return ak.operations.structure.concatenate(chunks, highlevel=False)
 
         else:
@@ -3435,6 +3785,16 @@ class _Dataset(object):
     def row_group_metadata(self):
         raise NotImplementedError
 
+    def paths_and_counts(self, row_groups):
+        raise NotImplementedError
+
+    def select_row_groups(self, row_groups):
+        self.row_groups = row_groups
+        if self.partition_columns != [] and len(row_groups) != 0:
+            self.partition_columns = _parquet_partitions_to_awkward(
+                self.paths_and_counts(row_groups)
+            )
+
     def read_row_group(self, row_group, columns=None):
         raise NotImplementedError
 
@@ -3468,6 +3828,12 @@ class _ParquetFileDataset(_Dataset):
         schema = _partial_schema_from_columns(schema, columns)
 
         self._use_threads = use_threads
+        if hasattr(source, "read"):
+            # a Python file-like object has one position, so concurrent
+            # readers must take turns
+            self._lock = threading.Lock()
+        else:
+            self._lock = None
 
         super(_ParquetFileDataset, self).__init__(
             schema, row_groups, columns, partition_columns=[]
@@ -3481,9 +3847,15 @@ class _ParquetFileDataset(_Dataset):
         if columns is None:
             columns = self.columns
 
-        return self._file.read_row_group(
-            row_group, columns=columns, use_threads=self._use_threads
-        )
+        if self._lock is None:
+            return self._file.read_row_group(
+                row_group, columns=columns, use_threads=self._use_threads
+            )
+        else:
+            with self._lock:
+                return self._file.read_row_group(
+                    row_group, columns=columns, use_threads=self._use_threads
+                )
 
 
 class _ParquetDataset(_Dataset):
@@ -3512,7 +3884,7 @@ class _ParquetDataset(_Dataset):
             columns = schema.names
         schema = _partial_schema_from_columns(schema, columns)
 
-        if include_partition_columns:
+        if include_partition_columns and len(row_groups) != 0:
             paths_and_counts = self._get_paths_and_counts(
                 self._metadata_file, row_groups
             )
@@ -3574,6 +3946,9 @@ class _ParquetDataset(_Dataset):
     def row_group_metadata(self):
         return [self._metadata_file.metadata.row_group(i) for i in self.row_groups]
 
+    def paths_and_counts(self, row_groups):
+        return self._get_paths_and_counts(self._metadata_file, row_groups)
+
     def read_row_group(self, row_group, columns=None):
         if columns is None:
             columns = self.columns
@@ -3599,14 +3974,15 @@ class _ParquetMultiFileDataset(_Dataset):
         include_partition_columns=True,
         options=None,
     ):
-        schema, lookup, paths_and_counts = self._get_dataset_metadata(
-            source, relative_to, options
-        )
+        schema, lookup = self._get_dataset_metadata(source, relative_to, options)
+        self._lookup = lookup
         if row_groups is None:
             row_groups = range(len(lookup))
 
-        if include_partition_columns:
-            partition_columns = _parquet_partitions_to_awkward(paths_and_counts)
+        if include_partition_columns and len(row_groups) != 0:
+            partition_columns = _parquet_partitions_to_awkward(
+                self.paths_and_counts(row_groups)
+            )
         else:
             partition_columns = []
 
@@ -3614,7 +3990,6 @@ class _ParquetMultiFileDataset(_Dataset):
             columns = schema.names
         schema = _partial_schema_from_columns(schema, columns)
 
-        self._lookup = lookup
         self._use_threads = use_threads
         super(_ParquetMultiFileDataset, self).__init__(
             schema, row_groups, columns, partition_columns
@@ -3626,7 +4001,6 @@ class _ParquetMultiFileDataset(_Dataset):
 
         schema = None
         lookup = []
-        paths_and_counts = []
         for filename in source:
             single_file = pyarrow.parquet.ParquetFile(filename, **options)
             if schema is None:
@@ -3639,25 +4013,34 @@ class _ParquetMultiFileDataset(_Dataset):
                     )
                     + ak._util.exception_suffix(__file__)
                 )
+            path = os.path.relpath(filename, relative_to)
             for i in range(single_file.num_row_groups):
-                lookup.append((single_file, i))
-            paths_and_counts.append(
-                (os.path.relpath(filename, relative_to), single_file.metadata.num_rows)
-            )
-        return schema, lookup, paths_and_counts
+                lookup.append((single_file, i, path))
+        return schema, lookup
 
     @property
     def row_group_metadata(self):
         return [
             f.metadata.row_group(g)
-            for f, g in (self._lookup[g] for g in self.row_groups)
+            for f, g, _ in (self._lookup[g] for g in self.row_groups)
         ]
 
+    def paths_and_counts(self, row_groups):
+        paths_and_counts = []
+        for row_group in row_groups:
+            single_file, local_row_group, path = self._lookup[row_group]
+            count = single_file.metadata.row_group(local_row_group).num_rows
+            if len(paths_and_counts) != 0 and paths_and_counts[-1][0] == path:
+                paths_and_counts[-1][1] += count
+            else:
+                paths_and_counts.append([path, count])
+        return paths_and_counts
+
     def read_row_group(self, row_group, columns=None):
         if columns is None:
             columns = self.columns
 
-        single_file, local_row_group = self._lookup[row_group]
+        single_file, local_row_group, _ = self._lookup[row_group]
 
         return single_file.read_row_group(
             local_row_group, columns, use_threads=self._use_threads
@@ -3722,6 +4105,108 @@ def _partial_schema_from_columns(schema, columns):
     return pyarrow.schema(pa_fields)
 
 
+_parquet_filter_ops = ("==", "=", "!=", "<", "<=", ">", ">=", "in", "not in")
+
+
+def _parquet_regularize_filter(filter):
+    if isinstance(filter, tuple):
+        disjunction = [[filter]]
+    elif all(isinstance(x, tuple) for x in filter):
+        disjunction = [list(filter)]
+    else:
+        disjunction = [list(x) for x in filter]
+
+    for conjunction in disjunction:
+        for term in conjunction:
+            if (
+                not isinstance(term, tuple)
+                or len(term) != 3
+                or not ak._util.isstr(term[0])
+                or term[1] not in _parquet_filter_ops
+            ):
+                raise ValueError(
+                    "filter terms must be (column, op, value) tuples with op in "
+                    "{0}, not {1}".format(", ".join(_parquet_filter_ops), repr(term))
+                    + ak._util.exception_suffix(__file__)
+                )
+    return disjunction
+
+
+def _parquet_leaf_name(path_in_schema):
+    # "y.list.item.z" is field "z" of the records in list "y", which a
+    # filter names as "y.z"
+    parts = path_in_schema.split(".")
+    out = []
+    i = 0
+    while i < len(parts):
+        if (
+            parts[i] == "list"
+            and i + 1 < len(parts)
+            and parts[i + 1] in ("item", "element")
+        ):
+            i += 2
+        else:
+            out.append(parts[i])
+            i += 1
+    return ".".join(out)
+
+
+def _parquet_statistics_may_match(statistics, op, value):
+    if statistics is None or not statistics.has_min_max:
+        return True
+    low, high = statistics.min, statistics.max
+    try:
+        if op in ("==", "="):
+            return low <= value <= high
+        elif op == "!=":
+            return not (low == high == value)
+        elif op == "<":
+            return low < value
+        elif op == "<=":
+            return low <= value
+        elif op == ">":
+            return high > value
+        elif op == ">=":
+            return high >= value
+        elif op == "in":
+            return any(low <= x <= high for x in value)
+        else:
+            return not (low == high and low in value)
+    except TypeError:
+        # values that can't be compared with the statistics can't rule out
+        # the row group
+        return True
+
+
+def _parquet_filter_row_groups(dataset, filter):
+    disjunction = _parquet_regularize_filter(filter)
+    selected = []
+    for row_group, metadata in zip(dataset.row_groups, dataset.row_group_metadata):
+        statistics = {}
+        for i in range(metadata.num_columns):
+            column = metadata.column(i)
+            statistics[_parquet_leaf_name(column.path_in_schema)] = column.statistics
+
+        for conjunction in disjunction:
+            for column, _, _ in conjunction:
+                if column not in statistics:
+                    raise ValueError(
+                        "filter column {0} is not a leaf column of the Parquet "
+                        "schema (nested fields are named like 'x.y')".format(
+                            repr(column)
+                        )
+                        + ak._util.exception_suffix(__file__)
+                    )
+            if all(
+                _parquet_statistics_may_match(statistics[column], op, value)
+                for column, op, value in conjunction
+            ):
+                selected.append(row_group)
+                break
+
+    return selected
+
+
 def _create_partitioned_array_from_form(
     form,
     state,
@@ -3774,7 +4259,7 @@ def _create_partitioned_array_from_form(
                 field_names = recordlookup
                 fields = contents
             else:
-                start, stop = offsets[row_group], offsets[row_group + 1]
+                start, stop = offsets[length_index], offsets[length_index + 1]
                 field_names = [x[0] for x in partition_columns] + recordlookup
                 fields = [x[1][start:stop] for x in partition_columns] + contents
             recordarray = ak.layout.RecordArray(fields, field_names, length)
@@ -3786,84 +4271,151 @@ def _create_partitioned_array_from_form(
         return ak.partition.IrregularlyPartitionedArray(partitions, offsets[1:])
 
 
-def _regularize_lazy_cache(lazy_cache):
-    hold_cache = None
-    if lazy_cache is None:
-        pass
-    # Wrap existing ArrayCache's internal cache
-    elif isinstance(lazy_cache, ak.layout.ArrayCache):
-        pass
+def _parquet_tables_to_layout(tables):
+    batches = [x for table in tables for x in table.to_batches() if len(x) > 0]
+    if len(batches) == 0:
+        # zero-length array with the right type
+        return _from_arrow(tables[0], False, highlevel=False)
     else:
-        if lazy_cache == "new":
-            hold_cache = ak._util.MappingProxy({})
-        elif lazy_cache == "attach":
-            raise TypeError("lazy_cache must be a MutableMapping")
-        else:
-            hold_cache = ak._util.MappingProxy.maybe_wrap(lazy_cache)
-            if not isinstance(hold_cache, MutableMapping):
-                raise TypeError("lazy_cache must be a MutableMapping")
-        lazy_cache = ak.layout.ArrayCache(hold_cache)
-    return lazy_cache, hold_cache
+        return _from_arrow(batches, False, highlevel=False)
 
 
-def _regularize_parquet_lazy_cache_key(lazy_cache_key):
-    if lazy_cache_key is None:
-        lazy_cache_key = "ak.from_parquet:{0}".format(_from_parquet_key())
-    return lazy_cache_key
+def _parquet_empty_layout(form):
+    # a length-0 layout with the type of a _parquet_schema_to_form Form,
+    # for when no row groups are read
+    if isinstance(form, ak.forms.VirtualForm):
+        return _parquet_empty_layout(form.form)
 
+    elif isinstance(form, ak.forms.RecordForm):
+        keys = form.keys()
+        return ak.layout.RecordArray(
+            [_parquet_empty_layout(form.contents[x]) for x in keys],
+            keys,
+            0,
+            parameters=form.parameters,
+        )
 
-def from_parquet(
-    source,
-    columns=None,
-    row_groups=None,
-    use_threads=True,
-    include_partition_columns=True,
-    lazy=False,
-    lazy_cache="new",
-    lazy_cache_key=None,
-    highlevel=True,
-    behavior=None,
-    **options  # NOTE: a comma after **options breaks Python 2
-):
-    """
-    Args:
-        source (str, Path, file-like object, pyarrow.NativeFile): Where to
-            get the Parquet file. If `source` is the name of a local directory
-            (str or Path), then it is interpreted as a partitioned Parquet dataset.
-        columns (None or list of str): If None, read all columns; otherwise,
-            read a specified set of columns.
-        row_groups (None, int, or list of int): If None, read all row groups;
-            otherwise, read a single or list of row groups.
-        use_threads (bool): Passed to the pyarrow.parquet.ParquetFile.read
-            functions; if True, do multithreaded reading.
-        include_partition_columns (bool): If True and `source` is a partitioned
-            Parquet dataset with subdirectory names defining partition names
-            and values, include those special columns in the output.
-        lazy (bool): If True, read columns in row groups on demand (as
-            #ak.layout.VirtualArray, possibly in #ak.partition.PartitionedArray
-            if the file has more than one row group); if False, read all
-            requested data immediately.
-        lazy_cache (None, "new", or MutableMapping): If lazy, pass this
-            cache to the VirtualArrays. If "new", a new dict (keep-forever cache)
-            is created. If None, no cache is used.
-        lazy_cache_key (None or str): If lazy, pass this cache_key to the
-            VirtualArrays. If None, a process-unique string is constructed.
-        highlevel (bool): If True, return an #ak.Array; otherwise, return
-            a low-level #ak.layout.Content subclass.
-        behavior (None or dict): Custom #ak.behavior for the output array, if
-            high-level.
-        options: All other options are passed to pyarrow.parquet.ParquetFile.
+    elif isinstance(form, ak.forms.ListOffsetForm):
+        if form.offsets == "i32":
+            offsets = ak.layout.Index32(numpy.zeros(1, np.int32))
+            cls = ak.layout.ListOffsetArray32
+        else:
+            offsets = ak.layout.Index64(numpy.zeros(1, np.int64))
+            cls = ak.layout.ListOffsetArray64
+        return cls(
+            offsets, _parquet_empty_layout(form.content), parameters=form.parameters
+        )
 
-    Reads a Parquet file into an Awkward Array (through pyarrow).
+    elif isinstance(form, ak.forms.ByteMaskedForm):
+        return ak.layout.ByteMaskedArray(
+            ak.layout.Index8(numpy.zeros(0, np.int8)),
+            _parquet_empty_layout(form.content),
+            form.valid_when,
+            parameters=form.parameters,
+        )
 
-        >>> ak.from_parquet("array1.parquet")
-        <Array [[1, 2, 3], [], ... [], [6, 7, 8, 9]] type='6 * var * ?int64'>
+    elif isinstance(form, ak.forms.IndexedOptionForm):
+        return ak.layout.IndexedOptionArray64(
+            ak.layout.Index64(numpy.zeros(0, np.int64)),
+            _parquet_empty_layout(form.content),
+            parameters=form.parameters,
+        )
+
+    elif isinstance(form, ak.forms.NumpyForm):
+        return ak.layout.NumpyArray(
+            numpy.zeros((0,) + tuple(form.inner_shape), form.to_numpy()),
+            parameters=form.parameters,
+        )
+
+    elif isinstance(form, ak.forms.EmptyForm):
+        return ak.layout.EmptyArray(parameters=form.parameters)
+
+    else:
+        raise AssertionError(
+            "unexpected Form: {0}".format(type(form))
+            + ak._util.exception_suffix(__file__)
+        )
 
-    See also #ak.from_arrow, which is used as an intermediate step.
-    See also #ak.to_parquet.
-    """
-    _import_pyarrow("ak.from_parquet")
 
+def _parquet_finish_layout(dataset, layout, start):
+    assert isinstance(layout, ak.layout.RecordArray) and not layout.istuple
+    if dataset.partition_columns != []:
+        stop = start + len(layout)
+        field_names = [x[0] for x in dataset.partition_columns]
+        fields = [x[1][start:stop] for x in dataset.partition_columns]
+        return ak.layout.RecordArray(
+            fields + layout.contents, field_names + layout.keys(), stop - start
+        )
+    elif dataset.schema.names == [""]:
+        return layout[""]
+    else:
+        return layout
+
+
+def _read_parquet_partitions(dataset, threads):
+    row_groups = list(dataset.row_groups)
+    if threads < 1:
+        raise ValueError(
+            "threads must be at least 1, not {0}".format(threads)
+            + ak._util.exception_suffix(__file__)
+        )
+    threads = min(threads, len(row_groups))
+
+    def read(row_group):
+        return _parquet_tables_to_layout([dataset.read_row_group(row_group)])
+
+    if threads > 1:
+        import multiprocessing.pool
+
+        pool = multiprocessing.pool.ThreadPool(threads)
+        try:
+            partitions = pool.map(read, row_groups, chunksize=1)
+        finally:
+            pool.terminate()
+            pool.join()
+    else:
+        partitions = [read(x) for x in row_groups]
+
+    start = 0
+    for i, partition in enumerate(partitions):
+        partitions[i] = _parquet_finish_layout(dataset, partition, start)
+        start += len(partition)
+
+    if len(partitions) == 1:
+        return partitions[0]
+    else:
+        return ak.partition.IrregularlyPartitionedArray(partitions)
+
+
+def _regularize_lazy_cache(lazy_cache):
+    hold_cache = None
+    if lazy_cache is None:
+        pass
+    # Wrap existing ArrayCache's internal cache
+    elif isinstance(lazy_cache, ak.layout.ArrayCache):
+        pass
+    else:
+        if lazy_cache == "new":
+            hold_cache = ak._util.MappingProxy({})
+        elif lazy_cache == "attach":
+            raise TypeError("lazy_cache must be a MutableMapping")
+        else:
+            hold_cache = ak._util.MappingProxy.maybe_wrap(lazy_cache)
+            if not isinstance(hold_cache, MutableMapping):
+                raise TypeError("lazy_cache must be a MutableMapping")
+        lazy_cache = ak.layout.ArrayCache(hold_cache)
+    return lazy_cache, hold_cache
+
+
+def _regularize_parquet_lazy_cache_key(lazy_cache_key):
+    if lazy_cache_key is None:
+        lazy_cache_key = "ak.from_parquet:{0}".format(_from_parquet_key())
+    return lazy_cache_key
+
+
+def _parquet_dataset(
+    source, columns, row_groups, use_threads, include_partition_columns, filter, options
+):
     if isinstance(row_groups, (numbers.Integral, np.integer)):
         row_groups = [row_groups]
 
@@ -3917,12 +4469,119 @@ def from_parquet(
     else:
         dataset = _ParquetFileDataset(source, row_groups, columns, use_threads, options)
 
-    if dataset.is_empty:
-        return ak.layout.RecordArray(
-            [ak.layout.EmptyArray() for _ in dataset.columns], dataset.columns, 0
+    if filter is not None:
+        dataset.select_row_groups(_parquet_filter_row_groups(dataset, filter))
+
+    return dataset
+
+
+def from_parquet(
+    source,
+    columns=None,
+    row_groups=None,
+    use_threads=True,
+    include_partition_columns=True,
+    lazy=False,
+    lazy_cache="new",
+    lazy_cache_key=None,
+    highlevel=True,
+    behavior=None,
+    threads=None,
+    filter=None,
+    **options  # NOTE: a comma after **options breaks Python 2
+):
+    """
+    Args:
+        source (str, Path, file-like object, pyarrow.NativeFile): Where to
+            get the Parquet file. If `source` is the name of a local directory
+            (str or Path), then it is interpreted as a partitioned Parquet dataset.
+        columns (None or list of str): If None, read all columns; otherwise,
+            read a specified set of columns.
+        row_groups (None, int, or list of int): If None, read all row groups;
+            otherwise, read a single or list of row groups.
+        use_threads (bool): Passed to the pyarrow.parquet.ParquetFile.read
+            functions; if True, do multithreaded reading.
+        include_partition_columns (bool): If True and `source` is a partitioned
+            Parquet dataset with subdirectory names defining partition names
+            and values, include those special columns in the output.
+        lazy (bool): If True, read columns in row groups on demand (as
+            #ak.layout.VirtualArray, possibly in #ak.partition.PartitionedArray
+            if the file has more than one row group); if False, read all
+            requested data immediately.
+        lazy_cache (None, "new", or MutableMapping): If lazy, pass this
+            cache to the VirtualArrays. If "new", a new dict (keep-forever cache)
+            is created. If None, no cache is used. An
+            #ak.cache.LRUArrayCache bounds the memory used by the cache.
+        lazy_cache_key (None or str): If lazy, pass this cache_key to the
+            VirtualArrays. If None, a process-unique string is constructed.
+        highlevel (bool): If True, return an #ak.Array; otherwise, return
+            a low-level #ak.layout.Content subclass.
+        behavior (None or dict): Custom #ak.behavior for the output array, if
+            high-level.
+        threads (None or int): If not None, read and convert row groups
+            concurrently on this many threads and return them as an
+            #ak.partition.PartitionedArray with one partition per row group,
+            in the original order. Can't be combined with `lazy`.
+        filter (None, tuple, list of tuples, or list of lists of tuples): If
+            not None, skip row groups whose column statistics show that they
+            can't satisfy these comparisons (see below).
+        options: All other options are passed to pyarrow.parquet.ParquetFile.
+
+    Reads a Parquet file into an Awkward Array (through pyarrow).
+
+        >>> ak.from_parquet("array1.parquet")
+        <Array [[1, 2, 3], [], ... [], [6, 7, 8, 9]] type='6 * var * ?int64'>
+
+    With `threads`, both the Parquet decoding (in pyarrow) and the Arrow to
+    Awkward conversion of different row groups overlap. At most `threads` row
+    groups are held as Arrow tables at any time; each is released as soon as
+    it has been converted. The `use_threads` option still controls pyarrow's
+    own parallelism within a row group, which may be redundant when reading
+    many small row groups concurrently.
+
+    The `filter` uses the minimum and maximum values that Parquet writers
+    record for each column in each row group to avoid reading row groups
+    that can't contain a match. Each comparison is a `(column, op, value)`
+    tuple with `op` one of `"=="`, `"!="`, `"<"`, `"<="`, `">"`, `">="`,
+    `"in"`, or `"not in"`; a list of tuples is their conjunction (and) and a
+    list of lists of tuples is a disjunction (or) of conjunctions, as in
+    pyarrow's `filters`. Columns inside records are named with dots, and
+    values inside lists are compared element by element, so
+
+        ak.from_parquet("events.parquet", filter=[("run", ">=", 100), ("muons.pt", ">", 50)])
+
+    reads only the row groups in which `run` can be at least 100 and some
+    muon can have a `pt` above 50. Only whole row groups are skipped; the
+    rows of the row groups that are read are not filtered. Row groups
+    without statistics are always read. This also applies to `lazy` reading,
+    in which skipped row groups have no partition at all.
+
+    See also #ak.from_arrow, which is used as an intermediate step.
+    See also #ak.to_parquet.
+    """
+    _import_pyarrow("ak.from_parquet")
+
+    if lazy and threads is not None:
+        raise ValueError(
+            "threads can't be used with lazy=True, which reads row groups on demand"
+            + ak._util.exception_suffix(__file__)
         )
 
-    if lazy:
+    dataset = _parquet_dataset(
+        source,
+        columns,
+        row_groups,
+        use_threads,
+        include_partition_columns,
+        filter,
+        options,
+    )
+
+    if dataset.is_empty:
+        out = _parquet_empty_layout(_parquet_schema_to_form(dataset.schema))
+        out = _parquet_finish_layout(dataset, out, 0)
+
+    elif lazy:
         lazy_cache, hold_cache = _regularize_lazy_cache(lazy_cache)
         lazy_cache_key = _regularize_parquet_lazy_cache_key(lazy_cache_key)
 
@@ -3942,6 +4601,9 @@ def from_parquet(
             lazy_cache_key,
         )
 
+    elif threads is not None:
+        out = _read_parquet_partitions(dataset, threads)
+
     else:
         batches = dataset.read_row_group_batches()
         out = _from_arrow(batches, False, highlevel=False)
@@ -3959,6 +4621,166 @@ def from_parquet(
     return ak._util.maybe_wrap(out, behavior, highlevel)
 
 
+def iter_parquet(
+    source,
+    columns=None,
+    row_groups=None,
+    batch_size=None,
+    prefetch=1,
+    use_threads=True,
+    include_partition_columns=True,
+    filter=None,
+    highlevel=True,
+    behavior=None,
+    **options  # NOTE: a comma after **options breaks Python 2
+):
+    """
+    Args:
+        source (str, Path, file-like object, pyarrow.NativeFile): Where to
+            get the Parquet file or dataset, as in #ak.from_parquet.
+        columns (None or list of str): If None, read all columns; otherwise,
+            read a specified set of columns.
+        row_groups (None, int, or list of int): If None, read all row groups;
+            otherwise, read a single or list of row groups.
+        batch_size (None or int): If None, yield one array per row group;
+            otherwise, yield arrays of exactly this many rows (except the
+            last), regardless of row group boundaries.
+        prefetch (int): Number of batches to read ahead in a background
+            thread while the current one is being processed; if 0, read
+            each batch only when it is requested.
+        use_threads (bool): Passed to the pyarrow.parquet.ParquetFile.read
+            functions; if True, do multithreaded reading.
+        include_partition_columns (bool): If True and `source` is a partitioned
+            Parquet dataset with subdirectory names defining partition names
+            and values, include those special columns in the output.
+        filter (None, tuple, list of tuples, or list of lists of tuples): If
+            not None, skip row groups whose column statistics show that they
+            can't satisfy these comparisons, as in #ak.from_parquet.
+        highlevel (bool): If True, yield #ak.Array; otherwise, yield
+            low-level #ak.layout.Content subclasses.
+        behavior (None or dict): Custom #ak.behavior for the output arrays, if
+            high-level.
+        options: All other options are passed to pyarrow.parquet.ParquetFile.
+
+    Iterates over a Parquet file or dataset in batches, for jobs that make
+    one pass over the data:
+
+        for batch in ak.iter_parquet("events.parquet", ["x", "y"], batch_size=100000):
+            process(batch)
+
+    Unlike a lazy #ak.from_parquet, nothing is cached: each batch is an
+    ordinary array that is released when it is no longer referenced. Besides
+    the batch being processed, at most `prefetch` batches wait in memory
+    (as Arrow tables) and one more is being read, so the reading of the next
+    batches overlaps with the processing of the current one.
+
+    See also #ak.from_parquet.
+    """
+    _import_pyarrow("ak.iter_parquet")
+
+    if batch_size is not None and batch_size < 1:
+        raise ValueError(
+            "batch_size must be None or at least 1, not {0}".format(batch_size)
+            + ak._util.exception_suffix(__file__)
+        )
+    if prefetch < 0:
+        raise ValueError(
+            "prefetch must be non-negative, not {0}".format(prefetch)
+            + ak._util.exception_suffix(__file__)
+        )
+
+    dataset = _parquet_dataset(
+        source,
+        columns,
+        row_groups,
+        use_threads,
+        include_partition_columns,
+        filter,
+        options,
+    )
+    return _iter_parquet_batches(dataset, batch_size, prefetch, highlevel, behavior)
+
+
+def _iter_parquet_tables(dataset, batch_size):
+    if batch_size is None:
+        for row_group in dataset.row_groups:
+            yield [dataset.read_row_group(row_group)]
+
+    else:
+        pending = []
+        pending_length = 0
+        for row_group in dataset.row_groups:
+            table = dataset.read_row_group(row_group)
+            start = 0
+            while pending_length + len(table) - start >= batch_size:
+                stop = start + batch_size - pending_length
+                pending.append(table.slice(start, stop - start))
+                yield pending
+                pending = []
+                pending_length = 0
+                start = stop
+            if start < len(table):
+                pending.append(table.slice(start))
+                pending_length += len(table) - start
+        if pending_length != 0:
+            yield pending
+
+
+def _iter_in_thread(iterator, size):
+    items = queue.Queue(size)
+    stopping = threading.Event()
+    finished = object()
+
+    def put(item):
+        while not stopping.is_set():
+            try:
+                items.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def run():
+        try:
+            for item in iterator:
+                if not put((item, None)):
+                    return
+        except Exception as err:
+            put((None, err))
+        else:
+            put((finished, None))
+
+    thread = threading.Thread(target=run)
+    thread.daemon = True
+    thread.start()
+    try:
+        while True:
+            item, err = items.get()
+            if err is not None:
+                raise err
+            elif item is finished:
+                break
+            else:
+                yield item
+    finally:
+        stopping.set()
+        thread.join()
+
+
+def _iter_parquet_batches(dataset, batch_size, prefetch, highlevel, behavior):
+    tables = _iter_parquet_tables(dataset, batch_size)
+    if prefetch > 0:
+        tables = _iter_in_thread(tables, prefetch)
+
+    start = 0
+    for batch in tables:
+        layout = _parquet_finish_layout(
+            dataset, _parquet_tables_to_layout(batch), start
+        )
+        start += len(layout)
+        yield ak._util.maybe_wrap(layout, behavior, highlevel)
+
+
 def to_buffers(
     array,
     container=None,
@@ -3966,6 +4788,8 @@ def to_buffers(
     form_key="node{id}",
     key_format="part{partition}-{form_key}-{attribute}",
     virtual="materialize",
+    compression=None,
+    compression_level=None,
 ):
     """
     Args:
@@ -3995,6 +4819,13 @@ def to_buffers(
             assuming that it contains `form_keys` that can be found in the
             container (e.g. by a previous pass through this function). No other
             values are allowed for this function argument.
+        compression (None or str): If not None, encode and compress each buffer
+            with one of `"none"` (encode only), `"zlib"`, `"lzma"`, `"bz2"`,
+            `"lz4"` (requires the lz4 library), or `"zstd"` (requires the
+            zstandard library). Such a container must be read back with
+            `compressed=True` in #ak.from_buffers.
+        compression_level (None or int): Compression level passed to the codec;
+            if None, the codec's default is used.
 
     Decomposes an Awkward Array into a Form and a collection of memory buffers,
     so that data can be losslessly written to file formats and storage devices
@@ -4101,6 +4932,15 @@ def to_buffers(
         >>> ak.partitions(reconstituted)
         [3, 1, 3, 1]
 
+    With a `compression`, each buffer in the `container` is a bytes object
+    holding a small header and the compressed buffer. Before compression,
+    `"offsets"`, `"starts"`, and `"stops"` are delta-encoded and 8-bit `"tags"`
+    and `"mask"` buffers are bit-packed to the number of bits that their largest
+    value needs, which lets the codec shrink them much further.
+
+        >>> form, length, container = ak.to_buffers(original, compression="zlib")
+        >>> reconstituted = ak.from_buffers(form, length, container, compressed=True)
+
     If you intend to use this function for saving data, you may want to pack it
     first with #ak.packed.
 
@@ -4149,8 +4989,20 @@ def to_buffers(
 
     num_form_keys = [0]
 
-    def little_endian(array):
-        return array.astype(array.dtype.newbyteorder("<"), copy=False)
+    if compression is not None and compression not in _buffer_codecs:
+        raise ValueError(
+            "compression must be None or one of {0}, not {1}".format(
+                ", ".join(repr(x) for x in _buffer_codecs), repr(compression)
+            )
+            + ak._util.exception_suffix(__file__)
+        )
+
+    def encode(array, attribute):
+        array = array.astype(array.dtype.newbyteorder("<"), copy=False)
+        if compression is None:
+            return array
+        else:
+            return _encode_buffer(array, attribute, compression, compression_level)
 
     def fill(layout, part):
         has_identities = layout.identities is not None
@@ -4167,7 +5019,7 @@ def to_buffers(
         if isinstance(layout, ak.layout.EmptyArray):
             fk = form_key(id=str(key_index))
             key = key_format(form_key=fk, attribute="data", partition=str(part))
-            container[key] = little_endian(numpy.asarray(layout))
+            container[key] = encode(numpy.asarray(layout), "data")
             return ak.forms.EmptyForm(has_identities, parameters, fk)
 
         elif isinstance(
@@ -4180,7 +5032,7 @@ def to_buffers(
         ):
             fk = form_key(id=str(key_index), layout=layout)
             key = key_format(form_key=fk, attribute="index", partition=str(part))
-            container[key] = little_endian(numpy.asarray(layout.index))
+            container[key] = encode(numpy.asarray(layout.index), "index")
             return ak.forms.IndexedForm(
                 index_form(layout.index),
                 fill(layout.content, part),
@@ -4194,7 +5046,7 @@ def to_buffers(
         ):
             fk = form_key(id=str(key_index), layout=layout)
             key = key_format(form_key=fk, attribute="index", partition=str(part))
-            container[key] = little_endian(numpy.asarray(layout.index))
+            container[key] = encode(numpy.asarray(layout.index), "index")
             return ak.forms.IndexedOptionForm(
                 index_form(layout.index),
                 fill(layout.content, part),
@@ -4206,7 +5058,7 @@ def to_buffers(
         elif isinstance(layout, ak.layout.ByteMaskedArray):
             fk = form_key(id=str(key_index), layout=layout)
             key = key_format(form_key=fk, attribute="mask", partition=str(part))
-            container[key] = little_endian(numpy.asarray(layout.mask))
+            container[key] = encode(numpy.asarray(layout.mask), "mask")
             return ak.forms.ByteMaskedForm(
                 index_form(layout.mask),
                 fill(layout.content, part),
@@ -4219,7 +5071,7 @@ def to_buffers(
         elif isinstance(layout, ak.layout.BitMaskedArray):
             fk = form_key(id=str(key_index), layout=layout)
             key = key_format(form_key=fk, attribute="mask", partition=str(part))
-            container[key] = little_endian(numpy.asarray(layout.mask))
+            container[key] = encode(numpy.asarray(layout.mask), "mask")
             return ak.forms.BitMaskedForm(
                 index_form(layout.mask),
                 fill(layout.content, part),
@@ -4244,9 +5096,9 @@ def to_buffers(
         ):
             fk = form_key(id=str(key_index), layout=layout)
             key = key_format(form_key=fk, attribute="starts", partition=str(part))
-            container[key] = little_endian(numpy.asarray(layout.starts))
+            container[key] = encode(numpy.asarray(layout.starts), "starts")
             key = key_format(form_key=fk, attribute="stops", partition=str(part))
-            container[key] = little_endian(numpy.asarray(layout.stops))
+            container[key] = encode(numpy.asarray(layout.stops), "stops")
             return ak.forms.ListForm(
                 index_form(layout.starts),
                 index_form(layout.stops),
@@ -4266,7 +5118,7 @@ def to_buffers(
         ):
             fk = form_key(id=str(key_index), layout=layout)
             key = key_format(form_key=fk, attribute="offsets", partition=str(part))
-            container[key] = little_endian(numpy.asarray(layout.offsets))
+            container[key] = encode(numpy.asarray(layout.offsets), "offsets")
             return ak.forms.ListOffsetForm(
                 index_form(layout.offsets),
                 fill(layout.content, part),
@@ -4279,7 +5131,7 @@ def to_buffers(
             fk = form_key(id=str(key_index), layout=layout)
             key = key_format(form_key=fk, attribute="data", partition=str(part))
             array = numpy.asarray(layout)
-            container[key] = little_endian(array)
+            container[key] = encode(array, "data")
             form = ak.forms.Form.from_numpy(array.dtype)
             return ak.forms.NumpyForm(
                 layout.shape[1:],
@@ -4332,9 +5184,9 @@ def to_buffers(
 
             fk = form_key(id=str(key_index), layout=layout)
             key = key_format(form_key=fk, attribute="tags", partition=str(part))
-            container[key] = little_endian(numpy.asarray(layout.tags))
+            container[key] = encode(numpy.asarray(layout.tags), "tags")
             key = key_format(form_key=fk, attribute="index", partition=str(part))
-            container[key] = little_endian(numpy.asarray(layout.index))
+            container[key] = encode(numpy.asarray(layout.index), "index")
             return ak.forms.UnionForm(
                 index_form(layout.tags),
                 index_form(layout.index),
@@ -4417,6 +5269,155 @@ def _asbuf(obj):
         return tmp.reshape(-1).view(np.uint8)
 
 
+_buffer_codecs = ("none", "zlib", "lzma", "bz2", "lz4", "zstd")
+_buffer_filters = ("none", "delta", "bitpack")
+_encoded_buffer_magic = b"AKZ\x01"
+_encoded_buffer_header = struct.Struct("<BBBxQ")
+
+
+def _import_codec(codec, module, package):
+    try:
+        return __import__(module, fromlist=[""])
+    except ImportError:
+        raise ImportError(
+            """to use compression={0}, you must install {1}:
+
+    pip install {1}
+
+or
+
+    conda install -c conda-forge {1}
+""".format(
+                repr(codec), package
+            )
+        )
+
+
+def _compress(codec, data, level):
+    if codec == "none":
+        return data.tobytes()
+    elif codec == "zlib":
+        import zlib
+
+        return zlib.compress(data, -1 if level is None else level)
+    elif codec == "lzma":
+        import lzma
+
+        return lzma.compress(data, preset=level)
+    elif codec == "bz2":
+        import bz2
+
+        return bz2.compress(data, 9 if level is None else level)
+    elif codec == "lz4":
+        lz4_frame = _import_codec(codec, "lz4.frame", "lz4")
+        return lz4_frame.compress(data, compression_level=0 if level is None else level)
+    else:
+        zstandard = _import_codec(codec, "zstandard", "zstandard")
+        return zstandard.ZstdCompressor(level=3 if level is None else level).compress(
+            data
+        )
+
+
+def _decompress(codec, data):
+    if codec == "none":
+        return data
+    data = data.tobytes()
+    if codec == "zlib":
+        import zlib
+
+        return zlib.decompress(data)
+    elif codec == "lzma":
+        import lzma
+
+        return lzma.decompress(data)
+    elif codec == "bz2":
+        import bz2
+
+        return bz2.decompress(data)
+    elif codec == "lz4":
+        return _import_codec(codec, "lz4.frame", "lz4").decompress(data)
+    else:
+        zstandard = _import_codec(codec, "zstandard", "zstandard")
+        return zstandard.ZstdDecompressor().decompress(data)
+
+
+def _encode_buffer(array, attribute, codec, level):
+    raw = _asbuf(numpy.ascontiguousarray(array))
+    nbytes = len(raw)
+    itemsize = array.dtype.itemsize
+
+    if (
+        attribute in ("offsets", "starts", "stops")
+        and itemsize in (4, 8)
+        and len(raw) > 0
+    ):
+        # differences, in unsigned arithmetic so that the round-trip is exact
+        values = raw.view("<u{0}".format(itemsize))
+        filtered = numpy.empty(len(values), values.dtype)
+        filtered[0] = values[0]
+        filtered[1:] = values[1:] - values[:-1]
+        filter, parameter = "delta", itemsize
+        raw = filtered.view(np.uint8)
+
+    elif attribute in ("tags", "mask") and itemsize == 1 and len(raw) > 0:
+        bits = max(int(raw.max()).bit_length(), 1)
+        if bits < 8:
+            columns = numpy.unpackbits(raw.reshape(-1, 1), axis=1)[:, 8 - bits :]
+            filter, parameter = "bitpack", bits
+            raw = numpy.packbits(columns.reshape(-1))
+        else:
+            filter, parameter = "none", 0
+
+    else:
+        filter, parameter = "none", 0
+
+    header = _encoded_buffer_header.pack(
+        _buffer_codecs.index(codec),
+        _buffer_filters.index(filter),
+        parameter,
+        nbytes,
+    )
+    return _encoded_buffer_magic + header + _compress(codec, raw, level)
+
+
+def _decode_buffer(encoded):
+    encoded = _asbuf(encoded)
+    start = len(_encoded_buffer_magic)
+    if encoded[:start].tobytes() != _encoded_buffer_magic:
+        raise ValueError(
+            "buffer was not encoded by ak.to_buffers with a compression"
+            + ak._util.exception_suffix(__file__)
+        )
+    codec, filter, parameter, nbytes = _encoded_buffer_header.unpack(
+        encoded[start : start + _encoded_buffer_header.size].tobytes()
+    )
+    codec = _buffer_codecs[codec]
+    filter = _buffer_filters[filter]
+
+    raw = _asbuf(_decompress(codec, encoded[start + _encoded_buffer_header.size :]))
+
+    if filter == "delta":
+        values = raw.view("<u{0}".format(parameter))
+        return numpy.cumsum(values, dtype=values.dtype).view(np.uint8)
+
+    elif filter == "bitpack":
+        columns = numpy.unpackbits(raw)[: nbytes * parameter].reshape(-1, parameter)
+        padded = numpy.zeros((nbytes, 8), np.uint8)
+        padded[:, 8 - parameter :] = columns
+        return numpy.packbits(padded, axis=1).reshape(-1)
+
+    else:
+        return raw
+
+
+class _DecodedBuffers(object):
+    def __init__(self, container):
+        self.container = container
+
+    def __getitem__(self, key):
+        return _decode_buffer(self.container[key])
+
+
 def _form_to_layout(
     form,
     container,
@@ -4957,6 +5958,7 @@ def from_buffers(
     lazy_cache_key=None,
     highlevel=True,
     behavior=None,
+    compressed=False,
 ):
     """
     Args:
@@ -4985,13 +5987,17 @@ def from_buffers(
             read on demand.
         lazy_cache (None, "new", or MutableMapping): If lazy, pass this
             cache to the VirtualArrays. If "new", a new dict (keep-forever cache)
-            is created. If None, no cache is used.
+            is created. If None, no cache is used. An
+            #ak.cache.LRUArrayCache bounds the memory used by the cache.
         lazy_cache_key (None or str): If lazy, pass this cache_key to the
             VirtualArrays. If None, a process-unique string is constructed.
         highlevel (bool): If True, return an #ak.Array; otherwise, return
             a low-level #ak.layout.Content subclass.
         behavior (None or dict): Custom #ak.behavior for the output array, if
             high-level.
+        compressed (bool): If True, the buffers in the `container` were encoded
+            by #ak.to_buffers with a `compression`; each one is decompressed
+            when it is read (on demand, if `lazy`).
 
     Reconstitutes an Awkward Array from a Form, length, and a collection of memory
     buffers, so that data can be losslessly read from file formats and storage
@@ -5033,6 +6039,9 @@ def from_buffers(
 
         key_format = generate_key_format(key_format)
 
+    if compressed:
+        container = _DecodedBuffers(container)
+
     hold_cache = None
     if lazy:
         form = _wrap_record_with_virtual(form)
@@ -5110,6 +6119,227 @@ def from_buffers(
     return ak._util.maybe_wrap(out, behavior, highlevel)
 
 
+_pickling_lock = threading.Lock()
+_pickling_stack = []
+
+
+class _PicklingOptions(object):
+    def __init__(self, packed):
+        self.packed = packed
+
+    def __enter__(self):
+        with _pickling_lock:
+            _pickling_stack.append(self)
+        return self
+
+    def __exit__(self, exception_type, exception_value, traceback):
+        with _pickling_lock:
+            _pickling_stack.remove(self)
+
+
+def pickling(packed=True):
+    """
+    Args:
+        packed (bool): If True (the default), arrays and records are passed
+            through #ak.packed before they are pickled; if False, their
+            buffers are pickled as they are.
+
+    Returns a context manager that sets options for pickling #ak.Array and
+    #ak.Record objects, including pickling by `multiprocessing`, Dask, and
+    other libraries that use pickle to send data between processes.
+
+    Packing makes the pickle as small as possible, since it drops any data
+    that are not reachable (such as the parts of a buffer outside of a
+    slice), but it makes a copy of every buffer that is not already compact.
+    For arrays that are known to be compact already (for instance, just read
+    from a file), that step can be skipped:
+
+        >>> with ak.pickling(packed=False):
+        ...     results = pool.map(function, [array1, array2, array3])
+
+    The setting applies to the whole process, including pickling in other
+    threads (such as the task-handling thread of a `multiprocessing.Pool`),
+    until the context exits.
+
+    With pickle protocol 5 or later (Python 3.8+), the buffers are emitted as
+    `pickle.PickleBuffer` objects. They are still copied into the pickle
+    stream by default. They can also be transferred out-of-band, without
+    copies, through a `buffer_callback`:
+
+        >>> buffers = []
+        >>> data = pickle.dumps(array, protocol=5, buffer_callback=buffers.append)
+        >>> pickle.loads(data, buffers=buffers)
+        <Array [[1.1, 2.2, 3.3], [], [4.4, 5.5]] type='3 * var * float64'>
+
+    The unpickled array then views the memory of those buffers.
+    """
+    return _PicklingOptions(packed)
+
+
+def _pickle_packed():
+    with _pickling_lock:
+        return len(_pickling_stack) == 0 or _pickling_stack[-1].packed
+
+
+def _pickle_container(container, protocol):
+    PickleBuffer = getattr(pickle, "PickleBuffer", None)
+    if protocol is None or protocol < 5 or PickleBuffer is None:
+        return container
+    out = {}
+    for key, value in container.items():
+        if isinstance(value, np.ndarray):
+            value = numpy.ascontiguousarray(value)
+        out[key] = PickleBuffer(value)
+    return out
+
+
+_buffers_file_magic = b"AWKWARD-BUFFERS\x01"
+_buffers_file_alignment = 64
+
+
+def _buffers_file_aligned(position):
+    return -(-position // _buffers_file_alignment) * _buffers_file_alignment
+
+
+def to_buffers_file(
+    array, path, form_key="node{id}", compression=None, compression_level=None
+):
+    """
+    Args:
+        array: Data to write to the file.
+        path (str or path-like): Name of the file to write (overwritten if it
+            exists).
+        form_key (str, callable): Passed to #ak.to_buffers.
+        compression (None or str): Passed to #ak.to_buffers.
+        compression_level (None or int): Passed to #ak.to_buffers.
+
+    Writes an Awkward Array to a single file that #ak.from_buffers_file can
+    memory-map, without first reading it into memory.
+
+    The file consists of a short header, containing the Form (as JSON), the
+    length (or partition lengths), and the position of each buffer, followed
+    by the raw (little-endian) buffers from #ak.to_buffers, each aligned to
+    64 bytes. Virtual arrays are materialized. If a `compression` is given, the
+    buffers are encoded and compressed as described in #ak.to_buffers, which
+    makes the file smaller, but they have to be decompressed into memory when
+    read.
+
+        >>> ak.to_buffers_file(ak.Array([[1, 2, 3], [], [4, 5]]), "array.akb")
+        >>> ak.from_buffers_file("array.akb")
+        <Array [[1, 2, 3], [], [4, 5]] type='3 * var * int64'>
+
+    If you intend to use this function for saving data, you may want to pack it
+    first with #ak.packed.
+
+    See also #ak.from_buffers_file and #ak.to_buffers.
+    """
+    path = _regularize_path(path)
+    key_format = "part{partition}-{form_key}-{attribute}"
+
+    form, length, container = to_buffers(
+        array,
+        form_key=form_key,
+        key_format=key_format,
+        compression=compression,
+        compression_level=compression_level,
+    )
+
+    buffers = []
+    positions = {}
+    position = 0
+    for key, value in container.items():
+        buffer = _asbuf(value)
+        position = _buffers_file_aligned(position)
+        positions[key] = [position, len(buffer)]
+        buffers.append((position, buffer))
+        position += len(buffer)
+
+    header = json.dumps(
+        {
+            "form": json.loads(form.tojson()),
+            "length": length,
+            "key_format": key_format,
+            "compressed": compression is not None,
+            "buffers": positions,
+        }
+    ).encode("utf-8")
+    start = _buffers_file_aligned(len(_buffers_file_magic) + 8 + len(header))
+
+    with open(path, "wb") as file:
+        file.write(_buffers_file_magic)
+        file.write(struct.pack("<Q", len(header)))
+        file.write(header)
+        for position, buffer in buffers:
+            file.write(b"\x00" * (start + position - file.tell()))
+            file.write(buffer.data)
+        file.write(b"\x00" * (_buffers_file_aligned(file.tell()) - file.tell()))
+
+
+def from_buffers_file(
+    path,
+    lazy=False,
+    lazy_cache="new",
+    lazy_cache_key=None,
+    highlevel=True,
+    behavior=None,
+):
+    """
+    Args:
+        path (str or path-like): Name of a file written by #ak.to_buffers_file.
+        lazy (bool): If True, build the array or its partitions on demand (as
+            #ak.layout.VirtualArray, see #ak.from_buffers).
+        lazy_cache (None, "new", or MutableMapping): Passed to #ak.from_buffers.
+        lazy_cache_key (None or str): Passed to #ak.from_buffers.
+        highlevel (bool): If True, return an #ak.Array; otherwise, return
+            a low-level #ak.layout.Content subclass.
+        behavior (None or dict): Custom #ak.behavior for the output array, if
+            high-level.
+
+    Reads an Awkward Array from a file written by #ak.to_buffers_file.
+
+    The file is memory-mapped (read-only) and the buffers are views of that
+    mapping, so opening it takes the same time regardless of its size and
+    pages of the file are only read from disk when the parts of the array
+    that use them are accessed. The mapping stays open as long as any array
+    built from it exists. Compressed buffers (see #ak.to_buffers_file) are
+    decompressed when they are read, on demand if `lazy`.
+
+    See also #ak.to_buffers_file and #ak.from_buffers.
+    """
+    path = _regularize_path(path)
+
+    with open(path, "rb") as file:
+        magic = file.read(len(_buffers_file_magic))
+        if magic != _buffers_file_magic:
+            raise ValueError(
+                "not a file written by ak.to_buffers_file: {0}".format(repr(path))
+                + ak._util.exception_suffix(__file__)
+            )
+        (header_size,) = struct.unpack("<Q", file.read(8))
+        header = json.loads(file.read(header_size).decode("utf-8"))
+        mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    start = _buffers_file_aligned(len(_buffers_file_magic) + 8 + header_size)
+    container = {}
+    for key, (position, size) in header["buffers"].items():
+        container[key] = numpy.frombuffer(
+            mapped, dtype=np.uint8, count=size, offset=start + position
+        )
+
+    return from_buffers(
+        header["form"],
+        header["length"],
+        container,
+        key_format=header["key_format"],
+        compressed=header["compressed"],
+        lazy=lazy,
+        lazy_cache=lazy_cache,
+        lazy_cache_key=lazy_cache_key,
+        highlevel=highlevel,
+        behavior=behavior,
+    )
+
+
 def to_pandas(
     array, how="inner", levelname=lambda i: "sub" * i + "entry", anonymous="values"
 ):
@@ -5376,8 +6606,11 @@ __all__ = [
         "collections",
         "math",
         "os",
+        "mmap",
+        "pickle",
+        "struct",
         "threading",
-        "distutils",
+        "queue",
         "glob",
         "re",
         "Iterable",
@@ -7,6 +7,18 @@ import awkward as ak
 np = ak.nplike.NumpyMetadata.instance()
 
 
+def _completely_flatten_apply(layout, function):
+    # partitions are flattened and reduced in the partition executor, if any
+    if isinstance(layout, ak.partition.PartitionedArray):
+        partials = ak.partition.execute(
+            lambda x: [function(y) for y in ak._util.completely_flatten(x)],
+            layout.partitions,
+        )
+        return [y for x in partials for y in x]
+    else:
+        return [function(x) for x in ak._util.completely_flatten(layout)]
+
+
 def count(array, axis=None, keepdims=False, mask_identity=False):
     """
     Args:
@@ -88,7 +100,7 @@ def count(array, axis=None, keepdims=False, mask_identity=False):
                 return xs[0] + reduce(xs[1:])
 
         return reduce(
-            [ak.nplike.of(x).size(x) for x in ak._util.completely_flatten(layout)]
+            _completely_flatten_apply(layout, lambda x: ak.nplike.of(x).size(x))
         )
     else:
         behavior = ak._util.behaviorof(array)
@@ -141,10 +153,9 @@ def count_nonzero(array, axis=None, keepdims=False, mask_identity=False):
                 return xs[0] + reduce(xs[1:])
 
         return reduce(
-            [
-                ak.nplike.of(x).count_nonzero(x)
-                for x in ak._util.completely_flatten(layout)
-            ]
+            _completely_flatten_apply(
+                layout, lambda x: ak.nplike.of(x).count_nonzero(x)
+            )
         )
     else:
         behavior = ak._util.behaviorof(array)
@@ -338,7 +349,7 @@ def sum(array, axis=None, keepdims=False, mask_identity=False):
                 return xs[0] + reduce(xs[1:])
 
         return reduce(
-            [ak.nplike.of(x).sum(x) for x in ak._util.completely_flatten(layout)]
+            _completely_flatten_apply(layout, lambda x: ak.nplike.of(x).sum(x))
         )
     else:
         behavior = ak._util.behaviorof(array)
@@ -387,7 +398,7 @@ def prod(array, axis=None, keepdims=False, mask_identity=False):
                 return xs[0] * reduce(xs[1:])
 
         return reduce(
-            [ak.nplike.of(x).prod(x) for x in ak._util.completely_flatten(layout)]
+            _completely_flatten_apply(layout, lambda x: ak.nplike.of(x).prod(x))
         )
     else:
         behavior = ak._util.behaviorof(array)
@@ -438,7 +449,7 @@ def any(array, axis=None, keepdims=False, mask_identity=False):
                 return xs[0] or reduce(xs[1:])
 
         return reduce(
-            [ak.nplike.of(x).any(x) for x in ak._util.completely_flatten(layout)]
+            _completely_flatten_apply(layout, lambda x: ak.nplike.of(x).any(x))
         )
     else:
         behavior = ak._util.behaviorof(array)
@@ -489,7 +500,7 @@ def all(array, axis=None, keepdims=False, mask_identity=False):
                 return xs[0] and reduce(xs[1:])
 
         return reduce(
-            [ak.nplike.of(x).all(x) for x in ak._util.completely_flatten(layout)]
+            _completely_flatten_apply(layout, lambda x: ak.nplike.of(x).all(x))
         )
     else:
         behavior = ak._util.behaviorof(array)
@@ -547,8 +558,10 @@ def min(array, axis=None, keepdims=False, initial=None, mask_identity=True):
                 x, y = xs[0], reduce(xs[1:])
                 return x if x < y else y
 
-        tmp = ak._util.completely_flatten(layout)
-        return reduce([ak.nplike.of(x).min(x) for x in tmp if len(x) > 0])
+        tmp = _completely_flatten_apply(
+            layout, lambda x: ak.nplike.of(x).min(x) if len(x) > 0 else None
+        )
+        return reduce([x for x in tmp if x is not None])
     else:
         behavior = ak._util.behaviorof(array)
         return ak._util.wrap(
@@ -608,8 +621,10 @@ def max(array, axis=None, keepdims=False, initial=None, mask_identity=True):
                 x, y = xs[0], reduce(xs[1:])
                 return x if x > y else y
 
-        tmp = ak._util.completely_flatten(layout)
-        return reduce([ak.nplike.of(x).max(x) for x in tmp if len(x) > 0])
+        tmp = _completely_flatten_apply(
+            layout, lambda x: ak.nplike.of(x).max(x) if len(x) > 0 else None
+        )
+        return reduce([x for x in tmp if x is not None])
     else:
         behavior = ak._util.behaviorof(array)
         return ak._util.wrap(
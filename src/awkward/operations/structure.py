@@ -2494,6 +2494,13 @@ def sort(array, axis=-1, ascending=True, stable=True, highlevel=True, behavior=N
 
         >>> ak.sort(ak.Array([[7, 5, 7], [], [2], [8, 2]]))
         <Array [[5, 7, 7], [], [2], [2, 8]] type='4 * var * int64'>
+
+    Partitioned arrays are sorted one partition at a time (see
+    #ak.partition.set_executor to do so in parallel). If a partitioned array
+    of numbers is sorted at `axis=0`, the sorted partitions are spilled to
+    memory-mapped temporary files and merged, so that the partitions (which
+    may be lazy, see #ak.from_parquet) are not all concatenated in memory.
+    The result has the same partitioning as `array`.
     """
     layout = ak.operations.convert.to_layout(
         array, allow_record=False, allow_other=False
@@ -2538,6 +2545,10 @@ def argsort(array, axis=-1, ascending=True, stable=True, highlevel=True, behavio
         <Array [[1, 0, 2], [], [0], [1, 0]] type='4 * var * int64'>
         >>> data[index]
         <Array [[5, 7, 7], [], [2], [2, 8]] type='4 * var * int64'>
+
+    Partitioned arrays of numbers are sorted at `axis=0` by merging sorted
+    partitions, as described in #ak.sort. Equal values are kept in their
+    original order, regardless of `stable`.
     """
     layout = ak.operations.convert.to_layout(
         array, allow_record=False, allow_other=False
@@ -3958,7 +3969,8 @@ def virtual(
             be generated earlier than intended; if a non-negative int, use this
             to predict the length and verify that the generated array complies.
         cache (None, "new", or MutableMapping): If "new", a new dict (keep-forever
-            cache) is created. If None, no cache is used.
+            cache) is created. If None, no cache is used. An
+            #ak.cache.LRUArrayCache bounds the memory used by the cache.
         cache_key (None or str): If None, a unique string is generated for this
             virtual array for use with the `cache` (unique per Python process);
             otherwise, the explicitly provided key is used (which ought to
@@ -2,7 +2,9 @@
 
 from __future__ import absolute_import
 
+import mmap
 import numbers
+import threading
 
 try:
     from collections.abc import Iterable
@@ -91,8 +93,260 @@ def iterate(numpartitions, arrays):
             yield out
 
 
+_executor = None
+_owned_executor = None
+_in_task = threading.local()
+
+
+def set_executor(executor):
+    """
+    Args:
+        executor (None, int, or executor): If None, operations on partitioned
+            arrays are performed one partition at a time in the calling thread;
+            if an int, a thread pool with that many threads is created; otherwise,
+            any object with a `map(function, iterable)` method, such as
+            `concurrent.futures.ThreadPoolExecutor` or
+            `multiprocessing.pool.ThreadPool`.
+
+    Sets the executor that processes the partitions of an
+    #ak.partition.PartitionedArray: ufuncs, reducers (including #ak.mean,
+    #ak.var, etc., through the reducers they are built from), and structure
+    operations such as #ak.num, #ak.flatten, #ak.combinations, #ak.sort, and
+    #ak.fill_none that act within partitions. Reducers that combine all
+    partitions (`axis=None` or `axis=0`) reduce each partition separately and
+    then combine the partial results.
+
+    Returns the previous executor, so that it can be restored:
+
+        >>> previous = ak.partition.set_executor(8)
+        >>> try:
+        ...     ak.sum(array)
+        ... finally:
+        ...     ak.partition.set_executor(previous)
+
+    A thread pool is effective to the extent that the work releases the
+    Python GIL, as NumPy's ufuncs and reducers on large arrays do. Process
+    pools can't be used, since the tasks are closures over arrays in memory.
+
+    An operation that is already running in the executor (for instance, a
+    ufunc applied by a function passed to #ak.partition.apply) processes its
+    partitions serially, rather than waiting for threads of the same pool.
+    """
+    global _executor, _owned_executor
+    previous = _executor
+
+    if isinstance(executor, (numbers.Integral, np.integer)):
+        if executor < 1:
+            raise ValueError(
+                "number of threads must be at least 1, not {0}".format(executor)
+                + ak._util.exception_suffix(__file__)
+            )
+        import multiprocessing.pool
+
+        executor = multiprocessing.pool.ThreadPool(executor)
+        owned = executor
+    elif executor is None or callable(getattr(executor, "map", None)):
+        owned = None
+    else:
+        raise TypeError(
+            "executor must be None, an int, or have a 'map' method, not {0}".format(
+                repr(executor)
+            )
+            + ak._util.exception_suffix(__file__)
+        )
+
+    if _owned_executor is not None and _owned_executor is not executor:
+        _owned_executor.close()
+    _executor, _owned_executor = executor, owned
+
+    return previous
+
+
+def get_executor():
+    """
+    Returns the executor set by #ak.partition.set_executor (None by default).
+    """
+    return _executor
+
+
+def _run_task(function_item):
+    function, item = function_item
+    _in_task.active = True
+    try:
+        return function(item)
+    finally:
+        _in_task.active = False
+
+
+def execute(function, items):
+    """
+    Args:
+        function (callable): Function to apply to each item.
+        items (iterable): Items, usually partitions.
+
+    Returns the list of `function(item)` for each of the `items`, computed with
+    the executor set by #ak.partition.set_executor, if any.
+    """
+    items = list(items)
+    executor = _executor
+    if executor is None or len(items) <= 1 or getattr(_in_task, "active", False):
+        return [function(x) for x in items]
+    else:
+        return list(executor.map(_run_task, [(function, x) for x in items]))
+
+
 def apply(function, array):
-    return IrregularlyPartitionedArray([function(x) for x in array.partitions])
+    return IrregularlyPartitionedArray(execute(function, array.partitions))
+
+
+# number of items that the external merge sort takes from each sorted run at a time
+_merge_block_length = 1 << 16
+
+
+def _spill(array=None, length=None, dtype=None):
+    # copies an array into (or allocates a new array in) an anonymous,
+    # memory-mapped temporary file, which the operating system can page out
+    import tempfile
+
+    file = tempfile.TemporaryFile()
+    try:
+        if array is None:
+            file.truncate(length * dtype.itemsize)
+            access = mmap.ACCESS_WRITE
+        else:
+            file.write(array.tobytes())
+            file.flush()
+            dtype = array.dtype
+            access = mmap.ACCESS_READ
+        mapped = mmap.mmap(file.fileno(), 0, access=access)
+    finally:
+        file.close()
+    return numpy.frombuffer(mapped, dtype=dtype)
+
+
+def _values_form(partition):
+    # the form of a partition's values, which for a lazy partition is the
+    # generator's form (None if unknown), so that it is not materialized
+    form = partition.form
+    if isinstance(form, ak.forms.VirtualForm):
+        form = form.form
+    return form
+
+
+def _external_sortable(partitions):
+    forms = [_values_form(x) for x in partitions]
+    if not all(
+        isinstance(form, ak.forms.NumpyForm)
+        and form.inner_shape == []
+        and not form.has_identities
+        and form.primitive == forms[0].primitive
+        and form.parameters == forms[0].parameters
+        for form in forms
+    ):
+        return False
+    dtype = np.dtype(forms[0].primitive)
+    return dtype.kind in "biuf" and sum(len(x) for x in partitions) != 0
+
+
+def _external_sort(array, ascending, stable, argsort):
+    """
+    Sorts a PartitionedArray of one-dimensional numbers at axis=0 by sorting
+    each partition (in the partition executor), spilling the sorted runs to
+    memory-mapped temporary files, and merging the runs in blocks of
+    `_merge_block_length` into a memory-mapped output, which is partitioned
+    like the input. Like the in-memory sort, NaN comes first and the merge is
+    stable (ties are ordered by their original position).
+    """
+    partitions = array.partitions
+    starts = [0] + array.stops[:-1]
+
+    def sort_run(partition_start):
+        partition, start = partition_start
+        if isinstance(partition, ak.layout.VirtualArray):
+            partition = partition.array
+        values = numpy.asarray(partition)
+        if len(values) == 0:
+            return None
+        index = numpy.asarray(partition.argsort(0, ascending, True))
+        run_values = _spill(values[index])
+        if argsort:
+            run_index = _spill(index.astype(np.int64) + start)
+        else:
+            run_index = None
+        return [run_values, run_index, 0]
+
+    runs = [x for x in execute(sort_run, zip(partitions, starts)) if x is not None]
+    dtype = np.dtype(np.int64) if argsort else runs[0][0].dtype
+    length = array.stops[-1]
+    output = _spill(length=length, dtype=dtype)
+
+    def key(value, index):
+        if value != value:
+            return (0, 0, index)
+        else:
+            value = value.item()
+            return (1, value if ascending else -value, index)
+
+    position = 0
+    while position < length:
+        blocks = []
+        boundary = None
+        for run_values, run_index, start in runs:
+            stop = min(start + _merge_block_length, len(run_values))
+            values = run_values[start:stop]
+            index = None if run_index is None else run_index[start:stop]
+            blocks.append((values, index))
+            if len(values) != 0:
+                last = key(values[-1], 0 if index is None else index[-1])
+                if boundary is None or last < boundary:
+                    boundary = last
+
+        # every run's block starts with the items that precede or equal
+        # the smallest last item of all blocks; merge only those
+        chunk_values = []
+        chunk_index = []
+        for run, (values, index) in zip(runs, blocks):
+            if len(values) == 0:
+                continue
+            isnan = values != values
+            if boundary[0] == 0:
+                take = isnan
+            else:
+                value = boundary[1] if ascending else -boundary[1]
+                before = (values < value) if ascending else (values > value)
+                take = isnan | before
+                equal = values == value
+            if index is not None:
+                if boundary[0] == 0:
+                    take = take & (index <= boundary[2])
+                else:
+                    take = take | (equal & (index <= boundary[2]))
+            elif boundary[0] != 0:
+                take = take | equal
+            count = int(numpy.count_nonzero(take))
+            chunk_values.append(values[:count])
+            if index is not None:
+                chunk_index.append(index[:count])
+            run[2] += count
+
+        chunk_values = numpy.concatenate(chunk_values)
+        order = numpy.asarray(
+            ak.layout.NumpyArray(chunk_values).argsort(0, ascending, True)
+        )
+        if argsort:
+            chunk = numpy.concatenate(chunk_index)[order]
+        else:
+            chunk = chunk_values[order]
+        output[position : position + len(chunk)] = chunk
+        position += len(chunk)
+
+    parameters = {} if argsort else _values_form(partitions[0]).parameters
+    return array.replace_partitions(
+        [
+            ak.layout.NumpyArray(output[start:stop], parameters=parameters)
+            for start, stop in zip(starts, array.stops)
+        ]
+    )
 
 
 class PartitionedArray(object):
@@ -474,11 +728,13 @@ class PartitionedArray(object):
         return None
 
     def fillna(self, what):
-        return self.replace_partitions([x.fillna(what) for x in self.partitions])
+        return self.replace_partitions(
+            execute(lambda x: x.fillna(what), self.partitions)
+        )
 
     def num(self, axis):
         if first(self).axis_wrap_if_negative(axis) == 0:
-            prepared = [x.num(axis) for x in self.partitions]
+            prepared = execute(lambda x: x.num(axis), self.partitions)
             if any(isinstance(x, ak.layout.Record) for x in prepared):
                 names = None
                 counts = None
@@ -497,7 +753,9 @@ class PartitionedArray(object):
             else:
                 return sum(prepared)
         else:
-            return self.replace_partitions([x.num(axis) for x in self.partitions])
+            return self.replace_partitions(
+                execute(lambda x: x.num(axis), self.partitions)
+            )
 
     def flatten(self, *args, **kwargs):
         return apply(lambda x: x.flatten(*args, **kwargs), self)
@@ -510,7 +768,7 @@ class PartitionedArray(object):
             return self.toContent().rpad(length, axis)
         else:
             return self.replace_partitions(
-                [x.rpad(length, axis) for x in self.partitions]
+                execute(lambda x: x.rpad(length, axis), self.partitions)
             )
 
     def rpad_and_clip(self, length, axis):
@@ -518,7 +776,7 @@ class PartitionedArray(object):
             return self.toContent().rpad_and_clip(length, axis)
         else:
             return self.replace_partitions(
-                [x.rpad_and_clip(length, axis) for x in self.partitions]
+                execute(lambda x: x.rpad_and_clip(length, axis), self.partitions)
             )
 
     def mergeable(self, other):
@@ -549,19 +807,53 @@ class PartitionedArray(object):
                 )
         return out
 
+    # how the partial results of reducing each partition along the outermost
+    # axis are combined (argmin and argmax need the whole array)
+    _reduce_combine = {
+        "count": "sum",
+        "count_nonzero": "sum",
+        "sum": "sum",
+        "prod": "prod",
+        "any": "any",
+        "all": "all",
+        "min": "min",
+        "max": "max",
+    }
+
     def reduce(self, name, axis, mask, keepdims, initial=None):
         branch, depth = first(self).branch_depth
         negaxis = -axis
         if not branch and negaxis <= 0:
             negaxis += depth
         if not branch and negaxis == depth:
-            if initial is None:
-                return getattr(self.toContent(), name)(axis, mask, keepdims)
-            else:
-                return getattr(self.toContent(), name)(axis, mask, keepdims, initial)
+            args = (
+                (axis, mask, keepdims)
+                if initial is None
+                else (
+                    axis,
+                    mask,
+                    keepdims,
+                    initial,
+                )
+            )
+            combine = self._reduce_combine.get(name)
+            if combine is None or self.numpartitions == 1:
+                return getattr(self.toContent(), name)(*args)
+
+            # reductions along the outermost axis are aligned by index, so
+            # reducing the concatenated one-row partial results along the
+            # outermost axis gives the same result as reducing everything
+            partial_args = (axis, mask, True) + args[3:]
+            partials = execute(
+                lambda x: getattr(x, name)(*partial_args), self.partitions
+            )
+            combined = ak.operations.structure.concatenate(partials, highlevel=False)
+            return getattr(combined, combine)(*((0, mask, keepdims) + args[3:]))
         else:
             return self.replace_partitions(
-                [getattr(x, name)(axis, mask, keepdims) for x in self.partitions]
+                execute(
+                    lambda x: getattr(x, name)(axis, mask, keepdims), self.partitions
+                )
             )
 
     def count(self, axis, mask, keepdims):
@@ -609,7 +901,7 @@ class PartitionedArray(object):
 
         else:
             return self.replace_partitions(
-                [x.localindex(axis) for x in self.partitions]
+                execute(lambda x: x.localindex(axis), self.partitions)
             )
 
     def combinations(self, n, replacement, keys, parameters, axis):
@@ -617,31 +909,35 @@ class PartitionedArray(object):
             return self.toContent().combinations(n, replacement, keys, parameters, axis)
         else:
             return self.replace_partitions(
-                [
-                    x.combinations(n, replacement, keys, parameters, axis)
-                    for x in self.partitions
-                ]
+                execute(
+                    lambda x: x.combinations(n, replacement, keys, parameters, axis),
+                    self.partitions,
+                )
             )
 
     def sort(self, axis, ascending, stable):
         if first(self).axis_wrap_if_negative(axis) == 0:
+            if self.numpartitions > 1 and _external_sortable(self.partitions):
+                return _external_sort(self, ascending, stable, False)
             return self.toContent().sort(axis, ascending, stable)
         else:
             return self.replace_partitions(
-                [x.sort(axis, ascending, stable) for x in self.partitions]
+                execute(lambda x: x.sort(axis, ascending, stable), self.partitions)
             )
 
     def argsort(self, axis, ascending, stable):
         if first(self).axis_wrap_if_negative(axis) == 0:
+            if self.numpartitions > 1 and _external_sortable(self.partitions):
+                return _external_sort(self, ascending, stable, True)
             return self.toContent().argsort(axis, ascending, stable)
         else:
             return self.replace_partitions(
-                [x.argsort(axis, ascending, stable) for x in self.partitions]
+                execute(lambda x: x.argsort(axis, ascending, stable), self.partitions)
             )
 
     def numbers_to_type(self, dtype_string):
         return self.replace_partitions(
-            [x.numbers_to_type(dtype_string) for x in self.partitions]
+            execute(lambda x: x.numbers_to_type(dtype_string), self.partitions)
         )
 
     def is_unique(self):
@@ -9,6 +9,69 @@
 #include "awkward/Reducer.h"
 
 namespace awkward {
+  namespace {
+    template <typename OUT, typename IN>
+    const std::shared_ptr<void>
+    reduce_segmented_sum(const std::string& name,
+                         const void* data,
+                         const Index64& offsets,
+                         int64_t outlength) {
+      kernel::lib ptr_lib = kernel::lib::cpu;   // DERIVE
+      std::shared_ptr<OUT> ptr = kernel::malloc<OUT>(
+        ptr_lib, outlength*(int64_t)sizeof(OUT));
+      struct Error err = kernel::ListOffsetArray_reduce_segmented_sum_64<OUT, IN>(
+        ptr_lib,
+        ptr.get(),
+        reinterpret_cast<const IN*>(data),
+        offsets.data(),
+        outlength);
+      util::handle_error(err, util::quote(name), nullptr);
+      return ptr;
+    }
+
+    template <typename T>
+    const std::shared_ptr<void>
+    reduce_segmented_min(const std::string& name,
+                         const void* data,
+                         const Index64& offsets,
+                         int64_t outlength,
+                         T identity) {
+      kernel::lib ptr_lib = kernel::lib::cpu;   // DERIVE
+      std::shared_ptr<T> ptr = kernel::malloc<T>(
+        ptr_lib, outlength*(int64_t)sizeof(T));
+      struct Error err = kernel::ListOffsetArray_reduce_segmented_min_64<T, T>(
+        ptr_lib,
+        ptr.get(),
+        reinterpret_cast<const T*>(data),
+        offsets.data(),
+        outlength,
+        identity);
+      util::handle_error(err, util::quote(name), nullptr);
+      return ptr;
+    }
+
+    template <typename T>
+    const std::shared_ptr<void>
+    reduce_segmented_max(const std::string& name,
+                         const void* data,
+                         const Index64& offsets,
+                         int64_t outlength,
+                         T identity) {
+      kernel::lib ptr_lib = kernel::lib::cpu;   // DERIVE
+      std::shared_ptr<T> ptr = kernel::malloc<T>(
+        ptr_lib, outlength*(int64_t)sizeof(T));
+      struct Error err = kernel::ListOffsetArray_reduce_segmented_max_64<T, T>(
+        ptr_lib,
+        ptr.get(),
+        reinterpret_cast<const T*>(data),
+        offsets.data(),
+        outlength,
+        identity);
+      util::handle_error(err, util::quote(name), nullptr);
+      return ptr;
+    }
+  }
+
   util::dtype
   Reducer::return_dtype(util::dtype given_dtype) const {
     return given_dtype;
@@ -19,6 +82,14 @@ namespace awkward {
     return false;
   }
 
+  const std::shared_ptr<void>
+  Reducer::apply_segmented(util::dtype dtype,
+                           const void* data,
+                           const Index64& offsets,
+                           int64_t outlength) const {
+    return std::shared_ptr<void>(nullptr);
+  }
+
   ////////// count
 
   const std::string
@@ -36,6 +107,24 @@ namespace awkward {
     return util::dtype::int64;
   }
 
+  const std::shared_ptr<void>
+  ReducerCount::apply_segmented(util::dtype dtype,
+                                const void* data,
+                                const Index64& offsets,
+                                int64_t outlength) const {
+    // Like apply_bool, this ignores the data (and therefore its dtype).
+    kernel::lib ptr_lib = kernel::lib::cpu;   // DERIVE
+    std::shared_ptr<int64_t> ptr = kernel::malloc<int64_t>(
+      ptr_lib, outlength*(int64_t)sizeof(int64_t));
+    struct Error err = kernel::ListOffsetArray_reduce_segmented_count_64(
+      ptr_lib,
+      ptr.get(),
+      offsets.data(),
+      outlength);
+    util::handle_error(err, util::quote(name()), nullptr);
+    return ptr;
+  }
+
   const std::shared_ptr<void>
   ReducerCount::apply_bool(const bool* data,
                            const Index64& parents,
@@ -482,6 +571,52 @@ namespace awkward {
     }
   }
 
+  const std::shared_ptr<void>
+  ReducerSum::apply_segmented(util::dtype dtype,
+                              const void* data,
+                              const Index64& offsets,
+                              int64_t outlength) const {
+    switch (dtype) {
+#if defined _MSC_VER || defined __i386__
+    case util::dtype::int8:
+      return reduce_segmented_sum<int32_t, int8_t>(name(), data, offsets, outlength);
+    case util::dtype::int16:
+      return reduce_segmented_sum<int32_t, int16_t>(name(), data, offsets, outlength);
+    case util::dtype::int32:
+      return reduce_segmented_sum<int32_t, int32_t>(name(), data, offsets, outlength);
+    case util::dtype::uint8:
+      return reduce_segmented_sum<uint32_t, uint8_t>(name(), data, offsets, outlength);
+    case util::dtype::uint16:
+      return reduce_segmented_sum<uint32_t, uint16_t>(name(), data, offsets, outlength);
+    case util::dtype::uint32:
+      return reduce_segmented_sum<uint32_t, uint32_t>(name(), data, offsets, outlength);
+#else
+    case util::dtype::int8:
+      return reduce_segmented_sum<int64_t, int8_t>(name(), data, offsets, outlength);
+    case util::dtype::int16:
+      return reduce_segmented_sum<int64_t, int16_t>(name(), data, offsets, outlength);
+    case util::dtype::int32:
+      return reduce_segmented_sum<int64_t, int32_t>(name(), data, offsets, outlength);
+    case util::dtype::uint8:
+      return reduce_segmented_sum<uint64_t, uint8_t>(name(), data, offsets, outlength);
+    case util::dtype::uint16:
+      return reduce_segmented_sum<uint64_t, uint16_t>(name(), data, offsets, outlength);
+    case util::dtype::uint32:
+      return reduce_segmented_sum<uint64_t, uint32_t>(name(), data, offsets, outlength);
+#endif
+    case util::dtype::int64:
+      return reduce_segmented_sum<int64_t, int64_t>(name(), data, offsets, outlength);
+    case util::dtype::uint64:
+      return reduce_segmented_sum<uint64_t, uint64_t>(name(), data, offsets, outlength);
+    case util::dtype::float32:
+      return reduce_segmented_sum<float, float>(name(), data, offsets, outlength);
+    case util::dtype::float64:
+      return reduce_segmented_sum<double, double>(name(), data, offsets, outlength);
+    default:
+      return std::shared_ptr<void>(nullptr);
+    }
+  }
+
   const std::shared_ptr<void>
   ReducerSum::apply_bool(const bool* data,
                          const Index64& parents,
@@ -1745,6 +1880,47 @@ namespace awkward {
     return util::dtype::float64;
   }
 
+  const std::shared_ptr<void>
+  ReducerMin::apply_segmented(util::dtype dtype,
+                              const void* data,
+                              const Index64& offsets,
+                              int64_t outlength) const {
+    switch (dtype) {
+    case util::dtype::int8:
+      return reduce_segmented_min<int8_t>(name(), data, offsets, outlength,
+        has_initial_ ? (int8_t)initial_i64_ : std::numeric_limits<int8_t>::max());
+    case util::dtype::int16:
+      return reduce_segmented_min<int16_t>(name(), data, offsets, outlength,
+        has_initial_ ? (int16_t)initial_i64_ : std::numeric_limits<int16_t>::max());
+    case util::dtype::int32:
+      return reduce_segmented_min<int32_t>(name(), data, offsets, outlength,
+        has_initial_ ? (int32_t)initial_i64_ : std::numeric_limits<int32_t>::max());
+    case util::dtype::int64:
+      return reduce_segmented_min<int64_t>(name(), data, offsets, outlength,
+        has_initial_ ? (int64_t)initial_i64_ : std::numeric_limits<int64_t>::max());
+    case util::dtype::uint8:
+      return reduce_segmented_min<uint8_t>(name(), data, offsets, outlength,
+        has_initial_ ? (uint8_t)initial_u64_ : std::numeric_limits<uint8_t>::max());
+    case util::dtype::uint16:
+      return reduce_segmented_min<uint16_t>(name(), data, offsets, outlength,
+        has_initial_ ? (uint16_t)initial_u64_ : std::numeric_limits<uint16_t>::max());
+    case util::dtype::uint32:
+      return reduce_segmented_min<uint32_t>(name(), data, offsets, outlength,
+        has_initial_ ? (uint32_t)initial_u64_ : std::numeric_limits<uint32_t>::max());
+    case util::dtype::uint64:
+      return reduce_segmented_min<uint64_t>(name(), data, offsets, outlength,
+        has_initial_ ? (uint64_t)initial_u64_ : std::numeric_limits<uint64_t>::max());
+    case util::dtype::float32:
+      return reduce_segmented_min<float>(name(), data, offsets, outlength,
+        has_initial_ ? (float)initial_f64_ : std::numeric_limits<float>::infinity());
+    case util::dtype::float64:
+      return reduce_segmented_min<double>(name(), data, offsets, outlength,
+        has_initial_ ? (double)initial_f64_ : std::numeric_limits<double>::infinity());
+    default:
+      return std::shared_ptr<void>(nullptr);
+    }
+  }
+
   const std::shared_ptr<void>
   ReducerMin::apply_bool(const bool* data,
                          const Index64& parents,
@@ -2079,6 +2255,47 @@ namespace awkward {
     return util::dtype::float64;
   }
 
+  const std::shared_ptr<void>
+  ReducerMax::apply_segmented(util::dtype dtype,
+                              const void* data,
+                              const Index64& offsets,
+                              int64_t outlength) const {
+    switch (dtype) {
+    case util::dtype::int8:
+      return reduce_segmented_max<int8_t>(name(), data, offsets, outlength,
+        has_initial_ ? (int8_t)initial_i64_ : std::numeric_limits<int8_t>::min());
+    case util::dtype::int16:
+      return reduce_segmented_max<int16_t>(name(), data, offsets, outlength,
+        has_initial_ ? (int16_t)initial_i64_ : std::numeric_limits<int16_t>::min());
+    case util::dtype::int32:
+      return reduce_segmented_max<int32_t>(name(), data, offsets, outlength,
+        has_initial_ ? (int32_t)initial_i64_ : std::numeric_limits<int32_t>::min());
+    case util::dtype::int64:
+      return reduce_segmented_max<int64_t>(name(), data, offsets, outlength,
+        has_initial_ ? (int64_t)initial_i64_ : std::numeric_limits<int64_t>::min());
+    case util::dtype::uint8:
+      return reduce_segmented_max<uint8_t>(name(), data, offsets, outlength,
+        has_initial_ ? (uint8_t)initial_u64_ : std::numeric_limits<uint8_t>::min());
+    case util::dtype::uint16:
+      return reduce_segmented_max<uint16_t>(name(), data, offsets, outlength,
+        has_initial_ ? (uint16_t)initial_u64_ : std::numeric_limits<uint16_t>::min());
+    case util::dtype::uint32:
+      return reduce_segmented_max<uint32_t>(name(), data, offsets, outlength,
+        has_initial_ ? (uint32_t)initial_u64_ : std::numeric_limits<uint32_t>::min());
+    case util::dtype::uint64:
+      return reduce_segmented_max<uint64_t>(name(), data, offsets, outlength,
+        has_initial_ ? (uint64_t)initial_u64_ : std::numeric_limits<uint64_t>::min());
+    case util::dtype::float32:
+      return reduce_segmented_max<float>(name(), data, offsets, outlength,
+        has_initial_ ? (float)initial_f64_ : -std::numeric_limits<float>::infinity());
+    case util::dtype::float64:
+      return reduce_segmented_max<double>(name(), data, offsets, outlength,
+        has_initial_ ? (double)initial_f64_ : -std::numeric_limits<double>::infinity());
+    default:
+      return std::shared_ptr<void>(nullptr);
+    }
+  }
+
   const std::shared_ptr<void>
   ReducerMax::apply_bool(const bool* data,
                          const Index64& parents,
@@ -1429,14 +1429,6 @@ namespace awkward {
         nextlen);
       util::handle_error(err4, classname(), identities_.get());
 
-      Index64 gaps(outlength);
-      struct Error err5 = kernel::ListOffsetArray_reduce_nonlocal_findgaps_64(
-        kernel::lib::cpu,   // DERIVE
-        gaps.data(),
-        parents.data(),
-        parents.length());
-      util::handle_error(err5, classname(), identities_.get());
-
       Index64 outstarts(outlength);
       Index64 outstops(outlength);
       struct Error err6 = kernel::ListOffsetArray_reduce_nonlocal_outstartsstops_64(
@@ -1445,7 +1437,6 @@ namespace awkward {
         outstops.data(),
         distincts.data(),
         maxcount * outlength,
-        gaps.data(),
         outlength);
       util::handle_error(err6, classname(), identities_.get());
 
@@ -1499,34 +1490,46 @@ namespace awkward {
     }
 
     else {
-      int64_t globalstart;
-      int64_t globalstop;
-      struct Error err1 = kernel::ListOffsetArray_reduce_global_startstop_64(
-        kernel::lib::cpu,   // DERIVE
-        &globalstart,
-        &globalstop,
-        offsets_.data(),
-        offsets_.length() - 1);
-      util::handle_error(err1, classname(), identities_.get());
+      // Lists of numbers can be reduced segment by segment, using the
+      // offsets directly, without making a parents index for the content.
+      ContentPtr outcontent(nullptr);
+      if (NumpyArray* rawcontent = dynamic_cast<NumpyArray*>(content_.get())) {
+        outcontent = rawcontent->reduce_segmented(reducer,
+                                                  offsets_,
+                                                  mask,
+                                                  keepdims);
+      }
 
-      Index64 nextparents(globalstop - globalstart);
-      struct Error err2 = kernel::ListOffsetArray_reduce_local_nextparents_64(
-        kernel::lib::cpu,   // DERIVE
-        nextparents.data(),
-        offsets_.data(),
-        offsets_.length() - 1);
-      util::handle_error(err2, classname(), identities_.get());
+      if (outcontent.get() == nullptr) {
+        int64_t globalstart;
+        int64_t globalstop;
+        struct Error err1 = kernel::ListOffsetArray_reduce_global_startstop_64(
+          kernel::lib::cpu,   // DERIVE
+          &globalstart,
+          &globalstop,
+          offsets_.data(),
+          offsets_.length() - 1);
+        util::handle_error(err1, classname(), identities_.get());
 
-      ContentPtr trimmed = content_.get()->getitem_range_nowrap(globalstart,
-                                                                globalstop);
-      ContentPtr outcontent = trimmed.get()->reduce_next(reducer,
-                                                         negaxis,
-                                                         util::make_starts(offsets_),
-                                                         shifts,
-                                                         nextparents,
-                                                         offsets_.length() - 1,
-                                                         mask,
-                                                         keepdims);
+        Index64 nextparents(globalstop - globalstart);
+        struct Error err2 = kernel::ListOffsetArray_reduce_local_nextparents_64(
+          kernel::lib::cpu,   // DERIVE
+          nextparents.data(),
+          offsets_.data(),
+          offsets_.length() - 1);
+        util::handle_error(err2, classname(), identities_.get());
+
+        ContentPtr trimmed = content_.get()->getitem_range_nowrap(globalstart,
+                                                                  globalstop);
+        outcontent = trimmed.get()->reduce_next(reducer,
+                                                negaxis,
+                                                util::make_starts(offsets_),
+                                                shifts,
+                                                nextparents,
+                                                offsets_.length() - 1,
+                                                mask,
+                                                keepdims);
+      }
 
       Index64 outoffsets(outlength + 1);
       struct Error err3 = kernel::ListOffsetArray_reduce_local_outoffsets_64(
@@ -3357,6 +3357,66 @@ namespace awkward {
     }
   }
 
+  const ContentPtr
+  NumpyArray::reduce_segmented(const Reducer& reducer,
+                               const Index64& offsets,
+                               bool mask,
+                               bool keepdims) const {
+    if (shape_.size() != 1  ||  !iscontiguous()  ||  reducer.returns_positions()) {
+      return ContentPtr(nullptr);
+    }
+    int64_t outlength = offsets.length() - 1;
+    std::shared_ptr<void> ptr = reducer.apply_segmented(dtype_,
+                                                        data(),
+                                                        offsets,
+                                                        outlength);
+    if (ptr.get() == nullptr) {
+      return ContentPtr(nullptr);
+    }
+
+    util::dtype dtype = reducer.return_dtype(dtype_);
+    std::string format = util::dtype_to_format(dtype, format_);
+    ssize_t itemsize = util::dtype_to_itemsize(dtype);
+
+    std::vector<ssize_t> shape({ (ssize_t)outlength });
+    std::vector<ssize_t> strides({ itemsize });
+    ContentPtr out = std::make_shared<NumpyArray>(Identities::none(),
+                                                  util::Parameters(),
+                                                  ptr,
+                                                  shape,
+                                                  strides,
+                                                  0,
+                                                  itemsize,
+                                                  format,
+                                                  dtype,
+                                                  ptr_lib_);
+
+    if (mask) {
+      Index8 outmask(outlength);
+      struct Error err = kernel::ListOffsetArray_reduce_segmented_mask_ByteMaskedArray_64(
+        kernel::lib::cpu,   // DERIVE
+        outmask.data(),
+        offsets.data(),
+        outlength);
+      util::handle_error(err, classname(), nullptr);
+      out = std::make_shared<ByteMaskedArray>(Identities::none(),
+                                              util::Parameters(),
+                                              outmask,
+                                              out,
+                                              false);
+    }
+
+    if (keepdims) {
+      out = std::make_shared<RegularArray>(Identities::none(),
+                                           util::Parameters(),
+                                           out,
+                                           1,
+                                           length());
+    }
+
+    return out;
+  }
+
   const ContentPtr
   NumpyArray::localindex(int64_t axis, int64_t depth) const {
     int64_t posaxis = axis_wrap_if_negative(axis);
@@ -48,6 +48,18 @@ namespace awkward {
     return builder_.get()->snapshot();
   }
 
+  const ContentPtr
+  ArrayBuilder::snapshot_range(int64_t start, int64_t stop) const {
+    if (start < 0  ||  stop < start  ||  stop > length()) {
+      throw std::invalid_argument(
+        std::string("snapshot range ") + std::to_string(start)
+        + std::string(":") + std::to_string(stop)
+        + std::string(" is out of bounds for an ArrayBuilder of length ")
+        + std::to_string(length()) + FILENAME(__LINE__));
+    }
+    return builder_.get()->snapshot_range(start, stop);
+  }
+
   const ContentPtr
   ArrayBuilder::getitem_at(int64_t at) const {
     return snapshot().get()->getitem_at(at);
@@ -93,6 +105,21 @@ namespace awkward {
     maybeupdate(builder_.get()->real(x));
   }
 
+  void
+  ArrayBuilder::booleans(const bool* x, int64_t length) {
+    maybeupdate(builder_.get()->booleans(x, length));
+  }
+
+  void
+  ArrayBuilder::integers(const int64_t* x, int64_t length) {
+    maybeupdate(builder_.get()->integers(x, length));
+  }
+
+  void
+  ArrayBuilder::reals(const double* x, int64_t length) {
+    maybeupdate(builder_.get()->reals(x, length));
+  }
+
   void
   ArrayBuilder::complex(std::complex<double> x) {
     maybeupdate(builder_.get()->complex(x));
@@ -3,9 +3,12 @@
 #include "awkward/builder/ArrayBuilderOptions.h"
 
 namespace awkward {
-  ArrayBuilderOptions::ArrayBuilderOptions(int64_t initial, double resize)
+  ArrayBuilderOptions::ArrayBuilderOptions(int64_t initial,
+                                           double resize,
+                                           bool chunked)
       : initial_(initial)
-      , resize_(resize) { }
+      , resize_(resize)
+      , chunked_(chunked) { }
 
   int64_t
   ArrayBuilderOptions::initial() const {
@@ -16,4 +19,9 @@ namespace awkward {
   ArrayBuilderOptions::resize() const {
     return resize_;
   }
+
+  bool
+  ArrayBuilderOptions::chunked() const {
+    return chunked_;
+  }
 }
@@ -40,11 +40,16 @@ namespace awkward {
 
   const ContentPtr
   BoolBuilder::snapshot() const {
-    std::vector<ssize_t> shape = { (ssize_t)buffer_.length() };
+    return snapshot_range(0, buffer_.length());
+  }
+
+  const ContentPtr
+  BoolBuilder::snapshot_range(int64_t start, int64_t stop) const {
+    std::vector<ssize_t> shape = { (ssize_t)(stop - start) };
     std::vector<ssize_t> strides = { (ssize_t)sizeof(bool) };
     return std::make_shared<NumpyArray>(Identities::none(),
                                         util::Parameters(),
-                                        buffer_.ptr(),
+                                        buffer_.ptr_range(start, stop),
                                         shape,
                                         strides,
                                         0,
@@ -86,6 +91,12 @@ namespace awkward {
     return out;
   }
 
+  const BuilderPtr
+  BoolBuilder::booleans(const bool* x, int64_t length) {
+    buffer_.extend(reinterpret_cast<const uint8_t*>(x), length);
+    return shared_from_this();
+  }
+
   const BuilderPtr
   BoolBuilder::complex(std::complex<double> x) {
     BuilderPtr out = UnionBuilder::fromsingle(options_, shared_from_this());
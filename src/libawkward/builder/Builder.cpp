@@ -1,7 +1,47 @@
 // BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
 
+#include "awkward/Content.h"
+
 #include "awkward/builder/Builder.h"
 
 namespace awkward {
   Builder::~Builder() = default;
+
+  const ContentPtr
+  Builder::snapshot_range(int64_t start, int64_t stop) const {
+    return snapshot().get()->getitem_range_nowrap(start, stop);
+  }
+
+  const BuilderPtr
+  Builder::booleans(const bool* x, int64_t length) {
+    for (int64_t i = 0;  i < length;  i++) {
+      BuilderPtr out = boolean(x[i]);
+      if (out.get() != this) {
+        return out.get()->booleans(x + i + 1, length - i - 1);
+      }
+    }
+    return shared_from_this();
+  }
+
+  const BuilderPtr
+  Builder::integers(const int64_t* x, int64_t length) {
+    for (int64_t i = 0;  i < length;  i++) {
+      BuilderPtr out = integer(x[i]);
+      if (out.get() != this) {
+        return out.get()->integers(x + i + 1, length - i - 1);
+      }
+    }
+    return shared_from_this();
+  }
+
+  const BuilderPtr
+  Builder::reals(const double* x, int64_t length) {
+    for (int64_t i = 0;  i < length;  i++) {
+      BuilderPtr out = real(x[i]);
+      if (out.get() != this) {
+        return out.get()->reals(x + i + 1, length - i - 1);
+      }
+    }
+    return shared_from_this();
+  }
 }
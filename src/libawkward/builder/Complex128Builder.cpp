@@ -22,7 +22,9 @@ namespace awkward {
                                const GrowableBuffer<int64_t>& old) {
     GrowableBuffer<std::complex<double>> buffer =
       GrowableBuffer<std::complex<double>>::empty(options, old.reserved());
-    int64_t* oldraw = old.ptr().get();
+    // holds a copy if the old buffer is in chunked panels
+    std::shared_ptr<int64_t> oldptr = old.ptr();
+    int64_t* oldraw = oldptr.get();
     std::complex<double>* newraw = buffer.ptr().get();
     for (int64_t i = 0;  i < 2*old.length();  i++) {
       newraw[i] = {static_cast<double>(oldraw[i]), 0};
@@ -36,7 +38,9 @@ namespace awkward {
                                  const GrowableBuffer<double>& old) {
     GrowableBuffer<std::complex<double>> buffer =
       GrowableBuffer<std::complex<double>>::empty(options, old.reserved());
-    double* oldraw = old.ptr().get();
+    // holds a copy if the old buffer is in chunked panels
+    std::shared_ptr<double> oldptr = old.ptr();
+    double* oldraw = oldptr.get();
     std::complex<double>* newraw = buffer.ptr().get();
     for (int64_t i = 0;  i < old.length();  i++) {
       newraw[i] = std::complex<double>(oldraw[i], 0);
@@ -67,11 +71,16 @@ namespace awkward {
 
   const ContentPtr
   Complex128Builder::snapshot() const {
-    std::vector<ssize_t> shape = { (ssize_t)buffer_.length() };
+    return snapshot_range(0, buffer_.length());
+  }
+
+  const ContentPtr
+  Complex128Builder::snapshot_range(int64_t start, int64_t stop) const {
+    std::vector<ssize_t> shape = { (ssize_t)(stop - start) };
     std::vector<ssize_t> strides = { (ssize_t)sizeof(std::complex<double>) };
     return std::make_shared<NumpyArray>(Identities::none(),
                                         util::Parameters(),
-                                        buffer_.ptr(),
+                                        buffer_.ptr_range(start, stop),
                                         shape,
                                         strides,
                                         0,
@@ -48,7 +48,12 @@ namespace awkward {
 
   const ContentPtr
   DatetimeBuilder::snapshot() const {
-    std::vector<ssize_t> shape = { (ssize_t)content_.length() };
+    return snapshot_range(0, content_.length());
+  }
+
+  const ContentPtr
+  DatetimeBuilder::snapshot_range(int64_t start, int64_t stop) const {
+    std::vector<ssize_t> shape = { (ssize_t)(stop - start) };
     std::vector<ssize_t> strides = { (ssize_t)sizeof(int64_t) };
 
     auto dtype = util::name_to_dtype(units_);
@@ -58,7 +63,7 @@ namespace awkward {
     return std::make_shared<NumpyArray>(
              Identities::none(),
              util::Parameters(),
-             content_.ptr(),
+             content_.ptr_range(start, stop),
              shape,
              strides,
              0,
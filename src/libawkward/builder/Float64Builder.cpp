@@ -24,7 +24,9 @@ namespace awkward {
                             const GrowableBuffer<int64_t>& old) {
     GrowableBuffer<double> buffer =
       GrowableBuffer<double>::empty(options, old.reserved());
-    int64_t* oldraw = old.ptr().get();
+    // holds a copy if the old buffer is in chunked panels
+    std::shared_ptr<int64_t> oldptr = old.ptr();
+    int64_t* oldraw = oldptr.get();
     double* newraw = buffer.ptr().get();
     for (int64_t i = 0;  i < old.length();  i++) {
       newraw[i] = (double)oldraw[i];
@@ -60,11 +62,16 @@ namespace awkward {
 
   const ContentPtr
   Float64Builder::snapshot() const {
-    std::vector<ssize_t> shape = { (ssize_t)buffer_.length() };
+    return snapshot_range(0, buffer_.length());
+  }
+
+  const ContentPtr
+  Float64Builder::snapshot_range(int64_t start, int64_t stop) const {
+    std::vector<ssize_t> shape = { (ssize_t)(stop - start) };
     std::vector<ssize_t> strides = { (ssize_t)sizeof(double) };
     return std::make_shared<NumpyArray>(Identities::none(),
                                         util::Parameters(),
-                                        buffer_.ptr(),
+                                        buffer_.ptr_range(start, stop),
                                         shape,
                                         strides,
                                         0,
@@ -105,6 +112,20 @@ namespace awkward {
     return shared_from_this();
   }
 
+  const BuilderPtr
+  Float64Builder::integers(const int64_t* x, int64_t length) {
+    for (int64_t i = 0;  i < length;  i++) {
+      buffer_.append((double)x[i]);
+    }
+    return shared_from_this();
+  }
+
+  const BuilderPtr
+  Float64Builder::reals(const double* x, int64_t length) {
+    buffer_.extend(x, length);
+    return shared_from_this();
+  }
+
   const BuilderPtr
   Float64Builder::complex(std::complex<double> x) {
     BuilderPtr out = Complex128Builder::fromfloat64(options_, buffer_);
@@ -4,11 +4,55 @@
 
 #include "awkward/builder/GrowableBuffer.h"
 
+#include <atomic>
 #include <complex>
 #include <cmath>
 #include <cstring>
 
 namespace awkward {
+  namespace {
+    std::atomic<int64_t> current_bytes_(0);
+    std::atomic<int64_t> peak_bytes_(0);
+    std::atomic<int64_t> copies_(0);
+    std::atomic<int64_t> copied_bytes_(0);
+
+    /// @brief Allocates `length` elements, counting them in the
+    /// GrowableBufferStats until the last reference is released.
+    template <typename T>
+    std::shared_ptr<T>
+    allocate(int64_t length) {
+      int64_t bytes = length*(int64_t)sizeof(T);
+      std::shared_ptr<T> raw = kernel::malloc<T>(kernel::lib::cpu, bytes);
+      int64_t now = (current_bytes_ += bytes);
+      int64_t peak = peak_bytes_.load();
+      while (now > peak  &&  !peak_bytes_.compare_exchange_weak(peak, now)) { }
+      return std::shared_ptr<T>(raw.get(), [raw, bytes](T* ptr) {
+        current_bytes_ -= bytes;
+      });
+    }
+
+    void
+    count_copy(int64_t bytes) {
+      copies_++;
+      copied_bytes_ += bytes;
+    }
+  }
+
+  GrowableBufferStats
+  growablebuffer_stats() {
+    return { current_bytes_.load(),
+             peak_bytes_.load(),
+             copies_.load(),
+             copied_bytes_.load() };
+  }
+
+  void
+  reset_growablebuffer_stats() {
+    peak_bytes_ = current_bytes_.load();
+    copies_ = 0;
+    copied_bytes_ = 0;
+  }
+
   template <typename T>
   GrowableBuffer<T>
   GrowableBuffer<T>::empty(const ArrayBuilderOptions& options) {
@@ -23,7 +67,7 @@ namespace awkward {
     if (actual < (size_t)minreserve) {
       actual = (size_t)minreserve;
     }
-    std::shared_ptr<T> ptr = kernel::malloc<T>(kernel::lib::cpu, (int64_t)(actual*sizeof(T)));
+    std::shared_ptr<T> ptr = allocate<T>((int64_t)actual);
     return GrowableBuffer(options, ptr, 0, (int64_t)actual);
   }
 
@@ -48,7 +92,7 @@ namespace awkward {
     if (actual < (size_t)length) {
       actual = (size_t)length;
     }
-    std::shared_ptr<T> ptr = kernel::malloc<T>(kernel::lib::cpu, (int64_t)(actual*sizeof(T)));
+    std::shared_ptr<T> ptr = allocate<T>((int64_t)actual);
     T* rawptr = ptr.get();
     for (int64_t i = 0;  i < length;  i++) {
       rawptr[i] = (T)i;
@@ -64,19 +108,60 @@ namespace awkward {
       : options_(options)
       , ptr_(ptr)
       , length_(length)
-      , reserved_(reserved) { }
+      , reserved_(reserved)
+      , panels_length_(0) { }
 
   template <typename T>
   GrowableBuffer<T>::GrowableBuffer(const ArrayBuilderOptions& options)
       : GrowableBuffer(options,
-                       kernel::malloc<T>(kernel::lib::cpu, options.initial()*(int64_t)sizeof(T)),
+                       allocate<T>(options.initial()),
                        0,
                        options.initial()) { }
 
   template <typename T>
   const std::shared_ptr<T>
   GrowableBuffer<T>::ptr() const {
-    return ptr_;
+    if (panels_.empty()) {
+      return ptr_;
+    }
+    return ptr_range(0, length_);
+  }
+
+  template <typename T>
+  const std::shared_ptr<T>
+  GrowableBuffer<T>::ptr_range(int64_t start, int64_t stop) const {
+    // the current panel is the last one, after all of #panels_
+    size_t numpanels = panels_.size() + 1;
+    size_t first = 0;
+    int64_t firststart = 0;
+    while (first + 1 < numpanels  &&
+           start >= firststart + panel_lengths_[first]) {
+      firststart += panel_lengths_[first];
+      first++;
+    }
+    const std::shared_ptr<T>& firstpanel =
+      (first < panels_.size() ? panels_[first] : ptr_);
+    if (first + 1 == numpanels  ||
+        stop <= firststart + panel_lengths_[first]) {
+      return std::shared_ptr<T>(firstpanel,
+                                firstpanel.get() + (start - firststart));
+    }
+    std::shared_ptr<T> ptr = allocate<T>(stop - start);
+    int64_t panelstart = firststart;
+    for (size_t i = first;  i < numpanels  &&  panelstart < stop;  i++) {
+      const std::shared_ptr<T>& panel =
+        (i < panels_.size() ? panels_[i] : ptr_);
+      int64_t panelstop = (i < panels_.size() ? panelstart + panel_lengths_[i]
+                                              : length_);
+      int64_t low = (start > panelstart ? start : panelstart);
+      int64_t high = (stop < panelstop ? stop : panelstop);
+      memcpy(ptr.get() + (low - start),
+             panel.get() + (low - panelstart),
+             (size_t)(high - low) * sizeof(T));
+      panelstart = panelstop;
+    }
+    count_copy((stop - start)*(int64_t)sizeof(T));
+    return ptr;
   }
 
   template <typename T>
@@ -88,6 +173,9 @@ namespace awkward {
   template <typename T>
   void
   GrowableBuffer<T>::set_length(int64_t newlength) {
+    if (!panels_.empty()) {
+      concatenate(newlength > length_ ? newlength : length_);
+    }
     if (newlength > reserved_) {
       set_reserved(newlength);
     }
@@ -104,11 +192,30 @@ namespace awkward {
   void
   GrowableBuffer<T>::set_reserved(int64_t minreserved) {
     if (minreserved > reserved_) {
-      std::shared_ptr<T> ptr = kernel::malloc<T>(kernel::lib::cpu, minreserved*(int64_t)sizeof(T));
-      memcpy(ptr.get(), ptr_.get(), (size_t)length_ * sizeof(T));
-      ptr_ = ptr;
-      reserved_ = minreserved;
+      concatenate(minreserved);
+    }
+  }
+
+  template <typename T>
+  void
+  GrowableBuffer<T>::concatenate(int64_t minreserved) {
+    std::shared_ptr<T> ptr = allocate<T>(minreserved);
+    int64_t start = 0;
+    for (size_t i = 0;  i < panels_.size();  i++) {
+      memcpy(ptr.get() + start,
+             panels_[i].get(),
+             (size_t)panel_lengths_[i] * sizeof(T));
+      start += panel_lengths_[i];
     }
+    memcpy(ptr.get() + start,
+           ptr_.get(),
+           (size_t)(length_ - panels_length_) * sizeof(T));
+    count_copy(length_*(int64_t)sizeof(T));
+    ptr_ = ptr;
+    reserved_ = minreserved;
+    panels_.clear();
+    panel_lengths_.clear();
+    panels_length_ = 0;
   }
 
   template <typename T>
@@ -116,22 +223,94 @@ namespace awkward {
   GrowableBuffer<T>::clear() {
     length_ = 0;
     reserved_ = options_.initial();
-    ptr_ = kernel::malloc<T>(kernel::lib::cpu, options_.initial()*(int64_t)sizeof(T));
+    ptr_ = allocate<T>(options_.initial());
+    panels_.clear();
+    panel_lengths_.clear();
+    panels_length_ = 0;
   }
 
   template <typename T>
   void
   GrowableBuffer<T>::append(T datum) {
     if (length_ == reserved_) {
-      set_reserved((int64_t)ceil(reserved_ * options_.resize()));
+      if (options_.chunked()) {
+        int64_t panel = (int64_t)ceil(reserved_ * (options_.resize() - 1.0));
+        if (panel < options_.initial()) {
+          panel = options_.initial();
+        }
+        if (panel < 1) {
+          panel = 1;
+        }
+        panels_.push_back(ptr_);
+        panel_lengths_.push_back(length_ - panels_length_);
+        panels_length_ = length_;
+        ptr_ = allocate<T>(panel);
+        reserved_ += panel;
+      }
+      else {
+        set_reserved((int64_t)ceil(reserved_ * options_.resize()));
+      }
     }
-    ptr_.get()[length_] = datum;
+    ptr_.get()[length_ - panels_length_] = datum;
     length_++;
   }
 
+  template <typename T>
+  void
+  GrowableBuffer<T>::extend(const T* data, int64_t length) {
+    if (length <= 0) {
+      return;
+    }
+    int64_t available = reserved_ - length_;
+    if (length > available) {
+      if (options_.chunked()) {
+        if (available > 0) {
+          memcpy(ptr_.get() + (length_ - panels_length_),
+                 data,
+                 (size_t)available * sizeof(T));
+          length_ += available;
+          data += available;
+          length -= available;
+        }
+        int64_t panel = (int64_t)ceil(reserved_ * (options_.resize() - 1.0));
+        if (panel < options_.initial()) {
+          panel = options_.initial();
+        }
+        if (panel < length) {
+          panel = length;
+        }
+        panels_.push_back(ptr_);
+        panel_lengths_.push_back(length_ - panels_length_);
+        panels_length_ = length_;
+        ptr_ = allocate<T>(panel);
+        reserved_ += panel;
+      }
+      else {
+        int64_t newreserved = (int64_t)ceil(reserved_ * options_.resize());
+        if (newreserved < length_ + length) {
+          newreserved = length_ + length;
+        }
+        set_reserved(newreserved);
+      }
+    }
+    memcpy(ptr_.get() + (length_ - panels_length_),
+           data,
+           (size_t)length * sizeof(T));
+    length_ += length;
+  }
+
   template <typename T>
   T
   GrowableBuffer<T>::getitem_at_nowrap(int64_t at) const {
+    if (at >= panels_length_) {
+      return ptr_.get()[at - panels_length_];
+    }
+    for (size_t i = 0;  i < panels_.size();  i++) {
+      if (at < panel_lengths_[i]) {
+        return panels_[i].get()[at];
+      }
+      at -= panel_lengths_[i];
+    }
     return ptr_.get()[at];
   }
 
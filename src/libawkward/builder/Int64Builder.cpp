@@ -47,12 +47,17 @@ namespace awkward {
 
   const ContentPtr
   Int64Builder::snapshot() const {
-    std::vector<ssize_t> shape = { (ssize_t)buffer_.length() };
+    return snapshot_range(0, buffer_.length());
+  }
+
+  const ContentPtr
+  Int64Builder::snapshot_range(int64_t start, int64_t stop) const {
+    std::vector<ssize_t> shape = { (ssize_t)(stop - start) };
     std::vector<ssize_t> strides = { (ssize_t)sizeof(int64_t) };
     return std::make_shared<NumpyArray>(
              Identities::none(),
              util::Parameters(),
-             buffer_.ptr(),
+             buffer_.ptr_range(start, stop),
              shape,
              strides,
              0,
@@ -94,6 +99,12 @@ namespace awkward {
     return out;
   }
 
+  const BuilderPtr
+  Int64Builder::integers(const int64_t* x, int64_t length) {
+    buffer_.extend(x, length);
+    return shared_from_this();
+  }
+
   const BuilderPtr
   Int64Builder::complex(std::complex<double> x) {
     BuilderPtr out = Complex128Builder::fromint64(options_, buffer_);
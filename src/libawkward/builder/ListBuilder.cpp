@@ -61,6 +61,21 @@ namespace awkward {
                                                content_.get()->snapshot());
   }
 
+  const ContentPtr
+  ListBuilder::snapshot_range(int64_t start, int64_t stop) const {
+    int64_t low = offsets_.getitem_at_nowrap(start);
+    Index64 offsets(stop - start + 1);
+    int64_t* rawoffsets = offsets.data();
+    for (int64_t i = 0;  i <= stop - start;  i++) {
+      rawoffsets[i] = offsets_.getitem_at_nowrap(start + i) - low;
+    }
+    return std::make_shared<ListOffsetArray64>(
+      Identities::none(),
+      util::Parameters(),
+      offsets,
+      content_.get()->snapshot_range(low, low + rawoffsets[stop - start]));
+  }
+
   bool
   ListBuilder::active() const {
     return begun_;
@@ -118,6 +133,39 @@ namespace awkward {
     }
   }
 
+  const BuilderPtr
+  ListBuilder::booleans(const bool* x, int64_t length) {
+    if (!begun_) {
+      return Builder::booleans(x, length);
+    }
+    else {
+      maybeupdate(content_.get()->booleans(x, length));
+      return shared_from_this();
+    }
+  }
+
+  const BuilderPtr
+  ListBuilder::integers(const int64_t* x, int64_t length) {
+    if (!begun_) {
+      return Builder::integers(x, length);
+    }
+    else {
+      maybeupdate(content_.get()->integers(x, length));
+      return shared_from_this();
+    }
+  }
+
+  const BuilderPtr
+  ListBuilder::reals(const double* x, int64_t length) {
+    if (!begun_) {
+      return Builder::reals(x, length);
+    }
+    else {
+      maybeupdate(content_.get()->reals(x, length));
+      return shared_from_this();
+    }
+  }
+
   const BuilderPtr
   ListBuilder::complex(std::complex<double> x) {
     if (!begun_) {
@@ -67,6 +67,38 @@ namespace awkward {
                                 content_.get()->snapshot()).simplify_optiontype();
   }
 
+  const ContentPtr
+  OptionBuilder::snapshot_range(int64_t start, int64_t stop) const {
+    // valid entries point to increasing positions in the content, so the
+    // range of content they need is from the first to the last of them
+    int64_t low = -1;
+    int64_t high = -1;
+    Index64 index(stop - start);
+    int64_t* rawindex = index.data();
+    for (int64_t i = 0;  i < stop - start;  i++) {
+      int64_t x = index_.getitem_at_nowrap(start + i);
+      if (x >= 0) {
+        if (low == -1) {
+          low = x;
+        }
+        high = x + 1;
+        rawindex[i] = x - low;
+      }
+      else {
+        rawindex[i] = -1;
+      }
+    }
+    if (low == -1) {
+      low = 0;
+      high = 0;
+    }
+    return IndexedOptionArray64(
+      Identities::none(),
+      util::Parameters(),
+      index,
+      content_.get()->snapshot_range(low, high)).simplify_optiontype();
+  }
+
   bool
   OptionBuilder::active() const {
     return content_.get()->active();
@@ -122,6 +154,51 @@ namespace awkward {
     return shared_from_this();
   }
 
+  const BuilderPtr
+  OptionBuilder::booleans(const bool* x, int64_t length) {
+    if (!content_.get()->active()) {
+      int64_t contentlength = content_.get()->length();
+      maybeupdate(content_.get()->booleans(x, length));
+      for (int64_t i = 0;  i < length;  i++) {
+        index_.append(contentlength + i);
+      }
+    }
+    else {
+      content_.get()->booleans(x, length);
+    }
+    return shared_from_this();
+  }
+
+  const BuilderPtr
+  OptionBuilder::integers(const int64_t* x, int64_t length) {
+    if (!content_.get()->active()) {
+      int64_t contentlength = content_.get()->length();
+      maybeupdate(content_.get()->integers(x, length));
+      for (int64_t i = 0;  i < length;  i++) {
+        index_.append(contentlength + i);
+      }
+    }
+    else {
+      content_.get()->integers(x, length);
+    }
+    return shared_from_this();
+  }
+
+  const BuilderPtr
+  OptionBuilder::reals(const double* x, int64_t length) {
+    if (!content_.get()->active()) {
+      int64_t contentlength = content_.get()->length();
+      maybeupdate(content_.get()->reals(x, length));
+      for (int64_t i = 0;  i < length;  i++) {
+        index_.append(contentlength + i);
+      }
+    }
+    else {
+      content_.get()->reals(x, length);
+    }
+    return shared_from_this();
+  }
+
   const BuilderPtr
   OptionBuilder::complex(std::complex<double> x) {
     if (!content_.get()->active()) {
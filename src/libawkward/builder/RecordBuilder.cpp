@@ -120,6 +120,32 @@ namespace awkward {
                                          caches);
   }
 
+  const ContentPtr
+  RecordBuilder::snapshot_range(int64_t start, int64_t stop) const {
+    if (length_ == -1) {
+      return std::make_shared<EmptyArray>(Identities::none(),
+                                          util::Parameters());
+    }
+    util::Parameters parameters;
+    if (nameptr_ != nullptr) {
+      parameters["__record__"] = util::quote(name_);
+    }
+    ContentPtrVec contents;
+    util::RecordLookupPtr recordlookup =
+      std::make_shared<util::RecordLookup>();
+    for (size_t i = 0;  i < contents_.size();  i++) {
+      contents.push_back(contents_[i].get()->snapshot_range(start, stop));
+      recordlookup.get()->push_back(keys_[i]);
+    }
+    std::vector<ArrayCachePtr> caches;  // nothing is virtual here
+    return std::make_shared<RecordArray>(Identities::none(),
+                                         parameters,
+                                         contents,
+                                         recordlookup,
+                                         stop - start,
+                                         caches);
+  }
+
   bool
   RecordBuilder::active() const {
     return begun_;
@@ -209,6 +235,36 @@ namespace awkward {
     return shared_from_this();
   }
 
+  const BuilderPtr
+  RecordBuilder::booleans(const bool* x, int64_t length) {
+    if (begun_  &&  nextindex_ != -1  &&
+        contents_[(size_t)nextindex_].get()->active()) {
+      contents_[(size_t)nextindex_].get()->booleans(x, length);
+      return shared_from_this();
+    }
+    return Builder::booleans(x, length);
+  }
+
+  const BuilderPtr
+  RecordBuilder::integers(const int64_t* x, int64_t length) {
+    if (begun_  &&  nextindex_ != -1  &&
+        contents_[(size_t)nextindex_].get()->active()) {
+      contents_[(size_t)nextindex_].get()->integers(x, length);
+      return shared_from_this();
+    }
+    return Builder::integers(x, length);
+  }
+
+  const BuilderPtr
+  RecordBuilder::reals(const double* x, int64_t length) {
+    if (begun_  &&  nextindex_ != -1  &&
+        contents_[(size_t)nextindex_].get()->active()) {
+      contents_[(size_t)nextindex_].get()->reals(x, length);
+      return shared_from_this();
+    }
+    return Builder::reals(x, length);
+  }
+
   const BuilderPtr
   RecordBuilder::complex(std::complex<double> x) {
     if (!begun_) {
@@ -59,6 +59,11 @@ namespace awkward {
 
   const ContentPtr
   StringBuilder::snapshot() const {
+    return snapshot_range(0, offsets_.length() - 1);
+  }
+
+  const ContentPtr
+  StringBuilder::snapshot_range(int64_t start, int64_t stop) const {
     util::Parameters char_parameters;
     util::Parameters string_parameters;
 
@@ -76,13 +81,24 @@ namespace awkward {
         + FILENAME(__LINE__));
     }
 
-    Index64 offsets(offsets_.ptr(), 0, offsets_.length(), kernel::lib::cpu);
-    std::vector<ssize_t> shape = { (ssize_t)content_.length() };
+    int64_t low = offsets_.getitem_at_nowrap(start);
+    int64_t high = offsets_.getitem_at_nowrap(stop);
+    std::shared_ptr<int64_t> rawoffsets = offsets_.ptr_range(start, stop + 1);
+    if (low != 0) {
+      Index64 shifted(stop - start + 1);
+      int64_t* rawshifted = shifted.data();
+      for (int64_t i = 0;  i <= stop - start;  i++) {
+        rawshifted[i] = rawoffsets.get()[i] - low;
+      }
+      rawoffsets = shifted.ptr();
+    }
+    Index64 offsets(rawoffsets, 0, stop - start + 1, kernel::lib::cpu);
+    std::vector<ssize_t> shape = { (ssize_t)(high - low) };
     std::vector<ssize_t> strides = { (ssize_t)sizeof(uint8_t) };
     ContentPtr content;
     content = std::make_shared<NumpyArray>(Identities::none(),
                                            char_parameters,
-                                           content_.ptr(),
+                                           content_.ptr_range(low, high),
                                            shape,
                                            strides,
                                            0,
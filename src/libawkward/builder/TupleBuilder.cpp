@@ -82,6 +82,25 @@ namespace awkward {
                                          caches);
   }
 
+  const ContentPtr
+  TupleBuilder::snapshot_range(int64_t start, int64_t stop) const {
+    if (length_ == -1) {
+      return std::make_shared<EmptyArray>(Identities::none(),
+                                          util::Parameters());
+    }
+    ContentPtrVec contents;
+    for (size_t i = 0;  i < contents_.size();  i++) {
+      contents.push_back(contents_[i].get()->snapshot_range(start, stop));
+    }
+    std::vector<ArrayCachePtr> caches;  // nothing is virtual here
+    return std::make_shared<RecordArray>(Identities::none(),
+                                         util::Parameters(),
+                                         contents,
+                                         util::RecordLookupPtr(nullptr),
+                                         stop - start,
+                                         caches);
+  }
+
   bool
   TupleBuilder::active() const {
     return begun_;
@@ -171,6 +190,36 @@ namespace awkward {
     return shared_from_this();
   }
 
+  const BuilderPtr
+  TupleBuilder::booleans(const bool* x, int64_t length) {
+    if (begun_  &&  nextindex_ != -1  &&
+        contents_[(size_t)nextindex_].get()->active()) {
+      contents_[(size_t)nextindex_].get()->booleans(x, length);
+      return shared_from_this();
+    }
+    return Builder::booleans(x, length);
+  }
+
+  const BuilderPtr
+  TupleBuilder::integers(const int64_t* x, int64_t length) {
+    if (begun_  &&  nextindex_ != -1  &&
+        contents_[(size_t)nextindex_].get()->active()) {
+      contents_[(size_t)nextindex_].get()->integers(x, length);
+      return shared_from_this();
+    }
+    return Builder::integers(x, length);
+  }
+
+  const BuilderPtr
+  TupleBuilder::reals(const double* x, int64_t length) {
+    if (begun_  &&  nextindex_ != -1  &&
+        contents_[(size_t)nextindex_].get()->active()) {
+      contents_[(size_t)nextindex_].get()->reals(x, length);
+      return shared_from_this();
+    }
+    return Builder::reals(x, length);
+  }
+
   const BuilderPtr
   TupleBuilder::complex(std::complex<double> x) {
     if (!begun_) {
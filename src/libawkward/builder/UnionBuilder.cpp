@@ -82,6 +82,39 @@ namespace awkward {
                           contents).simplify_uniontype(true, false);
   }
 
+  const ContentPtr
+  UnionBuilder::snapshot_range(int64_t start, int64_t stop) const {
+    // each content is needed from the first to the last entry it has in
+    // the range, because entries of a given tag have increasing indexes
+    std::vector<int64_t> lows(contents_.size(), -1);
+    std::vector<int64_t> highs(contents_.size(), 0);
+    Index8 tags(stop - start);
+    Index64 index(stop - start);
+    int8_t* rawtags = tags.data();
+    int64_t* rawindex = index.data();
+    for (int64_t i = 0;  i < stop - start;  i++) {
+      int8_t tag = tags_.getitem_at_nowrap(start + i);
+      int64_t x = index_.getitem_at_nowrap(start + i);
+      if (lows[(size_t)tag] == -1) {
+        lows[(size_t)tag] = x;
+      }
+      highs[(size_t)tag] = x + 1;
+      rawtags[i] = tag;
+      rawindex[i] = x - lows[(size_t)tag];
+    }
+    ContentPtrVec contents;
+    for (size_t i = 0;  i < contents_.size();  i++) {
+      int64_t low = (lows[i] == -1 ? 0 : lows[i]);
+      int64_t high = (lows[i] == -1 ? 0 : highs[i]);
+      contents.push_back(contents_[i].get()->snapshot_range(low, high));
+    }
+    return UnionArray8_64(Identities::none(),
+                          util::Parameters(),
+                          tags,
+                          index,
+                          contents).simplify_uniontype(true, false);
+  }
+
   bool
   UnionBuilder::active() const {
     return current_ != -1;
@@ -197,6 +230,33 @@ namespace awkward {
     return shared_from_this();
   }
 
+  const BuilderPtr
+  UnionBuilder::booleans(const bool* x, int64_t length) {
+    if (current_ != -1) {
+      contents_[(size_t)current_].get()->booleans(x, length);
+      return shared_from_this();
+    }
+    return Builder::booleans(x, length);
+  }
+
+  const BuilderPtr
+  UnionBuilder::integers(const int64_t* x, int64_t length) {
+    if (current_ != -1) {
+      contents_[(size_t)current_].get()->integers(x, length);
+      return shared_from_this();
+    }
+    return Builder::integers(x, length);
+  }
+
+  const BuilderPtr
+  UnionBuilder::reals(const double* x, int64_t length) {
+    if (current_ != -1) {
+      contents_[(size_t)current_].get()->reals(x, length);
+      return shared_from_this();
+    }
+    return Builder::reals(x, length);
+  }
+
   const BuilderPtr
   UnionBuilder::complex(std::complex<double> x) {
     if (current_ == -1) {
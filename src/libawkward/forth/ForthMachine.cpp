@@ -5,6 +5,10 @@
 #include <sstream>
 #include <stdexcept>
 #include <chrono>
+#include <atomic>
+#include <exception>
+#include <thread>
+#include <memory>
 
 #include "awkward/forth/ForthMachine.h"
 
@@ -103,8 +107,24 @@ namespace awkward {
   #define CODE_RSHIFT 63
   #define CODE_FALSE 64
   #define CODE_TRUE 65
+  // superinstructions, only made by the optimizer
+  #define CODE_LITERAL_ADD 66
+  #define CODE_LITERAL_SUB 67
+  #define CODE_LITERAL_MUL 68
+  #define CODE_LITERAL_EQ 69
+  #define CODE_LITERAL_NE 70
+  #define CODE_LITERAL_GT 71
+  #define CODE_LITERAL_GE 72
+  #define CODE_LITERAL_LT 73
+  #define CODE_LITERAL_LE 74
+  #define CODE_LITERAL_AND 75
+  #define CODE_LITERAL_LSHIFT 76
+  #define CODE_LITERAL_RSHIFT 77
+  #define CODE_DUP_WRITE 78
+  #define CODE_DUP_WRITE_ADD 79
+  #define CODE_DO_READ 80
   // beginning of the user-defined dictionary
-  #define BOUND_DICTIONARY 66
+  #define BOUND_DICTIONARY 81
 
   const std::set<std::string> reserved_words_({
     // comments
@@ -213,15 +233,128 @@ namespace awkward {
     {"true", CODE_TRUE}
   });
 
+  // 'literal op' pairs that the optimizer fuses into one superinstruction
+  const std::map<int64_t, int64_t> literal_superinstructions_({
+    {CODE_ADD, CODE_LITERAL_ADD},
+    {CODE_SUB, CODE_LITERAL_SUB},
+    {CODE_MUL, CODE_LITERAL_MUL},
+    {CODE_EQ, CODE_LITERAL_EQ},
+    {CODE_NE, CODE_LITERAL_NE},
+    {CODE_GT, CODE_LITERAL_GT},
+    {CODE_GE, CODE_LITERAL_GE},
+    {CODE_LT, CODE_LITERAL_LT},
+    {CODE_LE, CODE_LITERAL_LE},
+    {CODE_AND, CODE_LITERAL_AND},
+    {CODE_LSHIFT, CODE_LITERAL_LSHIFT},
+    {CODE_RSHIFT, CODE_LITERAL_RSHIFT}
+  });
+
+  // Evaluates 'value op' at compile time, the way internal_run would, if
+  // the result can be a literal (fits in 32 bits, so no overflow either).
+  static bool
+  fold_unary(int64_t code, int64_t value, int64_t& result) noexcept {
+    switch (code) {
+      case CODE_NEGATE:
+        result = -value;
+        break;
+      case CODE_ADD1:
+        result = value + 1;
+        break;
+      case CODE_SUB1:
+        result = value - 1;
+        break;
+      case CODE_ABS:
+        result = value < 0 ? -value : value;
+        break;
+      case CODE_EQ0:
+        result = value == 0 ? -1 : 0;
+        break;
+      case CODE_INVERT:
+        result = ~value;
+        break;
+      default:
+        return false;
+    }
+    return result >= INT32_MIN  &&  result <= INT32_MAX;
+  }
+
+  // Same for 'one two op'; division by zero is left for the runtime error.
+  static bool
+  fold_binary(int64_t code, int64_t one, int64_t two, int64_t& result) noexcept {
+    switch (code) {
+      case CODE_ADD:
+        result = one + two;
+        break;
+      case CODE_SUB:
+        result = one - two;
+        break;
+      case CODE_MUL:
+        result = one * two;
+        break;
+      case CODE_DIV: {
+        if (two == 0) {
+          return false;
+        }
+        int64_t tmp = one / two;
+        result = tmp * two == one ? tmp : tmp - ((one < 0) ^ (two < 0));
+        break;
+      }
+      case CODE_MOD:
+        if (two == 0) {
+          return false;
+        }
+        result = (two + (one % two)) % two;
+        break;
+      case CODE_MIN:
+        result = std::min(one, two);
+        break;
+      case CODE_MAX:
+        result = std::max(one, two);
+        break;
+      case CODE_EQ:
+        result = one == two ? -1 : 0;
+        break;
+      case CODE_NE:
+        result = one != two ? -1 : 0;
+        break;
+      case CODE_GT:
+        result = one > two ? -1 : 0;
+        break;
+      case CODE_GE:
+        result = one >= two ? -1 : 0;
+        break;
+      case CODE_LT:
+        result = one < two ? -1 : 0;
+        break;
+      case CODE_LE:
+        result = one <= two ? -1 : 0;
+        break;
+      case CODE_AND:
+        result = one & two;
+        break;
+      case CODE_OR:
+        result = one | two;
+        break;
+      case CODE_XOR:
+        result = one ^ two;
+        break;
+      default:
+        return false;
+    }
+    return result >= INT32_MIN  &&  result <= INT32_MAX;
+  }
+
   template <typename T, typename I>
   ForthMachineOf<T, I>::ForthMachineOf(const std::string& source,
                                        int64_t stack_max_depth,
                                        int64_t recursion_max_depth,
                                        int64_t output_initial_size,
-                                       double output_resize_factor)
+                                       double output_resize_factor,
+                                       bool optimize)
     : source_(source)
     , output_initial_size_(output_initial_size)
     , output_resize_factor_(output_resize_factor)
+    , optimize_(optimize)
 
     , stack_buffer_(new T[stack_max_depth])
     , stack_depth_(0)
@@ -252,6 +385,9 @@ namespace awkward {
     std::vector<std::pair<int64_t, int64_t>> linecol;
     tokenize(tokenized, linecol);
     compile(tokenized, linecol);
+    if (optimize_) {
+      optimize_bytecodes();
+    }
   }
 
   template <typename T, typename I>
@@ -698,6 +834,30 @@ namespace awkward {
         case CODE_TRUE: {
           return "true";
         }
+        case CODE_DUP_WRITE: {
+          int64_t out_num = bytecodes_[(IndexTypeOf<int64_t>)bytecode_position + 1];
+          return "dup " + output_names_[(IndexTypeOf<int64_t>)out_num] + " <- stack";
+        }
+        case CODE_DUP_WRITE_ADD: {
+          int64_t out_num = bytecodes_[(IndexTypeOf<int64_t>)bytecode_position + 1];
+          return "dup " + output_names_[(IndexTypeOf<int64_t>)out_num] + " +<- stack";
+        }
+        case CODE_DO_READ: {
+          return std::move(std::string("do\n")
+                 + indent + "  " + decompiled_at(bytecode_position + 1, indent + "  ") + "\n"
+                 + indent + "loop");
+        }
+      }
+      // 'literal op' superinstructions decompile as the original pair
+      for (auto pair : literal_superinstructions_) {
+        if (pair.second == bytecode) {
+          for (auto word : generic_builtin_words_) {
+            if (word.second == pair.first) {
+              return std::to_string(bytecodes_[(IndexTypeOf<int64_t>)bytecode_position + 1])
+                     + " " + word.first;
+            }
+          }
+        }
       }
       return std::move(std::string("(unrecognized bytecode ") + std::to_string(bytecode) + ")");
     }
@@ -733,6 +893,12 @@ namespace awkward {
     return output_resize_factor_;
   }
 
+  template <typename T, typename I>
+  bool
+  ForthMachineOf<T, I>::optimize() const noexcept {
+    return optimize_;
+  }
+
   template <typename T, typename I>
   const std::vector<T>
   ForthMachineOf<T, I>::stack() const {
@@ -1021,6 +1187,64 @@ namespace awkward {
     current_error_ = util::ForthError::none;
   }
 
+  template <typename T, typename I>
+  const std::shared_ptr<ForthOutputBuffer>
+  ForthMachineOf<T, I>::new_output(IndexTypeOf<int64_t> index, int64_t initial) const {
+    double resize = output_resize_factor_;
+    std::shared_ptr<ForthOutputBuffer> out;
+    switch (output_dtypes_[index]) {
+      case util::dtype::boolean: {
+        out = std::make_shared<ForthOutputBufferOf<bool>>(initial, resize);
+        break;
+      }
+      case util::dtype::int8: {
+        out = std::make_shared<ForthOutputBufferOf<int8_t>>(initial, resize);
+        break;
+      }
+      case util::dtype::int16: {
+        out = std::make_shared<ForthOutputBufferOf<int16_t>>(initial, resize);
+        break;
+      }
+      case util::dtype::int32: {
+        out = std::make_shared<ForthOutputBufferOf<int32_t>>(initial, resize);
+        break;
+      }
+      case util::dtype::int64: {
+        out = std::make_shared<ForthOutputBufferOf<int64_t>>(initial, resize);
+        break;
+      }
+      case util::dtype::uint8: {
+        out = std::make_shared<ForthOutputBufferOf<uint8_t>>(initial, resize);
+        break;
+      }
+      case util::dtype::uint16: {
+        out = std::make_shared<ForthOutputBufferOf<uint16_t>>(initial, resize);
+        break;
+      }
+      case util::dtype::uint32: {
+        out = std::make_shared<ForthOutputBufferOf<uint32_t>>(initial, resize);
+        break;
+      }
+      case util::dtype::uint64: {
+        out = std::make_shared<ForthOutputBufferOf<uint64_t>>(initial, resize);
+        break;
+      }
+      case util::dtype::float32: {
+        out = std::make_shared<ForthOutputBufferOf<float>>(initial, resize);
+        break;
+      }
+      case util::dtype::float64: {
+        out = std::make_shared<ForthOutputBufferOf<double>>(initial, resize);
+        break;
+      }
+      default: {
+        throw std::runtime_error(std::string("unhandled ForthOutputBuffer type")
+                                 + FILENAME(__LINE__));
+      }
+    }
+    return out;
+  }
+
   template <typename T, typename I>
   void
   ForthMachineOf<T, I>::begin(
@@ -1047,61 +1271,8 @@ namespace awkward {
     }
 
     current_outputs_ = std::vector<std::shared_ptr<ForthOutputBuffer>>();
-    int64_t init = output_initial_size_;
-    double resize = output_resize_factor_;
     for (IndexTypeOf<int64_t> i = 0;  i < output_names_.size();  i++) {
-      std::shared_ptr<ForthOutputBuffer> out;
-      switch (output_dtypes_[i]) {
-        case util::dtype::boolean: {
-          out = std::make_shared<ForthOutputBufferOf<bool>>(init, resize);
-          break;
-        }
-        case util::dtype::int8: {
-          out = std::make_shared<ForthOutputBufferOf<int8_t>>(init, resize);
-          break;
-        }
-        case util::dtype::int16: {
-          out = std::make_shared<ForthOutputBufferOf<int16_t>>(init, resize);
-          break;
-        }
-        case util::dtype::int32: {
-          out = std::make_shared<ForthOutputBufferOf<int32_t>>(init, resize);
-          break;
-        }
-        case util::dtype::int64: {
-          out = std::make_shared<ForthOutputBufferOf<int64_t>>(init, resize);
-          break;
-        }
-        case util::dtype::uint8: {
-          out = std::make_shared<ForthOutputBufferOf<uint8_t>>(init, resize);
-          break;
-        }
-        case util::dtype::uint16: {
-          out = std::make_shared<ForthOutputBufferOf<uint16_t>>(init, resize);
-          break;
-        }
-        case util::dtype::uint32: {
-          out = std::make_shared<ForthOutputBufferOf<uint32_t>>(init, resize);
-          break;
-        }
-        case util::dtype::uint64: {
-          out = std::make_shared<ForthOutputBufferOf<uint64_t>>(init, resize);
-          break;
-        }
-        case util::dtype::float32: {
-          out = std::make_shared<ForthOutputBufferOf<float>>(init, resize);
-          break;
-        }
-        case util::dtype::float64: {
-          out = std::make_shared<ForthOutputBufferOf<double>>(init, resize);
-          break;
-        }
-        default: {
-          throw std::runtime_error(std::string("unhandled ForthOutputBuffer type")
-                                   + FILENAME(__LINE__));
-        }
-      }
-      current_outputs_.push_back(out);
+      current_outputs_.push_back(new_output(i, output_initial_size_));
     }
 
     recursion_target_depth_.push(0);
@@ -1178,6 +1349,108 @@ namespace awkward {
     return run(inputs);
   }
 
+  template <typename T, typename I>
+  const std::vector<ForthRunResultOf<T>>
+  ForthMachineOf<T, I>::run_parallel(
+      const std::vector<std::map<std::string, std::shared_ptr<ForthInputBuffer>>>& input_sets,
+      int64_t num_threads,
+      const std::set<util::ForthError>& ignore) const {
+    int64_t length = (int64_t)input_sets.size();
+    if (num_threads <= 0) {
+      num_threads = (int64_t)std::thread::hardware_concurrency();
+    }
+    num_threads = std::max(std::min(num_threads, length), (int64_t)1);
+
+    std::vector<ForthRunResultOf<T>> results((size_t)length);
+    std::vector<std::exception_ptr> exceptions((size_t)length);
+    std::atomic<int64_t> next(0);
+    std::atomic<bool> failed(false);
+
+    // each worker takes the next unclaimed input set until there are none
+    // (or a run has failed), so that uneven input sets balance out; its
+    // machine is made with the first input set, so that an error in making
+    // it is reported like an error in running it
+    auto work = [&]() -> void {
+      std::unique_ptr<ForthMachineOf<T, I>> machine;
+      int64_t index;
+      while (!failed  &&  (index = next++) < length) {
+        ForthRunResultOf<T>& result = results[(size_t)index];
+        try {
+          if (machine.get() == nullptr) {
+            machine.reset(new ForthMachineOf<T, I>(source_,
+                                                   stack_max_depth_,
+                                                   recursion_max_depth_,
+                                                   output_initial_size_,
+                                                   output_resize_factor_,
+                                                   optimize_));
+          }
+          result.error = machine.get()->run(input_sets[(size_t)index]);
+          result.outputs = machine.get()->current_outputs_;
+          machine.get()->maybe_throw(result.error, ignore);
+        }
+        catch (...) {
+          exceptions[(size_t)index] = std::current_exception();
+          failed = true;
+        }
+        if (machine.get() != nullptr) {
+          machine.get()->reset();
+        }
+      }
+    };
+
+    std::vector<std::thread> threads;
+    for (int64_t t = 1;  t < num_threads;  t++) {
+      try {
+        threads.emplace_back(work);
+      }
+      catch (std::system_error&) {
+        // could not start another thread: run with the ones we have
+        break;
+      }
+    }
+    work();
+    for (auto& thread : threads) {
+      thread.join();
+    }
+
+    for (auto& exception : exceptions) {
+      if (exception) {
+        std::rethrow_exception(exception);
+      }
+    }
+    return results;
+  }
+
+  template <typename T, typename I>
+  const std::vector<std::shared_ptr<ForthOutputBuffer>>
+  ForthMachineOf<T, I>::concatenate_outputs(
+      const std::vector<ForthRunResultOf<T>>& results,
+      const std::set<std::string>& offsets) const {
+    for (auto name : offsets) {
+      if (!is_output(name)) {
+        throw std::invalid_argument(
+          std::string("AwkwardForth source code does not define an output named ")
+          + name + FILENAME(__LINE__)
+        );
+      }
+    }
+    std::vector<std::shared_ptr<ForthOutputBuffer>> out;
+    for (IndexTypeOf<int64_t> i = 0;  i < output_names_.size();  i++) {
+      int64_t total = 0;
+      for (auto& result : results) {
+        total += result.outputs[i].get()->len();
+      }
+      std::shared_ptr<ForthOutputBuffer> buffer = new_output(
+          i, std::max(total, (int64_t)1));
+      bool as_offsets = (offsets.count(output_names_[i]) != 0);
+      for (auto& result : results) {
+        buffer.get()->append(*result.outputs[i].get(), as_offsets);
+      }
+      out.push_back(buffer);
+    }
+    return out;
+  }
+
   template <typename T, typename I>
   util::ForthError
   ForthMachineOf<T, I>::resume() {
@@ -1561,7 +1834,23 @@ namespace awkward {
         case CODE_REWIND:
         case CODE_STRING:
         case CODE_PRINT_STRING:
+        case CODE_LITERAL_ADD:
+        case CODE_LITERAL_SUB:
+        case CODE_LITERAL_MUL:
+        case CODE_LITERAL_EQ:
+        case CODE_LITERAL_NE:
+        case CODE_LITERAL_GT:
+        case CODE_LITERAL_GE:
+        case CODE_LITERAL_LT:
+        case CODE_LITERAL_LE:
+        case CODE_LITERAL_AND:
+        case CODE_LITERAL_LSHIFT:
+        case CODE_LITERAL_RSHIFT:
+        case CODE_DUP_WRITE:
+        case CODE_DUP_WRITE_ADD:
           return 2;
+        case CODE_DO_READ:
+          return 1 + bytecodes_per_instruction(bytecode_position + 1);
         default:
           return 1;
       }
@@ -1736,6 +2025,123 @@ namespace awkward {
     }
   }
 
+  template <typename T, typename I>
+  void
+  ForthMachineOf<T, I>::optimize_bytecodes() {
+    // Control flow only ever enters a segment at its beginning, so a peephole
+    // pass within each segment can't break any jumps. Each instruction stays
+    // whole: the '[segment] again' structures and friends are never split.
+    std::vector<std::vector<I>> dictionary;
+    for (IndexTypeOf<int64_t> segment = 0;  segment + 1 < bytecodes_offsets_.size();  segment++) {
+      std::vector<std::vector<I>> instructions;
+      int64_t pos = bytecodes_offsets_[segment];
+      while (pos < bytecodes_offsets_[segment + 1]) {
+        int64_t num = bytecodes_per_instruction(pos);
+        instructions.push_back(std::vector<I>(bytecodes_.begin() + pos,
+                                              bytecodes_.begin() + pos + num));
+        pos += num;
+
+        // Constant folding: 'literal op' and 'literal literal op' become a
+        // literal, repeatedly, so that '2 3 + 4 *' becomes '20'.
+        while (true) {
+          IndexTypeOf<int64_t> last = instructions.size() - 1;
+          int64_t result;
+          if (instructions.size() >= 2  &&
+              instructions[last].size() == 1  &&
+              instructions[last - 1].size() == 2  &&
+              instructions[last - 1][0] == CODE_LITERAL  &&
+              fold_unary(instructions[last][0],
+                         instructions[last - 1][1],
+                         result)) {
+            instructions.pop_back();
+            instructions[last - 1][1] = (I)result;
+          }
+          else if (instructions.size() >= 3  &&
+                   instructions[last].size() == 1  &&
+                   instructions[last - 1].size() == 2  &&
+                   instructions[last - 1][0] == CODE_LITERAL  &&
+                   instructions[last - 2].size() == 2  &&
+                   instructions[last - 2][0] == CODE_LITERAL  &&
+                   fold_binary(instructions[last][0],
+                               instructions[last - 2][1],
+                               instructions[last - 1][1],
+                               result)) {
+            instructions.pop_back();
+            instructions.pop_back();
+            instructions[last - 2][1] = (I)result;
+          }
+          else {
+            break;
+          }
+        }
+      }
+
+      // Superinstructions: fuse the remaining pairs.
+      std::vector<I> bytecodes;
+      for (IndexTypeOf<int64_t> i = 0;  i < instructions.size();  i++) {
+        const std::vector<I>& one = instructions[i];
+        if (i + 1 < instructions.size()) {
+          const std::vector<I>& two = instructions[i + 1];
+
+          // 'literal op' -> 'op' with an immediate argument
+          if (one.size() == 2  &&  one[0] == CODE_LITERAL  &&  two.size() == 1  &&
+              literal_superinstructions_.find(two[0]) != literal_superinstructions_.end()) {
+            bytecodes.push_back((I)literal_superinstructions_.at(two[0]));
+            bytecodes.push_back(one[1]);
+            i++;
+            continue;
+          }
+
+          // 'dup out <- stack' and 'dup out +<- stack' -> write without popping
+          if (one.size() == 1  &&  one[0] == CODE_DUP  &&  two.size() == 2  &&
+              (two[0] == CODE_WRITE  ||  two[0] == CODE_WRITE_ADD)) {
+            bytecodes.push_back(two[0] == CODE_WRITE ? CODE_DUP_WRITE : CODE_DUP_WRITE_ADD);
+            bytecodes.push_back(two[1]);
+            i++;
+            continue;
+          }
+        }
+
+        // 'do in X-> out loop' -> one bulk read of (stop - start) items,
+        // for fixed-width items only.
+        if (one.size() == 2  &&  one[0] == CODE_DO) {
+          int64_t body = one[1] - BOUND_DICTIONARY;
+          int64_t start = bytecodes_offsets_[(IndexTypeOf<int64_t>)body];
+          int64_t stop = bytecodes_offsets_[(IndexTypeOf<int64_t>)body + 1];
+          I read = start < stop ? bytecodes_[(IndexTypeOf<int64_t>)start] : 0;
+          if (read < 0  &&
+              stop - start == 3  &&
+              (~read & READ_DIRECT) != 0  &&
+              (~read & READ_REPEATED) == 0  &&
+              (~read & READ_MASK) != READ_VARINT  &&
+              (~read & READ_MASK) != READ_ZIGZAG  &&
+              (~read & READ_MASK) != READ_NBIT) {
+            bytecodes.push_back(CODE_DO_READ);
+            bytecodes.insert(bytecodes.end(),
+                             bytecodes_.begin() + start,
+                             bytecodes_.begin() + stop);
+            continue;
+          }
+        }
+
+        bytecodes.insert(bytecodes.end(), one.begin(), one.end());
+      }
+      dictionary.push_back(bytecodes);
+    }
+
+    // The segments that became unreachable stay, so that segment numbers
+    // (and hence dictionary bytecodes) do not change.
+    bytecodes_.clear();
+    bytecodes_offsets_.clear();
+    bytecodes_offsets_.push_back(0);
+    for (auto segment : dictionary) {
+      for (auto bytecode : segment) {
+        bytecodes_.push_back(bytecode);
+      }
+      bytecodes_offsets_.push_back((int64_t)bytecodes_.size());
+    }
+  }
+
   template <typename T, typename I>
   void
   ForthMachineOf<T, I>::parse(const std::string& defn,
@@ -3785,6 +4191,331 @@ namespace awkward {
               stack_push(-1);
               break;
             }
+
+            case CODE_LITERAL_ADD: {
+              I num = bytecode_get();
+              bytecodes_pointer_where()++;
+              // The unfused literal would have overflowed a full stack, so
+              // the superinstructions fail in the same way.
+              if (stack_cannot_push()) {
+                current_error_ = util::ForthError::stack_overflow;
+                return;
+              }
+              if (stack_cannot_pop()) {
+                current_error_ = util::ForthError::stack_underflow;
+                return;
+              }
+              T* top = stack_peek();
+              *top = *top + (T)num;
+              break;
+            }
+
+            case CODE_LITERAL_SUB: {
+              I num = bytecode_get();
+              bytecodes_pointer_where()++;
+              if (stack_cannot_push()) {
+                current_error_ = util::ForthError::stack_overflow;
+                return;
+              }
+              if (stack_cannot_pop()) {
+                current_error_ = util::ForthError::stack_underflow;
+                return;
+              }
+              T* top = stack_peek();
+              *top = *top - (T)num;
+              break;
+            }
+
+            case CODE_LITERAL_MUL: {
+              I num = bytecode_get();
+              bytecodes_pointer_where()++;
+              if (stack_cannot_push()) {
+                current_error_ = util::ForthError::stack_overflow;
+                return;
+              }
+              if (stack_cannot_pop()) {
+                current_error_ = util::ForthError::stack_underflow;
+                return;
+              }
+              T* top = stack_peek();
+              *top = *top * (T)num;
+              break;
+            }
+
+            case CODE_LITERAL_EQ: {
+              I num = bytecode_get();
+              bytecodes_pointer_where()++;
+              if (stack_cannot_push()) {
+                current_error_ = util::ForthError::stack_overflow;
+                return;
+              }
+              if (stack_cannot_pop()) {
+                current_error_ = util::ForthError::stack_underflow;
+                return;
+              }
+              T* top = stack_peek();
+              *top = *top == (T)num ? -1 : 0;
+              break;
+            }
+
+            case CODE_LITERAL_NE: {
+              I num = bytecode_get();
+              bytecodes_pointer_where()++;
+              if (stack_cannot_push()) {
+                current_error_ = util::ForthError::stack_overflow;
+                return;
+              }
+              if (stack_cannot_pop()) {
+                current_error_ = util::ForthError::stack_underflow;
+                return;
+              }
+              T* top = stack_peek();
+              *top = *top != (T)num ? -1 : 0;
+              break;
+            }
+
+            case CODE_LITERAL_GT: {
+              I num = bytecode_get();
+              bytecodes_pointer_where()++;
+              if (stack_cannot_push()) {
+                current_error_ = util::ForthError::stack_overflow;
+                return;
+              }
+              if (stack_cannot_pop()) {
+                current_error_ = util::ForthError::stack_underflow;
+                return;
+              }
+              T* top = stack_peek();
+              *top = *top > (T)num ? -1 : 0;
+              break;
+            }
+
+            case CODE_LITERAL_GE: {
+              I num = bytecode_get();
+              bytecodes_pointer_where()++;
+              if (stack_cannot_push()) {
+                current_error_ = util::ForthError::stack_overflow;
+                return;
+              }
+              if (stack_cannot_pop()) {
+                current_error_ = util::ForthError::stack_underflow;
+                return;
+              }
+              T* top = stack_peek();
+              *top = *top >= (T)num ? -1 : 0;
+              break;
+            }
+
+            case CODE_LITERAL_LT: {
+              I num = bytecode_get();
+              bytecodes_pointer_where()++;
+              if (stack_cannot_push()) {
+                current_error_ = util::ForthError::stack_overflow;
+                return;
+              }
+              if (stack_cannot_pop()) {
+                current_error_ = util::ForthError::stack_underflow;
+                return;
+              }
+              T* top = stack_peek();
+              *top = *top < (T)num ? -1 : 0;
+              break;
+            }
+
+            case CODE_LITERAL_LE: {
+              I num = bytecode_get();
+              bytecodes_pointer_where()++;
+              if (stack_cannot_push()) {
+                current_error_ = util::ForthError::stack_overflow;
+                return;
+              }
+              if (stack_cannot_pop()) {
+                current_error_ = util::ForthError::stack_underflow;
+                return;
+              }
+              T* top = stack_peek();
+              *top = *top <= (T)num ? -1 : 0;
+              break;
+            }
+
+            case CODE_LITERAL_AND: {
+              I num = bytecode_get();
+              bytecodes_pointer_where()++;
+              if (stack_cannot_push()) {
+                current_error_ = util::ForthError::stack_overflow;
+                return;
+              }
+              if (stack_cannot_pop()) {
+                current_error_ = util::ForthError::stack_underflow;
+                return;
+              }
+              T* top = stack_peek();
+              *top = *top & (T)num;
+              break;
+            }
+
+            case CODE_LITERAL_LSHIFT: {
+              I num = bytecode_get();
+              bytecodes_pointer_where()++;
+              if (stack_cannot_push()) {
+                current_error_ = util::ForthError::stack_overflow;
+                return;
+              }
+              if (stack_cannot_pop()) {
+                current_error_ = util::ForthError::stack_underflow;
+                return;
+              }
+              T* top = stack_peek();
+              *top = *top << (T)num;
+              break;
+            }
+
+            case CODE_LITERAL_RSHIFT: {
+              I num = bytecode_get();
+              bytecodes_pointer_where()++;
+              if (stack_cannot_push()) {
+                current_error_ = util::ForthError::stack_overflow;
+                return;
+              }
+              if (stack_cannot_pop()) {
+                current_error_ = util::ForthError::stack_underflow;
+                return;
+              }
+              T* top = stack_peek();
+              *top = *top >> (T)num;
+              break;
+            }
+
+            case CODE_DUP_WRITE: {
+              I out_num = bytecode_get();
+              bytecodes_pointer_where()++;
+              if (stack_cannot_pop()) {
+                current_error_ = util::ForthError::stack_underflow;
+                return;
+              }
+              if (stack_cannot_push()) {
+                current_error_ = util::ForthError::stack_overflow;
+                return;
+              }
+              T* top = stack_peek();
+              write_from_stack(out_num, top);
+
+              count_writes_++;
+              break;
+            }
+
+            case CODE_DUP_WRITE_ADD: {
+              I out_num = bytecode_get();
+              bytecodes_pointer_where()++;
+              if (stack_cannot_pop()) {
+                current_error_ = util::ForthError::stack_underflow;
+                return;
+              }
+              if (stack_cannot_push()) {
+                current_error_ = util::ForthError::stack_overflow;
+                return;
+              }
+              T* top = stack_peek();
+              write_add_from_stack(out_num, top);
+
+              count_writes_++;
+              break;
+            }
+
+            case CODE_DO_READ: {
+              I read = bytecode_get();
+              bytecodes_pointer_where()++;
+              I in_num = bytecode_get();
+              bytecodes_pointer_where()++;
+              I out_num = bytecode_get();
+              bytecodes_pointer_where()++;
+
+              if (stack_cannot_pop2()) {
+                current_error_ = util::ForthError::stack_underflow;
+                return;
+              }
+              T* pair = stack_pop2();
+              if (do_current_depth_ == recursion_max_depth_) {
+                current_error_ = util::ForthError::recursion_depth_exceeded;
+                return;
+              }
+              int64_t num_items = std::max((int64_t)pair[0] - (int64_t)pair[1], (int64_t)0);
+              if (num_items == 0) {
+                break;
+              }
+              if (recursion_current_depth_ == recursion_max_depth_) {
+                current_error_ = util::ForthError::recursion_depth_exceeded;
+                return;
+              }
+
+              bool byteswap;
+              if (NATIVELY_BIG_ENDIAN) {
+                byteswap = ((~read & READ_BIGENDIAN) == 0);
+              }
+              else {
+                byteswap = ((~read & READ_BIGENDIAN) != 0);
+              }
+
+              I format = ~read & READ_MASK;
+              int64_t itemsize;
+              switch (format) {
+                case READ_INT16:
+                case READ_UINT16:
+                  itemsize = 2;
+                  break;
+                case READ_INT32:
+                case READ_UINT32:
+                case READ_FLOAT32:
+                  itemsize = 4;
+                  break;
+                case READ_INT64:
+                case READ_UINT64:
+                case READ_FLOAT64:
+                  itemsize = 8;
+                  break;
+                case READ_INTP:
+                case READ_UINTP:
+                  itemsize = (int64_t)sizeof(ssize_t);
+                  break;
+                default:
+                  itemsize = 1;
+              }
+
+              // The loop would have read and written every whole item before
+              // running out of input, so the bulk read does, too.
+              ForthInputBuffer* input = current_inputs_[(IndexTypeOf<int64_t>)in_num].get();
+              int64_t available = (input->len() - input->pos()) / itemsize;
+              bool read_beyond = num_items > available;
+              if (read_beyond) {
+                num_items = available;
+              }
+
+              if (num_items != 0) {
+                switch (format) {
+                  case READ_BOOL:    WRITE_DIRECTLY(bool, bool)
+                  case READ_INT8:    WRITE_DIRECTLY(int8_t, int8)
+                  case READ_INT16:   WRITE_DIRECTLY(int16_t, int16)
+                  case READ_INT32:   WRITE_DIRECTLY(int32_t, int32)
+                  case READ_INT64:   WRITE_DIRECTLY(int64_t, int64)
+                  case READ_INTP:    WRITE_DIRECTLY(ssize_t, intp)
+                  case READ_UINT8:   WRITE_DIRECTLY(uint8_t, uint8)
+                  case READ_UINT16:  WRITE_DIRECTLY(uint16_t, uint16)
+                  case READ_UINT32:  WRITE_DIRECTLY(uint32_t, uint32)
+                  case READ_UINT64:  WRITE_DIRECTLY(uint64_t, uint64)
+                  case READ_UINTP:   WRITE_DIRECTLY(size_t, uintp)
+                  case READ_FLOAT32: WRITE_DIRECTLY(float, float32)
+                  case READ_FLOAT64: WRITE_DIRECTLY(double, float64)
+                }
+              }
+
+              count_reads_ += num_items;
+              count_writes_ += num_items;
+              if (read_beyond) {
+                current_error_ = util::ForthError::read_beyond;
+                return;
+              }
+              break;
+            }
           }
         } // end handle one instruction
 
@@ -235,6 +235,37 @@ namespace awkward {
     return Index64(ptr_, 0, length_, kernel::lib::cpu);
   }
 
+  template <typename OUT>
+  void
+  ForthOutputBufferOf<OUT>::append(const ForthOutputBuffer& other, bool as_offsets) {
+    if (dynamic_cast<const ForthOutputBufferOf<OUT>*>(&other) == nullptr) {
+      throw std::invalid_argument(
+        std::string("ForthOutputBuffer types do not match in append")
+        + FILENAME(__LINE__)
+      );
+    }
+    const OUT* values = reinterpret_cast<const OUT*>(other.ptr().get());
+    int64_t num_items = other.len();
+    if (as_offsets  &&  (!std::is_integral<OUT>::value  ||  std::is_same<OUT, bool>::value)) {
+      throw std::invalid_argument(
+        std::string("ForthOutputBuffer of offsets must have an integer type, not ")
+        + std::string(typeid(OUT).name()) + FILENAME(__LINE__)
+      );
+    }
+    if (as_offsets  &&  length_ != 0  &&  num_items != 0) {
+      OUT shift = (OUT)(ptr_.get()[length_ - 1] - values[0]);
+      int64_t next = length_ + num_items - 1;
+      maybe_resize(next);
+      for (int64_t i = 1;  i < num_items;  i++) {
+        ptr_.get()[length_ + i - 1] = (OUT)(values[i] + shift);
+      }
+      length_ = next;
+    }
+    else {
+      write_copy(num_items, values);
+    }
+  }
+
   template <typename OUT>
   void
   ForthOutputBufferOf<OUT>::write_one_bool(bool value, bool byteswap) noexcept {
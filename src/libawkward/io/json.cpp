@@ -14,7 +14,18 @@
 #include "rapidjson/error/en.h"
 
 #include "awkward/builder/ArrayBuilder.h"
+#include "awkward/builder/GrowableBuffer.h"
 #include "awkward/Content.h"
+#include "awkward/array/BitMaskedArray.h"
+#include "awkward/array/ByteMaskedArray.h"
+#include "awkward/array/EmptyArray.h"
+#include "awkward/array/IndexedArray.h"
+#include "awkward/array/ListArray.h"
+#include "awkward/array/ListOffsetArray.h"
+#include "awkward/array/NumpyArray.h"
+#include "awkward/array/RecordArray.h"
+#include "awkward/array/RegularArray.h"
+#include "awkward/array/UnmaskedArray.h"
 
 #include "awkward/io/json.h"
 
@@ -643,7 +654,8 @@ namespace awkward {
             const char* nan_string,
             const char* infinity_string,
             const char* minus_infinity_string)
-        : builder_(options)
+        : options_(options)
+        , builder_(options)
         , moved_(false)
         , nan_string_(nan_string)
         , infinity_string_(infinity_string)
@@ -761,7 +773,13 @@ namespace awkward {
       return builder_.snapshot();
     }
 
+    void clear() {
+      // a fresh builder, so that each chunk's type is discovered anew
+      builder_ = ArrayBuilder(options_);
+    }
+
   private:
+    const ArrayBuilderOptions options_;
     ArrayBuilder builder_;
     bool moved_;
     const char* nan_string_;
@@ -769,38 +787,47 @@ namespace awkward {
     const char* minus_infinity_string_;
   };
 
+  /// @brief Parses the next top-level JSON value from `stream` into the
+  /// handler's builder, returning `false` if only whitespace was left.
   template<typename HANDLER, typename STREAM>
-  const ContentPtr
-  do_parse(HANDLER& handler, rj::Reader& reader, STREAM& stream) {
-    int64_t number = 0;
-    while (stream.Peek() != 0) {
-      handler.reset_moved();
-      bool fully_parsed = reader.Parse<rj::kParseStopWhenDoneFlag>(stream, handler);
-      if (handler.moved()) {
-        if (!fully_parsed) {
-          if (stream.Peek() == 0) {
-            throw std::invalid_argument(
-                std::string("incomplete JSON object at the end of the stream")
-                + FILENAME(__LINE__));
-          }
-          else {
-            throw std::invalid_argument(
-              std::string("JSON File error at char ")
-              + std::to_string(stream.Tell()) + std::string(": \'")
-              + stream.Peek() + std::string("\'")
+  bool
+  parse_one(HANDLER& handler, rj::Reader& reader, STREAM& stream) {
+    handler.reset_moved();
+    bool fully_parsed = reader.Parse<rj::kParseStopWhenDoneFlag>(stream, handler);
+    if (handler.moved()) {
+      if (!fully_parsed) {
+        if (stream.Peek() == 0) {
+          throw std::invalid_argument(
+              std::string("incomplete JSON object at the end of the stream")
               + FILENAME(__LINE__));
-          }
         }
         else {
-          number++;
+          throw std::invalid_argument(
+            std::string("JSON File error at char ")
+            + std::to_string(stream.Tell()) + std::string(": \'")
+            + stream.Peek() + std::string("\'")
+            + FILENAME(__LINE__));
         }
       }
-      else if (stream.Peek() != 0) {
-        throw std::invalid_argument(
-          std::string("JSON File error at char ")
-          + std::to_string(stream.Tell()) + std::string(": \'")
-          + stream.Peek() + std::string("\'")
-          + FILENAME(__LINE__));
+      return true;
+    }
+    else if (stream.Peek() != 0) {
+      throw std::invalid_argument(
+        std::string("JSON File error at char ")
+        + std::to_string(stream.Tell()) + std::string(": \'")
+        + stream.Peek() + std::string("\'")
+        + FILENAME(__LINE__));
+    }
+    return false;
+  }
+
+  template<typename HANDLER, typename STREAM>
+  const ContentPtr
+  do_parse(HANDLER& handler, rj::Reader& reader, STREAM& stream) {
+    int64_t number = 0;
+    while (stream.Peek() != 0) {
+      if (parse_one(handler, reader, stream)) {
+        number++;
       }
     }
 
@@ -813,6 +840,34 @@ namespace awkward {
     }
   }
 
+  /// @brief Parses top-level JSON values from `stream` until it is
+  /// exhausted, `max_records` values have been read, or at least
+  /// `max_bytes` have been consumed (a limit less than 1 is no limit).
+  ///
+  /// Returns nullptr if the stream had no more values.
+  template<typename HANDLER, typename STREAM>
+  const ContentPtr
+  do_parse_chunk(HANDLER& handler,
+                 rj::Reader& reader,
+                 STREAM& stream,
+                 int64_t max_records,
+                 int64_t max_bytes) {
+    handler.clear();
+    int64_t number = 0;
+    size_t start = stream.Tell();
+    while (stream.Peek() != 0  &&
+           (max_records < 1  ||  number < max_records)  &&
+           (max_bytes < 1  ||  (int64_t)(stream.Tell() - start) < max_bytes)) {
+      if (parse_one(handler, reader, stream)) {
+        number++;
+      }
+    }
+    if (number == 0) {
+      return ContentPtr(nullptr);
+    }
+    return handler.snapshot();
+  }
+
   const ContentPtr
   FromJsonString(const char* source,
                  const ArrayBuilderOptions& options,
@@ -846,4 +901,1455 @@ namespace awkward {
                     minus_infinity_string);
     return do_parse(handler, reader, stream);
   }
+
+  class FromJsonIterator::Impl {
+  public:
+    Impl(const ArrayBuilderOptions& options,
+         const char* nan_string,
+         const char* infinity_string,
+         const char* minus_infinity_string)
+        : handler_(options,
+                   nan_string,
+                   infinity_string,
+                   minus_infinity_string) { }
+
+    virtual ~Impl() = default;
+
+    virtual const ContentPtr
+      next(int64_t max_records, int64_t max_bytes) = 0;
+
+    virtual int64_t
+      bytes_read() const = 0;
+
+  protected:
+    Handler handler_;
+    rj::Reader reader_;
+  };
+
+  namespace {
+    class FromJsonStringIteratorImpl: public FromJsonIterator::Impl {
+    public:
+      FromJsonStringIteratorImpl(const char* source,
+                                 const ArrayBuilderOptions& options,
+                                 const char* nan_string,
+                                 const char* infinity_string,
+                                 const char* minus_infinity_string)
+          : FromJsonIterator::Impl(options,
+                                   nan_string,
+                                   infinity_string,
+                                   minus_infinity_string)
+          , stream_(source) { }
+
+      const ContentPtr
+      next(int64_t max_records, int64_t max_bytes) override {
+        return do_parse_chunk(handler_,
+                              reader_,
+                              stream_,
+                              max_records,
+                              max_bytes);
+      }
+
+      int64_t
+      bytes_read() const override {
+        return (int64_t)stream_.Tell();
+      }
+
+    private:
+      rj::StringStream stream_;
+    };
+
+    class FromJsonFileIteratorImpl: public FromJsonIterator::Impl {
+    public:
+      FromJsonFileIteratorImpl(FILE* source,
+                               const ArrayBuilderOptions& options,
+                               int64_t buffersize,
+                               const char* nan_string,
+                               const char* infinity_string,
+                               const char* minus_infinity_string)
+          : FromJsonIterator::Impl(options,
+                                   nan_string,
+                                   infinity_string,
+                                   minus_infinity_string)
+          , buffer_(kernel::malloc<char>(kernel::lib::cpu, buffersize))
+          , stream_(source, buffer_.get(), ((size_t)buffersize)*sizeof(char)) { }
+
+      const ContentPtr
+      next(int64_t max_records, int64_t max_bytes) override {
+        return do_parse_chunk(handler_,
+                              reader_,
+                              stream_,
+                              max_records,
+                              max_bytes);
+      }
+
+      int64_t
+      bytes_read() const override {
+        return (int64_t)stream_.Tell();
+      }
+
+    private:
+      std::shared_ptr<char> buffer_;
+      rj::FileReadStream stream_;
+    };
+  }
+
+  FromJsonIterator::FromJsonIterator(const char* source,
+                                     const ArrayBuilderOptions& options,
+                                     const char* nan_string,
+                                     const char* infinity_string,
+                                     const char* minus_infinity_string)
+      : impl_(new FromJsonStringIteratorImpl(source,
+                                             options,
+                                             nan_string,
+                                             infinity_string,
+                                             minus_infinity_string)) { }
+
+  FromJsonIterator::FromJsonIterator(FILE* source,
+                                     const ArrayBuilderOptions& options,
+                                     int64_t buffersize,
+                                     const char* nan_string,
+                                     const char* infinity_string,
+                                     const char* minus_infinity_string)
+      : impl_(new FromJsonFileIteratorImpl(source,
+                                           options,
+                                           buffersize,
+                                           nan_string,
+                                           infinity_string,
+                                           minus_infinity_string)) { }
+
+  FromJsonIterator::~FromJsonIterator() {
+    delete impl_;
+  }
+
+  const ContentPtr
+  FromJsonIterator::next(int64_t max_records, int64_t max_bytes) {
+    return impl_->next(max_records, max_bytes);
+  }
+
+  int64_t
+  FromJsonIterator::bytes_read() const {
+    return impl_->bytes_read();
+  }
+
+  ////////// reading from JSON with a Form
+
+  namespace {
+    /// @brief Receives the SAX events for one node of a Form and appends
+    /// them directly to typed buffers; the default for every event is to
+    /// reject it as not matching the Form.
+    class FormFiller {
+    public:
+      FormFiller(const FormPtr& form): form_(form) { }
+
+      virtual ~FormFiller() = default;
+
+      virtual int64_t
+        length() const = 0;
+
+      virtual bool
+        active() const {
+        return false;
+      }
+
+      virtual const ContentPtr
+        snapshot() const = 0;
+
+      /// @brief Appends an arbitrary item in place of a value that a
+      /// ByteMaskedArray or BitMaskedArray masks out.
+      virtual void
+        placeholder() {
+        mismatch("null");
+      }
+
+      virtual void
+        null() {
+        mismatch("null");
+      }
+
+      virtual void
+        boolean(bool x) {
+        mismatch("boolean");
+      }
+
+      virtual void
+        integer(int64_t x) {
+        mismatch("integer");
+      }
+
+      virtual void
+        real(double x) {
+        mismatch("real number");
+      }
+
+      virtual void
+        string(const char* str, int64_t length) {
+        mismatch("string");
+      }
+
+      virtual void
+        beginlist() {
+        mismatch("list");
+      }
+
+      virtual void
+        endlist() {
+        mismatch("end of list");
+      }
+
+      virtual void
+        beginrecord() {
+        mismatch("record");
+      }
+
+      virtual void
+        key(const char* str) {
+        mismatch("record field");
+      }
+
+      virtual void
+        endrecord() {
+        mismatch("end of record");
+      }
+
+    protected:
+      void
+        mismatch(const std::string& what) const {
+        throw std::invalid_argument(
+          std::string("JSON ") + what + std::string(" does not match form:\n\n")
+          + form_.get()->tojson(true, false)
+          + FILENAME(__LINE__));
+      }
+
+      const FormPtr form_;
+    };
+
+    using FormFillerPtr = std::shared_ptr<FormFiller>;
+
+    FormFillerPtr
+    make_filler(const FormPtr& form,
+                const ArrayBuilderOptions& options,
+                const char* nan_string,
+                const char* infinity_string,
+                const char* minus_infinity_string);
+
+    /// @brief Returns true if `x` can be stored as a T without wrapping.
+    template <typename T>
+    bool
+    integer_fits(int64_t x) {
+      if (std::is_signed<T>::value) {
+        return x >= (int64_t)std::numeric_limits<T>::min()  &&
+               x <= (int64_t)std::numeric_limits<T>::max();
+      }
+      else {
+        return x >= 0  &&  (uint64_t)x <= (uint64_t)std::numeric_limits<T>::max();
+      }
+    }
+
+    template <>
+    bool
+    integer_fits<float>(int64_t x) {
+      return true;
+    }
+
+    template <>
+    bool
+    integer_fits<double>(int64_t x) {
+      return true;
+    }
+
+    template <typename T>
+    class NumpyFiller: public FormFiller {
+    public:
+      NumpyFiller(const FormPtr& form,
+                  const ArrayBuilderOptions& options,
+                  const char* nan_string,
+                  const char* infinity_string,
+                  const char* minus_infinity_string)
+          : FormFiller(form)
+          , buffer_(GrowableBuffer<T>::empty(options))
+          , nan_string_(nan_string)
+          , infinity_string_(infinity_string)
+          , minus_infinity_string_(minus_infinity_string) { }
+
+      int64_t
+        length() const override {
+        return buffer_.length();
+      }
+
+      const ContentPtr
+        snapshot() const override {
+        NumpyForm* raw = dynamic_cast<NumpyForm*>(form_.get());
+        std::vector<ssize_t> shape = { (ssize_t)buffer_.length() };
+        std::vector<ssize_t> strides = { (ssize_t)sizeof(T) };
+        return std::make_shared<NumpyArray>(Identities::none(),
+                                            raw->parameters(),
+                                            buffer_.ptr(),
+                                            shape,
+                                            strides,
+                                            0,
+                                            sizeof(T),
+                                            raw->format(),
+                                            raw->dtype(),
+                                            kernel::lib::cpu);
+      }
+
+      void
+        placeholder() override {
+        buffer_.append((T)0);
+      }
+
+      void
+        boolean(bool x) override {
+        if (std::is_same<T, bool>::value) {
+          buffer_.append((T)x);
+        }
+        else {
+          mismatch("boolean");
+        }
+      }
+
+      void
+        integer(int64_t x) override {
+        if (std::is_same<T, bool>::value) {
+          mismatch("integer");
+        }
+        if (!integer_fits<T>(x)) {
+          mismatch(std::string("integer ") + std::to_string(x));
+        }
+        buffer_.append((T)x);
+      }
+
+      void
+        real(double x) override {
+        if (std::is_floating_point<T>::value) {
+          buffer_.append((T)x);
+        }
+        else {
+          mismatch("real number");
+        }
+      }
+
+      void
+        string(const char* str, int64_t length) override {
+        if (std::is_floating_point<T>::value) {
+          if (nan_string_ != nullptr  &&  strcmp(str, nan_string_) == 0) {
+            buffer_.append((T)std::numeric_limits<double>::quiet_NaN());
+            return;
+          }
+          else if (infinity_string_ != nullptr  &&
+                   strcmp(str, infinity_string_) == 0) {
+            buffer_.append((T)std::numeric_limits<double>::infinity());
+            return;
+          }
+          else if (minus_infinity_string_ != nullptr  &&
+                   strcmp(str, minus_infinity_string_) == 0) {
+            buffer_.append((T)-std::numeric_limits<double>::infinity());
+            return;
+          }
+        }
+        mismatch("string");
+      }
+
+    private:
+      GrowableBuffer<T> buffer_;
+      const char* nan_string_;
+      const char* infinity_string_;
+      const char* minus_infinity_string_;
+    };
+
+    class StringFiller: public FormFiller {
+    public:
+      StringFiller(const FormPtr& form,
+                   const FormPtr& content_form,
+                   const ArrayBuilderOptions& options)
+          : FormFiller(form)
+          , content_form_(content_form)
+          , offsets_(GrowableBuffer<int64_t>::full(options, 0, 1))
+          , content_(GrowableBuffer<uint8_t>::empty(options)) { }
+
+      int64_t
+        length() const override {
+        return offsets_.length() - 1;
+      }
+
+      const ContentPtr
+        snapshot() const override {
+        Index64 offsets(offsets_.ptr(), 0, offsets_.length(), kernel::lib::cpu);
+        std::vector<ssize_t> shape = { (ssize_t)content_.length() };
+        std::vector<ssize_t> strides = { (ssize_t)sizeof(uint8_t) };
+        ContentPtr content = std::make_shared<NumpyArray>(
+          Identities::none(),
+          content_form_.get()->parameters(),
+          content_.ptr(),
+          shape,
+          strides,
+          0,
+          sizeof(uint8_t),
+          "B",
+          util::dtype::uint8,
+          kernel::lib::cpu);
+        return std::make_shared<ListOffsetArray64>(Identities::none(),
+                                                   form_.get()->parameters(),
+                                                   offsets,
+                                                   content);
+      }
+
+      void
+        placeholder() override {
+        offsets_.append(content_.length());
+      }
+
+      void
+        string(const char* str, int64_t length) override {
+        for (int64_t i = 0;  i < length;  i++) {
+          content_.append((uint8_t)str[i]);
+        }
+        offsets_.append(content_.length());
+      }
+
+    private:
+      const FormPtr content_form_;
+      GrowableBuffer<int64_t> offsets_;
+      GrowableBuffer<uint8_t> content_;
+    };
+
+    /// @brief Shared event routing for ListFiller and RegularFiller: events
+    /// between `[` and `]` go to the content.
+    class ListLikeFiller: public FormFiller {
+    public:
+      ListLikeFiller(const FormPtr& form, const FormFillerPtr& content)
+          : FormFiller(form)
+          , content_(content)
+          , active_(false)
+          , start_(0) { }
+
+      bool
+        active() const override {
+        return active_;
+      }
+
+      void
+        null() override {
+        check_active("null");
+        content_.get()->null();
+      }
+
+      void
+        boolean(bool x) override {
+        check_active("boolean");
+        content_.get()->boolean(x);
+      }
+
+      void
+        integer(int64_t x) override {
+        check_active("integer");
+        content_.get()->integer(x);
+      }
+
+      void
+        real(double x) override {
+        check_active("real number");
+        content_.get()->real(x);
+      }
+
+      void
+        string(const char* str, int64_t length) override {
+        check_active("string");
+        content_.get()->string(str, length);
+      }
+
+      void
+        beginlist() override {
+        if (!active_) {
+          active_ = true;
+          start_ = content_.get()->length();
+        }
+        else {
+          content_.get()->beginlist();
+        }
+      }
+
+      void
+        endlist() override {
+        check_active("end of list");
+        if (content_.get()->active()) {
+          content_.get()->endlist();
+        }
+        else {
+          active_ = false;
+          finish(content_.get()->length() - start_);
+        }
+      }
+
+      void
+        beginrecord() override {
+        check_active("record");
+        content_.get()->beginrecord();
+      }
+
+      void
+        key(const char* str) override {
+        check_active("record field");
+        content_.get()->key(str);
+      }
+
+      void
+        endrecord() override {
+        check_active("end of record");
+        content_.get()->endrecord();
+      }
+
+    protected:
+      virtual void
+        finish(int64_t count) = 0;
+
+      void
+        check_active(const std::string& what) const {
+        if (!active_) {
+          mismatch(what);
+        }
+      }
+
+      const FormFillerPtr content_;
+      bool active_;
+      int64_t start_;
+    };
+
+    class ListFiller: public ListLikeFiller {
+    public:
+      ListFiller(const FormPtr& form,
+                 const FormFillerPtr& content,
+                 const ArrayBuilderOptions& options)
+          : ListLikeFiller(form, content)
+          , offsets_(GrowableBuffer<int64_t>::full(options, 0, 1)) { }
+
+      int64_t
+        length() const override {
+        return offsets_.length() - 1;
+      }
+
+      const ContentPtr
+        snapshot() const override {
+        Index64 offsets(offsets_.ptr(), 0, offsets_.length(), kernel::lib::cpu);
+        return std::make_shared<ListOffsetArray64>(Identities::none(),
+                                                   form_.get()->parameters(),
+                                                   offsets,
+                                                   content_.get()->snapshot());
+      }
+
+      void
+        placeholder() override {
+        offsets_.append(content_.get()->length());
+      }
+
+      const FormFillerPtr
+        content() const {
+        return content_;
+      }
+
+    protected:
+      void
+        finish(int64_t count) override {
+        offsets_.append(content_.get()->length());
+      }
+
+    private:
+      GrowableBuffer<int64_t> offsets_;
+    };
+
+    class RegularFiller: public ListLikeFiller {
+    public:
+      RegularFiller(const FormPtr& form,
+                    const FormFillerPtr& content,
+                    int64_t size)
+          : ListLikeFiller(form, content)
+          , size_(size)
+          , length_(0) { }
+
+      int64_t
+        length() const override {
+        return length_;
+      }
+
+      const ContentPtr
+        snapshot() const override {
+        return std::make_shared<RegularArray>(Identities::none(),
+                                              form_.get()->parameters(),
+                                              content_.get()->snapshot(),
+                                              size_,
+                                              length_);
+      }
+
+      void
+        placeholder() override {
+        for (int64_t i = 0;  i < size_;  i++) {
+          content_.get()->placeholder();
+        }
+        length_++;
+      }
+
+    protected:
+      void
+        finish(int64_t count) override {
+        if (count != size_) {
+          throw std::invalid_argument(
+            std::string("JSON list of length ") + std::to_string(count)
+            + std::string(" does not match regular size ")
+            + std::to_string(size_) + FILENAME(__LINE__));
+        }
+        length_++;
+      }
+
+    private:
+      const int64_t size_;
+      int64_t length_;
+    };
+
+    /// @brief Returns true if an option-type Form is filled as an
+    /// IndexedOptionArray64: either it is one or it masks an EmptyForm,
+    /// which has no room for placeholders (the same "?unknown" type).
+    bool
+    option_is_indexed(const FormPtr& form) {
+      if (dynamic_cast<IndexedOptionForm*>(form.get()) != nullptr) {
+        return true;
+      }
+      else if (ByteMaskedForm* raw = dynamic_cast<ByteMaskedForm*>(form.get())) {
+        return dynamic_cast<EmptyForm*>(raw->content().get()) != nullptr;
+      }
+      else if (BitMaskedForm* raw = dynamic_cast<BitMaskedForm*>(form.get())) {
+        return dynamic_cast<EmptyForm*>(raw->content().get()) != nullptr;
+      }
+      return false;
+    }
+
+    /// @brief Fills any of the option-type nodes: IndexedOptionArray64 gets
+    /// an index into the non-null items, ByteMaskedArray and BitMaskedArray
+    /// get a mask and a placeholder in the content for each null, and
+    /// UnmaskedArray rejects nulls.
+    class OptionFiller: public FormFiller {
+    public:
+      OptionFiller(const FormPtr& form,
+                   const FormFillerPtr& content,
+                   const ArrayBuilderOptions& options)
+          : FormFiller(form)
+          , content_(content)
+          , indexed_(option_is_indexed(form))
+          , unmasked_(dynamic_cast<UnmaskedForm*>(form.get()) != nullptr)
+          , index_(GrowableBuffer<int64_t>::empty(options))
+          , valid_(GrowableBuffer<int8_t>::empty(options)) { }
+
+      int64_t
+        length() const override {
+        if (indexed_) {
+          return index_.length();
+        }
+        else if (unmasked_) {
+          return content_.get()->length();
+        }
+        else {
+          return valid_.length();
+        }
+      }
+
+      bool
+        active() const override {
+        return content_.get()->active();
+      }
+
+      const ContentPtr
+        snapshot() const override {
+        ContentPtr content = content_.get()->snapshot();
+        if (indexed_) {
+          Index64 index(index_.ptr(), 0, index_.length(), kernel::lib::cpu);
+          return std::make_shared<IndexedOptionArray64>(
+            Identities::none(),
+            form_.get()->parameters(),
+            index,
+            content);
+        }
+        else if (unmasked_) {
+          return std::make_shared<UnmaskedArray>(
+            Identities::none(),
+            form_.get()->parameters(),
+            content);
+        }
+        int64_t length = valid_.length();
+        std::shared_ptr<int8_t> validptr = valid_.ptr();
+        const int8_t* valid = validptr.get();
+        if (ByteMaskedForm* raw = dynamic_cast<ByteMaskedForm*>(form_.get())) {
+          Index8 mask(length);
+          int8_t* ptr = mask.data();
+          for (int64_t i = 0;  i < length;  i++) {
+            ptr[i] = (int8_t)((valid[i] != 0) == raw->valid_when());
+          }
+          return std::make_shared<ByteMaskedArray>(
+            Identities::none(),
+            form_.get()->parameters(),
+            mask,
+            content,
+            raw->valid_when());
+        }
+        BitMaskedForm* raw = dynamic_cast<BitMaskedForm*>(form_.get());
+        IndexU8 mask((length + 7) / 8);
+        uint8_t* ptr = mask.data();
+        for (int64_t i = 0;  i < mask.length();  i++) {
+          ptr[i] = 0;
+        }
+        for (int64_t i = 0;  i < length;  i++) {
+          if ((valid[i] != 0) == raw->valid_when()) {
+            ptr[i / 8] |= (uint8_t)(raw->lsb_order() ? (1 << (i % 8))
+                                                     : (128 >> (i % 8)));
+          }
+        }
+        return std::make_shared<BitMaskedArray>(
+          Identities::none(),
+          form_.get()->parameters(),
+          mask,
+          content,
+          raw->valid_when(),
+          length,
+          raw->lsb_order());
+      }
+
+      void
+        placeholder() override {
+        null();
+      }
+
+      void
+        null() override {
+        if (content_.get()->active()) {
+          content_.get()->null();
+        }
+        else if (indexed_) {
+          index_.append(-1);
+        }
+        else if (unmasked_) {
+          mismatch("null");
+        }
+        else {
+          valid_.append(0);
+          content_.get()->placeholder();
+        }
+      }
+
+      void
+        boolean(bool x) override {
+        maybe_append();
+        content_.get()->boolean(x);
+      }
+
+      void
+        integer(int64_t x) override {
+        maybe_append();
+        content_.get()->integer(x);
+      }
+
+      void
+        real(double x) override {
+        maybe_append();
+        content_.get()->real(x);
+      }
+
+      void
+        string(const char* str, int64_t length) override {
+        maybe_append();
+        content_.get()->string(str, length);
+      }
+
+      void
+        beginlist() override {
+        maybe_append();
+        content_.get()->beginlist();
+      }
+
+      void
+        endlist() override {
+        content_.get()->endlist();
+      }
+
+      void
+        beginrecord() override {
+        maybe_append();
+        content_.get()->beginrecord();
+      }
+
+      void
+        key(const char* str) override {
+        content_.get()->key(str);
+      }
+
+      void
+        endrecord() override {
+        content_.get()->endrecord();
+      }
+
+    private:
+      void
+        maybe_append() {
+        if (content_.get()->active()) {
+          return;
+        }
+        else if (indexed_) {
+          index_.append(content_.get()->length());
+        }
+        else if (!unmasked_) {
+          valid_.append(1);
+        }
+      }
+
+      const FormFillerPtr content_;
+      const bool indexed_;
+      const bool unmasked_;
+      GrowableBuffer<int64_t> index_;
+      GrowableBuffer<int8_t> valid_;
+    };
+
+    class RecordFiller: public FormFiller {
+    public:
+      RecordFiller(const FormPtr& form,
+                   const std::vector<FormFillerPtr>& contents,
+                   const std::vector<bool>& optional)
+          : FormFiller(form)
+          , contents_(contents)
+          , optional_(optional)
+          , keys_(form.get()->keys())
+          , active_(false)
+          , length_(0)
+          , field_(-1)
+          , skipping_(false)
+          , depth_(0) { }
+
+      int64_t
+        length() const override {
+        return length_;
+      }
+
+      bool
+        active() const override {
+        return active_;
+      }
+
+      const ContentPtr
+        snapshot() const override {
+        RecordForm* raw = dynamic_cast<RecordForm*>(form_.get());
+        ContentPtrVec contents;
+        for (auto content : contents_) {
+          contents.push_back(content.get()->snapshot());
+        }
+        return std::make_shared<RecordArray>(Identities::none(),
+                                             raw->parameters(),
+                                             contents,
+                                             raw->recordlookup(),
+                                             length_);
+      }
+
+      void
+        placeholder() override {
+        for (auto content : contents_) {
+          content.get()->placeholder();
+        }
+        length_++;
+      }
+
+      void
+        null() override {
+        if (value("null")) {
+          contents_[(size_t)field_].get()->null();
+        }
+      }
+
+      void
+        boolean(bool x) override {
+        if (value("boolean")) {
+          contents_[(size_t)field_].get()->boolean(x);
+        }
+      }
+
+      void
+        integer(int64_t x) override {
+        if (value("integer")) {
+          contents_[(size_t)field_].get()->integer(x);
+        }
+      }
+
+      void
+        real(double x) override {
+        if (value("real number")) {
+          contents_[(size_t)field_].get()->real(x);
+        }
+      }
+
+      void
+        string(const char* str, int64_t length) override {
+        if (value("string")) {
+          contents_[(size_t)field_].get()->string(str, length);
+        }
+      }
+
+      void
+        beginlist() override {
+        if (begin("list")) {
+          contents_[(size_t)field_].get()->beginlist();
+        }
+      }
+
+      void
+        endlist() override {
+        if (end("end of list")) {
+          contents_[(size_t)field_].get()->endlist();
+        }
+      }
+
+      void
+        beginrecord() override {
+        if (!active_) {
+          active_ = true;
+          field_ = -1;
+        }
+        else if (begin("record")) {
+          contents_[(size_t)field_].get()->beginrecord();
+        }
+      }
+
+      void
+        key(const char* str) override {
+        if (!active_) {
+          mismatch("record field");
+        }
+        else if (skipping_) {
+          return;
+        }
+        else if (field_ != -1  &&  contents_[(size_t)field_].get()->active()) {
+          contents_[(size_t)field_].get()->key(str);
+        }
+        else {
+          // fields usually arrive in Form order, so try the next one first
+          int64_t numfields = (int64_t)keys_.size();
+          int64_t next = field_ + 1;
+          if (next < numfields  &&  keys_[(size_t)next] == str) {
+            field_ = next;
+            return;
+          }
+          for (int64_t i = 0;  i < numfields;  i++) {
+            if (keys_[(size_t)i] == str) {
+              field_ = i;
+              return;
+            }
+          }
+          // not in the Form: skip over this field's value
+          skipping_ = true;
+          depth_ = 0;
+        }
+      }
+
+      void
+        endrecord() override {
+        if (!active_) {
+          mismatch("end of record");
+        }
+        else if (skipping_) {
+          skip_end();
+        }
+        else if (field_ != -1  &&  contents_[(size_t)field_].get()->active()) {
+          contents_[(size_t)field_].get()->endrecord();
+        }
+        else {
+          active_ = false;
+          length_++;
+          for (size_t i = 0;  i < contents_.size();  i++) {
+            int64_t fieldlength = contents_[i].get()->length();
+            if (fieldlength < length_  &&  optional_[i]) {
+              contents_[i].get()->null();
+            }
+            else if (fieldlength != length_) {
+              throw std::invalid_argument(
+                std::string("JSON record ")
+                + std::string(fieldlength < length_ ? "is missing"
+                                                    : "has more than one")
+                + std::string(" field ") + util::quote(keys_[i])
+                + FILENAME(__LINE__));
+            }
+          }
+        }
+      }
+
+    private:
+      /// @brief Returns `true` if a scalar should go to the current field.
+      bool
+        value(const std::string& what) {
+        if (!active_) {
+          mismatch(what);
+        }
+        if (skipping_) {
+          if (depth_ == 0) {
+            skipping_ = false;
+          }
+          return false;
+        }
+        check_field(what);
+        return true;
+      }
+
+      /// @brief Returns `true` if a `[` should go to the current field.
+      bool
+        begin(const std::string& what) {
+        if (!active_) {
+          mismatch(what);
+        }
+        if (skipping_) {
+          depth_++;
+          return false;
+        }
+        check_field(what);
+        return true;
+      }
+
+      /// @brief Returns `true` if a `]` should go to the current field.
+      bool
+        end(const std::string& what) {
+        if (!active_) {
+          mismatch(what);
+        }
+        if (skipping_) {
+          skip_end();
+          return false;
+        }
+        check_field(what);
+        return true;
+      }
+
+      void
+        skip_end() {
+        depth_--;
+        if (depth_ == 0) {
+          skipping_ = false;
+        }
+      }
+
+      void
+        check_field(const std::string& what) const {
+        if (field_ == -1) {
+          mismatch(what);
+        }
+      }
+
+      const std::vector<FormFillerPtr> contents_;
+      const std::vector<bool> optional_;
+      const std::vector<std::string> keys_;
+      bool active_;
+      int64_t length_;
+      int64_t field_;
+      bool skipping_;
+      int64_t depth_;
+    };
+
+    class EmptyFiller: public FormFiller {
+    public:
+      EmptyFiller(const FormPtr& form): FormFiller(form) { }
+
+      int64_t
+        length() const override {
+        return 0;
+      }
+
+      const ContentPtr
+        snapshot() const override {
+        return std::make_shared<EmptyArray>(Identities::none(),
+                                            form_.get()->parameters());
+      }
+    };
+
+    FormFillerPtr
+    make_filler(const FormPtr& form,
+                const ArrayBuilderOptions& options,
+                const char* nan_string,
+                const char* infinity_string,
+                const char* minus_infinity_string) {
+      if (NumpyForm* raw = dynamic_cast<NumpyForm*>(form.get())) {
+        std::vector<int64_t> inner_shape = raw->inner_shape();
+        if (!inner_shape.empty()) {
+          FormPtr inner = std::make_shared<NumpyForm>(
+            false,
+            util::Parameters(),
+            FormKey(nullptr),
+            std::vector<int64_t>(inner_shape.begin() + 1, inner_shape.end()),
+            raw->itemsize(),
+            raw->format(),
+            raw->dtype());
+          FormPtr outer = std::make_shared<RegularForm>(false,
+                                                        raw->parameters(),
+                                                        FormKey(nullptr),
+                                                        inner,
+                                                        inner_shape[0]);
+          return make_filler(outer,
+                             options,
+                             nan_string,
+                             infinity_string,
+                             minus_infinity_string);
+        }
+        switch (raw->dtype()) {
+#define AWKWARD_NUMPY_FILLER(DTYPE, T)                             \
+          case util::dtype::DTYPE:                                 \
+            return std::make_shared<NumpyFiller<T>>(form,          \
+                                                    options,       \
+                                                    nan_string,    \
+                                                    infinity_string, \
+                                                    minus_infinity_string);
+          AWKWARD_NUMPY_FILLER(boolean, bool)
+          AWKWARD_NUMPY_FILLER(int8, int8_t)
+          AWKWARD_NUMPY_FILLER(int16, int16_t)
+          AWKWARD_NUMPY_FILLER(int32, int32_t)
+          AWKWARD_NUMPY_FILLER(int64, int64_t)
+          AWKWARD_NUMPY_FILLER(uint8, uint8_t)
+          AWKWARD_NUMPY_FILLER(uint16, uint16_t)
+          AWKWARD_NUMPY_FILLER(uint32, uint32_t)
+          AWKWARD_NUMPY_FILLER(uint64, uint64_t)
+          AWKWARD_NUMPY_FILLER(float32, float)
+          AWKWARD_NUMPY_FILLER(float64, double)
+#undef AWKWARD_NUMPY_FILLER
+          default:
+            throw std::invalid_argument(
+              std::string("from_json with a form does not support dtype ")
+              + util::dtype_to_name(raw->dtype()) + FILENAME(__LINE__));
+        }
+      }
+
+      FormPtr content(nullptr);
+      if (ListOffsetForm* raw = dynamic_cast<ListOffsetForm*>(form.get())) {
+        content = raw->content();
+      }
+      else if (ListForm* raw = dynamic_cast<ListForm*>(form.get())) {
+        content = raw->content();
+      }
+      if (content.get() != nullptr) {
+        if (form.get()->parameter_equals("__array__", "\"string\"")  ||
+            form.get()->parameter_equals("__array__", "\"bytestring\"")) {
+          return std::make_shared<StringFiller>(form, content, options);
+        }
+        return std::make_shared<ListFiller>(
+          form,
+          make_filler(content,
+                      options,
+                      nan_string,
+                      infinity_string,
+                      minus_infinity_string),
+          options);
+      }
+
+      if (RegularForm* raw = dynamic_cast<RegularForm*>(form.get())) {
+        return std::make_shared<RegularFiller>(
+          form,
+          make_filler(raw->content(),
+                      options,
+                      nan_string,
+                      infinity_string,
+                      minus_infinity_string),
+          raw->size());
+      }
+
+      if (IndexedOptionForm* raw = dynamic_cast<IndexedOptionForm*>(form.get())) {
+        content = raw->content();
+      }
+      else if (ByteMaskedForm* raw = dynamic_cast<ByteMaskedForm*>(form.get())) {
+        content = raw->content();
+      }
+      else if (BitMaskedForm* raw = dynamic_cast<BitMaskedForm*>(form.get())) {
+        content = raw->content();
+      }
+      else if (UnmaskedForm* raw = dynamic_cast<UnmaskedForm*>(form.get())) {
+        content = raw->content();
+      }
+      if (content.get() != nullptr) {
+        return std::make_shared<OptionFiller>(
+          form,
+          make_filler(content,
+                      options,
+                      nan_string,
+                      infinity_string,
+                      minus_infinity_string),
+          options);
+      }
+
+      if (RecordForm* raw = dynamic_cast<RecordForm*>(form.get())) {
+        std::vector<FormFillerPtr> contents;
+        std::vector<bool> optional;
+        for (auto x : raw->contents()) {
+          contents.push_back(make_filler(x,
+                                         options,
+                                         nan_string,
+                                         infinity_string,
+                                         minus_infinity_string));
+          optional.push_back(
+            dynamic_cast<OptionFiller*>(contents.back().get()) != nullptr  &&
+            dynamic_cast<UnmaskedForm*>(x.get()) == nullptr);
+        }
+        return std::make_shared<RecordFiller>(form, contents, optional);
+      }
+
+      if (dynamic_cast<EmptyForm*>(form.get()) != nullptr) {
+        return std::make_shared<EmptyFiller>(form);
+      }
+
+      throw std::invalid_argument(
+        std::string("from_json with a form does not support this node "
+                    "(only numbers, booleans, strings, lists, records, "
+                    "and option-types):\n\n")
+        + form.get()->tojson(true, false) + FILENAME(__LINE__));
+    }
+
+    /// @brief Fills the Form's buffers directly from SAX events.
+    ///
+    /// The input may be a single JSON array of items or a sequence of
+    /// concatenated values, each of which is an item. Both interpretations
+    /// are followed until one of them fails; at the end, the single-array
+    /// one wins if it is still viable (the same rule as FromJsonString
+    /// without a Form). If the Form is a record and the input is a single
+    /// record, that Record is returned, as in FromJsonString without a Form;
+    /// any other single item is an array of length 1 with the Form's type.
+    class FormHandler: public rj::BaseReaderHandler<rj::UTF8<>, FormHandler> {
+    public:
+      FormHandler(const FormPtr& form,
+                  const ArrayBuilderOptions& options,
+                  const char* nan_string,
+                  const char* infinity_string,
+                  const char* minus_infinity_string)
+          : items_(make_filler(form,
+                               options,
+                               nan_string,
+                               infinity_string,
+                               minus_infinity_string))
+          , document_(std::make_shared<ListFiller>(
+              form,
+              make_filler(form,
+                          options,
+                          nan_string,
+                          infinity_string,
+                          minus_infinity_string),
+              options))
+          , isrecord_(dynamic_cast<RecordForm*>(form.get()) != nullptr)
+          , items_viable_(true)
+          , document_viable_(true)
+          , moved_(false)
+          , depth_(0)
+          , number_(0) { }
+
+      void
+      reset_moved() {
+        moved_ = false;
+      }
+
+      bool
+      moved() const {
+        return moved_;
+      }
+
+      bool Null() {
+        start_value(false);
+        dispatch([](FormFiller* x) { x->null(); });
+        return true;
+      }
+
+      bool Bool(bool x) {
+        start_value(false);
+        dispatch([x](FormFiller* y) { y->boolean(x); });
+        return true;
+      }
+
+      bool Int(int x) {
+        start_value(false);
+        dispatch([x](FormFiller* y) { y->integer((int64_t)x); });
+        return true;
+      }
+
+      bool Uint(unsigned int x) {
+        start_value(false);
+        dispatch([x](FormFiller* y) { y->integer((int64_t)x); });
+        return true;
+      }
+
+      bool Int64(int64_t x) {
+        start_value(false);
+        dispatch([x](FormFiller* y) { y->integer(x); });
+        return true;
+      }
+
+      bool Uint64(uint64_t x) {
+        start_value(false);
+        dispatch([x](FormFiller* y) { y->integer((int64_t)x); });
+        return true;
+      }
+
+      bool Double(double x) {
+        start_value(false);
+        dispatch([x](FormFiller* y) { y->real(x); });
+        return true;
+      }
+
+      bool
+      String(const char* str, rj::SizeType length, bool copy) {
+        start_value(false);
+        dispatch([str, length](FormFiller* y) {
+          y->string(str, (int64_t)length);
+        });
+        return true;
+      }
+
+      bool
+      StartArray() {
+        start_value(true);
+        dispatch([](FormFiller* x) { x->beginlist(); });
+        return true;
+      }
+
+      bool
+      EndArray(rj::SizeType numfields) {
+        moved_ = true;
+        depth_--;
+        dispatch([](FormFiller* x) { x->endlist(); });
+        return true;
+      }
+
+      bool
+      StartObject() {
+        start_value(true);
+        dispatch([](FormFiller* x) { x->beginrecord(); });
+        return true;
+      }
+
+      bool
+      EndObject(rj::SizeType numfields) {
+        moved_ = true;
+        depth_--;
+        dispatch([](FormFiller* x) { x->endrecord(); });
+        return true;
+      }
+
+      bool
+      Key(const char* str, rj::SizeType length, bool copy) {
+        moved_ = true;
+        dispatch([str](FormFiller* x) { x->key(str); });
+        return true;
+      }
+
+      const ContentPtr snapshot() const {
+        if (number_ == 1  &&  document_viable_) {
+          return document_.get()->content().get()->snapshot();
+        }
+        else if (number_ == 1  &&  isrecord_) {
+          return items_.get()->snapshot().get()->getitem_at_nowrap(0);
+        }
+        return items_.get()->snapshot();
+      }
+
+    private:
+      void
+      start_value(bool nested) {
+        moved_ = true;
+        if (depth_ == 0) {
+          number_++;
+          if (number_ > 1  &&  document_viable_) {
+            document_viable_ = false;
+            document_error_ = std::string(
+              "JSON with more than one top-level value "
+              "is not a single array") + FILENAME(__LINE__);
+            check();
+          }
+        }
+        if (nested) {
+          depth_++;
+        }
+      }
+
+      template <typename EVENT>
+      void
+      dispatch(const EVENT& event) {
+        if (items_viable_) {
+          try {
+            event(items_.get());
+          }
+          catch (std::invalid_argument& err) {
+            items_viable_ = false;
+            items_error_ = err.what();
+          }
+        }
+        if (document_viable_) {
+          try {
+            event(document_.get());
+          }
+          catch (std::invalid_argument& err) {
+            document_viable_ = false;
+            document_error_ = err.what();
+          }
+        }
+        check();
+      }
+
+      void
+      check() const {
+        if (!items_viable_  &&  !document_viable_) {
+          throw std::invalid_argument(number_ == 1 ? document_error_
+                                                   : items_error_);
+        }
+      }
+
+      const FormFillerPtr items_;
+      const std::shared_ptr<ListFiller> document_;
+      const bool isrecord_;
+      bool items_viable_;
+      bool document_viable_;
+      std::string items_error_;
+      std::string document_error_;
+      bool moved_;
+      int64_t depth_;
+      int64_t number_;
+    };
+
+    template<typename STREAM>
+    const ContentPtr
+    do_parse_form(FormHandler& handler, rj::Reader& reader, STREAM& stream) {
+      while (stream.Peek() != 0) {
+        parse_one(handler, reader, stream);
+      }
+      return handler.snapshot();
+    }
+  }
+
+  const ContentPtr
+  FromJsonString(const char* source,
+                 const FormPtr& form,
+                 const ArrayBuilderOptions& options,
+                 const char* nan_string,
+                 const char* infinity_string,
+                 const char* minus_infinity_string) {
+    rj::Reader reader;
+    rj::StringStream stream(source);
+    FormHandler handler(form,
+                        options,
+                        nan_string,
+                        infinity_string,
+                        minus_infinity_string);
+    return do_parse_form(handler, reader, stream);
+  }
+
+  const ContentPtr
+  FromJsonFile(FILE* source,
+               const FormPtr& form,
+               const ArrayBuilderOptions& options,
+               int64_t buffersize,
+               const char* nan_string,
+               const char* infinity_string,
+               const char* minus_infinity_string) {
+    rj::Reader reader;
+    std::shared_ptr<char> buffer = kernel::malloc<char>(kernel::lib::cpu, buffersize);
+    rj::FileReadStream stream(source,
+                              buffer.get(),
+                              ((size_t)buffersize)*sizeof(char));
+    FormHandler handler(form,
+                        options,
+                        nan_string,
+                        infinity_string,
+                        minus_infinity_string);
+    return do_parse_form(handler, reader, stream);
+  }
 }
@@ -2,7 +2,15 @@
 
 #define FILENAME(line) FILENAME_FOR_EXCEPTIONS("src/libawkward/kernel-dispatch.cpp", line)
 
+#include <algorithm>
+#include <atomic>
+#include <chrono>
 #include <complex>
+#include <mutex>
+#include <system_error>
+#include <thread>
+#include <unordered_map>
+#include <vector>
 
 #include "awkward/common.h"
 #include "awkward/util.h"
@@ -173,6 +181,243 @@ namespace awkward {
       }
     }
 
+    std::atomic<int64_t> parallel_threads_(1);
+    std::atomic<int64_t> parallel_threshold_(1048576);
+
+    void
+    set_parallel_threads(int64_t num_threads) {
+      if (num_threads < 0) {
+        throw std::invalid_argument(
+          std::string("number of kernel threads must be non-negative")
+          + FILENAME(__LINE__));
+      }
+      if (num_threads == 0) {
+        num_threads = (int64_t)std::thread::hardware_concurrency();
+      }
+      parallel_threads_ = std::max(num_threads, (int64_t)1);
+    }
+
+    int64_t
+    parallel_threads() {
+      return parallel_threads_;
+    }
+
+    void
+    set_parallel_threshold(int64_t threshold) {
+      if (threshold < 0) {
+        throw std::invalid_argument(
+          std::string("kernel parallel threshold must be non-negative")
+          + FILENAME(__LINE__));
+      }
+      parallel_threshold_ = threshold;
+    }
+
+    int64_t
+    parallel_threshold() {
+      return parallel_threshold_;
+    }
+
+    std::atomic<bool> profiling_(false);
+    std::atomic<int64_t> profile_max_events_(1048576);
+
+    namespace {
+      typedef std::chrono::steady_clock profile_clock;
+
+      struct ProfileTotals {
+        int64_t calls;
+        int64_t elements;
+        int64_t nanoseconds;
+      };
+
+      struct ProfileRecord {
+        const char* name;
+        int64_t thread;
+        int64_t start;
+        int64_t duration;
+        int64_t elements;
+      };
+
+      // Guards everything below; only taken while profiling is on.
+      std::mutex profile_mutex;
+      // Keyed by the kernel name's string literal, to avoid building a
+      // std::string per call.
+      std::unordered_map<const char*, ProfileTotals> profile_totals;
+      std::vector<ProfileRecord> profile_records;
+      int64_t profile_dropped = 0;
+      std::unordered_map<std::thread::id, int64_t> profile_threads;
+      const profile_clock::time_point profile_epoch = profile_clock::now();
+
+      /// @brief Records one call through the CPU dispatch if profiling
+      /// is on when it starts.
+      class ProfileScope {
+      public:
+        ProfileScope(const char* name, int64_t elements)
+            : name_(name)
+            , elements_(elements)
+            , active_(profiling_.load(std::memory_order_relaxed)) {
+          if (active_) {
+            start_ = profile_clock::now();
+          }
+        }
+
+        ~ProfileScope() {
+          if (active_) {
+            profile_clock::time_point stop = profile_clock::now();
+            int64_t duration = (int64_t)std::chrono::duration_cast<
+              std::chrono::nanoseconds>(stop - start_).count();
+            std::lock_guard<std::mutex> lock(profile_mutex);
+            ProfileTotals& totals = profile_totals[name_];
+            totals.calls++;
+            totals.elements += elements_;
+            totals.nanoseconds += duration;
+            if ((int64_t)profile_records.size() < profile_max_events_) {
+              std::thread::id id = std::this_thread::get_id();
+              auto thread = profile_threads.find(id);
+              if (thread == profile_threads.end()) {
+                thread = profile_threads.emplace(
+                  id, (int64_t)profile_threads.size()).first;
+              }
+              profile_records.push_back(ProfileRecord{
+                name_,
+                thread->second,
+                (int64_t)std::chrono::duration_cast<std::chrono::nanoseconds>(
+                  start_ - profile_epoch).count(),
+                duration,
+                elements_});
+            }
+            else {
+              profile_dropped++;
+            }
+          }
+        }
+
+      private:
+        const char* name_;
+        int64_t elements_;
+        bool active_;
+        profile_clock::time_point start_;
+      };
+    }
+
+    void
+    set_profiling(bool enabled) {
+      profiling_ = enabled;
+    }
+
+    bool
+    profiling() {
+      return profiling_;
+    }
+
+    void
+    set_profile_max_events(int64_t max_events) {
+      if (max_events < 0) {
+        throw std::invalid_argument(
+          std::string("maximum number of profile events must be non-negative")
+          + FILENAME(__LINE__));
+      }
+      profile_max_events_ = max_events;
+    }
+
+    int64_t
+    profile_max_events() {
+      return profile_max_events_;
+    }
+
+    void
+    reset_profile() {
+      std::lock_guard<std::mutex> lock(profile_mutex);
+      profile_totals.clear();
+      profile_records.clear();
+      profile_dropped = 0;
+      profile_threads.clear();
+    }
+
+    std::vector<KernelProfileCounts>
+    profile_counts() {
+      std::lock_guard<std::mutex> lock(profile_mutex);
+      std::vector<KernelProfileCounts> out;
+      out.reserve(profile_totals.size());
+      for (auto const& pair : profile_totals) {
+        out.push_back(KernelProfileCounts{pair.first,
+                                          pair.second.calls,
+                                          pair.second.elements,
+                                          pair.second.nanoseconds});
+      }
+      return out;
+    }
+
+    std::vector<KernelProfileEvent>
+    profile_events() {
+      std::lock_guard<std::mutex> lock(profile_mutex);
+      std::vector<KernelProfileEvent> out;
+      out.reserve(profile_records.size());
+      for (auto const& record : profile_records) {
+        out.push_back(KernelProfileEvent{record.name,
+                                         record.thread,
+                                         record.start,
+                                         record.duration,
+                                         record.elements});
+      }
+      return out;
+    }
+
+    int64_t
+    profile_events_dropped() {
+      std::lock_guard<std::mutex> lock(profile_mutex);
+      return profile_dropped;
+    }
+
+    /// @brief Calls `range(start, stop)` on contiguous, disjoint subranges
+    /// of `[0, length)`, one per thread, and returns the first failure (in
+    /// subrange order) or success.
+    ///
+    /// `range` must only touch the items in its subrange, so that the
+    /// subranges can be processed concurrently. If the length is below
+    /// #parallel_threshold or only one thread is configured, `range` is
+    /// called once, in the calling thread.
+    template <typename RANGE>
+    ERROR
+    parallel_for(int64_t length, const RANGE& range) {
+      int64_t numthreads = std::min((int64_t)parallel_threads_, length);
+      if (numthreads <= 1  ||  length < parallel_threshold_) {
+        return range(0, length);
+      }
+      int64_t chunksize = (length + numthreads - 1) / numthreads;
+      std::vector<struct Error> errors((size_t)numthreads, success());
+      std::vector<std::thread> threads;
+      int64_t serial_from = numthreads;
+      for (int64_t t = 1;  t < numthreads;  t++) {
+        int64_t start = std::min(t*chunksize, length);
+        int64_t stop = std::min(start + chunksize, length);
+        try {
+          threads.emplace_back([&range, &errors, t, start, stop]() {
+            errors[(size_t)t] = range(start, stop);
+          });
+        }
+        catch (std::system_error&) {
+          // could not start another thread: finish the rest in this one
+          serial_from = t;
+          break;
+        }
+      }
+      errors[0] = range(0, std::min(chunksize, length));
+      for (int64_t t = serial_from;  t < numthreads;  t++) {
+        int64_t start = std::min(t*chunksize, length);
+        int64_t stop = std::min(start + chunksize, length);
+        errors[(size_t)t] = range(start, stop);
+      }
+      for (auto& thread : threads) {
+        thread.join();
+      }
+      for (auto& err : errors) {
+        if (err.str != nullptr) {
+          return err;
+        }
+      }
+      return success();
+    }
+
   /////////////////////////////////// awkward/kernels/getitem.h
 
     template<>
@@ -180,6 +425,7 @@ namespace awkward {
       kernel::lib ptr_lib,
       bool *ptr) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_NumpyArraybool_getitem_at0", 1);
         return awkward_NumpyArraybool_getitem_at0(ptr);
       }
       else if (ptr_lib == kernel::lib::cuda) {
@@ -198,6 +444,7 @@ namespace awkward {
       kernel::lib ptr_lib,
       int8_t *ptr) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_NumpyArray8_getitem_at0", 1);
         return awkward_NumpyArray8_getitem_at0(ptr);
       }
       else if (ptr_lib == kernel::lib::cuda) {
@@ -216,6 +463,7 @@ namespace awkward {
       kernel::lib ptr_lib,
       uint8_t *ptr) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_NumpyArrayU8_getitem_at0", 1);
         return awkward_NumpyArrayU8_getitem_at0(ptr);
       }
       else if (ptr_lib == kernel::lib::cuda) {
@@ -234,6 +482,7 @@ namespace awkward {
       kernel::lib ptr_lib,
       int16_t *ptr) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_NumpyArray16_getitem_at0", 1);
         return awkward_NumpyArray16_getitem_at0(ptr);
       }
       else if (ptr_lib == kernel::lib::cuda) {
@@ -252,6 +501,7 @@ namespace awkward {
       kernel::lib ptr_lib,
       uint16_t *ptr) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_NumpyArrayU16_getitem_at0", 1);
         return awkward_NumpyArrayU16_getitem_at0(ptr);
       }
       else if (ptr_lib == kernel::lib::cuda) {
@@ -270,6 +520,7 @@ namespace awkward {
       kernel::lib ptr_lib,
       int32_t *ptr) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_NumpyArray32_getitem_at0", 1);
         return awkward_NumpyArray32_getitem_at0(ptr);
       }
       else if (ptr_lib == kernel::lib::cuda) {
@@ -288,6 +539,7 @@ namespace awkward {
       kernel::lib ptr_lib,
       uint32_t *ptr) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_NumpyArrayU32_getitem_at0", 1);
         return awkward_NumpyArrayU32_getitem_at0(ptr);
       }
       else if (ptr_lib == kernel::lib::cuda) {
@@ -306,6 +558,7 @@ namespace awkward {
         kernel::lib ptr_lib,
         int64_t *ptr) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_NumpyArray64_getitem_at0", 1);
         return awkward_NumpyArray64_getitem_at0(ptr);
       }
       else if (ptr_lib == kernel::lib::cuda) {
@@ -324,6 +577,7 @@ namespace awkward {
         kernel::lib ptr_lib,
         uint64_t *ptr) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_NumpyArrayU64_getitem_at0", 1);
         return awkward_NumpyArrayU64_getitem_at0(ptr);
       }
       else if (ptr_lib == kernel::lib::cuda) {
@@ -342,6 +596,7 @@ namespace awkward {
       kernel::lib ptr_lib,
       float *ptr) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_NumpyArrayfloat32_getitem_at0", 1);
         return awkward_NumpyArrayfloat32_getitem_at0(ptr);
       }
       else if (ptr_lib == kernel::lib::cuda) {
@@ -360,6 +615,7 @@ namespace awkward {
       kernel::lib ptr_lib,
       double *ptr) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_NumpyArrayfloat64_getitem_at0", 1);
         return awkward_NumpyArrayfloat64_getitem_at0(ptr);
       }
       else if (ptr_lib == kernel::lib::cuda) {
@@ -396,6 +652,7 @@ namespace awkward {
       int64_t lenflathead,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_regularize_arrayslice_64", length);
         return awkward_regularize_arrayslice_64(
           flatheadptr,
           lenflathead,
@@ -420,6 +677,7 @@ namespace awkward {
       const int8_t* fromindex,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_Index8_iscontiguous", length);
         return awkward_Index8_iscontiguous(
           result,
           fromindex,
@@ -446,6 +704,7 @@ namespace awkward {
       const uint8_t* fromindex,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_IndexU8_iscontiguous", length);
         return awkward_IndexU8_iscontiguous(
           result,
           fromindex,
@@ -472,6 +731,7 @@ namespace awkward {
       const int32_t* fromindex,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_Index32_iscontiguous", length);
         return awkward_Index32_iscontiguous(
           result,
           fromindex,
@@ -498,6 +758,7 @@ namespace awkward {
       const uint32_t* fromindex,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_IndexU32_iscontiguous", length);
         return awkward_IndexU32_iscontiguous(
           result,
           fromindex,
@@ -524,6 +785,7 @@ namespace awkward {
       const int64_t* fromindex,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_Index64_iscontiguous", length);
         return awkward_Index64_iscontiguous(
           result,
           fromindex,
@@ -550,6 +812,7 @@ namespace awkward {
       const int8_t *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_Index8_to_Index64", length);
         return awkward_Index8_to_Index64(
           toptr,
           fromptr,
@@ -576,6 +839,7 @@ namespace awkward {
       const uint8_t *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_IndexU8_to_Index64", length);
         return awkward_IndexU8_to_Index64(
           toptr,
           fromptr,
@@ -602,6 +866,7 @@ namespace awkward {
       const int32_t *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_Index32_to_Index64", length);
         return awkward_Index32_to_Index64(
           toptr,
           fromptr,
@@ -628,6 +893,7 @@ namespace awkward {
       const uint32_t *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_IndexU32_to_Index64", length);
         return awkward_IndexU32_to_Index64(
           toptr,
           fromptr,
@@ -656,12 +922,17 @@ namespace awkward {
       int64_t lenfromindex,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
-        return awkward_Index8_carry_64(
-          toindex,
-          fromindex,
-          carry,
-          lenfromindex,
-          length);
+        ProfileScope profile("awkward_Index8_carry_64", length);
+        return parallel_for(
+          length,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_Index8_carry_64(
+              toindex + start,
+              fromindex,
+              carry + start,
+              lenfromindex,
+              stop - start);
+          });
       }
       else if (ptr_lib == kernel::lib::cuda) {
         CREATE_KERNEL(awkward_Index8_carry_64, ptr_lib);
@@ -688,12 +959,17 @@ namespace awkward {
       int64_t lenfromindex,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
-        return awkward_IndexU8_carry_64(
-          toindex,
-          fromindex,
-          carry,
-          lenfromindex,
-          length);
+        ProfileScope profile("awkward_IndexU8_carry_64", length);
+        return parallel_for(
+          length,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_IndexU8_carry_64(
+              toindex + start,
+              fromindex,
+              carry + start,
+              lenfromindex,
+              stop - start);
+          });
       }
       else if (ptr_lib == kernel::lib::cuda) {
         CREATE_KERNEL(awkward_IndexU8_carry_64, ptr_lib);
@@ -720,12 +996,17 @@ namespace awkward {
       int64_t lenfromindex,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
-        return awkward_Index32_carry_64(
-          toindex,
-          fromindex,
-          carry,
-          lenfromindex,
-          length);
+        ProfileScope profile("awkward_Index32_carry_64", length);
+        return parallel_for(
+          length,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_Index32_carry_64(
+              toindex + start,
+              fromindex,
+              carry + start,
+              lenfromindex,
+              stop - start);
+          });
       }
       else if (ptr_lib == kernel::lib::cuda) {
         CREATE_KERNEL(awkward_Index32_carry_64, ptr_lib);
@@ -752,12 +1033,17 @@ namespace awkward {
       int64_t lenfromindex,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
-        return awkward_IndexU32_carry_64(
-          toindex,
-          fromindex,
-          carry,
-          lenfromindex,
-          length);
+        ProfileScope profile("awkward_IndexU32_carry_64", length);
+        return parallel_for(
+          length,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_IndexU32_carry_64(
+              toindex + start,
+              fromindex,
+              carry + start,
+              lenfromindex,
+              stop - start);
+          });
       }
       else if (ptr_lib == kernel::lib::cuda) {
         CREATE_KERNEL(awkward_IndexU32_carry_64, ptr_lib);
@@ -784,12 +1070,17 @@ namespace awkward {
       int64_t lenfromindex,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
-        return awkward_Index64_carry_64(
-          toindex,
-          fromindex,
-          carry,
-          lenfromindex,
-          length);
+        ProfileScope profile("awkward_Index64_carry_64", length);
+        return parallel_for(
+          length,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_Index64_carry_64(
+              toindex + start,
+              fromindex,
+              carry + start,
+              lenfromindex,
+              stop - start);
+          });
       }
       else if (ptr_lib == kernel::lib::cuda) {
         CREATE_KERNEL(awkward_Index64_carry_64, ptr_lib);
@@ -815,6 +1106,7 @@ namespace awkward {
       const int64_t *carry,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_Index8_carry_nocheck_64", length);
         return awkward_Index8_carry_nocheck_64(
           toindex,
           fromindex,
@@ -844,6 +1136,7 @@ namespace awkward {
       const int64_t *carry,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_IndexU8_carry_nocheck_64", length);
         return awkward_IndexU8_carry_nocheck_64(
           toindex,
           fromindex,
@@ -873,6 +1166,7 @@ namespace awkward {
       const int64_t *carry,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_Index32_carry_nocheck_64", length);
         return awkward_Index32_carry_nocheck_64(
           toindex,
           fromindex,
@@ -902,6 +1196,7 @@ namespace awkward {
       const int64_t *carry,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_IndexU32_carry_nocheck_64", length);
         return awkward_IndexU32_carry_nocheck_64(
           toindex,
           fromindex,
@@ -931,6 +1226,7 @@ namespace awkward {
       const int64_t *carry,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_Index64_carry_nocheck_64", length);
         return awkward_Index64_carry_nocheck_64(
           toindex,
           fromindex,
@@ -960,6 +1256,7 @@ namespace awkward {
       const int64_t *shape,
       const int64_t *strides) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_slicearray_ravel_64", 1);
         return awkward_slicearray_ravel_64(
           toptr,
           fromptr,
@@ -986,6 +1283,7 @@ namespace awkward {
       const int64_t *missingindex,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_slicemissing_check_same", length);
         return awkward_slicemissing_check_same(
           same,
           bytemask,
@@ -1010,6 +1308,7 @@ namespace awkward {
       int32_t *toptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_carry_arange32", length);
         return awkward_carry_arange32(
           toptr,
           length);
@@ -1033,6 +1332,7 @@ namespace awkward {
       uint32_t *toptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_carry_arangeU32", length);
         return awkward_carry_arangeU32(
           toptr,
           length);
@@ -1056,6 +1356,7 @@ namespace awkward {
       int64_t *toptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_carry_arange64", length);
         return awkward_carry_arange64(
           toptr,
           length);
@@ -1083,6 +1384,7 @@ namespace awkward {
       int64_t width,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_Identities32_getitem_carry_64", length);
         return awkward_Identities32_getitem_carry_64(
           newidentitiesptr,
           identitiesptr,
@@ -1113,6 +1415,7 @@ namespace awkward {
       int64_t width,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_Identities64_getitem_carry_64", length);
         return awkward_Identities64_getitem_carry_64(
           newidentitiesptr,
           identitiesptr,
@@ -1139,6 +1442,7 @@ namespace awkward {
       int64_t skip,
       int64_t stride) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_NumpyArray_contiguous_init_64", 1);
         return awkward_NumpyArray_contiguous_init_64(
           toptr,
           skip,
@@ -1165,6 +1469,7 @@ namespace awkward {
       const uint8_t *fromptr,
       int64_t len) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_NumpyArray_copy", len);
         return awkward_NumpyArray_copy(
           toptr,
           fromptr,
@@ -1191,12 +1496,17 @@ namespace awkward {
       int64_t stride,
       const int64_t *pos) {
       if (ptr_lib == kernel::lib::cpu) {
-        return awkward_NumpyArray_contiguous_copy_64(
-          toptr,
-          fromptr,
+        ProfileScope profile("awkward_NumpyArray_contiguous_copy_64", len);
+        return parallel_for(
           len,
-          stride,
-          pos);
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_NumpyArray_contiguous_copy_64(
+              toptr + start*stride,
+              fromptr,
+              stop - start,
+              stride,
+              pos + start);
+          });
       }
       else if (ptr_lib == kernel::lib::cuda) {
         throw std::runtime_error(
@@ -1219,6 +1529,7 @@ namespace awkward {
       int64_t stride,
       const int64_t *pos) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_NumpyArray_contiguous_copy_from_many_64", len);
         return awkward_NumpyArray_contiguous_copy_from_many_64(
           toptr,
           fromptrs,
@@ -1247,6 +1558,7 @@ namespace awkward {
       int64_t skip,
       int64_t stride) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_NumpyArray_contiguous_next_64", len);
         return awkward_NumpyArray_contiguous_next_64(
           topos,
           frompos,
@@ -1274,12 +1586,17 @@ namespace awkward {
       int64_t stride,
       const int64_t *pos) {
       if (ptr_lib == kernel::lib::cpu) {
-        return awkward_NumpyArray_getitem_next_null_64(
-          toptr,
-          fromptr,
+        ProfileScope profile("awkward_NumpyArray_getitem_next_null_64", len);
+        return parallel_for(
           len,
-          stride,
-          pos);
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_NumpyArray_getitem_next_null_64(
+              toptr + start*stride,
+              fromptr,
+              stop - start,
+              stride,
+              pos + start);
+          });
       }
       else if (ptr_lib == kernel::lib::cuda) {
         throw std::runtime_error(
@@ -1301,6 +1618,7 @@ namespace awkward {
       int64_t skip,
       int64_t at) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_NumpyArray_getitem_next_at_64", lencarry);
         return awkward_NumpyArray_getitem_next_at_64(
           nextcarryptr,
           carryptr,
@@ -1334,6 +1652,7 @@ namespace awkward {
       int64_t start,
       int64_t step) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_NumpyArray_getitem_next_range_64", lencarry);
         return awkward_NumpyArray_getitem_next_range_64(
           nextcarryptr,
           carryptr,
@@ -1367,6 +1686,7 @@ namespace awkward {
       int64_t start,
       int64_t step) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_NumpyArray_getitem_next_range_advanced_64", lencarry);
         return awkward_NumpyArray_getitem_next_range_advanced_64(
           nextcarryptr,
           nextadvancedptr,
@@ -1400,6 +1720,7 @@ namespace awkward {
       int64_t lenflathead,
       int64_t skip) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_NumpyArray_getitem_next_array_64", lencarry);
         return awkward_NumpyArray_getitem_next_array_64(
           nextcarryptr,
           nextadvancedptr,
@@ -1430,6 +1751,7 @@ namespace awkward {
       int64_t lencarry,
       int64_t skip) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_NumpyArray_getitem_next_array_advanced_64", lencarry);
         return awkward_NumpyArray_getitem_next_array_advanced_64(
           nextcarryptr,
           carryptr,
@@ -1462,6 +1784,7 @@ namespace awkward {
       int64_t length,
       int64_t stride) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_NumpyArray_getitem_boolean_numtrue", length);
         return awkward_NumpyArray_getitem_boolean_numtrue(
           numtrue,
           fromptr,
@@ -1487,6 +1810,7 @@ namespace awkward {
       int64_t length,
       int64_t stride) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_NumpyArray_getitem_boolean_nonzero_64", length);
         return awkward_NumpyArray_getitem_boolean_nonzero_64(
           toptr,
           fromptr,
@@ -1514,6 +1838,7 @@ namespace awkward {
       int64_t lenstarts,
       int64_t at) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_ListArray32_getitem_next_at_64", lenstarts);
         return awkward_ListArray32_getitem_next_at_64(
           tocarry,
           fromstarts,
@@ -1542,6 +1867,7 @@ namespace awkward {
       int64_t lenstarts,
       int64_t at) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_ListArrayU32_getitem_next_at_64", lenstarts);
         return awkward_ListArrayU32_getitem_next_at_64(
           tocarry,
           fromstarts,
@@ -1570,6 +1896,7 @@ namespace awkward {
       int64_t lenstarts,
       int64_t at) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_ListArray64_getitem_next_at_64", lenstarts);
        return awkward_ListArray64_getitem_next_at_64(
          tocarry,
          fromstarts,
@@ -1600,6 +1927,7 @@ namespace awkward {
       int64_t stop,
       int64_t step) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_ListArray32_getitem_next_range_carrylength", lenstarts);
         return awkward_ListArray32_getitem_next_range_carrylength(
           carrylength,
           fromstarts,
@@ -1632,6 +1960,7 @@ namespace awkward {
       int64_t stop,
       int64_t step) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_ListArrayU32_getitem_next_range_carrylength", lenstarts);
        return awkward_ListArrayU32_getitem_next_range_carrylength(
          carrylength,
          fromstarts,
@@ -1664,6 +1993,7 @@ namespace awkward {
       int64_t stop,
       int64_t step) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_ListArray64_getitem_next_range_carrylength", lenstarts);
         return awkward_ListArray64_getitem_next_range_carrylength(
           carrylength,
           fromstarts,
@@ -1697,6 +2027,7 @@ namespace awkward {
       int64_t stop,
       int64_t step) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_ListArray32_getitem_next_range_64", lenstarts);
        return awkward_ListArray32_getitem_next_range_64(
          tooffsets,
          tocarry,
@@ -1731,6 +2062,7 @@ namespace awkward {
       int64_t stop,
       int64_t step) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_ListArrayU32_getitem_next_range_64", lenstarts);
         return awkward_ListArrayU32_getitem_next_range_64(
           tooffsets,
           tocarry,
@@ -1765,6 +2097,7 @@ namespace awkward {
       int64_t stop,
       int64_t step) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_ListArray64_getitem_next_range_64", lenstarts);
         return awkward_ListArray64_getitem_next_range_64(
           tooffsets,
           tocarry,
@@ -1794,6 +2127,7 @@ namespace awkward {
       const int32_t *fromoffsets,
       int64_t lenstarts) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_ListArray32_getitem_next_range_counts_64", lenstarts);
         return awkward_ListArray32_getitem_next_range_counts_64(
           total,
           fromoffsets,
@@ -1820,6 +2154,7 @@ namespace awkward {
       const uint32_t *fromoffsets,
       int64_t lenstarts) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_ListArrayU32_getitem_next_range_counts_64", lenstarts);
         return awkward_ListArrayU32_getitem_next_range_counts_64(
           total,
           fromoffsets,
@@ -1846,6 +2181,7 @@ namespace awkward {
       const int64_t *fromoffsets,
       int64_t lenstarts) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_ListArray64_getitem_next_range_counts_64", lenstarts);
         return awkward_ListArray64_getitem_next_range_counts_64(
           total,
           fromoffsets,
@@ -1873,6 +2209,7 @@ namespace awkward {
       const int32_t *fromoffsets,
       int64_t lenstarts) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_ListArray32_getitem_next_range_spreadadvanced_64", lenstarts);
        return awkward_ListArray32_getitem_next_range_spreadadvanced_64(
          toadvanced,
          fromadvanced,
@@ -1899,6 +2236,7 @@ namespace awkward {
       const uint32_t *fromoffsets,
       int64_t lenstarts) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_ListArrayU32_getitem_next_range_spreadadvanced_64", lenstarts);
         return awkward_ListArrayU32_getitem_next_range_spreadadvanced_64(
           toadvanced,
           fromadvanced,
@@ -1925,6 +2263,7 @@ namespace awkward {
       const int64_t *fromoffsets,
       int64_t lenstarts) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_ListArray64_getitem_next_range_spreadadvanced_64", lenstarts);
        return awkward_ListArray64_getitem_next_range_spreadadvanced_64(
          toadvanced,
          fromadvanced,
@@ -1955,6 +2294,7 @@ namespace awkward {
       int64_t lenarray,
       int64_t lencontent) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_ListArray32_getitem_next_array_64", lenstarts);
         return awkward_ListArray32_getitem_next_array_64(
           tocarry,
           toadvanced,
@@ -1989,6 +2329,7 @@ namespace awkward {
       int64_t lenarray,
       int64_t lencontent) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_ListArrayU32_getitem_next_array_64", lenstarts);
         return awkward_ListArrayU32_getitem_next_array_64(
           tocarry,
           toadvanced,
@@ -2023,6 +2364,7 @@ namespace awkward {
       int64_t lenarray,
       int64_t lencontent) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_ListArray64_getitem_next_array_64", lenstarts);
         return awkward_ListArray64_getitem_next_array_64(
           tocarry,
           toadvanced,
@@ -2058,6 +2400,7 @@ namespace awkward {
       int64_t lenarray,
       int64_t lencontent) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_ListArray32_getitem_next_array_advanced_64", lenstarts);
         return awkward_ListArray32_getitem_next_array_advanced_64(
           tocarry,
           toadvanced,
@@ -2094,6 +2437,7 @@ namespace awkward {
       int64_t lenarray,
       int64_t lencontent) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_ListArrayU32_getitem_next_array_advanced_64", lenstarts);
         return awkward_ListArrayU32_getitem_next_array_advanced_64(
           tocarry,
           toadvanced,
@@ -2130,6 +2474,7 @@ namespace awkward {
       int64_t lenarray,
       int64_t lencontent) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_ListArray64_getitem_next_array_advanced_64", lenstarts);
         return awkward_ListArray64_getitem_next_array_advanced_64(
           tocarry,
           toadvanced,
@@ -2164,14 +2509,23 @@ namespace awkward {
       int64_t lenstarts,
       int64_t lencarry) {
       if (ptr_lib == kernel::lib::cpu) {
-        return awkward_ListArray32_getitem_carry_64(
-          tostarts,
-          tostops,
-          fromstarts,
-          fromstops,
-          fromcarry,
-          lenstarts,
-          lencarry);
+        ProfileScope profile("awkward_ListArray32_getitem_carry_64", lenstarts);
+        return parallel_for(
+          lencarry,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            struct Error err = awkward_ListArray32_getitem_carry_64(
+              tostarts + start,
+              tostops + start,
+              fromstarts,
+              fromstops,
+              fromcarry + start,
+              lenstarts,
+              stop - start);
+            if (err.str != nullptr  &&  err.identity != kSliceNone) {
+              err.identity += start;
+            }
+            return err;
+          });
       }
       else if (ptr_lib == kernel::lib::cuda) {
         throw std::runtime_error(
@@ -2196,15 +2550,24 @@ namespace awkward {
       int64_t lenstarts,
       int64_t lencarry) {
       if (ptr_lib == kernel::lib::cpu) {
-       return awkward_ListArrayU32_getitem_carry_64(
-         tostarts,
-         tostops,
-         fromstarts,
-         fromstops,
-         fromcarry,
-         lenstarts,
-         lencarry);
-     }
+        ProfileScope profile("awkward_ListArrayU32_getitem_carry_64", lenstarts);
+        return parallel_for(
+          lencarry,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            struct Error err = awkward_ListArrayU32_getitem_carry_64(
+              tostarts + start,
+              tostops + start,
+              fromstarts,
+              fromstops,
+              fromcarry + start,
+              lenstarts,
+              stop - start);
+            if (err.str != nullptr  &&  err.identity != kSliceNone) {
+              err.identity += start;
+            }
+            return err;
+          });
+      }
       else if (ptr_lib == kernel::lib::cuda) {
         throw std::runtime_error(
           std::string("not implemented: ptr_lib == cuda_kernels for ListArray_getitem_carry_64<uint32_t>")
@@ -2228,14 +2591,23 @@ namespace awkward {
       int64_t lenstarts,
       int64_t lencarry) {
       if (ptr_lib == kernel::lib::cpu) {
-        return awkward_ListArray64_getitem_carry_64(
-          tostarts,
-          tostops,
-          fromstarts,
-          fromstops,
-          fromcarry,
-          lenstarts,
-          lencarry);
+        ProfileScope profile("awkward_ListArray64_getitem_carry_64", lenstarts);
+        return parallel_for(
+          lencarry,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            struct Error err = awkward_ListArray64_getitem_carry_64(
+              tostarts + start,
+              tostops + start,
+              fromstarts,
+              fromstops,
+              fromcarry + start,
+              lenstarts,
+              stop - start);
+            if (err.str != nullptr  &&  err.identity != kSliceNone) {
+              err.identity += start;
+            }
+            return err;
+          });
       }
       else if (ptr_lib == kernel::lib::cuda) {
         throw std::runtime_error(
@@ -2256,6 +2628,7 @@ namespace awkward {
       int64_t len,
       int64_t size) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_RegularArray_getitem_next_at_64", len);
         return awkward_RegularArray_getitem_next_at_64(
           tocarry,
           at,
@@ -2283,6 +2656,7 @@ namespace awkward {
       int64_t size,
       int64_t nextsize) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_RegularArray_getitem_next_range_64", len);
         return awkward_RegularArray_getitem_next_range_64(
           tocarry,
           regular_start,
@@ -2310,6 +2684,7 @@ namespace awkward {
       int64_t len,
       int64_t nextsize) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_RegularArray_getitem_next_range_spreadadvanced_64", len);
         return awkward_RegularArray_getitem_next_range_spreadadvanced_64(
           toadvanced,
           fromadvanced,
@@ -2335,6 +2710,7 @@ namespace awkward {
       int64_t lenarray,
       int64_t size) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_RegularArray_getitem_next_array_regularize_64", lenarray);
         return awkward_RegularArray_getitem_next_array_regularize_64(
           toarray,
           fromarray,
@@ -2362,6 +2738,7 @@ namespace awkward {
       int64_t lenarray,
       int64_t size) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_RegularArray_getitem_next_array_64", len);
         return awkward_RegularArray_getitem_next_array_64(
           tocarry,
           toadvanced,
@@ -2392,6 +2769,7 @@ namespace awkward {
       int64_t lenarray,
       int64_t size) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_RegularArray_getitem_next_array_advanced_64", len);
         return awkward_RegularArray_getitem_next_array_advanced_64(
           tocarry,
           toadvanced,
@@ -2426,6 +2804,7 @@ namespace awkward {
       int64_t lencarry,
       int64_t size) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_RegularArray_getitem_carry_64", lencarry);
         return awkward_RegularArray_getitem_carry_64(
           tocarry,
           fromcarry,
@@ -2451,6 +2830,7 @@ namespace awkward {
       const int32_t *fromindex,
       int64_t lenindex) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_IndexedArray32_numnull", lenindex);
         return awkward_IndexedArray32_numnull(
           numnull,
           fromindex,
@@ -2475,6 +2855,7 @@ namespace awkward {
       const uint32_t *fromindex,
       int64_t lenindex) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_IndexedArrayU32_numnull", lenindex);
         return awkward_IndexedArrayU32_numnull(
           numnull,
           fromindex,
@@ -2499,6 +2880,7 @@ namespace awkward {
       const int64_t *fromindex,
       int64_t lenindex) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_IndexedArray64_numnull", lenindex);
         return awkward_IndexedArray64_numnull(
           numnull,
           fromindex,
@@ -2525,6 +2907,7 @@ namespace awkward {
       const int64_t* parents,
       const int64_t* starts) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_IndexedArray32_index_of_nulls", lenindex);
         return awkward_IndexedArray32_index_of_nulls(
           toindex,
           fromindex,
@@ -2553,6 +2936,7 @@ namespace awkward {
       const int64_t* parents,
       const int64_t* starts) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_IndexedArrayU32_index_of_nulls", lenindex);
         return awkward_IndexedArrayU32_index_of_nulls(
           toindex,
           fromindex,
@@ -2581,6 +2965,7 @@ namespace awkward {
       const int64_t* parents,
       const int64_t* starts) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_IndexedArray64_index_of_nulls", lenindex);
         return awkward_IndexedArray64_index_of_nulls(
           toindex,
           fromindex,
@@ -2609,6 +2994,7 @@ namespace awkward {
       int64_t lenindex,
       int64_t lencontent) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_IndexedArray32_getitem_nextcarry_outindex_64", lenindex);
        return awkward_IndexedArray32_getitem_nextcarry_outindex_64(
          tocarry,
          toindex,
@@ -2637,6 +3023,7 @@ namespace awkward {
       int64_t lenindex,
       int64_t lencontent) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_IndexedArrayU32_getitem_nextcarry_outindex_64", lenindex);
         return awkward_IndexedArrayU32_getitem_nextcarry_outindex_64(
           tocarry,
           toindex,
@@ -2665,6 +3052,7 @@ namespace awkward {
       int64_t lenindex,
       int64_t lencontent) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_IndexedArray64_getitem_nextcarry_outindex_64", lenindex);
        return awkward_IndexedArray64_getitem_nextcarry_outindex_64(
          tocarry,
          toindex,
@@ -2693,6 +3081,7 @@ namespace awkward {
       int64_t lenindex,
       int64_t lencontent) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_IndexedArray32_getitem_nextcarry_outindex_mask_64", lenindex);
         return awkward_IndexedArray32_getitem_nextcarry_outindex_mask_64(
           tocarry,
           toindex,
@@ -2721,6 +3110,7 @@ namespace awkward {
       int64_t lenindex,
       int64_t lencontent) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_IndexedArrayU32_getitem_nextcarry_outindex_mask_64", lenindex);
        return awkward_IndexedArrayU32_getitem_nextcarry_outindex_mask_64(
          tocarry,
          toindex,
@@ -2749,6 +3139,7 @@ namespace awkward {
       int64_t lenindex,
       int64_t lencontent) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_IndexedArray64_getitem_nextcarry_outindex_mask_64", lenindex);
         return awkward_IndexedArray64_getitem_nextcarry_outindex_mask_64(
           tocarry,
           toindex,
@@ -2777,6 +3168,7 @@ namespace awkward {
       const int64_t *nonzero,
       int64_t nonzerolength) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_ListOffsetArray_getitem_adjust_offsets_64", length);
         return awkward_ListOffsetArray_getitem_adjust_offsets_64(
           tooffsets,
           tononzero,
@@ -2810,6 +3202,7 @@ namespace awkward {
       const int8_t *originalmask,
       int64_t masklength) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_ListOffsetArray_getitem_adjust_offsets_index_64", length);
         return awkward_ListOffsetArray_getitem_adjust_offsets_index_64(
           tooffsets,
           tononzero,
@@ -2844,6 +3237,7 @@ namespace awkward {
       const int64_t *nonzero,
       int64_t nonzerolength) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_IndexedArray_getitem_adjust_outindex_64", fromindexlength);
         return awkward_IndexedArray_getitem_adjust_outindex_64(
           tomask,
           toindex,
@@ -2873,6 +3267,7 @@ namespace awkward {
       int64_t lenindex,
       int64_t lencontent) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_IndexedArray32_getitem_nextcarry_64", lenindex);
         return awkward_IndexedArray32_getitem_nextcarry_64(
           tocarry,
           fromindex,
@@ -2899,6 +3294,7 @@ namespace awkward {
       int64_t lenindex,
       int64_t lencontent) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_IndexedArrayU32_getitem_nextcarry_64", lenindex);
         return awkward_IndexedArrayU32_getitem_nextcarry_64(
           tocarry,
           fromindex,
@@ -2925,6 +3321,7 @@ namespace awkward {
       int64_t lenindex,
       int64_t lencontent) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_IndexedArray64_getitem_nextcarry_64", lenindex);
         return awkward_IndexedArray64_getitem_nextcarry_64(
           tocarry,
           fromindex,
@@ -2952,6 +3349,7 @@ namespace awkward {
       int64_t lenindex,
       int64_t lencarry) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_IndexedArray32_getitem_carry_64", lenindex);
        return awkward_IndexedArray32_getitem_carry_64(
          toindex,
          fromindex,
@@ -2980,6 +3378,7 @@ namespace awkward {
       int64_t lenindex,
       int64_t lencarry) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_IndexedArrayU32_getitem_carry_64", lenindex);
         return awkward_IndexedArrayU32_getitem_carry_64(
           toindex,
           fromindex,
@@ -3008,6 +3407,7 @@ namespace awkward {
       int64_t lenindex,
       int64_t lencarry) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_IndexedArray64_getitem_carry_64", lenindex);
        return awkward_IndexedArray64_getitem_carry_64(
          toindex,
          fromindex,
@@ -3034,6 +3434,7 @@ namespace awkward {
       const int8_t *fromtags,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_UnionArray8_regular_index_getsize", length);
         return awkward_UnionArray8_regular_index_getsize(
           size,
           fromtags,
@@ -3062,6 +3463,7 @@ namespace awkward {
       const int8_t *fromtags,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_UnionArray8_32_regular_index", length);
        return awkward_UnionArray8_32_regular_index(
          toindex,
          current,
@@ -3090,6 +3492,7 @@ namespace awkward {
       const int8_t *fromtags,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_UnionArray8_U32_regular_index", length);
         return awkward_UnionArray8_U32_regular_index(
           toindex,
           current,
@@ -3118,6 +3521,7 @@ namespace awkward {
       const int8_t *fromtags,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_UnionArray8_64_regular_index", length);
        return awkward_UnionArray8_64_regular_index(
          toindex,
          current,
@@ -3147,6 +3551,7 @@ namespace awkward {
       int64_t length,
       int64_t which) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_UnionArray8_32_project_64", length);
         return awkward_UnionArray8_32_project_64(
           lenout,
           tocarry,
@@ -3177,6 +3582,7 @@ namespace awkward {
       int64_t length,
       int64_t which) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_UnionArray8_U32_project_64", length);
        return awkward_UnionArray8_U32_project_64(
          lenout,
          tocarry,
@@ -3207,6 +3613,7 @@ namespace awkward {
       int64_t length,
       int64_t which) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_UnionArray8_64_project_64", length);
         return awkward_UnionArray8_64_project_64(
           lenout,
           tocarry,
@@ -3235,6 +3642,7 @@ namespace awkward {
       int64_t repetitions,
       int64_t regularsize) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_missing_repeat_64", indexlength);
         return awkward_missing_repeat_64(
           outindex,
           index,
@@ -3262,6 +3670,7 @@ namespace awkward {
       int64_t regularsize,
       int64_t regularlength) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_RegularArray_getitem_jagged_expand_64", regularsize);
         return awkward_RegularArray_getitem_jagged_expand_64(
           multistarts,
           multistops,
@@ -3293,6 +3702,7 @@ namespace awkward {
       int64_t jaggedsize,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_ListArray32_getitem_jagged_expand_64", length);
         return awkward_ListArray32_getitem_jagged_expand_64(
           multistarts,
           multistops,
@@ -3327,6 +3737,7 @@ namespace awkward {
       int64_t jaggedsize,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_ListArrayU32_getitem_jagged_expand_64", length);
        return awkward_ListArrayU32_getitem_jagged_expand_64(
          multistarts,
          multistops,
@@ -3361,6 +3772,7 @@ namespace awkward {
       int64_t jaggedsize,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_ListArray64_getitem_jagged_expand_64", length);
         return awkward_ListArray64_getitem_jagged_expand_64(
           multistarts,
           multistops,
@@ -3390,6 +3802,7 @@ namespace awkward {
       const int64_t *slicestops,
       int64_t sliceouterlen) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_ListArray_getitem_jagged_carrylen_64", sliceouterlen);
         return awkward_ListArray_getitem_jagged_carrylen_64(
           carrylen,
           slicestarts,
@@ -3422,6 +3835,7 @@ namespace awkward {
       const int32_t *fromstops,
       int64_t contentlen) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_ListArray32_getitem_jagged_apply_64", sliceouterlen);
        return awkward_ListArray32_getitem_jagged_apply_64(
          tooffsets,
          tocarry,
@@ -3460,6 +3874,7 @@ namespace awkward {
       const uint32_t *fromstops,
       int64_t contentlen) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_ListArrayU32_getitem_jagged_apply_64", sliceouterlen);
        return awkward_ListArrayU32_getitem_jagged_apply_64(
          tooffsets,
          tocarry,
@@ -3498,6 +3913,7 @@ namespace awkward {
       const int64_t *fromstops,
       int64_t contentlen) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_ListArray64_getitem_jagged_apply_64", sliceouterlen);
        return awkward_ListArray64_getitem_jagged_apply_64(
          tooffsets,
          tocarry,
@@ -3531,6 +3947,7 @@ namespace awkward {
       const int64_t *missing,
       int64_t missinglength) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_ListArray_getitem_jagged_numvalid_64", length);
         return awkward_ListArray_getitem_jagged_numvalid_64(
           numvalid,
           slicestarts,
@@ -3561,6 +3978,7 @@ namespace awkward {
       int64_t length,
       const int64_t *missing) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_ListArray_getitem_jagged_shrink_64", length);
         return awkward_ListArray_getitem_jagged_shrink_64(
           tocarry,
           tosmalloffsets,
@@ -3592,6 +4010,7 @@ namespace awkward {
       const int32_t *fromstarts,
       const int32_t *fromstops) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_ListArray32_getitem_jagged_descend_64", sliceouterlen);
         return awkward_ListArray32_getitem_jagged_descend_64(
           tooffsets,
           slicestarts,
@@ -3622,6 +4041,7 @@ namespace awkward {
       const uint32_t *fromstarts,
       const uint32_t *fromstops) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_ListArrayU32_getitem_jagged_descend_64", sliceouterlen);
        return awkward_ListArrayU32_getitem_jagged_descend_64(
          tooffsets,
          slicestarts,
@@ -3652,6 +4072,7 @@ namespace awkward {
       const int64_t *fromstarts,
       const int64_t *fromstops) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_ListArray64_getitem_jagged_descend_64", sliceouterlen);
         return awkward_ListArray64_getitem_jagged_descend_64(
           tooffsets,
           slicestarts,
@@ -3677,6 +4098,7 @@ namespace awkward {
                                    int8_t *ptr,
                                    int64_t at) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_Index8_getitem_at_nowrap", 1);
         return awkward_Index8_getitem_at_nowrap(
           ptr,
           at);
@@ -3699,6 +4121,7 @@ namespace awkward {
                                     uint8_t *ptr,
                                     int64_t at) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_IndexU8_getitem_at_nowrap", 1);
         return awkward_IndexU8_getitem_at_nowrap(
           ptr,
           at);
@@ -3721,6 +4144,7 @@ namespace awkward {
                                     int32_t *ptr,
                                     int64_t at) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_Index32_getitem_at_nowrap", 1);
         return awkward_Index32_getitem_at_nowrap(
           ptr,
           at);
@@ -3743,6 +4167,7 @@ namespace awkward {
                                      uint32_t *ptr,
                                      int64_t at) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_IndexU32_getitem_at_nowrap", 1);
         return awkward_IndexU32_getitem_at_nowrap(
           ptr,
           at);
@@ -3765,6 +4190,7 @@ namespace awkward {
                                     int64_t *ptr,
                                     int64_t at) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_Index64_getitem_at_nowrap", 1);
         return awkward_Index64_getitem_at_nowrap(
           ptr,
           at);
@@ -3788,6 +4214,7 @@ namespace awkward {
                                  int64_t at,
                                  int8_t value) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_Index8_setitem_at_nowrap", 1);
         awkward_Index8_setitem_at_nowrap(
           ptr,
           at,
@@ -3813,6 +4240,7 @@ namespace awkward {
                                  int64_t at,
                                  uint8_t value) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_IndexU8_setitem_at_nowrap", 1);
         awkward_IndexU8_setitem_at_nowrap(
           ptr,
           at,
@@ -3838,6 +4266,7 @@ namespace awkward {
                                  int64_t at,
                                  int32_t value) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_Index32_setitem_at_nowrap", 1);
         awkward_Index32_setitem_at_nowrap(
           ptr,
           at,
@@ -3863,6 +4292,7 @@ namespace awkward {
                                  int64_t at,
                                  uint32_t value) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_IndexU32_setitem_at_nowrap", 1);
         awkward_IndexU32_setitem_at_nowrap(
           ptr,
           at,
@@ -3888,6 +4318,7 @@ namespace awkward {
                                  int64_t at,
                                  int64_t value) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_Index64_setitem_at_nowrap", 1);
         awkward_Index64_setitem_at_nowrap(
           ptr,
           at,
@@ -3915,6 +4346,7 @@ namespace awkward {
       const int64_t *fromcarry,
       int64_t lencarry) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_ByteMaskedArray_getitem_carry_64", lenmask);
         return awkward_ByteMaskedArray_getitem_carry_64(
           tomask,
           frommask,
@@ -3945,6 +4377,7 @@ namespace awkward {
       int64_t length,
       bool validwhen) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_ByteMaskedArray_numnull", length);
         return awkward_ByteMaskedArray_numnull(
           numnull,
           mask,
@@ -3970,6 +4403,7 @@ namespace awkward {
       int64_t length,
       bool validwhen) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_ByteMaskedArray_getitem_nextcarry_64", length);
         return awkward_ByteMaskedArray_getitem_nextcarry_64(
           tocarry,
           mask,
@@ -3996,6 +4430,7 @@ namespace awkward {
       int64_t length,
       bool validwhen) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_ByteMaskedArray_getitem_nextcarry_outindex_64", length);
         return awkward_ByteMaskedArray_getitem_nextcarry_outindex_64(
           tocarry,
           toindex,
@@ -4022,6 +4457,7 @@ namespace awkward {
       int64_t length,
       bool validwhen) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_ByteMaskedArray_toIndexedOptionArray64", length);
         return awkward_ByteMaskedArray_toIndexedOptionArray64(
           toindex,
           mask,
@@ -4052,6 +4488,7 @@ namespace awkward {
       int64_t *stops_out,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_Content_getitem_next_missing_jagged_getmaskstartstop", length);
         return awkward_Content_getitem_next_missing_jagged_getmaskstartstop(
           index_in,
           offsets_in,
@@ -4082,6 +4519,7 @@ namespace awkward {
       int64_t *stops_out,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_MaskedArray32_getitem_next_jagged_project", length);
         return awkward_MaskedArray32_getitem_next_jagged_project(
           index,
           starts_in,
@@ -4111,6 +4549,7 @@ namespace awkward {
       int64_t *stops_out,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_MaskedArrayU32_getitem_next_jagged_project", length);
         return awkward_MaskedArrayU32_getitem_next_jagged_project(
           index,
           starts_in,
@@ -4140,6 +4579,7 @@ namespace awkward {
       int64_t *stops_out,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_MaskedArray64_getitem_next_jagged_project", length);
         return awkward_MaskedArray64_getitem_next_jagged_project(
           index,
           starts_in,
@@ -4168,6 +4608,7 @@ namespace awkward {
       int32_t *toptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_new_Identities32", length);
         return awkward_new_Identities32(
           toptr,
           length);
@@ -4189,6 +4630,7 @@ namespace awkward {
       int64_t *toptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_new_Identities64", length);
         return awkward_new_Identities64(
           toptr,
           length);
@@ -4212,6 +4654,7 @@ namespace awkward {
       int64_t length,
       int64_t width) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_Identities32_to_Identities64", length);
         return awkward_Identities32_to_Identities64(
           toptr,
           fromptr,
@@ -4239,6 +4682,7 @@ namespace awkward {
       int64_t fromlength,
       int64_t fromwidth) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_Identities32_from_ListOffsetArray32", tolength);
         return awkward_Identities32_from_ListOffsetArray32(
           toptr,
           fromptr,
@@ -4269,6 +4713,7 @@ namespace awkward {
       int64_t fromlength,
       int64_t fromwidth) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_Identities32_from_ListOffsetArrayU32", tolength);
         return awkward_Identities32_from_ListOffsetArrayU32(
           toptr,
           fromptr,
@@ -4299,6 +4744,7 @@ namespace awkward {
       int64_t fromlength,
       int64_t fromwidth) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_Identities32_from_ListOffsetArray64", tolength);
         return awkward_Identities32_from_ListOffsetArray64(
           toptr,
           fromptr,
@@ -4329,6 +4775,7 @@ namespace awkward {
       int64_t fromlength,
       int64_t fromwidth) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_Identities64_from_ListOffsetArray32", tolength);
         return awkward_Identities64_from_ListOffsetArray32(
           toptr,
           fromptr,
@@ -4359,6 +4806,7 @@ namespace awkward {
       int64_t fromlength,
       int64_t fromwidth) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_Identities64_from_ListOffsetArrayU32", tolength);
         return awkward_Identities64_from_ListOffsetArrayU32(
           toptr,
           fromptr,
@@ -4389,6 +4837,7 @@ namespace awkward {
       int64_t fromlength,
       int64_t fromwidth) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_Identities64_from_ListOffsetArray64", tolength);
         return awkward_Identities64_from_ListOffsetArray64(
           toptr,
           fromptr,
@@ -4421,6 +4870,7 @@ namespace awkward {
       int64_t fromlength,
       int64_t fromwidth) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_Identities32_from_ListArray32", tolength);
         return awkward_Identities32_from_ListArray32(
           uniquecontents,
           toptr,
@@ -4455,6 +4905,7 @@ namespace awkward {
       int64_t fromlength,
       int64_t fromwidth) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_Identities32_from_ListArrayU32", tolength);
         return awkward_Identities32_from_ListArrayU32(
           uniquecontents,
           toptr,
@@ -4489,6 +4940,7 @@ namespace awkward {
       int64_t fromlength,
       int64_t fromwidth) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_Identities32_from_ListArray64", tolength);
         return awkward_Identities32_from_ListArray64(
           uniquecontents,
           toptr,
@@ -4523,6 +4975,7 @@ namespace awkward {
       int64_t fromlength,
       int64_t fromwidth) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_Identities64_from_ListArray32", tolength);
         return awkward_Identities64_from_ListArray32(
           uniquecontents,
           toptr,
@@ -4557,6 +5010,7 @@ namespace awkward {
       int64_t fromlength,
       int64_t fromwidth) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_Identities64_from_ListArrayU32", tolength);
         return awkward_Identities64_from_ListArrayU32(
           uniquecontents,
           toptr,
@@ -4591,6 +5045,7 @@ namespace awkward {
       int64_t fromlength,
       int64_t fromwidth) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_Identities64_from_ListArray64", tolength);
         return awkward_Identities64_from_ListArray64(
           uniquecontents,
           toptr,
@@ -4623,6 +5078,7 @@ namespace awkward {
       int64_t fromlength,
       int64_t fromwidth) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_Identities32_from_RegularArray", size);
         return awkward_Identities32_from_RegularArray(
           toptr,
           fromptr,
@@ -4653,6 +5109,7 @@ namespace awkward {
       int64_t fromlength,
       int64_t fromwidth) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_Identities64_from_RegularArray", size);
         return awkward_Identities64_from_RegularArray(
           toptr,
           fromptr,
@@ -4684,6 +5141,7 @@ namespace awkward {
       int64_t fromlength,
       int64_t fromwidth) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_Identities32_from_IndexedArray32", tolength);
         return awkward_Identities32_from_IndexedArray32(
           uniquecontents,
           toptr,
@@ -4716,6 +5174,7 @@ namespace awkward {
       int64_t fromlength,
       int64_t fromwidth) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_Identities32_from_IndexedArrayU32", tolength);
        return awkward_Identities32_from_IndexedArrayU32(
          uniquecontents,
          toptr,
@@ -4748,6 +5207,7 @@ namespace awkward {
       int64_t fromlength,
       int64_t fromwidth) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_Identities32_from_IndexedArray64", tolength);
         return awkward_Identities32_from_IndexedArray64(
           uniquecontents,
           toptr,
@@ -4780,6 +5240,7 @@ namespace awkward {
       int64_t fromlength,
       int64_t fromwidth) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_Identities64_from_IndexedArray32", tolength);
        return awkward_Identities64_from_IndexedArray32(
          uniquecontents,
          toptr,
@@ -4812,6 +5273,7 @@ namespace awkward {
       int64_t fromlength,
       int64_t fromwidth) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_Identities64_from_IndexedArrayU32", tolength);
         return awkward_Identities64_from_IndexedArrayU32(
           uniquecontents,
           toptr,
@@ -4844,6 +5306,7 @@ namespace awkward {
       int64_t fromlength,
       int64_t fromwidth) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_Identities64_from_IndexedArray64", tolength);
        return awkward_Identities64_from_IndexedArray64(
          uniquecontents,
          toptr,
@@ -4878,6 +5341,7 @@ namespace awkward {
       int64_t fromwidth,
       int64_t which) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_Identities32_from_UnionArray8_32", tolength);
         return awkward_Identities32_from_UnionArray8_32(
           uniquecontents,
           toptr,
@@ -4914,6 +5378,7 @@ namespace awkward {
       int64_t fromwidth,
       int64_t which) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_Identities32_from_UnionArray8_U32", tolength);
         return awkward_Identities32_from_UnionArray8_U32(
           uniquecontents,
           toptr,
@@ -4950,6 +5415,7 @@ namespace awkward {
       int64_t fromwidth,
       int64_t which) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_Identities32_from_UnionArray8_64", tolength);
         return awkward_Identities32_from_UnionArray8_64(
           uniquecontents,
           toptr,
@@ -4986,6 +5452,7 @@ namespace awkward {
       int64_t fromwidth,
       int64_t which) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_Identities64_from_UnionArray8_32", tolength);
         return awkward_Identities64_from_UnionArray8_32(
           uniquecontents,
           toptr,
@@ -5022,6 +5489,7 @@ namespace awkward {
       int64_t fromwidth,
       int64_t which) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_Identities64_from_UnionArray8_U32", tolength);
         return awkward_Identities64_from_UnionArray8_U32(
           uniquecontents,
           toptr,
@@ -5058,6 +5526,7 @@ namespace awkward {
       int64_t fromwidth,
       int64_t which) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_Identities64_from_UnionArray8_64", tolength);
         return awkward_Identities64_from_UnionArray8_64(
           uniquecontents,
           toptr,
@@ -5089,6 +5558,7 @@ namespace awkward {
       int64_t fromlength,
       int64_t tolength) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_Identities32_extend", fromlength);
         return awkward_Identities32_extend(
           toptr,
           fromptr,
@@ -5115,6 +5585,7 @@ namespace awkward {
       int64_t fromlength,
       int64_t tolength) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_Identities64_extend", fromlength);
         return awkward_Identities64_extend(
           toptr,
           fromptr,
@@ -5143,11 +5614,16 @@ namespace awkward {
       const int32_t *fromstops,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
-        return awkward_ListArray32_num_64(
-          tonum,
-          fromstarts,
-          fromstops,
-          length);
+        ProfileScope profile("awkward_ListArray32_num_64", length);
+        return parallel_for(
+          length,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_ListArray32_num_64(
+              tonum + start,
+              fromstarts + start,
+              fromstops + start,
+              stop - start);
+          });
       }
       else if (ptr_lib == kernel::lib::cuda) {
         CREATE_KERNEL(awkward_ListArray32_num_64, ptr_lib);
@@ -5172,11 +5648,16 @@ namespace awkward {
       const uint32_t *fromstops,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
-        return awkward_ListArrayU32_num_64(
-          tonum,
-          fromstarts,
-          fromstops,
-          length);
+        ProfileScope profile("awkward_ListArrayU32_num_64", length);
+        return parallel_for(
+          length,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_ListArrayU32_num_64(
+              tonum + start,
+              fromstarts + start,
+              fromstops + start,
+              stop - start);
+          });
       }
       else if (ptr_lib == kernel::lib::cuda) {
         CREATE_KERNEL(awkward_ListArrayU32_num_64, ptr_lib);
@@ -5201,11 +5682,16 @@ namespace awkward {
       const int64_t *fromstops,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
-        return awkward_ListArray64_num_64(
-          tonum,
-          fromstarts,
-          fromstops,
-          length);
+        ProfileScope profile("awkward_ListArray64_num_64", length);
+        return parallel_for(
+          length,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_ListArray64_num_64(
+              tonum + start,
+              fromstarts + start,
+              fromstops + start,
+              stop - start);
+          });
       }
       else if (ptr_lib == kernel::lib::cuda) {
         CREATE_KERNEL(awkward_ListArray64_num_64, ptr_lib);
@@ -5228,6 +5714,7 @@ namespace awkward {
       int64_t size,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_RegularArray_num_64", length);
         return awkward_RegularArray_num_64(
           tonum,
           size,
@@ -5256,6 +5743,7 @@ namespace awkward {
       const int64_t *inneroffsets,
       int64_t inneroffsetslen) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_ListOffsetArray32_flatten_offsets_64", outeroffsetslen);
         return awkward_ListOffsetArray32_flatten_offsets_64(
           tooffsets,
           outeroffsets,
@@ -5287,6 +5775,7 @@ namespace awkward {
       const int64_t *inneroffsets,
       int64_t inneroffsetslen) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_ListOffsetArrayU32_flatten_offsets_64", outeroffsetslen);
         return awkward_ListOffsetArrayU32_flatten_offsets_64(
           tooffsets,
           outeroffsets,
@@ -5318,6 +5807,7 @@ namespace awkward {
       const int64_t *inneroffsets,
       int64_t inneroffsetslen) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_ListOffsetArray64_flatten_offsets_64", outeroffsetslen);
         return awkward_ListOffsetArray64_flatten_offsets_64(
           tooffsets,
           outeroffsets,
@@ -5349,6 +5839,7 @@ namespace awkward {
       const int64_t *offsets,
       int64_t offsetslength) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_IndexedArray32_flatten_none2empty_64", outindexlength);
         return awkward_IndexedArray32_flatten_none2empty_64(
           outoffsets,
           outindex,
@@ -5377,6 +5868,7 @@ namespace awkward {
       const int64_t *offsets,
       int64_t offsetslength) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_IndexedArrayU32_flatten_none2empty_64", outindexlength);
         return awkward_IndexedArrayU32_flatten_none2empty_64(
           outoffsets,
           outindex,
@@ -5405,6 +5897,7 @@ namespace awkward {
       const int64_t *offsets,
       int64_t offsetslength) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_IndexedArray64_flatten_none2empty_64", outindexlength);
         return awkward_IndexedArray64_flatten_none2empty_64(
           outoffsets,
           outindex,
@@ -5433,6 +5926,7 @@ namespace awkward {
       int64_t length,
       int64_t **offsetsraws) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_UnionArray32_flatten_length_64", length);
         return awkward_UnionArray32_flatten_length_64(
           total_length,
           fromtags,
@@ -5461,6 +5955,7 @@ namespace awkward {
       int64_t length,
       int64_t **offsetsraws) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_UnionArrayU32_flatten_length_64", length);
         return awkward_UnionArrayU32_flatten_length_64(
           total_length,
           fromtags,
@@ -5489,6 +5984,7 @@ namespace awkward {
       int64_t length,
       int64_t **offsetsraws) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_UnionArray64_flatten_length_64", length);
         return awkward_UnionArray64_flatten_length_64(
           total_length,
           fromtags,
@@ -5518,6 +6014,7 @@ namespace awkward {
       const int64_t* fromcounts,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_UnionArray8_32_nestedfill_tags_index_64", length);
         return awkward_UnionArray8_32_nestedfill_tags_index_64(
           totags,
           toindex,
@@ -5548,6 +6045,7 @@ namespace awkward {
       const int64_t* fromcounts,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_UnionArray8_U32_nestedfill_tags_index_64", length);
         return awkward_UnionArray8_U32_nestedfill_tags_index_64(
           totags,
           toindex,
@@ -5578,6 +6076,7 @@ namespace awkward {
       const int64_t* fromcounts,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_UnionArray8_64_nestedfill_tags_index_64", length);
         return awkward_UnionArray8_64_nestedfill_tags_index_64(
           totags,
           toindex,
@@ -5609,6 +6108,7 @@ namespace awkward {
       int64_t length,
       int64_t **offsetsraws) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_UnionArray32_flatten_combine_64", length);
         return awkward_UnionArray32_flatten_combine_64(
           totags,
           toindex,
@@ -5641,6 +6141,7 @@ namespace awkward {
       int64_t length,
       int64_t **offsetsraws) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_UnionArrayU32_flatten_combine_64", length);
         return awkward_UnionArrayU32_flatten_combine_64(
           totags,
           toindex,
@@ -5673,6 +6174,7 @@ namespace awkward {
       int64_t length,
       int64_t **offsetsraws) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_UnionArray64_flatten_combine_64", length);
         return awkward_UnionArray64_flatten_combine_64(
           totags,
           toindex,
@@ -5702,6 +6204,7 @@ namespace awkward {
       int64_t lenindex,
       int64_t lencontent) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_IndexedArray32_flatten_nextcarry_64", lenindex);
         return awkward_IndexedArray32_flatten_nextcarry_64(
           tocarry,
           fromindex,
@@ -5728,6 +6231,7 @@ namespace awkward {
       int64_t lenindex,
       int64_t lencontent) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_IndexedArrayU32_flatten_nextcarry_64", lenindex);
         return awkward_IndexedArrayU32_flatten_nextcarry_64(
           tocarry,
           fromindex,
@@ -5754,6 +6258,7 @@ namespace awkward {
       int64_t lenindex,
       int64_t lencontent) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_IndexedArray64_flatten_nextcarry_64", lenindex);
         return awkward_IndexedArray64_flatten_nextcarry_64(
           tocarry,
           fromindex,
@@ -5780,6 +6285,7 @@ namespace awkward {
       const int32_t *fromindex,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_IndexedArray32_overlay_mask8_to64", length);
         return awkward_IndexedArray32_overlay_mask8_to64(
           toindex,
           mask,
@@ -5809,6 +6315,7 @@ namespace awkward {
       const uint32_t *fromindex,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_IndexedArrayU32_overlay_mask8_to64", length);
         return awkward_IndexedArrayU32_overlay_mask8_to64(
           toindex,
           mask,
@@ -5838,6 +6345,7 @@ namespace awkward {
       const int64_t *fromindex,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_IndexedArray64_overlay_mask8_to64", length);
         return awkward_IndexedArray64_overlay_mask8_to64(
           toindex,
           mask,
@@ -5866,6 +6374,7 @@ namespace awkward {
       const int32_t *fromindex,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_IndexedArray32_mask8", length);
         return awkward_IndexedArray32_mask8(
           tomask,
           fromindex,
@@ -5892,6 +6401,7 @@ namespace awkward {
       const uint32_t *fromindex,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_IndexedArrayU32_mask8", length);
         return awkward_IndexedArrayU32_mask8(
           tomask,
           fromindex,
@@ -5918,6 +6428,7 @@ namespace awkward {
       const int64_t *fromindex,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_IndexedArray64_mask8", length);
         return awkward_IndexedArray64_mask8(
           tomask,
           fromindex,
@@ -5944,6 +6455,7 @@ namespace awkward {
       int64_t length,
       bool validwhen) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_ByteMaskedArray_mask8", length);
         return awkward_ByteMaskedArray_mask8(
           tomask,
           frommask,
@@ -5970,6 +6482,7 @@ namespace awkward {
       int8_t *tomask,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_zero_mask8", length);
         return awkward_zero_mask8(tomask, length);
       }
       else if (ptr_lib == kernel::lib::cuda) {
@@ -5990,6 +6503,7 @@ namespace awkward {
       int8_t *tomask,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_one_mask8", length);
         return awkward_one_mask8(tomask, length);
       }
       else if (ptr_lib == kernel::lib::cuda) {
@@ -6014,6 +6528,7 @@ namespace awkward {
       const int32_t *innerindex,
       int64_t innerlength) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_IndexedArray32_simplify32_to64", outerlength);
         return awkward_IndexedArray32_simplify32_to64(
           toindex,
           outerindex,
@@ -6042,6 +6557,7 @@ namespace awkward {
       const int32_t *innerindex,
       int64_t innerlength) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_IndexedArrayU32_simplify32_to64", outerlength);
         return awkward_IndexedArrayU32_simplify32_to64(
           toindex,
           outerindex,
@@ -6070,6 +6586,7 @@ namespace awkward {
       const int32_t *innerindex,
       int64_t innerlength) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_IndexedArray64_simplify32_to64", outerlength);
         return awkward_IndexedArray64_simplify32_to64(
           toindex,
           outerindex,
@@ -6098,6 +6615,7 @@ namespace awkward {
       const uint32_t *innerindex,
       int64_t innerlength) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_IndexedArray32_simplifyU32_to64", outerlength);
         return awkward_IndexedArray32_simplifyU32_to64(
           toindex,
           outerindex,
@@ -6126,6 +6644,7 @@ namespace awkward {
       const uint32_t *innerindex,
       int64_t innerlength) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_IndexedArrayU32_simplifyU32_to64", outerlength);
         return awkward_IndexedArrayU32_simplifyU32_to64(
           toindex,
           outerindex,
@@ -6154,6 +6673,7 @@ namespace awkward {
       const uint32_t *innerindex,
       int64_t innerlength) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_IndexedArray64_simplifyU32_to64", outerlength);
         return awkward_IndexedArray64_simplifyU32_to64(
           toindex,
           outerindex,
@@ -6182,6 +6702,7 @@ namespace awkward {
       const int64_t *innerindex,
       int64_t innerlength) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_IndexedArray32_simplify64_to64", outerlength);
         return awkward_IndexedArray32_simplify64_to64(
           toindex,
           outerindex,
@@ -6210,6 +6731,7 @@ namespace awkward {
       const int64_t *innerindex,
       int64_t innerlength) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_IndexedArrayU32_simplify64_to64", outerlength);
         return awkward_IndexedArrayU32_simplify64_to64(
           toindex,
           outerindex,
@@ -6238,6 +6760,7 @@ namespace awkward {
       const int64_t *innerindex,
       int64_t innerlength) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_IndexedArray64_simplify64_to64", outerlength);
         return awkward_IndexedArray64_simplify64_to64(
           toindex,
           outerindex,
@@ -6269,6 +6792,7 @@ namespace awkward {
       const int32_t *fromstops,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_ListArray32_compact_offsets_64", length);
         return awkward_ListArray32_compact_offsets_64(
           tooffsets,
           fromstarts,
@@ -6295,6 +6819,7 @@ namespace awkward {
       const uint32_t *fromstops,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_ListArrayU32_compact_offsets_64", length);
         return awkward_ListArrayU32_compact_offsets_64(
           tooffsets,
           fromstarts,
@@ -6321,6 +6846,7 @@ namespace awkward {
       const int64_t *fromstops,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_ListArray64_compact_offsets_64", length);
         return awkward_ListArray64_compact_offsets_64(
           tooffsets,
           fromstarts,
@@ -6345,6 +6871,7 @@ namespace awkward {
       int64_t length,
       int64_t size) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_RegularArray_compact_offsets64", length);
         return awkward_RegularArray_compact_offsets64(
           tooffsets,
           length,
@@ -6371,6 +6898,7 @@ namespace awkward {
       const int32_t *fromoffsets,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_ListOffsetArray32_compact_offsets_64", length);
         return awkward_ListOffsetArray32_compact_offsets_64(
           tooffsets,
           fromoffsets,
@@ -6395,6 +6923,7 @@ namespace awkward {
       const uint32_t *fromoffsets,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_ListOffsetArrayU32_compact_offsets_64", length);
         return awkward_ListOffsetArrayU32_compact_offsets_64(
           tooffsets,
           fromoffsets,
@@ -6419,6 +6948,7 @@ namespace awkward {
       const int64_t *fromoffsets,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_ListOffsetArray64_compact_offsets_64", length);
         return awkward_ListOffsetArray64_compact_offsets_64(
           tooffsets,
           fromoffsets,
@@ -6446,6 +6976,7 @@ namespace awkward {
       const int32_t *fromstops,
       int64_t lencontent) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_ListArray32_broadcast_tooffsets_64", offsetslength);
         return awkward_ListArray32_broadcast_tooffsets_64(
           tocarry,
           fromoffsets,
@@ -6476,6 +7007,7 @@ namespace awkward {
       const uint32_t *fromstops,
       int64_t lencontent) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_ListArrayU32_broadcast_tooffsets_64", offsetslength);
         return awkward_ListArrayU32_broadcast_tooffsets_64(
           tocarry,
           fromoffsets,
@@ -6506,6 +7038,7 @@ namespace awkward {
       const int64_t *fromstops,
       int64_t lencontent) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_ListArray64_broadcast_tooffsets_64", offsetslength);
         return awkward_ListArray64_broadcast_tooffsets_64(
           tocarry,
           fromoffsets,
@@ -6532,6 +7065,7 @@ namespace awkward {
       int64_t offsetslength,
       int64_t size) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_RegularArray_broadcast_tooffsets_64", offsetslength);
         return awkward_RegularArray_broadcast_tooffsets_64(
           fromoffsets,
           offsetslength,
@@ -6557,6 +7091,7 @@ namespace awkward {
       const int64_t *fromoffsets,
       int64_t offsetslength) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_RegularArray_broadcast_tooffsets_size1_64", offsetslength);
         return awkward_RegularArray_broadcast_tooffsets_size1_64(
           tocarry,
           fromoffsets,
@@ -6581,6 +7116,7 @@ namespace awkward {
       const int32_t *fromoffsets,
       int64_t offsetslength) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_ListOffsetArray32_toRegularArray", offsetslength);
         return awkward_ListOffsetArray32_toRegularArray(
           size,
           fromoffsets,
@@ -6605,6 +7141,7 @@ namespace awkward {
       const uint32_t *fromoffsets,
       int64_t offsetslength) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_ListOffsetArrayU32_toRegularArray", offsetslength);
         return awkward_ListOffsetArrayU32_toRegularArray(
           size,
           fromoffsets,
@@ -6629,6 +7166,7 @@ namespace awkward {
       const int64_t *fromoffsets,
       int64_t offsetslength) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_ListOffsetArray64_toRegularArray", offsetslength);
         return awkward_ListOffsetArray64_toRegularArray(
           size,
           fromoffsets,
@@ -6654,11 +7192,16 @@ namespace awkward {
       const bool *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
-        return awkward_NumpyArray_fill_tobool_frombool(
-          toptr,
-          tooffset,
-          fromptr,
-          length);
+        ProfileScope profile("awkward_NumpyArray_fill_tobool_frombool", length);
+        return parallel_for(
+          length,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_NumpyArray_fill_tobool_frombool(
+              toptr,
+              tooffset + start,
+              fromptr + start,
+              stop - start);
+          });
       }
       else if (ptr_lib == kernel::lib::cuda) {
         throw std::runtime_error(
@@ -6680,11 +7223,16 @@ namespace awkward {
       const bool *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
-        return awkward_NumpyArray_fill_toint8_frombool(
-          toptr,
-          tooffset,
-          fromptr,
-          length);
+        ProfileScope profile("awkward_NumpyArray_fill_toint8_frombool", length);
+        return parallel_for(
+          length,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_NumpyArray_fill_toint8_frombool(
+              toptr,
+              tooffset + start,
+              fromptr + start,
+              stop - start);
+          });
       }
       else if (ptr_lib == kernel::lib::cuda) {
         throw std::runtime_error(
@@ -6706,11 +7254,16 @@ namespace awkward {
       const bool *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
-        return awkward_NumpyArray_fill_toint16_frombool(
-          toptr,
-          tooffset,
-          fromptr,
-          length);
+        ProfileScope profile("awkward_NumpyArray_fill_toint16_frombool", length);
+        return parallel_for(
+          length,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_NumpyArray_fill_toint16_frombool(
+              toptr,
+              tooffset + start,
+              fromptr + start,
+              stop - start);
+          });
       }
       else if (ptr_lib == kernel::lib::cuda) {
         throw std::runtime_error(
@@ -6732,11 +7285,16 @@ namespace awkward {
       const bool *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
-        return awkward_NumpyArray_fill_toint32_frombool(
-          toptr,
-          tooffset,
-          fromptr,
-          length);
+        ProfileScope profile("awkward_NumpyArray_fill_toint32_frombool", length);
+        return parallel_for(
+          length,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_NumpyArray_fill_toint32_frombool(
+              toptr,
+              tooffset + start,
+              fromptr + start,
+              stop - start);
+          });
       }
       else if (ptr_lib == kernel::lib::cuda) {
         throw std::runtime_error(
@@ -6758,11 +7316,16 @@ namespace awkward {
       const bool *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
-        return awkward_NumpyArray_fill_toint64_frombool(
-          toptr,
-          tooffset,
-          fromptr,
-          length);
+        ProfileScope profile("awkward_NumpyArray_fill_toint64_frombool", length);
+        return parallel_for(
+          length,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_NumpyArray_fill_toint64_frombool(
+              toptr,
+              tooffset + start,
+              fromptr + start,
+              stop - start);
+          });
       }
       else if (ptr_lib == kernel::lib::cuda) {
         throw std::runtime_error(
@@ -6784,11 +7347,16 @@ namespace awkward {
       const bool *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
-        return awkward_NumpyArray_fill_touint8_frombool(
-          toptr,
-          tooffset,
-          fromptr,
-          length);
+        ProfileScope profile("awkward_NumpyArray_fill_touint8_frombool", length);
+        return parallel_for(
+          length,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_NumpyArray_fill_touint8_frombool(
+              toptr,
+              tooffset + start,
+              fromptr + start,
+              stop - start);
+          });
       }
       else if (ptr_lib == kernel::lib::cuda) {
         throw std::runtime_error(
@@ -6810,11 +7378,16 @@ namespace awkward {
       const bool *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
-        return awkward_NumpyArray_fill_touint16_frombool(
-          toptr,
-          tooffset,
-          fromptr,
-          length);
+        ProfileScope profile("awkward_NumpyArray_fill_touint16_frombool", length);
+        return parallel_for(
+          length,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_NumpyArray_fill_touint16_frombool(
+              toptr,
+              tooffset + start,
+              fromptr + start,
+              stop - start);
+          });
       }
       else if (ptr_lib == kernel::lib::cuda) {
         throw std::runtime_error(
@@ -6836,11 +7409,16 @@ namespace awkward {
       const bool *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
-        return awkward_NumpyArray_fill_touint32_frombool(
-          toptr,
-          tooffset,
-          fromptr,
-          length);
+        ProfileScope profile("awkward_NumpyArray_fill_touint32_frombool", length);
+        return parallel_for(
+          length,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_NumpyArray_fill_touint32_frombool(
+              toptr,
+              tooffset + start,
+              fromptr + start,
+              stop - start);
+          });
       }
       else if (ptr_lib == kernel::lib::cuda) {
         throw std::runtime_error(
@@ -6862,11 +7440,16 @@ namespace awkward {
       const bool *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
-        return awkward_NumpyArray_fill_touint64_frombool(
-          toptr,
-          tooffset,
-          fromptr,
-          length);
+        ProfileScope profile("awkward_NumpyArray_fill_touint64_frombool", length);
+        return parallel_for(
+          length,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_NumpyArray_fill_touint64_frombool(
+              toptr,
+              tooffset + start,
+              fromptr + start,
+              stop - start);
+          });
       }
       else if (ptr_lib == kernel::lib::cuda) {
         throw std::runtime_error(
@@ -6888,11 +7471,16 @@ namespace awkward {
       const bool *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
-        return awkward_NumpyArray_fill_tofloat32_frombool(
-          toptr,
-          tooffset,
-          fromptr,
-          length);
+        ProfileScope profile("awkward_NumpyArray_fill_tofloat32_frombool", length);
+        return parallel_for(
+          length,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_NumpyArray_fill_tofloat32_frombool(
+              toptr,
+              tooffset + start,
+              fromptr + start,
+              stop - start);
+          });
       }
       else if (ptr_lib == kernel::lib::cuda) {
         throw std::runtime_error(
@@ -6914,11 +7502,16 @@ namespace awkward {
       const bool *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
-        return awkward_NumpyArray_fill_tofloat64_frombool(
-          toptr,
-          tooffset,
-          fromptr,
-          length);
+        ProfileScope profile("awkward_NumpyArray_fill_tofloat64_frombool", length);
+        return parallel_for(
+          length,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_NumpyArray_fill_tofloat64_frombool(
+              toptr,
+              tooffset + start,
+              fromptr + start,
+              stop - start);
+          });
       }
       else if (ptr_lib == kernel::lib::cuda) {
         throw std::runtime_error(
@@ -6940,6 +7533,7 @@ namespace awkward {
       const bool *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_NumpyArray_fill_tocomplex64_frombool", length);
         return awkward_NumpyArray_fill_tocomplex64_frombool(
           reinterpret_cast<float*>(toptr),
           tooffset,
@@ -6966,6 +7560,7 @@ namespace awkward {
       const bool *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_NumpyArray_fill_tocomplex128_frombool", length);
         return awkward_NumpyArray_fill_tocomplex128_frombool(
           reinterpret_cast<double*>(toptr),
           tooffset,
@@ -6992,11 +7587,16 @@ namespace awkward {
       const bool *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
-        return awkward_NumpyArray_fill_tobool_frombool(
-          toptr,
-          tooffset,
-          fromptr,
-          length);
+        ProfileScope profile("awkward_NumpyArray_fill_tobool_frombool", length);
+        return parallel_for(
+          length,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_NumpyArray_fill_tobool_frombool(
+              toptr,
+              tooffset + start,
+              fromptr + start,
+              stop - start);
+          });
       }
       else if (ptr_lib == kernel::lib::cuda) {
         throw std::runtime_error(
@@ -7017,11 +7617,16 @@ namespace awkward {
       const bool *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
-        return awkward_NumpyArray_fill_toint8_frombool(
-          toptr,
-          tooffset,
-          fromptr,
-          length);
+        ProfileScope profile("awkward_NumpyArray_fill_toint8_frombool", length);
+        return parallel_for(
+          length,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_NumpyArray_fill_toint8_frombool(
+              toptr,
+              tooffset + start,
+              fromptr + start,
+              stop - start);
+          });
       }
       else if (ptr_lib == kernel::lib::cuda) {
         throw std::runtime_error(
@@ -7042,11 +7647,16 @@ namespace awkward {
       const bool *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
-        return awkward_NumpyArray_fill_toint16_frombool(
-          toptr,
-          tooffset,
-          fromptr,
-          length);
+        ProfileScope profile("awkward_NumpyArray_fill_toint16_frombool", length);
+        return parallel_for(
+          length,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_NumpyArray_fill_toint16_frombool(
+              toptr,
+              tooffset + start,
+              fromptr + start,
+              stop - start);
+          });
       }
       else if (ptr_lib == kernel::lib::cuda) {
         throw std::runtime_error(
@@ -7067,11 +7677,16 @@ namespace awkward {
       const bool *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
-        return awkward_NumpyArray_fill_toint32_frombool(
-          toptr,
-          tooffset,
-          fromptr,
-          length);
+        ProfileScope profile("awkward_NumpyArray_fill_toint32_frombool", length);
+        return parallel_for(
+          length,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_NumpyArray_fill_toint32_frombool(
+              toptr,
+              tooffset + start,
+              fromptr + start,
+              stop - start);
+          });
       }
       else if (ptr_lib == kernel::lib::cuda) {
         throw std::runtime_error(
@@ -7092,11 +7707,16 @@ namespace awkward {
       const bool *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
-        return awkward_NumpyArray_fill_toint64_frombool(
-          toptr,
-          tooffset,
-          fromptr,
-          length);
+        ProfileScope profile("awkward_NumpyArray_fill_toint64_frombool", length);
+        return parallel_for(
+          length,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_NumpyArray_fill_toint64_frombool(
+              toptr,
+              tooffset + start,
+              fromptr + start,
+              stop - start);
+          });
       }
       else if (ptr_lib == kernel::lib::cuda) {
         throw std::runtime_error(
@@ -7117,11 +7737,16 @@ namespace awkward {
       const bool *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
-        return awkward_NumpyArray_fill_touint8_frombool(
-          toptr,
-          tooffset,
-          fromptr,
-          length);
+        ProfileScope profile("awkward_NumpyArray_fill_touint8_frombool", length);
+        return parallel_for(
+          length,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_NumpyArray_fill_touint8_frombool(
+              toptr,
+              tooffset + start,
+              fromptr + start,
+              stop - start);
+          });
       }
       else if (ptr_lib == kernel::lib::cuda) {
         throw std::runtime_error(
@@ -7142,11 +7767,16 @@ namespace awkward {
       const bool *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
-        return awkward_NumpyArray_fill_touint16_frombool(
-          toptr,
-          tooffset,
-          fromptr,
-          length);
+        ProfileScope profile("awkward_NumpyArray_fill_touint16_frombool", length);
+        return parallel_for(
+          length,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_NumpyArray_fill_touint16_frombool(
+              toptr,
+              tooffset + start,
+              fromptr + start,
+              stop - start);
+          });
       }
       else if (ptr_lib == kernel::lib::cuda) {
         throw std::runtime_error(
@@ -7167,11 +7797,16 @@ namespace awkward {
       const bool *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
-        return awkward_NumpyArray_fill_touint32_frombool(
-          toptr,
-          tooffset,
-          fromptr,
-          length);
+        ProfileScope profile("awkward_NumpyArray_fill_touint32_frombool", length);
+        return parallel_for(
+          length,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_NumpyArray_fill_touint32_frombool(
+              toptr,
+              tooffset + start,
+              fromptr + start,
+              stop - start);
+          });
       }
       else if (ptr_lib == kernel::lib::cuda) {
         throw std::runtime_error(
@@ -7192,11 +7827,16 @@ namespace awkward {
       const bool *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
-        return awkward_NumpyArray_fill_touint64_frombool(
-          toptr,
-          tooffset,
-          fromptr,
-          length);
+        ProfileScope profile("awkward_NumpyArray_fill_touint64_frombool", length);
+        return parallel_for(
+          length,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_NumpyArray_fill_touint64_frombool(
+              toptr,
+              tooffset + start,
+              fromptr + start,
+              stop - start);
+          });
       }
       else if (ptr_lib == kernel::lib::cuda) {
         throw std::runtime_error(
@@ -7217,11 +7857,16 @@ namespace awkward {
       const bool *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
-        return awkward_NumpyArray_fill_tofloat32_frombool(
-          toptr,
-          tooffset,
-          fromptr,
-          length);
+        ProfileScope profile("awkward_NumpyArray_fill_tofloat32_frombool", length);
+        return parallel_for(
+          length,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_NumpyArray_fill_tofloat32_frombool(
+              toptr,
+              tooffset + start,
+              fromptr + start,
+              stop - start);
+          });
       }
       else if (ptr_lib == kernel::lib::cuda) {
         throw std::runtime_error(
@@ -7242,11 +7887,16 @@ namespace awkward {
       const bool *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
-        return awkward_NumpyArray_fill_tofloat64_frombool(
-          toptr,
-          tooffset,
-          fromptr,
-          length);
+        ProfileScope profile("awkward_NumpyArray_fill_tofloat64_frombool", length);
+        return parallel_for(
+          length,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_NumpyArray_fill_tofloat64_frombool(
+              toptr,
+              tooffset + start,
+              fromptr + start,
+              stop - start);
+          });
       }
       else if (ptr_lib == kernel::lib::cuda) {
         throw std::runtime_error(
@@ -7267,6 +7917,7 @@ namespace awkward {
       const bool *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_NumpyArray_fill_tocomplex64_frombool", length);
         return awkward_NumpyArray_fill_tocomplex64_frombool(
           reinterpret_cast<float*>(toptr),
           tooffset,
@@ -7292,6 +7943,7 @@ namespace awkward {
       const bool *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_NumpyArray_fill_tocomplex128_frombool", length);
         return awkward_NumpyArray_fill_tocomplex128_frombool(
           reinterpret_cast<double*>(toptr),
           tooffset,
@@ -7318,11 +7970,16 @@ namespace awkward {
       const int8_t *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
-        return awkward_NumpyArray_fill_tobool_fromint8(
-          toptr,
-          tooffset,
-          fromptr,
-          length);
+        ProfileScope profile("awkward_NumpyArray_fill_tobool_fromint8", length);
+        return parallel_for(
+          length,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_NumpyArray_fill_tobool_fromint8(
+              toptr,
+              tooffset + start,
+              fromptr + start,
+              stop - start);
+          });
       }
       else if (ptr_lib == kernel::lib::cuda) {
         throw std::runtime_error(
@@ -7343,11 +8000,16 @@ namespace awkward {
       const int8_t *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
-        return awkward_NumpyArray_fill_toint8_fromint8(
-          toptr,
-          tooffset,
-          fromptr,
-          length);
+        ProfileScope profile("awkward_NumpyArray_fill_toint8_fromint8", length);
+        return parallel_for(
+          length,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_NumpyArray_fill_toint8_fromint8(
+              toptr,
+              tooffset + start,
+              fromptr + start,
+              stop - start);
+          });
       }
       else if (ptr_lib == kernel::lib::cuda) {
         throw std::runtime_error(
@@ -7368,11 +8030,16 @@ namespace awkward {
       const int8_t *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
-        return awkward_NumpyArray_fill_toint16_fromint8(
-          toptr,
-          tooffset,
-          fromptr,
-          length);
+        ProfileScope profile("awkward_NumpyArray_fill_toint16_fromint8", length);
+        return parallel_for(
+          length,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_NumpyArray_fill_toint16_fromint8(
+              toptr,
+              tooffset + start,
+              fromptr + start,
+              stop - start);
+          });
       }
       else if (ptr_lib == kernel::lib::cuda) {
         throw std::runtime_error(
@@ -7393,11 +8060,16 @@ namespace awkward {
       const int8_t *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
-        return awkward_NumpyArray_fill_toint32_fromint8(
-          toptr,
-          tooffset,
-          fromptr,
-          length);
+        ProfileScope profile("awkward_NumpyArray_fill_toint32_fromint8", length);
+        return parallel_for(
+          length,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_NumpyArray_fill_toint32_fromint8(
+              toptr,
+              tooffset + start,
+              fromptr + start,
+              stop - start);
+          });
       }
       else if (ptr_lib == kernel::lib::cuda) {
         throw std::runtime_error(
@@ -7418,11 +8090,16 @@ namespace awkward {
       const int8_t *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
-        return awkward_NumpyArray_fill_toint64_fromint8(
-          toptr,
-          tooffset,
-          fromptr,
-          length);
+        ProfileScope profile("awkward_NumpyArray_fill_toint64_fromint8", length);
+        return parallel_for(
+          length,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_NumpyArray_fill_toint64_fromint8(
+              toptr,
+              tooffset + start,
+              fromptr + start,
+              stop - start);
+          });
       }
       else if (ptr_lib == kernel::lib::cuda) {
         throw std::runtime_error(
@@ -7443,11 +8120,16 @@ namespace awkward {
       const int8_t *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
-        return awkward_NumpyArray_fill_touint8_fromint8(
-          toptr,
-          tooffset,
-          fromptr,
-          length);
+        ProfileScope profile("awkward_NumpyArray_fill_touint8_fromint8", length);
+        return parallel_for(
+          length,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_NumpyArray_fill_touint8_fromint8(
+              toptr,
+              tooffset + start,
+              fromptr + start,
+              stop - start);
+          });
       }
       else if (ptr_lib == kernel::lib::cuda) {
         throw std::runtime_error(
@@ -7468,11 +8150,16 @@ namespace awkward {
       const int8_t *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
-        return awkward_NumpyArray_fill_touint16_fromint8(
-          toptr,
-          tooffset,
-          fromptr,
-          length);
+        ProfileScope profile("awkward_NumpyArray_fill_touint16_fromint8", length);
+        return parallel_for(
+          length,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_NumpyArray_fill_touint16_fromint8(
+              toptr,
+              tooffset + start,
+              fromptr + start,
+              stop - start);
+          });
       }
       else if (ptr_lib == kernel::lib::cuda) {
         throw std::runtime_error(
@@ -7493,11 +8180,16 @@ namespace awkward {
       const int8_t *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
-        return awkward_NumpyArray_fill_touint32_fromint8(
-          toptr,
-          tooffset,
-          fromptr,
-          length);
+        ProfileScope profile("awkward_NumpyArray_fill_touint32_fromint8", length);
+        return parallel_for(
+          length,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_NumpyArray_fill_touint32_fromint8(
+              toptr,
+              tooffset + start,
+              fromptr + start,
+              stop - start);
+          });
       }
       else if (ptr_lib == kernel::lib::cuda) {
         throw std::runtime_error(
@@ -7518,11 +8210,16 @@ namespace awkward {
       const int8_t *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
-        return awkward_NumpyArray_fill_touint64_fromint8(
-          toptr,
-          tooffset,
-          fromptr,
-          length);
+        ProfileScope profile("awkward_NumpyArray_fill_touint64_fromint8", length);
+        return parallel_for(
+          length,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_NumpyArray_fill_touint64_fromint8(
+              toptr,
+              tooffset + start,
+              fromptr + start,
+              stop - start);
+          });
       }
       else if (ptr_lib == kernel::lib::cuda) {
         throw std::runtime_error(
@@ -7543,11 +8240,16 @@ namespace awkward {
       const int8_t *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
-        return awkward_NumpyArray_fill_tofloat32_fromint8(
-          toptr,
-          tooffset,
-          fromptr,
-          length);
+        ProfileScope profile("awkward_NumpyArray_fill_tofloat32_fromint8", length);
+        return parallel_for(
+          length,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_NumpyArray_fill_tofloat32_fromint8(
+              toptr,
+              tooffset + start,
+              fromptr + start,
+              stop - start);
+          });
       }
       else if (ptr_lib == kernel::lib::cuda) {
         throw std::runtime_error(
@@ -7568,11 +8270,16 @@ namespace awkward {
       const int8_t *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
-        return awkward_NumpyArray_fill_tofloat64_fromint8(
-          toptr,
-          tooffset,
-          fromptr,
-          length);
+        ProfileScope profile("awkward_NumpyArray_fill_tofloat64_fromint8", length);
+        return parallel_for(
+          length,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_NumpyArray_fill_tofloat64_fromint8(
+              toptr,
+              tooffset + start,
+              fromptr + start,
+              stop - start);
+          });
       }
       else if (ptr_lib == kernel::lib::cuda) {
         throw std::runtime_error(
@@ -7593,6 +8300,7 @@ namespace awkward {
       const int8_t *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_NumpyArray_fill_tocomplex64_fromint8", length);
         return awkward_NumpyArray_fill_tocomplex64_fromint8(
           reinterpret_cast<float*>(toptr),
           tooffset,
@@ -7618,6 +8326,7 @@ namespace awkward {
       const int8_t *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_NumpyArray_fill_tocomplex128_fromint8", length);
         return awkward_NumpyArray_fill_tocomplex128_fromint8(
           reinterpret_cast<double*>(toptr),
           tooffset,
@@ -7644,11 +8353,16 @@ namespace awkward {
       const int16_t *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
-        return awkward_NumpyArray_fill_tobool_fromint16(
-          toptr,
-          tooffset,
-          fromptr,
-          length);
+        ProfileScope profile("awkward_NumpyArray_fill_tobool_fromint16", length);
+        return parallel_for(
+          length,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_NumpyArray_fill_tobool_fromint16(
+              toptr,
+              tooffset + start,
+              fromptr + start,
+              stop - start);
+          });
       }
       else if (ptr_lib == kernel::lib::cuda) {
         throw std::runtime_error(
@@ -7669,11 +8383,16 @@ namespace awkward {
       const int16_t *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
-        return awkward_NumpyArray_fill_toint8_fromint16(
-          toptr,
-          tooffset,
-          fromptr,
-          length);
+        ProfileScope profile("awkward_NumpyArray_fill_toint8_fromint16", length);
+        return parallel_for(
+          length,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_NumpyArray_fill_toint8_fromint16(
+              toptr,
+              tooffset + start,
+              fromptr + start,
+              stop - start);
+          });
       }
       else if (ptr_lib == kernel::lib::cuda) {
         throw std::runtime_error(
@@ -7694,11 +8413,16 @@ namespace awkward {
       const int16_t *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
-        return awkward_NumpyArray_fill_toint16_fromint16(
-          toptr,
-          tooffset,
-          fromptr,
-          length);
+        ProfileScope profile("awkward_NumpyArray_fill_toint16_fromint16", length);
+        return parallel_for(
+          length,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_NumpyArray_fill_toint16_fromint16(
+              toptr,
+              tooffset + start,
+              fromptr + start,
+              stop - start);
+          });
       }
       else if (ptr_lib == kernel::lib::cuda) {
         throw std::runtime_error(
@@ -7719,11 +8443,16 @@ namespace awkward {
       const int16_t *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
-        return awkward_NumpyArray_fill_toint32_fromint16(
-          toptr,
-          tooffset,
-          fromptr,
-          length);
+        ProfileScope profile("awkward_NumpyArray_fill_toint32_fromint16", length);
+        return parallel_for(
+          length,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_NumpyArray_fill_toint32_fromint16(
+              toptr,
+              tooffset + start,
+              fromptr + start,
+              stop - start);
+          });
       }
       else if (ptr_lib == kernel::lib::cuda) {
         throw std::runtime_error(
@@ -7744,11 +8473,16 @@ namespace awkward {
       const int16_t *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
-        return awkward_NumpyArray_fill_toint64_fromint16(
-          toptr,
-          tooffset,
-          fromptr,
-          length);
+        ProfileScope profile("awkward_NumpyArray_fill_toint64_fromint16", length);
+        return parallel_for(
+          length,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_NumpyArray_fill_toint64_fromint16(
+              toptr,
+              tooffset + start,
+              fromptr + start,
+              stop - start);
+          });
       }
       else if (ptr_lib == kernel::lib::cuda) {
         throw std::runtime_error(
@@ -7769,11 +8503,16 @@ namespace awkward {
       const int16_t *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
-        return awkward_NumpyArray_fill_touint8_fromint16(
-          toptr,
-          tooffset,
-          fromptr,
-          length);
+        ProfileScope profile("awkward_NumpyArray_fill_touint8_fromint16", length);
+        return parallel_for(
+          length,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_NumpyArray_fill_touint8_fromint16(
+              toptr,
+              tooffset + start,
+              fromptr + start,
+              stop - start);
+          });
       }
       else if (ptr_lib == kernel::lib::cuda) {
         throw std::runtime_error(
@@ -7794,11 +8533,16 @@ namespace awkward {
       const int16_t *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
-        return awkward_NumpyArray_fill_touint16_fromint16(
-          toptr,
-          tooffset,
-          fromptr,
-          length);
+        ProfileScope profile("awkward_NumpyArray_fill_touint16_fromint16", length);
+        return parallel_for(
+          length,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_NumpyArray_fill_touint16_fromint16(
+              toptr,
+              tooffset + start,
+              fromptr + start,
+              stop - start);
+          });
       }
       else if (ptr_lib == kernel::lib::cuda) {
         throw std::runtime_error(
@@ -7819,11 +8563,16 @@ namespace awkward {
       const int16_t *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
-        return awkward_NumpyArray_fill_touint32_fromint16(
-          toptr,
-          tooffset,
-          fromptr,
-          length);
+        ProfileScope profile("awkward_NumpyArray_fill_touint32_fromint16", length);
+        return parallel_for(
+          length,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_NumpyArray_fill_touint32_fromint16(
+              toptr,
+              tooffset + start,
+              fromptr + start,
+              stop - start);
+          });
       }
       else if (ptr_lib == kernel::lib::cuda) {
         throw std::runtime_error(
@@ -7844,11 +8593,16 @@ namespace awkward {
       const int16_t *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
-        return awkward_NumpyArray_fill_touint64_fromint16(
-          toptr,
-          tooffset,
-          fromptr,
-          length);
+        ProfileScope profile("awkward_NumpyArray_fill_touint64_fromint16", length);
+        return parallel_for(
+          length,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_NumpyArray_fill_touint64_fromint16(
+              toptr,
+              tooffset + start,
+              fromptr + start,
+              stop - start);
+          });
       }
       else if (ptr_lib == kernel::lib::cuda) {
         throw std::runtime_error(
@@ -7869,11 +8623,16 @@ namespace awkward {
       const int16_t *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
-        return awkward_NumpyArray_fill_tofloat32_fromint16(
-          toptr,
-          tooffset,
-          fromptr,
-          length);
+        ProfileScope profile("awkward_NumpyArray_fill_tofloat32_fromint16", length);
+        return parallel_for(
+          length,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_NumpyArray_fill_tofloat32_fromint16(
+              toptr,
+              tooffset + start,
+              fromptr + start,
+              stop - start);
+          });
       }
       else if (ptr_lib == kernel::lib::cuda) {
         throw std::runtime_error(
@@ -7894,11 +8653,16 @@ namespace awkward {
       const int16_t *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
-        return awkward_NumpyArray_fill_tofloat64_fromint16(
-          toptr,
-          tooffset,
-          fromptr,
-          length);
+        ProfileScope profile("awkward_NumpyArray_fill_tofloat64_fromint16", length);
+        return parallel_for(
+          length,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_NumpyArray_fill_tofloat64_fromint16(
+              toptr,
+              tooffset + start,
+              fromptr + start,
+              stop - start);
+          });
       }
       else if (ptr_lib == kernel::lib::cuda) {
         throw std::runtime_error(
@@ -7919,6 +8683,7 @@ namespace awkward {
       const int16_t *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_NumpyArray_fill_tocomplex64_fromint16", length);
         return awkward_NumpyArray_fill_tocomplex64_fromint16(
           reinterpret_cast<float*>(toptr),
           tooffset,
@@ -7944,6 +8709,7 @@ namespace awkward {
       const int16_t *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_NumpyArray_fill_tocomplex128_fromint16", length);
         return awkward_NumpyArray_fill_tocomplex128_fromint16(
           reinterpret_cast<double*>(toptr),
           tooffset,
@@ -7970,11 +8736,16 @@ namespace awkward {
       const int32_t *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
-        return awkward_NumpyArray_fill_tobool_fromint32(
-          toptr,
-          tooffset,
-          fromptr,
-          length);
+        ProfileScope profile("awkward_NumpyArray_fill_tobool_fromint32", length);
+        return parallel_for(
+          length,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_NumpyArray_fill_tobool_fromint32(
+              toptr,
+              tooffset + start,
+              fromptr + start,
+              stop - start);
+          });
       }
       else if (ptr_lib == kernel::lib::cuda) {
         throw std::runtime_error(
@@ -7995,11 +8766,16 @@ namespace awkward {
       const int32_t *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
-        return awkward_NumpyArray_fill_toint8_fromint32(
-          toptr,
-          tooffset,
-          fromptr,
-          length);
+        ProfileScope profile("awkward_NumpyArray_fill_toint8_fromint32", length);
+        return parallel_for(
+          length,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_NumpyArray_fill_toint8_fromint32(
+              toptr,
+              tooffset + start,
+              fromptr + start,
+              stop - start);
+          });
       }
       else if (ptr_lib == kernel::lib::cuda) {
         throw std::runtime_error(
@@ -8020,11 +8796,16 @@ namespace awkward {
       const int32_t *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
-        return awkward_NumpyArray_fill_toint16_fromint32(
-          toptr,
-          tooffset,
-          fromptr,
-          length);
+        ProfileScope profile("awkward_NumpyArray_fill_toint16_fromint32", length);
+        return parallel_for(
+          length,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_NumpyArray_fill_toint16_fromint32(
+              toptr,
+              tooffset + start,
+              fromptr + start,
+              stop - start);
+          });
       }
       else if (ptr_lib == kernel::lib::cuda) {
         throw std::runtime_error(
@@ -8045,11 +8826,16 @@ namespace awkward {
       const int32_t *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
-        return awkward_NumpyArray_fill_toint32_fromint32(
-          toptr,
-          tooffset,
-          fromptr,
-          length);
+        ProfileScope profile("awkward_NumpyArray_fill_toint32_fromint32", length);
+        return parallel_for(
+          length,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_NumpyArray_fill_toint32_fromint32(
+              toptr,
+              tooffset + start,
+              fromptr + start,
+              stop - start);
+          });
       }
       else if (ptr_lib == kernel::lib::cuda) {
         throw std::runtime_error(
@@ -8070,11 +8856,16 @@ namespace awkward {
       const int32_t *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
-        return awkward_NumpyArray_fill_toint64_fromint32(
-          toptr,
-          tooffset,
-          fromptr,
-          length);
+        ProfileScope profile("awkward_NumpyArray_fill_toint64_fromint32", length);
+        return parallel_for(
+          length,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_NumpyArray_fill_toint64_fromint32(
+              toptr,
+              tooffset + start,
+              fromptr + start,
+              stop - start);
+          });
       }
       else if (ptr_lib == kernel::lib::cuda) {
         throw std::runtime_error(
@@ -8095,11 +8886,16 @@ namespace awkward {
       const int32_t *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
-        return awkward_NumpyArray_fill_touint8_fromint32(
-          toptr,
-          tooffset,
-          fromptr,
-          length);
+        ProfileScope profile("awkward_NumpyArray_fill_touint8_fromint32", length);
+        return parallel_for(
+          length,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_NumpyArray_fill_touint8_fromint32(
+              toptr,
+              tooffset + start,
+              fromptr + start,
+              stop - start);
+          });
       }
       else if (ptr_lib == kernel::lib::cuda) {
         throw std::runtime_error(
@@ -8120,11 +8916,16 @@ namespace awkward {
       const int32_t *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
-        return awkward_NumpyArray_fill_touint16_fromint32(
-          toptr,
-          tooffset,
-          fromptr,
-          length);
+        ProfileScope profile("awkward_NumpyArray_fill_touint16_fromint32", length);
+        return parallel_for(
+          length,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_NumpyArray_fill_touint16_fromint32(
+              toptr,
+              tooffset + start,
+              fromptr + start,
+              stop - start);
+          });
       }
       else if (ptr_lib == kernel::lib::cuda) {
         throw std::runtime_error(
@@ -8145,11 +8946,16 @@ namespace awkward {
       const int32_t *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
-        return awkward_NumpyArray_fill_touint32_fromint32(
-          toptr,
-          tooffset,
-          fromptr,
-          length);
+        ProfileScope profile("awkward_NumpyArray_fill_touint32_fromint32", length);
+        return parallel_for(
+          length,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_NumpyArray_fill_touint32_fromint32(
+              toptr,
+              tooffset + start,
+              fromptr + start,
+              stop - start);
+          });
       }
       else if (ptr_lib == kernel::lib::cuda) {
         throw std::runtime_error(
@@ -8170,11 +8976,16 @@ namespace awkward {
       const int32_t *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
-        return awkward_NumpyArray_fill_touint64_fromint32(
-          toptr,
-          tooffset,
-          fromptr,
-          length);
+        ProfileScope profile("awkward_NumpyArray_fill_touint64_fromint32", length);
+        return parallel_for(
+          length,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_NumpyArray_fill_touint64_fromint32(
+              toptr,
+              tooffset + start,
+              fromptr + start,
+              stop - start);
+          });
       }
       else if (ptr_lib == kernel::lib::cuda) {
         throw std::runtime_error(
@@ -8195,11 +9006,16 @@ namespace awkward {
       const int32_t *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
-        return awkward_NumpyArray_fill_tofloat32_fromint32(
-          toptr,
-          tooffset,
-          fromptr,
-          length);
+        ProfileScope profile("awkward_NumpyArray_fill_tofloat32_fromint32", length);
+        return parallel_for(
+          length,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_NumpyArray_fill_tofloat32_fromint32(
+              toptr,
+              tooffset + start,
+              fromptr + start,
+              stop - start);
+          });
       }
       else if (ptr_lib == kernel::lib::cuda) {
         throw std::runtime_error(
@@ -8220,11 +9036,16 @@ namespace awkward {
       const int32_t *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
-        return awkward_NumpyArray_fill_tofloat64_fromint32(
-          toptr,
-          tooffset,
-          fromptr,
-          length);
+        ProfileScope profile("awkward_NumpyArray_fill_tofloat64_fromint32", length);
+        return parallel_for(
+          length,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_NumpyArray_fill_tofloat64_fromint32(
+              toptr,
+              tooffset + start,
+              fromptr + start,
+              stop - start);
+          });
       }
       else if (ptr_lib == kernel::lib::cuda) {
         throw std::runtime_error(
@@ -8245,6 +9066,7 @@ namespace awkward {
       const int32_t *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_NumpyArray_fill_tocomplex64_fromint32", length);
         return awkward_NumpyArray_fill_tocomplex64_fromint32(
           reinterpret_cast<float*>(toptr),
           tooffset,
@@ -8270,6 +9092,7 @@ namespace awkward {
       const int32_t *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_NumpyArray_fill_tocomplex128_fromint32", length);
         return awkward_NumpyArray_fill_tocomplex128_fromint32(
           reinterpret_cast<double*>(toptr),
           tooffset,
@@ -8296,11 +9119,16 @@ namespace awkward {
       const int64_t *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
-        return awkward_NumpyArray_fill_tobool_fromint64(
-          toptr,
-          tooffset,
-          fromptr,
-          length);
+        ProfileScope profile("awkward_NumpyArray_fill_tobool_fromint64", length);
+        return parallel_for(
+          length,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_NumpyArray_fill_tobool_fromint64(
+              toptr,
+              tooffset + start,
+              fromptr + start,
+              stop - start);
+          });
       }
       else if (ptr_lib == kernel::lib::cuda) {
         throw std::runtime_error(
@@ -8321,11 +9149,16 @@ namespace awkward {
       const int64_t *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
-        return awkward_NumpyArray_fill_toint8_fromint64(
-          toptr,
-          tooffset,
-          fromptr,
-          length);
+        ProfileScope profile("awkward_NumpyArray_fill_toint8_fromint64", length);
+        return parallel_for(
+          length,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_NumpyArray_fill_toint8_fromint64(
+              toptr,
+              tooffset + start,
+              fromptr + start,
+              stop - start);
+          });
       }
       else if (ptr_lib == kernel::lib::cuda) {
         throw std::runtime_error(
@@ -8346,11 +9179,16 @@ namespace awkward {
       const int64_t *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
-        return awkward_NumpyArray_fill_toint16_fromint64(
-          toptr,
-          tooffset,
-          fromptr,
-          length);
+        ProfileScope profile("awkward_NumpyArray_fill_toint16_fromint64", length);
+        return parallel_for(
+          length,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_NumpyArray_fill_toint16_fromint64(
+              toptr,
+              tooffset + start,
+              fromptr + start,
+              stop - start);
+          });
       }
       else if (ptr_lib == kernel::lib::cuda) {
         throw std::runtime_error(
@@ -8371,11 +9209,16 @@ namespace awkward {
       const int64_t *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
-        return awkward_NumpyArray_fill_toint32_fromint64(
-          toptr,
-          tooffset,
-          fromptr,
-          length);
+        ProfileScope profile("awkward_NumpyArray_fill_toint32_fromint64", length);
+        return parallel_for(
+          length,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_NumpyArray_fill_toint32_fromint64(
+              toptr,
+              tooffset + start,
+              fromptr + start,
+              stop - start);
+          });
       }
       else if (ptr_lib == kernel::lib::cuda) {
         throw std::runtime_error(
@@ -8396,11 +9239,16 @@ namespace awkward {
       const int64_t *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
-        return awkward_NumpyArray_fill_toint64_fromint64(
-          toptr,
-          tooffset,
-          fromptr,
-          length);
+        ProfileScope profile("awkward_NumpyArray_fill_toint64_fromint64", length);
+        return parallel_for(
+          length,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_NumpyArray_fill_toint64_fromint64(
+              toptr,
+              tooffset + start,
+              fromptr + start,
+              stop - start);
+          });
       }
       else if (ptr_lib == kernel::lib::cuda) {
         throw std::runtime_error(
@@ -8421,11 +9269,16 @@ namespace awkward {
       const int64_t *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
-        return awkward_NumpyArray_fill_touint8_fromint64(
-          toptr,
-          tooffset,
-          fromptr,
-          length);
+        ProfileScope profile("awkward_NumpyArray_fill_touint8_fromint64", length);
+        return parallel_for(
+          length,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_NumpyArray_fill_touint8_fromint64(
+              toptr,
+              tooffset + start,
+              fromptr + start,
+              stop - start);
+          });
       }
       else if (ptr_lib == kernel::lib::cuda) {
         throw std::runtime_error(
@@ -8446,11 +9299,16 @@ namespace awkward {
       const int64_t *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
-        return awkward_NumpyArray_fill_touint16_fromint64(
-          toptr,
-          tooffset,
-          fromptr,
-          length);
+        ProfileScope profile("awkward_NumpyArray_fill_touint16_fromint64", length);
+        return parallel_for(
+          length,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_NumpyArray_fill_touint16_fromint64(
+              toptr,
+              tooffset + start,
+              fromptr + start,
+              stop - start);
+          });
       }
       else if (ptr_lib == kernel::lib::cuda) {
         throw std::runtime_error(
@@ -8471,11 +9329,16 @@ namespace awkward {
       const int64_t *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
-        return awkward_NumpyArray_fill_touint32_fromint64(
-          toptr,
-          tooffset,
-          fromptr,
-          length);
+        ProfileScope profile("awkward_NumpyArray_fill_touint32_fromint64", length);
+        return parallel_for(
+          length,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_NumpyArray_fill_touint32_fromint64(
+              toptr,
+              tooffset + start,
+              fromptr + start,
+              stop - start);
+          });
       }
       else if (ptr_lib == kernel::lib::cuda) {
         throw std::runtime_error(
@@ -8496,11 +9359,16 @@ namespace awkward {
       const int64_t *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
-        return awkward_NumpyArray_fill_touint64_fromint64(
-          toptr,
-          tooffset,
-          fromptr,
-          length);
+        ProfileScope profile("awkward_NumpyArray_fill_touint64_fromint64", length);
+        return parallel_for(
+          length,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_NumpyArray_fill_touint64_fromint64(
+              toptr,
+              tooffset + start,
+              fromptr + start,
+              stop - start);
+          });
       }
       else if (ptr_lib == kernel::lib::cuda) {
         throw std::runtime_error(
@@ -8521,11 +9389,16 @@ namespace awkward {
       const int64_t *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
-        return awkward_NumpyArray_fill_tofloat32_fromint64(
-          toptr,
-          tooffset,
-          fromptr,
-          length);
+        ProfileScope profile("awkward_NumpyArray_fill_tofloat32_fromint64", length);
+        return parallel_for(
+          length,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_NumpyArray_fill_tofloat32_fromint64(
+              toptr,
+              tooffset + start,
+              fromptr + start,
+              stop - start);
+          });
       }
       else if (ptr_lib == kernel::lib::cuda) {
         throw std::runtime_error(
@@ -8546,11 +9419,16 @@ namespace awkward {
       const int64_t *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
-        return awkward_NumpyArray_fill_tofloat64_fromint64(
-          toptr,
-          tooffset,
-          fromptr,
-          length);
+        ProfileScope profile("awkward_NumpyArray_fill_tofloat64_fromint64", length);
+        return parallel_for(
+          length,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_NumpyArray_fill_tofloat64_fromint64(
+              toptr,
+              tooffset + start,
+              fromptr + start,
+              stop - start);
+          });
       }
       else if (ptr_lib == kernel::lib::cuda) {
         throw std::runtime_error(
@@ -8571,6 +9449,7 @@ namespace awkward {
       const int64_t *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_NumpyArray_fill_tocomplex64_fromint64", length);
         return awkward_NumpyArray_fill_tocomplex64_fromint64(
           reinterpret_cast<float*>(toptr),
           tooffset,
@@ -8596,6 +9475,7 @@ namespace awkward {
       const int64_t *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_NumpyArray_fill_tocomplex128_fromint64", length);
         return awkward_NumpyArray_fill_tocomplex128_fromint64(
           reinterpret_cast<double*>(toptr),
           tooffset,
@@ -8622,11 +9502,16 @@ namespace awkward {
       const uint8_t *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
-        return awkward_NumpyArray_fill_tobool_fromuint8(
-          toptr,
-          tooffset,
-          fromptr,
-          length);
+        ProfileScope profile("awkward_NumpyArray_fill_tobool_fromuint8", length);
+        return parallel_for(
+          length,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_NumpyArray_fill_tobool_fromuint8(
+              toptr,
+              tooffset + start,
+              fromptr + start,
+              stop - start);
+          });
       }
       else if (ptr_lib == kernel::lib::cuda) {
         throw std::runtime_error(
@@ -8647,11 +9532,16 @@ namespace awkward {
       const uint8_t *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
-        return awkward_NumpyArray_fill_toint8_fromuint8(
-          toptr,
-          tooffset,
-          fromptr,
-          length);
+        ProfileScope profile("awkward_NumpyArray_fill_toint8_fromuint8", length);
+        return parallel_for(
+          length,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_NumpyArray_fill_toint8_fromuint8(
+              toptr,
+              tooffset + start,
+              fromptr + start,
+              stop - start);
+          });
       }
       else if (ptr_lib == kernel::lib::cuda) {
         throw std::runtime_error(
@@ -8672,11 +9562,16 @@ namespace awkward {
       const uint8_t *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
-        return awkward_NumpyArray_fill_toint16_fromuint8(
-          toptr,
-          tooffset,
-          fromptr,
-          length);
+        ProfileScope profile("awkward_NumpyArray_fill_toint16_fromuint8", length);
+        return parallel_for(
+          length,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_NumpyArray_fill_toint16_fromuint8(
+              toptr,
+              tooffset + start,
+              fromptr + start,
+              stop - start);
+          });
       }
       else if (ptr_lib == kernel::lib::cuda) {
         throw std::runtime_error(
@@ -8697,11 +9592,16 @@ namespace awkward {
       const uint8_t *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
-        return awkward_NumpyArray_fill_toint32_fromuint8(
-          toptr,
-          tooffset,
-          fromptr,
-          length);
+        ProfileScope profile("awkward_NumpyArray_fill_toint32_fromuint8", length);
+        return parallel_for(
+          length,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_NumpyArray_fill_toint32_fromuint8(
+              toptr,
+              tooffset + start,
+              fromptr + start,
+              stop - start);
+          });
       }
       else if (ptr_lib == kernel::lib::cuda) {
         throw std::runtime_error(
@@ -8722,11 +9622,16 @@ namespace awkward {
       const uint8_t *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
-        return awkward_NumpyArray_fill_toint64_fromuint8(
-          toptr,
-          tooffset,
-          fromptr,
-          length);
+        ProfileScope profile("awkward_NumpyArray_fill_toint64_fromuint8", length);
+        return parallel_for(
+          length,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_NumpyArray_fill_toint64_fromuint8(
+              toptr,
+              tooffset + start,
+              fromptr + start,
+              stop - start);
+          });
       }
       else if (ptr_lib == kernel::lib::cuda) {
         throw std::runtime_error(
@@ -8747,11 +9652,16 @@ namespace awkward {
       const uint8_t *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
-        return awkward_NumpyArray_fill_touint8_fromuint8(
-          toptr,
-          tooffset,
-          fromptr,
-          length);
+        ProfileScope profile("awkward_NumpyArray_fill_touint8_fromuint8", length);
+        return parallel_for(
+          length,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_NumpyArray_fill_touint8_fromuint8(
+              toptr,
+              tooffset + start,
+              fromptr + start,
+              stop - start);
+          });
       }
       else if (ptr_lib == kernel::lib::cuda) {
         throw std::runtime_error(
@@ -8772,11 +9682,16 @@ namespace awkward {
       const uint8_t *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
-        return awkward_NumpyArray_fill_touint16_fromuint8(
-          toptr,
-          tooffset,
-          fromptr,
-          length);
+        ProfileScope profile("awkward_NumpyArray_fill_touint16_fromuint8", length);
+        return parallel_for(
+          length,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_NumpyArray_fill_touint16_fromuint8(
+              toptr,
+              tooffset + start,
+              fromptr + start,
+              stop - start);
+          });
       }
       else if (ptr_lib == kernel::lib::cuda) {
         throw std::runtime_error(
@@ -8797,11 +9712,16 @@ namespace awkward {
       const uint8_t *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
-        return awkward_NumpyArray_fill_touint32_fromuint8(
-          toptr,
-          tooffset,
-          fromptr,
-          length);
+        ProfileScope profile("awkward_NumpyArray_fill_touint32_fromuint8", length);
+        return parallel_for(
+          length,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_NumpyArray_fill_touint32_fromuint8(
+              toptr,
+              tooffset + start,
+              fromptr + start,
+              stop - start);
+          });
       }
       else if (ptr_lib == kernel::lib::cuda) {
         throw std::runtime_error(
@@ -8822,11 +9742,16 @@ namespace awkward {
       const uint8_t *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
-        return awkward_NumpyArray_fill_touint64_fromuint8(
-          toptr,
-          tooffset,
-          fromptr,
-          length);
+        ProfileScope profile("awkward_NumpyArray_fill_touint64_fromuint8", length);
+        return parallel_for(
+          length,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_NumpyArray_fill_touint64_fromuint8(
+              toptr,
+              tooffset + start,
+              fromptr + start,
+              stop - start);
+          });
       }
       else if (ptr_lib == kernel::lib::cuda) {
         throw std::runtime_error(
@@ -8847,11 +9772,16 @@ namespace awkward {
       const uint8_t *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
-        return awkward_NumpyArray_fill_tofloat32_fromuint8(
-          toptr,
-          tooffset,
-          fromptr,
-          length);
+        ProfileScope profile("awkward_NumpyArray_fill_tofloat32_fromuint8", length);
+        return parallel_for(
+          length,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_NumpyArray_fill_tofloat32_fromuint8(
+              toptr,
+              tooffset + start,
+              fromptr + start,
+              stop - start);
+          });
       }
       else if (ptr_lib == kernel::lib::cuda) {
         throw std::runtime_error(
@@ -8872,11 +9802,16 @@ namespace awkward {
       const uint8_t *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
-        return awkward_NumpyArray_fill_tofloat64_fromuint8(
-          toptr,
-          tooffset,
-          fromptr,
-          length);
+        ProfileScope profile("awkward_NumpyArray_fill_tofloat64_fromuint8", length);
+        return parallel_for(
+          length,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_NumpyArray_fill_tofloat64_fromuint8(
+              toptr,
+              tooffset + start,
+              fromptr + start,
+              stop - start);
+          });
       }
       else if (ptr_lib == kernel::lib::cuda) {
         throw std::runtime_error(
@@ -8897,6 +9832,7 @@ namespace awkward {
       const uint8_t *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_NumpyArray_fill_tocomplex64_fromuint8", length);
         return awkward_NumpyArray_fill_tocomplex64_fromuint8(
           reinterpret_cast<float*>(toptr),
           tooffset,
@@ -8922,6 +9858,7 @@ namespace awkward {
       const uint8_t *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_NumpyArray_fill_tocomplex128_fromuint8", length);
         return awkward_NumpyArray_fill_tocomplex128_fromuint8(
           reinterpret_cast<double*>(toptr),
           tooffset,
@@ -8948,11 +9885,16 @@ namespace awkward {
       const uint16_t *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
-        return awkward_NumpyArray_fill_tobool_fromuint16(
-          toptr,
-          tooffset,
-          fromptr,
-          length);
+        ProfileScope profile("awkward_NumpyArray_fill_tobool_fromuint16", length);
+        return parallel_for(
+          length,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_NumpyArray_fill_tobool_fromuint16(
+              toptr,
+              tooffset + start,
+              fromptr + start,
+              stop - start);
+          });
       }
       else if (ptr_lib == kernel::lib::cuda) {
         throw std::runtime_error(
@@ -8973,11 +9915,16 @@ namespace awkward {
       const uint16_t *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
-        return awkward_NumpyArray_fill_toint8_fromuint16(
-          toptr,
-          tooffset,
-          fromptr,
-          length);
+        ProfileScope profile("awkward_NumpyArray_fill_toint8_fromuint16", length);
+        return parallel_for(
+          length,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_NumpyArray_fill_toint8_fromuint16(
+              toptr,
+              tooffset + start,
+              fromptr + start,
+              stop - start);
+          });
       }
       else if (ptr_lib == kernel::lib::cuda) {
         throw std::runtime_error(
@@ -8998,11 +9945,16 @@ namespace awkward {
       const uint16_t *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
-        return awkward_NumpyArray_fill_toint16_fromuint16(
-          toptr,
-          tooffset,
-          fromptr,
-          length);
+        ProfileScope profile("awkward_NumpyArray_fill_toint16_fromuint16", length);
+        return parallel_for(
+          length,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_NumpyArray_fill_toint16_fromuint16(
+              toptr,
+              tooffset + start,
+              fromptr + start,
+              stop - start);
+          });
       }
       else if (ptr_lib == kernel::lib::cuda) {
         throw std::runtime_error(
@@ -9023,11 +9975,16 @@ namespace awkward {
       const uint16_t *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
-        return awkward_NumpyArray_fill_toint32_fromuint16(
-          toptr,
-          tooffset,
-          fromptr,
-          length);
+        ProfileScope profile("awkward_NumpyArray_fill_toint32_fromuint16", length);
+        return parallel_for(
+          length,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_NumpyArray_fill_toint32_fromuint16(
+              toptr,
+              tooffset + start,
+              fromptr + start,
+              stop - start);
+          });
       }
       else if (ptr_lib == kernel::lib::cuda) {
         throw std::runtime_error(
@@ -9048,11 +10005,16 @@ namespace awkward {
       const uint16_t *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
-        return awkward_NumpyArray_fill_toint64_fromuint16(
-          toptr,
-          tooffset,
-          fromptr,
-          length);
+        ProfileScope profile("awkward_NumpyArray_fill_toint64_fromuint16", length);
+        return parallel_for(
+          length,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_NumpyArray_fill_toint64_fromuint16(
+              toptr,
+              tooffset + start,
+              fromptr + start,
+              stop - start);
+          });
       }
       else if (ptr_lib == kernel::lib::cuda) {
         throw std::runtime_error(
@@ -9073,11 +10035,16 @@ namespace awkward {
       const uint16_t *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
-        return awkward_NumpyArray_fill_touint8_fromuint16(
-          toptr,
-          tooffset,
-          fromptr,
-          length);
+        ProfileScope profile("awkward_NumpyArray_fill_touint8_fromuint16", length);
+        return parallel_for(
+          length,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_NumpyArray_fill_touint8_fromuint16(
+              toptr,
+              tooffset + start,
+              fromptr + start,
+              stop - start);
+          });
       }
       else if (ptr_lib == kernel::lib::cuda) {
         throw std::runtime_error(
@@ -9098,11 +10065,16 @@ namespace awkward {
       const uint16_t *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
-        return awkward_NumpyArray_fill_touint16_fromuint16(
-          toptr,
-          tooffset,
-          fromptr,
-          length);
+        ProfileScope profile("awkward_NumpyArray_fill_touint16_fromuint16", length);
+        return parallel_for(
+          length,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_NumpyArray_fill_touint16_fromuint16(
+              toptr,
+              tooffset + start,
+              fromptr + start,
+              stop - start);
+          });
       }
       else if (ptr_lib == kernel::lib::cuda) {
         throw std::runtime_error(
@@ -9123,11 +10095,16 @@ namespace awkward {
       const uint16_t *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
-        return awkward_NumpyArray_fill_touint32_fromuint16(
-          toptr,
-          tooffset,
-          fromptr,
-          length);
+        ProfileScope profile("awkward_NumpyArray_fill_touint32_fromuint16", length);
+        return parallel_for(
+          length,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_NumpyArray_fill_touint32_fromuint16(
+              toptr,
+              tooffset + start,
+              fromptr + start,
+              stop - start);
+          });
       }
       else if (ptr_lib == kernel::lib::cuda) {
         throw std::runtime_error(
@@ -9148,11 +10125,16 @@ namespace awkward {
       const uint16_t *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
-        return awkward_NumpyArray_fill_touint64_fromuint16(
-          toptr,
-          tooffset,
-          fromptr,
-          length);
+        ProfileScope profile("awkward_NumpyArray_fill_touint64_fromuint16", length);
+        return parallel_for(
+          length,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_NumpyArray_fill_touint64_fromuint16(
+              toptr,
+              tooffset + start,
+              fromptr + start,
+              stop - start);
+          });
       }
       else if (ptr_lib == kernel::lib::cuda) {
         throw std::runtime_error(
@@ -9173,11 +10155,16 @@ namespace awkward {
       const uint16_t *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
-        return awkward_NumpyArray_fill_tofloat32_fromuint16(
-          toptr,
-          tooffset,
-          fromptr,
-          length);
+        ProfileScope profile("awkward_NumpyArray_fill_tofloat32_fromuint16", length);
+        return parallel_for(
+          length,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_NumpyArray_fill_tofloat32_fromuint16(
+              toptr,
+              tooffset + start,
+              fromptr + start,
+              stop - start);
+          });
       }
       else if (ptr_lib == kernel::lib::cuda) {
         throw std::runtime_error(
@@ -9198,11 +10185,16 @@ namespace awkward {
       const uint16_t *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
-        return awkward_NumpyArray_fill_tofloat64_fromuint16(
-          toptr,
-          tooffset,
-          fromptr,
-          length);
+        ProfileScope profile("awkward_NumpyArray_fill_tofloat64_fromuint16", length);
+        return parallel_for(
+          length,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_NumpyArray_fill_tofloat64_fromuint16(
+              toptr,
+              tooffset + start,
+              fromptr + start,
+              stop - start);
+          });
       }
       else if (ptr_lib == kernel::lib::cuda) {
         throw std::runtime_error(
@@ -9223,6 +10215,7 @@ namespace awkward {
       const uint16_t *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_NumpyArray_fill_tocomplex64_fromuint16", length);
         return awkward_NumpyArray_fill_tocomplex64_fromuint16(
           reinterpret_cast<float*>(toptr),
           tooffset,
@@ -9248,6 +10241,7 @@ namespace awkward {
       const uint16_t *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_NumpyArray_fill_tocomplex128_fromuint16", length);
         return awkward_NumpyArray_fill_tocomplex128_fromuint16(
           reinterpret_cast<double*>(toptr),
           tooffset,
@@ -9274,11 +10268,16 @@ namespace awkward {
       const uint32_t *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
-        return awkward_NumpyArray_fill_tobool_fromuint32(
-          toptr,
-          tooffset,
-          fromptr,
-          length);
+        ProfileScope profile("awkward_NumpyArray_fill_tobool_fromuint32", length);
+        return parallel_for(
+          length,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_NumpyArray_fill_tobool_fromuint32(
+              toptr,
+              tooffset + start,
+              fromptr + start,
+              stop - start);
+          });
       }
       else if (ptr_lib == kernel::lib::cuda) {
         throw std::runtime_error(
@@ -9299,11 +10298,16 @@ namespace awkward {
       const uint32_t *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
-        return awkward_NumpyArray_fill_toint8_fromuint32(
-          toptr,
-          tooffset,
-          fromptr,
-          length);
+        ProfileScope profile("awkward_NumpyArray_fill_toint8_fromuint32", length);
+        return parallel_for(
+          length,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_NumpyArray_fill_toint8_fromuint32(
+              toptr,
+              tooffset + start,
+              fromptr + start,
+              stop - start);
+          });
       }
       else if (ptr_lib == kernel::lib::cuda) {
         throw std::runtime_error(
@@ -9324,11 +10328,16 @@ namespace awkward {
       const uint32_t *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
-        return awkward_NumpyArray_fill_toint16_fromuint32(
-          toptr,
-          tooffset,
-          fromptr,
-          length);
+        ProfileScope profile("awkward_NumpyArray_fill_toint16_fromuint32", length);
+        return parallel_for(
+          length,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_NumpyArray_fill_toint16_fromuint32(
+              toptr,
+              tooffset + start,
+              fromptr + start,
+              stop - start);
+          });
       }
       else if (ptr_lib == kernel::lib::cuda) {
         throw std::runtime_error(
@@ -9349,11 +10358,16 @@ namespace awkward {
       const uint32_t *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
-        return awkward_NumpyArray_fill_toint32_fromuint32(
-          toptr,
-          tooffset,
-          fromptr,
-          length);
+        ProfileScope profile("awkward_NumpyArray_fill_toint32_fromuint32", length);
+        return parallel_for(
+          length,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_NumpyArray_fill_toint32_fromuint32(
+              toptr,
+              tooffset + start,
+              fromptr + start,
+              stop - start);
+          });
       }
       else if (ptr_lib == kernel::lib::cuda) {
         throw std::runtime_error(
@@ -9374,11 +10388,16 @@ namespace awkward {
       const uint32_t *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
-        return awkward_NumpyArray_fill_toint64_fromuint32(
-          toptr,
-          tooffset,
-          fromptr,
-          length);
+        ProfileScope profile("awkward_NumpyArray_fill_toint64_fromuint32", length);
+        return parallel_for(
+          length,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_NumpyArray_fill_toint64_fromuint32(
+              toptr,
+              tooffset + start,
+              fromptr + start,
+              stop - start);
+          });
       }
       else if (ptr_lib == kernel::lib::cuda) {
         throw std::runtime_error(
@@ -9399,11 +10418,16 @@ namespace awkward {
       const uint32_t *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
-        return awkward_NumpyArray_fill_touint8_fromuint32(
-          toptr,
-          tooffset,
-          fromptr,
-          length);
+        ProfileScope profile("awkward_NumpyArray_fill_touint8_fromuint32", length);
+        return parallel_for(
+          length,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_NumpyArray_fill_touint8_fromuint32(
+              toptr,
+              tooffset + start,
+              fromptr + start,
+              stop - start);
+          });
       }
       else if (ptr_lib == kernel::lib::cuda) {
         throw std::runtime_error(
@@ -9424,11 +10448,16 @@ namespace awkward {
       const uint32_t *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
-        return awkward_NumpyArray_fill_touint16_fromuint32(
-          toptr,
-          tooffset,
-          fromptr,
-          length);
+        ProfileScope profile("awkward_NumpyArray_fill_touint16_fromuint32", length);
+        return parallel_for(
+          length,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_NumpyArray_fill_touint16_fromuint32(
+              toptr,
+              tooffset + start,
+              fromptr + start,
+              stop - start);
+          });
       }
       else if (ptr_lib == kernel::lib::cuda) {
         throw std::runtime_error(
@@ -9449,11 +10478,16 @@ namespace awkward {
       const uint32_t *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
-        return awkward_NumpyArray_fill_touint32_fromuint32(
-          toptr,
-          tooffset,
-          fromptr,
-          length);
+        ProfileScope profile("awkward_NumpyArray_fill_touint32_fromuint32", length);
+        return parallel_for(
+          length,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_NumpyArray_fill_touint32_fromuint32(
+              toptr,
+              tooffset + start,
+              fromptr + start,
+              stop - start);
+          });
       }
       else if (ptr_lib == kernel::lib::cuda) {
         throw std::runtime_error(
@@ -9474,11 +10508,16 @@ namespace awkward {
       const uint32_t *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
-        return awkward_NumpyArray_fill_touint64_fromuint32(
-          toptr,
-          tooffset,
-          fromptr,
-          length);
+        ProfileScope profile("awkward_NumpyArray_fill_touint64_fromuint32", length);
+        return parallel_for(
+          length,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_NumpyArray_fill_touint64_fromuint32(
+              toptr,
+              tooffset + start,
+              fromptr + start,
+              stop - start);
+          });
       }
       else if (ptr_lib == kernel::lib::cuda) {
         throw std::runtime_error(
@@ -9499,11 +10538,16 @@ namespace awkward {
       const uint32_t *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
-        return awkward_NumpyArray_fill_tofloat32_fromuint32(
-          toptr,
-          tooffset,
-          fromptr,
-          length);
+        ProfileScope profile("awkward_NumpyArray_fill_tofloat32_fromuint32", length);
+        return parallel_for(
+          length,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_NumpyArray_fill_tofloat32_fromuint32(
+              toptr,
+              tooffset + start,
+              fromptr + start,
+              stop - start);
+          });
       }
       else if (ptr_lib == kernel::lib::cuda) {
         throw std::runtime_error(
@@ -9524,11 +10568,16 @@ namespace awkward {
       const uint32_t *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
-        return awkward_NumpyArray_fill_tofloat64_fromuint32(
-          toptr,
-          tooffset,
-          fromptr,
-          length);
+        ProfileScope profile("awkward_NumpyArray_fill_tofloat64_fromuint32", length);
+        return parallel_for(
+          length,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_NumpyArray_fill_tofloat64_fromuint32(
+              toptr,
+              tooffset + start,
+              fromptr + start,
+              stop - start);
+          });
       }
       else if (ptr_lib == kernel::lib::cuda) {
         throw std::runtime_error(
@@ -9549,6 +10598,7 @@ namespace awkward {
       const uint32_t *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_NumpyArray_fill_tocomplex64_fromuint32", length);
         return awkward_NumpyArray_fill_tocomplex64_fromuint32(
           reinterpret_cast<float*>(toptr),
           tooffset,
@@ -9574,6 +10624,7 @@ namespace awkward {
       const uint32_t *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_NumpyArray_fill_tocomplex128_fromuint32", length);
         return awkward_NumpyArray_fill_tocomplex128_fromuint32(
           reinterpret_cast<double*>(toptr),
           tooffset,
@@ -9600,11 +10651,16 @@ namespace awkward {
       const uint64_t *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
-        return awkward_NumpyArray_fill_tobool_fromuint64(
-          toptr,
-          tooffset,
-          fromptr,
-          length);
+        ProfileScope profile("awkward_NumpyArray_fill_tobool_fromuint64", length);
+        return parallel_for(
+          length,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_NumpyArray_fill_tobool_fromuint64(
+              toptr,
+              tooffset + start,
+              fromptr + start,
+              stop - start);
+          });
       }
       else if (ptr_lib == kernel::lib::cuda) {
         throw std::runtime_error(
@@ -9625,11 +10681,16 @@ namespace awkward {
       const uint64_t *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
-        return awkward_NumpyArray_fill_toint8_fromuint64(
-          toptr,
-          tooffset,
-          fromptr,
-          length);
+        ProfileScope profile("awkward_NumpyArray_fill_toint8_fromuint64", length);
+        return parallel_for(
+          length,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_NumpyArray_fill_toint8_fromuint64(
+              toptr,
+              tooffset + start,
+              fromptr + start,
+              stop - start);
+          });
       }
       else if (ptr_lib == kernel::lib::cuda) {
         throw std::runtime_error(
@@ -9650,11 +10711,16 @@ namespace awkward {
       const uint64_t *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
-        return awkward_NumpyArray_fill_toint16_fromuint64(
-          toptr,
-          tooffset,
-          fromptr,
-          length);
+        ProfileScope profile("awkward_NumpyArray_fill_toint16_fromuint64", length);
+        return parallel_for(
+          length,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_NumpyArray_fill_toint16_fromuint64(
+              toptr,
+              tooffset + start,
+              fromptr + start,
+              stop - start);
+          });
       }
       else if (ptr_lib == kernel::lib::cuda) {
         throw std::runtime_error(
@@ -9675,11 +10741,16 @@ namespace awkward {
       const uint64_t *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
-        return awkward_NumpyArray_fill_toint32_fromuint64(
-          toptr,
-          tooffset,
-          fromptr,
-          length);
+        ProfileScope profile("awkward_NumpyArray_fill_toint32_fromuint64", length);
+        return parallel_for(
+          length,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_NumpyArray_fill_toint32_fromuint64(
+              toptr,
+              tooffset + start,
+              fromptr + start,
+              stop - start);
+          });
       }
       else if (ptr_lib == kernel::lib::cuda) {
         throw std::runtime_error(
@@ -9700,11 +10771,16 @@ namespace awkward {
       const uint64_t *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
-        return awkward_NumpyArray_fill_toint64_fromuint64(
-          toptr,
-          tooffset,
-          fromptr,
-          length);
+        ProfileScope profile("awkward_NumpyArray_fill_toint64_fromuint64", length);
+        return parallel_for(
+          length,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_NumpyArray_fill_toint64_fromuint64(
+              toptr,
+              tooffset + start,
+              fromptr + start,
+              stop - start);
+          });
       }
       else if (ptr_lib == kernel::lib::cuda) {
         throw std::runtime_error(
@@ -9725,11 +10801,16 @@ namespace awkward {
       const uint64_t *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
-        return awkward_NumpyArray_fill_touint8_fromuint64(
-          toptr,
-          tooffset,
-          fromptr,
-          length);
+        ProfileScope profile("awkward_NumpyArray_fill_touint8_fromuint64", length);
+        return parallel_for(
+          length,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_NumpyArray_fill_touint8_fromuint64(
+              toptr,
+              tooffset + start,
+              fromptr + start,
+              stop - start);
+          });
       }
       else if (ptr_lib == kernel::lib::cuda) {
         throw std::runtime_error(
@@ -9750,11 +10831,16 @@ namespace awkward {
       const uint64_t *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
-        return awkward_NumpyArray_fill_touint16_fromuint64(
-          toptr,
-          tooffset,
-          fromptr,
-          length);
+        ProfileScope profile("awkward_NumpyArray_fill_touint16_fromuint64", length);
+        return parallel_for(
+          length,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_NumpyArray_fill_touint16_fromuint64(
+              toptr,
+              tooffset + start,
+              fromptr + start,
+              stop - start);
+          });
       }
       else if (ptr_lib == kernel::lib::cuda) {
         throw std::runtime_error(
@@ -9775,11 +10861,16 @@ namespace awkward {
       const uint64_t *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
-        return awkward_NumpyArray_fill_touint32_fromuint64(
-          toptr,
-          tooffset,
-          fromptr,
-          length);
+        ProfileScope profile("awkward_NumpyArray_fill_touint32_fromuint64", length);
+        return parallel_for(
+          length,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_NumpyArray_fill_touint32_fromuint64(
+              toptr,
+              tooffset + start,
+              fromptr + start,
+              stop - start);
+          });
       }
       else if (ptr_lib == kernel::lib::cuda) {
         throw std::runtime_error(
@@ -9800,11 +10891,16 @@ namespace awkward {
       const uint64_t *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
-        return awkward_NumpyArray_fill_touint64_fromuint64(
-          toptr,
-          tooffset,
-          fromptr,
-          length);
+        ProfileScope profile("awkward_NumpyArray_fill_touint64_fromuint64", length);
+        return parallel_for(
+          length,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_NumpyArray_fill_touint64_fromuint64(
+              toptr,
+              tooffset + start,
+              fromptr + start,
+              stop - start);
+          });
       }
       else if (ptr_lib == kernel::lib::cuda) {
         throw std::runtime_error(
@@ -9825,11 +10921,16 @@ namespace awkward {
       const uint64_t *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
-        return awkward_NumpyArray_fill_tofloat32_fromuint64(
-          toptr,
-          tooffset,
-          fromptr,
-          length);
+        ProfileScope profile("awkward_NumpyArray_fill_tofloat32_fromuint64", length);
+        return parallel_for(
+          length,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_NumpyArray_fill_tofloat32_fromuint64(
+              toptr,
+              tooffset + start,
+              fromptr + start,
+              stop - start);
+          });
       }
       else if (ptr_lib == kernel::lib::cuda) {
         throw std::runtime_error(
@@ -9850,11 +10951,16 @@ namespace awkward {
       const uint64_t *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
-        return awkward_NumpyArray_fill_tofloat64_fromuint64(
-          toptr,
-          tooffset,
-          fromptr,
-          length);
+        ProfileScope profile("awkward_NumpyArray_fill_tofloat64_fromuint64", length);
+        return parallel_for(
+          length,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_NumpyArray_fill_tofloat64_fromuint64(
+              toptr,
+              tooffset + start,
+              fromptr + start,
+              stop - start);
+          });
       }
       else if (ptr_lib == kernel::lib::cuda) {
         throw std::runtime_error(
@@ -9875,6 +10981,7 @@ namespace awkward {
       const uint64_t *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_NumpyArray_fill_tocomplex64_fromuint64", length);
         return awkward_NumpyArray_fill_tocomplex64_fromuint64(
           reinterpret_cast<float*>(toptr),
           tooffset,
@@ -9900,6 +11007,7 @@ namespace awkward {
       const uint64_t *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_NumpyArray_fill_tocomplex128_fromuint64", length);
         return awkward_NumpyArray_fill_tocomplex128_fromuint64(
           reinterpret_cast<double*>(toptr),
           tooffset,
@@ -9926,11 +11034,16 @@ namespace awkward {
       const float *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
-        return awkward_NumpyArray_fill_tobool_fromfloat32(
-          toptr,
-          tooffset,
-          fromptr,
-          length);
+        ProfileScope profile("awkward_NumpyArray_fill_tobool_fromfloat32", length);
+        return parallel_for(
+          length,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_NumpyArray_fill_tobool_fromfloat32(
+              toptr,
+              tooffset + start,
+              fromptr + start,
+              stop - start);
+          });
       }
       else if (ptr_lib == kernel::lib::cuda) {
         throw std::runtime_error(
@@ -9951,11 +11064,16 @@ namespace awkward {
       const float *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
-        return awkward_NumpyArray_fill_toint8_fromfloat32(
-          toptr,
-          tooffset,
-          fromptr,
-          length);
+        ProfileScope profile("awkward_NumpyArray_fill_toint8_fromfloat32", length);
+        return parallel_for(
+          length,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_NumpyArray_fill_toint8_fromfloat32(
+              toptr,
+              tooffset + start,
+              fromptr + start,
+              stop - start);
+          });
       }
       else if (ptr_lib == kernel::lib::cuda) {
         throw std::runtime_error(
@@ -9976,11 +11094,16 @@ namespace awkward {
       const float *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
-        return awkward_NumpyArray_fill_toint16_fromfloat32(
-          toptr,
-          tooffset,
-          fromptr,
-          length);
+        ProfileScope profile("awkward_NumpyArray_fill_toint16_fromfloat32", length);
+        return parallel_for(
+          length,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_NumpyArray_fill_toint16_fromfloat32(
+              toptr,
+              tooffset + start,
+              fromptr + start,
+              stop - start);
+          });
       }
       else if (ptr_lib == kernel::lib::cuda) {
         throw std::runtime_error(
@@ -10001,11 +11124,16 @@ namespace awkward {
       const float *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
-        return awkward_NumpyArray_fill_toint32_fromfloat32(
-          toptr,
-          tooffset,
-          fromptr,
-          length);
+        ProfileScope profile("awkward_NumpyArray_fill_toint32_fromfloat32", length);
+        return parallel_for(
+          length,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_NumpyArray_fill_toint32_fromfloat32(
+              toptr,
+              tooffset + start,
+              fromptr + start,
+              stop - start);
+          });
       }
       else if (ptr_lib == kernel::lib::cuda) {
         throw std::runtime_error(
@@ -10026,11 +11154,16 @@ namespace awkward {
       const float *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
-        return awkward_NumpyArray_fill_toint64_fromfloat32(
-          toptr,
-          tooffset,
-          fromptr,
-          length);
+        ProfileScope profile("awkward_NumpyArray_fill_toint64_fromfloat32", length);
+        return parallel_for(
+          length,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_NumpyArray_fill_toint64_fromfloat32(
+              toptr,
+              tooffset + start,
+              fromptr + start,
+              stop - start);
+          });
       }
       else if (ptr_lib == kernel::lib::cuda) {
         throw std::runtime_error(
@@ -10051,11 +11184,16 @@ namespace awkward {
       const float *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
-        return awkward_NumpyArray_fill_touint8_fromfloat32(
-          toptr,
-          tooffset,
-          fromptr,
-          length);
+        ProfileScope profile("awkward_NumpyArray_fill_touint8_fromfloat32", length);
+        return parallel_for(
+          length,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_NumpyArray_fill_touint8_fromfloat32(
+              toptr,
+              tooffset + start,
+              fromptr + start,
+              stop - start);
+          });
       }
       else if (ptr_lib == kernel::lib::cuda) {
         throw std::runtime_error(
@@ -10076,11 +11214,16 @@ namespace awkward {
       const float *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
-        return awkward_NumpyArray_fill_touint16_fromfloat32(
-          toptr,
-          tooffset,
-          fromptr,
-          length);
+        ProfileScope profile("awkward_NumpyArray_fill_touint16_fromfloat32", length);
+        return parallel_for(
+          length,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_NumpyArray_fill_touint16_fromfloat32(
+              toptr,
+              tooffset + start,
+              fromptr + start,
+              stop - start);
+          });
       }
       else if (ptr_lib == kernel::lib::cuda) {
         throw std::runtime_error(
@@ -10101,11 +11244,16 @@ namespace awkward {
       const float *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
-        return awkward_NumpyArray_fill_touint32_fromfloat32(
-          toptr,
-          tooffset,
-          fromptr,
-          length);
+        ProfileScope profile("awkward_NumpyArray_fill_touint32_fromfloat32", length);
+        return parallel_for(
+          length,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_NumpyArray_fill_touint32_fromfloat32(
+              toptr,
+              tooffset + start,
+              fromptr + start,
+              stop - start);
+          });
       }
       else if (ptr_lib == kernel::lib::cuda) {
         throw std::runtime_error(
@@ -10126,11 +11274,16 @@ namespace awkward {
       const float *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
-        return awkward_NumpyArray_fill_touint64_fromfloat32(
-          toptr,
-          tooffset,
-          fromptr,
-          length);
+        ProfileScope profile("awkward_NumpyArray_fill_touint64_fromfloat32", length);
+        return parallel_for(
+          length,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_NumpyArray_fill_touint64_fromfloat32(
+              toptr,
+              tooffset + start,
+              fromptr + start,
+              stop - start);
+          });
       }
       else if (ptr_lib == kernel::lib::cuda) {
         throw std::runtime_error(
@@ -10151,11 +11304,16 @@ namespace awkward {
       const float *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
-        return awkward_NumpyArray_fill_tofloat32_fromfloat32(
-          toptr,
-          tooffset,
-          fromptr,
-          length);
+        ProfileScope profile("awkward_NumpyArray_fill_tofloat32_fromfloat32", length);
+        return parallel_for(
+          length,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_NumpyArray_fill_tofloat32_fromfloat32(
+              toptr,
+              tooffset + start,
+              fromptr + start,
+              stop - start);
+          });
       }
       else if (ptr_lib == kernel::lib::cuda) {
         throw std::runtime_error(
@@ -10176,11 +11334,16 @@ namespace awkward {
       const float *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
-        return awkward_NumpyArray_fill_tofloat64_fromfloat32(
-          toptr,
-          tooffset,
-          fromptr,
-          length);
+        ProfileScope profile("awkward_NumpyArray_fill_tofloat64_fromfloat32", length);
+        return parallel_for(
+          length,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_NumpyArray_fill_tofloat64_fromfloat32(
+              toptr,
+              tooffset + start,
+              fromptr + start,
+              stop - start);
+          });
       }
       else if (ptr_lib == kernel::lib::cuda) {
         throw std::runtime_error(
@@ -10201,6 +11364,7 @@ namespace awkward {
       const float *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_NumpyArray_fill_tocomplex64_fromfloat32", length);
         return awkward_NumpyArray_fill_tocomplex64_fromfloat32(
           reinterpret_cast<float*>(toptr),
           tooffset,
@@ -10226,6 +11390,7 @@ namespace awkward {
       const float *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_NumpyArray_fill_tocomplex128_fromfloat32", length);
         return awkward_NumpyArray_fill_tocomplex128_fromfloat32(
           reinterpret_cast<double*>(toptr),
           tooffset,
@@ -10252,11 +11417,16 @@ namespace awkward {
       const double *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
-        return awkward_NumpyArray_fill_tobool_fromfloat64(
-          toptr,
-          tooffset,
-          fromptr,
-          length);
+        ProfileScope profile("awkward_NumpyArray_fill_tobool_fromfloat64", length);
+        return parallel_for(
+          length,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_NumpyArray_fill_tobool_fromfloat64(
+              toptr,
+              tooffset + start,
+              fromptr + start,
+              stop - start);
+          });
       }
       else if (ptr_lib == kernel::lib::cuda) {
         throw std::runtime_error(
@@ -10277,11 +11447,16 @@ namespace awkward {
       const double *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
-        return awkward_NumpyArray_fill_toint8_fromfloat64(
-          toptr,
-          tooffset,
-          fromptr,
-          length);
+        ProfileScope profile("awkward_NumpyArray_fill_toint8_fromfloat64", length);
+        return parallel_for(
+          length,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_NumpyArray_fill_toint8_fromfloat64(
+              toptr,
+              tooffset + start,
+              fromptr + start,
+              stop - start);
+          });
       }
       else if (ptr_lib == kernel::lib::cuda) {
         throw std::runtime_error(
@@ -10302,11 +11477,16 @@ namespace awkward {
       const double *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
-        return awkward_NumpyArray_fill_toint16_fromfloat64(
-          toptr,
-          tooffset,
-          fromptr,
-          length);
+        ProfileScope profile("awkward_NumpyArray_fill_toint16_fromfloat64", length);
+        return parallel_for(
+          length,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_NumpyArray_fill_toint16_fromfloat64(
+              toptr,
+              tooffset + start,
+              fromptr + start,
+              stop - start);
+          });
       }
       else if (ptr_lib == kernel::lib::cuda) {
         throw std::runtime_error(
@@ -10327,11 +11507,16 @@ namespace awkward {
       const double *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
-        return awkward_NumpyArray_fill_toint32_fromfloat64(
-          toptr,
-          tooffset,
-          fromptr,
-          length);
+        ProfileScope profile("awkward_NumpyArray_fill_toint32_fromfloat64", length);
+        return parallel_for(
+          length,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_NumpyArray_fill_toint32_fromfloat64(
+              toptr,
+              tooffset + start,
+              fromptr + start,
+              stop - start);
+          });
       }
       else if (ptr_lib == kernel::lib::cuda) {
         throw std::runtime_error(
@@ -10352,11 +11537,16 @@ namespace awkward {
       const double *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
-        return awkward_NumpyArray_fill_toint64_fromfloat64(
-          toptr,
-          tooffset,
-          fromptr,
-          length);
+        ProfileScope profile("awkward_NumpyArray_fill_toint64_fromfloat64", length);
+        return parallel_for(
+          length,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_NumpyArray_fill_toint64_fromfloat64(
+              toptr,
+              tooffset + start,
+              fromptr + start,
+              stop - start);
+          });
       }
       else if (ptr_lib == kernel::lib::cuda) {
         throw std::runtime_error(
@@ -10377,11 +11567,16 @@ namespace awkward {
       const double *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
-        return awkward_NumpyArray_fill_touint8_fromfloat64(
-          toptr,
-          tooffset,
-          fromptr,
-          length);
+        ProfileScope profile("awkward_NumpyArray_fill_touint8_fromfloat64", length);
+        return parallel_for(
+          length,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_NumpyArray_fill_touint8_fromfloat64(
+              toptr,
+              tooffset + start,
+              fromptr + start,
+              stop - start);
+          });
       }
       else if (ptr_lib == kernel::lib::cuda) {
         throw std::runtime_error(
@@ -10402,11 +11597,16 @@ namespace awkward {
       const double *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
-        return awkward_NumpyArray_fill_touint16_fromfloat64(
-          toptr,
-          tooffset,
-          fromptr,
-          length);
+        ProfileScope profile("awkward_NumpyArray_fill_touint16_fromfloat64", length);
+        return parallel_for(
+          length,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_NumpyArray_fill_touint16_fromfloat64(
+              toptr,
+              tooffset + start,
+              fromptr + start,
+              stop - start);
+          });
       }
       else if (ptr_lib == kernel::lib::cuda) {
         throw std::runtime_error(
@@ -10427,11 +11627,16 @@ namespace awkward {
       const double *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
-        return awkward_NumpyArray_fill_touint32_fromfloat64(
-          toptr,
-          tooffset,
-          fromptr,
-          length);
+        ProfileScope profile("awkward_NumpyArray_fill_touint32_fromfloat64", length);
+        return parallel_for(
+          length,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_NumpyArray_fill_touint32_fromfloat64(
+              toptr,
+              tooffset + start,
+              fromptr + start,
+              stop - start);
+          });
       }
       else if (ptr_lib == kernel::lib::cuda) {
         throw std::runtime_error(
@@ -10452,11 +11657,16 @@ namespace awkward {
       const double *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
-        return awkward_NumpyArray_fill_touint64_fromfloat64(
-          toptr,
-          tooffset,
-          fromptr,
-          length);
+        ProfileScope profile("awkward_NumpyArray_fill_touint64_fromfloat64", length);
+        return parallel_for(
+          length,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_NumpyArray_fill_touint64_fromfloat64(
+              toptr,
+              tooffset + start,
+              fromptr + start,
+              stop - start);
+          });
       }
       else if (ptr_lib == kernel::lib::cuda) {
         throw std::runtime_error(
@@ -10477,11 +11687,16 @@ namespace awkward {
       const double *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
-        return awkward_NumpyArray_fill_tofloat32_fromfloat64(
-          toptr,
-          tooffset,
-          fromptr,
-          length);
+        ProfileScope profile("awkward_NumpyArray_fill_tofloat32_fromfloat64", length);
+        return parallel_for(
+          length,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_NumpyArray_fill_tofloat32_fromfloat64(
+              toptr,
+              tooffset + start,
+              fromptr + start,
+              stop - start);
+          });
       }
       else if (ptr_lib == kernel::lib::cuda) {
         throw std::runtime_error(
@@ -10502,11 +11717,16 @@ namespace awkward {
       const double *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
-        return awkward_NumpyArray_fill_tofloat64_fromfloat64(
-          toptr,
-          tooffset,
-          fromptr,
-          length);
+        ProfileScope profile("awkward_NumpyArray_fill_tofloat64_fromfloat64", length);
+        return parallel_for(
+          length,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_NumpyArray_fill_tofloat64_fromfloat64(
+              toptr,
+              tooffset + start,
+              fromptr + start,
+              stop - start);
+          });
       }
       else if (ptr_lib == kernel::lib::cuda) {
         throw std::runtime_error(
@@ -10527,6 +11747,7 @@ namespace awkward {
       const double *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_NumpyArray_fill_tocomplex64_fromfloat64", length);
         return awkward_NumpyArray_fill_tocomplex64_fromfloat64(
           reinterpret_cast<float*>(toptr),
           tooffset,
@@ -10552,6 +11773,7 @@ namespace awkward {
       const double *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_NumpyArray_fill_tocomplex128_fromfloat64", length);
         return awkward_NumpyArray_fill_tocomplex128_fromfloat64(
           reinterpret_cast<double*>(toptr),
           tooffset,
@@ -10579,6 +11801,7 @@ namespace awkward {
       const std::complex<float> *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_NumpyArray_fill_tobool_fromcomplex64", length);
         return awkward_NumpyArray_fill_tobool_fromcomplex64(
           toptr,
           tooffset,
@@ -10604,6 +11827,7 @@ namespace awkward {
       const std::complex<float> *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_NumpyArray_fill_toint8_fromcomplex64", length);
         return awkward_NumpyArray_fill_toint8_fromcomplex64(
           toptr,
           tooffset,
@@ -10629,6 +11853,7 @@ namespace awkward {
       const std::complex<float> *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_NumpyArray_fill_toint16_fromcomplex64", length);
         return awkward_NumpyArray_fill_toint16_fromcomplex64(
           toptr,
           tooffset,
@@ -10654,6 +11879,7 @@ namespace awkward {
       const std::complex<float> *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_NumpyArray_fill_toint32_fromcomplex64", length);
         return awkward_NumpyArray_fill_toint32_fromcomplex64(
           toptr,
           tooffset,
@@ -10679,6 +11905,7 @@ namespace awkward {
       const std::complex<float> *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_NumpyArray_fill_toint64_fromcomplex64", length);
         return awkward_NumpyArray_fill_toint64_fromcomplex64(
           toptr,
           tooffset,
@@ -10704,6 +11931,7 @@ namespace awkward {
       const std::complex<float> *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_NumpyArray_fill_touint8_fromcomplex64", length);
         return awkward_NumpyArray_fill_touint8_fromcomplex64(
           toptr,
           tooffset,
@@ -10729,6 +11957,7 @@ namespace awkward {
       const std::complex<float> *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_NumpyArray_fill_touint16_fromcomplex64", length);
         return awkward_NumpyArray_fill_touint16_fromcomplex64(
           toptr,
           tooffset,
@@ -10754,6 +11983,7 @@ namespace awkward {
       const std::complex<float> *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_NumpyArray_fill_touint32_fromcomplex64", length);
         return awkward_NumpyArray_fill_touint32_fromcomplex64(
           toptr,
           tooffset,
@@ -10779,6 +12009,7 @@ namespace awkward {
       const std::complex<float> *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_NumpyArray_fill_touint64_fromcomplex64", length);
         return awkward_NumpyArray_fill_touint64_fromcomplex64(
           toptr,
           tooffset,
@@ -10804,6 +12035,7 @@ namespace awkward {
       const std::complex<float> *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_NumpyArray_fill_tofloat32_fromcomplex64", length);
         return awkward_NumpyArray_fill_tofloat32_fromcomplex64(
           toptr,
           tooffset,
@@ -10829,6 +12061,7 @@ namespace awkward {
       const std::complex<float> *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_NumpyArray_fill_tofloat64_fromcomplex64", length);
         return awkward_NumpyArray_fill_tofloat64_fromcomplex64(
           toptr,
           tooffset,
@@ -10854,6 +12087,7 @@ namespace awkward {
       const std::complex<float> *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_NumpyArray_fill_tofloat32_fromfloat32", length);
         return awkward_NumpyArray_fill_tofloat32_fromfloat32(
           reinterpret_cast<float*>(toptr),
           tooffset,
@@ -10879,6 +12113,7 @@ namespace awkward {
       const std::complex<float> *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_NumpyArray_fill_tofloat64_fromfloat32", length);
         return awkward_NumpyArray_fill_tofloat64_fromfloat32(
           reinterpret_cast<double*>(toptr),
           tooffset,
@@ -10905,6 +12140,7 @@ namespace awkward {
       const std::complex<double> *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_NumpyArray_fill_tobool_fromcomplex128", length);
         return awkward_NumpyArray_fill_tobool_fromcomplex128(
           toptr,
           tooffset,
@@ -10930,6 +12166,7 @@ namespace awkward {
       const std::complex<double> *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_NumpyArray_fill_toint8_fromcomplex128", length);
         return awkward_NumpyArray_fill_toint8_fromcomplex128(
           toptr,
           tooffset,
@@ -10955,6 +12192,7 @@ namespace awkward {
       const std::complex<double> *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_NumpyArray_fill_toint16_fromcomplex128", length);
         return awkward_NumpyArray_fill_toint16_fromcomplex128(
           toptr,
           tooffset,
@@ -10980,6 +12218,7 @@ namespace awkward {
       const std::complex<double> *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_NumpyArray_fill_toint32_fromcomplex128", length);
         return awkward_NumpyArray_fill_toint32_fromcomplex128(
           toptr,
           tooffset,
@@ -11005,6 +12244,7 @@ namespace awkward {
       const std::complex<double> *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_NumpyArray_fill_toint64_fromcomplex128", length);
         return awkward_NumpyArray_fill_toint64_fromcomplex128(
           toptr,
           tooffset,
@@ -11030,6 +12270,7 @@ namespace awkward {
       const std::complex<double> *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_NumpyArray_fill_touint8_fromcomplex128", length);
         return awkward_NumpyArray_fill_touint8_fromcomplex128(
           toptr,
           tooffset,
@@ -11055,6 +12296,7 @@ namespace awkward {
       const std::complex<double> *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_NumpyArray_fill_touint16_fromcomplex128", length);
         return awkward_NumpyArray_fill_touint16_fromcomplex128(
           toptr,
           tooffset,
@@ -11080,6 +12322,7 @@ namespace awkward {
       const std::complex<double> *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_NumpyArray_fill_touint32_fromcomplex128", length);
         return awkward_NumpyArray_fill_touint32_fromcomplex128(
           toptr,
           tooffset,
@@ -11105,6 +12348,7 @@ namespace awkward {
       const std::complex<double> *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_NumpyArray_fill_touint64_fromcomplex128", length);
         return awkward_NumpyArray_fill_touint64_fromcomplex128(
           toptr,
           tooffset,
@@ -11130,6 +12374,7 @@ namespace awkward {
       const std::complex<double> *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_NumpyArray_fill_tofloat32_fromcomplex128", length);
         return awkward_NumpyArray_fill_tofloat32_fromcomplex128(
           toptr,
           tooffset,
@@ -11155,6 +12400,7 @@ namespace awkward {
       const std::complex<double> *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_NumpyArray_fill_tofloat64_fromcomplex128", length);
         return awkward_NumpyArray_fill_tofloat64_fromcomplex128(
           toptr,
           tooffset,
@@ -11180,6 +12426,7 @@ namespace awkward {
       const std::complex<double> *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_NumpyArray_fill_tofloat32_fromfloat64", length);
         return awkward_NumpyArray_fill_tofloat32_fromfloat64(
           reinterpret_cast<float*>(toptr),
           tooffset,
@@ -11205,6 +12452,7 @@ namespace awkward {
       const std::complex<double> *fromptr,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_NumpyArray_fill_tofloat64_fromfloat64", length);
         return awkward_NumpyArray_fill_tofloat64_fromfloat64(
           reinterpret_cast<double*>(toptr),
           tooffset,
@@ -11232,6 +12480,7 @@ namespace awkward {
       int64_t length,
       double scale) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_NumpyArray_fill_scaled_toint64_fromint64", length);
         return awkward_NumpyArray_fill_scaled_toint64_fromint64(
           reinterpret_cast<int64_t*>(toptr),
           tooffset,
@@ -11264,6 +12513,7 @@ namespace awkward {
       const int64_t* fromstarts,
       int64_t startslength) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_NumpyArray_rearrange_shifted_toint64_fromint64", length);
         return awkward_NumpyArray_rearrange_shifted_toint64_fromint64(
           reinterpret_cast<int64_t*>(toptr),
           reinterpret_cast<const int64_t*>(fromshifts),
@@ -11299,6 +12549,7 @@ namespace awkward {
       int64_t length,
       int64_t base) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_ListArray_fill_to64_from32", length);
         return awkward_ListArray_fill_to64_from32(
           tostarts,
           tostartsoffset,
@@ -11333,6 +12584,7 @@ namespace awkward {
       int64_t length,
       int64_t base) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_ListArray_fill_to64_fromU32", length);
         return awkward_ListArray_fill_to64_fromU32(
           tostarts,
           tostartsoffset,
@@ -11367,6 +12619,7 @@ namespace awkward {
       int64_t length,
       int64_t base) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_ListArray_fill_to64_from64", length);
         return awkward_ListArray_fill_to64_from64(
           tostarts,
           tostartsoffset,
@@ -11398,6 +12651,7 @@ namespace awkward {
       int64_t length,
       int64_t base) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_IndexedArray_fill_to64_from32", length);
         return awkward_IndexedArray_fill_to64_from32(
           toindex,
           toindexoffset,
@@ -11426,6 +12680,7 @@ namespace awkward {
       int64_t length,
       int64_t base) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_IndexedArray_fill_to64_fromU32", length);
         return awkward_IndexedArray_fill_to64_fromU32(
           toindex,
           toindexoffset,
@@ -11454,6 +12709,7 @@ namespace awkward {
       int64_t length,
       int64_t base) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_IndexedArray_fill_to64_from64", length);
         return awkward_IndexedArray_fill_to64_from64(
           toindex,
           toindexoffset,
@@ -11480,6 +12736,7 @@ namespace awkward {
       int64_t length,
       int64_t base) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_IndexedArray_fill_to64_count", length);
         return awkward_IndexedArray_fill_to64_count(
           toindex,
           toindexoffset,
@@ -11509,6 +12766,7 @@ namespace awkward {
       int64_t length,
       int64_t base) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_UnionArray_filltags_to8_from8", length);
         return awkward_UnionArray_filltags_to8_from8(
           totags,
           totagsoffset,
@@ -11536,6 +12794,7 @@ namespace awkward {
       const int32_t *fromindex,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_UnionArray_fillindex_to64_from32", length);
         return awkward_UnionArray_fillindex_to64_from32(
           toindex,
           toindexoffset,
@@ -11562,6 +12821,7 @@ namespace awkward {
       const uint32_t *fromindex,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_UnionArray_fillindex_to64_fromU32", length);
         return awkward_UnionArray_fillindex_to64_fromU32(
           toindex,
           toindexoffset,
@@ -11588,6 +12848,7 @@ namespace awkward {
       const int64_t *fromindex,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_UnionArray_fillindex_to64_from64", length);
         return awkward_UnionArray_fillindex_to64_from64(
           toindex,
           toindexoffset,
@@ -11613,6 +12874,7 @@ namespace awkward {
       int64_t length,
       int64_t base) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_UnionArray_filltags_to8_const", length);
         return awkward_UnionArray_filltags_to8_const(
           totags,
           totagsoffset,
@@ -11637,6 +12899,7 @@ namespace awkward {
       int64_t toindexoffset,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_UnionArray_fillindex_to64_count", length);
         return awkward_UnionArray_fillindex_to64_count(
           toindex,
           toindexoffset,
@@ -11669,6 +12932,7 @@ namespace awkward {
       int64_t length,
       int64_t base) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_UnionArray8_32_simplify8_32_to8_64", length);
         return awkward_UnionArray8_32_simplify8_32_to8_64(
           totags,
           toindex,
@@ -11709,6 +12973,7 @@ namespace awkward {
       int64_t length,
       int64_t base) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_UnionArray8_U32_simplify8_32_to8_64", length);
         return awkward_UnionArray8_U32_simplify8_32_to8_64(
           totags,
           toindex,
@@ -11749,6 +13014,7 @@ namespace awkward {
       int64_t length,
       int64_t base) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_UnionArray8_64_simplify8_32_to8_64", length);
         return awkward_UnionArray8_64_simplify8_32_to8_64(
           totags,
           toindex,
@@ -11789,6 +13055,7 @@ namespace awkward {
       int64_t length,
       int64_t base) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_UnionArray8_32_simplify8_U32_to8_64", length);
         return awkward_UnionArray8_32_simplify8_U32_to8_64(
           totags,
           toindex,
@@ -11829,6 +13096,7 @@ namespace awkward {
       int64_t length,
       int64_t base) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_UnionArray8_U32_simplify8_U32_to8_64", length);
         return awkward_UnionArray8_U32_simplify8_U32_to8_64(
           totags,
           toindex,
@@ -11869,6 +13137,7 @@ namespace awkward {
       int64_t length,
       int64_t base) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_UnionArray8_64_simplify8_U32_to8_64", length);
         return awkward_UnionArray8_64_simplify8_U32_to8_64(
           totags,
           toindex,
@@ -11909,6 +13178,7 @@ namespace awkward {
       int64_t length,
       int64_t base) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_UnionArray8_32_simplify8_64_to8_64", length);
         return awkward_UnionArray8_32_simplify8_64_to8_64(
           totags,
           toindex,
@@ -11949,6 +13219,7 @@ namespace awkward {
       int64_t length,
       int64_t base) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_UnionArray8_U32_simplify8_64_to8_64", length);
         return awkward_UnionArray8_U32_simplify8_64_to8_64(
           totags,
           toindex,
@@ -11989,6 +13260,7 @@ namespace awkward {
       int64_t length,
       int64_t base) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_UnionArray8_64_simplify8_64_to8_64", length);
         return awkward_UnionArray8_64_simplify8_64_to8_64(
           totags,
           toindex,
@@ -12026,6 +13298,7 @@ namespace awkward {
       int64_t length,
       int64_t base) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_UnionArray8_32_simplify_one_to8_64", length);
         return awkward_UnionArray8_32_simplify_one_to8_64(
           totags,
           toindex,
@@ -12060,6 +13333,7 @@ namespace awkward {
       int64_t length,
       int64_t base) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_UnionArray8_U32_simplify_one_to8_64", length);
         return awkward_UnionArray8_U32_simplify_one_to8_64(
           totags,
           toindex,
@@ -12094,6 +13368,7 @@ namespace awkward {
       int64_t length,
       int64_t base) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_UnionArray8_64_simplify_one_to8_64", length);
         return awkward_UnionArray8_64_simplify_one_to8_64(
           totags,
           toindex,
@@ -12124,6 +13399,7 @@ namespace awkward {
       int64_t length,
       int64_t lencontent) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_ListArray32_validity", length);
         return awkward_ListArray32_validity(
           starts,
           stops,
@@ -12153,6 +13429,7 @@ namespace awkward {
       int64_t length,
       int64_t lencontent) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_ListArrayU32_validity", length);
         return awkward_ListArrayU32_validity(
           starts,
           stops,
@@ -12182,6 +13459,7 @@ namespace awkward {
       int64_t length,
       int64_t lencontent) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_ListArray64_validity", length);
         return awkward_ListArray64_validity(
           starts,
           stops,
@@ -12211,6 +13489,7 @@ namespace awkward {
       int64_t lencontent,
       bool isoption) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_IndexedArray32_validity", length);
         return awkward_IndexedArray32_validity(
           index,
           length,
@@ -12240,6 +13519,7 @@ namespace awkward {
       int64_t lencontent,
       bool isoption) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_IndexedArrayU32_validity", length);
         return awkward_IndexedArrayU32_validity(
           index,
           length,
@@ -12269,6 +13549,7 @@ namespace awkward {
       int64_t lencontent,
       bool isoption) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_IndexedArray64_validity", length);
         return awkward_IndexedArray64_validity(
           index,
           length,
@@ -12299,6 +13580,7 @@ namespace awkward {
       int64_t numcontents,
       const int64_t *lencontents) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_UnionArray8_32_validity", length);
         return awkward_UnionArray8_32_validity(
           tags,
           index,
@@ -12331,6 +13613,7 @@ namespace awkward {
       int64_t numcontents,
       const int64_t *lencontents) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_UnionArray8_U32_validity", length);
         return awkward_UnionArray8_U32_validity(
           tags,
           index,
@@ -12363,6 +13646,7 @@ namespace awkward {
       int64_t numcontents,
       const int64_t *lencontents) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_UnionArray8_64_validity", length);
         return awkward_UnionArray8_64_validity(
           tags,
           index,
@@ -12393,6 +13677,7 @@ namespace awkward {
       const int32_t *fromindex,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_UnionArray_fillna_from32_to64", length);
         return awkward_UnionArray_fillna_from32_to64(
           toindex,
           fromindex,
@@ -12419,6 +13704,7 @@ namespace awkward {
       const uint32_t *fromindex,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_UnionArray_fillna_fromU32_to64", length);
         return awkward_UnionArray_fillna_fromU32_to64(
           toindex,
           fromindex,
@@ -12445,6 +13731,7 @@ namespace awkward {
       const int64_t *fromindex,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_UnionArray_fillna_from64_to64", length);
         return awkward_UnionArray_fillna_from64_to64(
           toindex,
           fromindex,
@@ -12470,6 +13757,7 @@ namespace awkward {
       const int8_t *frommask,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_IndexedOptionArray_rpad_and_clip_mask_axis1_64", length);
         return awkward_IndexedOptionArray_rpad_and_clip_mask_axis1_64(
           toindex,
           frommask,
@@ -12493,6 +13781,7 @@ namespace awkward {
       int64_t target,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_index_rpad_and_clip_axis0_64", length);
         return awkward_index_rpad_and_clip_axis0_64(
           toindex,
           target,
@@ -12517,6 +13806,7 @@ namespace awkward {
       int64_t target,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_index_rpad_and_clip_axis1_64", length);
         return awkward_index_rpad_and_clip_axis1_64(
           tostarts,
           tostops,
@@ -12540,6 +13830,7 @@ namespace awkward {
       int64_t *toindex,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_Index_nones_as_index_64", length);
         return awkward_Index_nones_as_index_64(
           toindex,
           length);
@@ -12563,6 +13854,7 @@ namespace awkward {
       int64_t size,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_RegularArray_rpad_and_clip_axis1_64", length);
         return awkward_RegularArray_rpad_and_clip_axis1_64(
           toindex,
           target,
@@ -12587,6 +13879,7 @@ namespace awkward {
       const int64_t* fromoffsets,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_SliceVarNewAxis_to_SliceJagged64", length);
         return awkward_SliceVarNewAxis_to_SliceJagged64(
           tocarry,
           fromoffsets,
@@ -12612,6 +13905,7 @@ namespace awkward {
       const int32_t *fromstops,
       int64_t lenstarts) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_ListArray32_min_range", lenstarts);
         return awkward_ListArray32_min_range(
           tomin,
           fromstarts,
@@ -12641,6 +13935,7 @@ namespace awkward {
       const uint32_t *fromstops,
       int64_t lenstarts) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_ListArrayU32_min_range", lenstarts);
         return awkward_ListArrayU32_min_range(
           tomin,
           fromstarts,
@@ -12670,6 +13965,7 @@ namespace awkward {
       const int64_t *fromstops,
       int64_t lenstarts) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_ListArray64_min_range", lenstarts);
         return awkward_ListArray64_min_range(
           tomin,
           fromstarts,
@@ -12700,6 +13996,7 @@ namespace awkward {
       int64_t target,
       int64_t lenstarts) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_ListArray32_rpad_and_clip_length_axis1", lenstarts);
         return awkward_ListArray32_rpad_and_clip_length_axis1(
           tolength,
           fromstarts,
@@ -12728,6 +14025,7 @@ namespace awkward {
       int64_t target,
       int64_t lenstarts) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_ListArrayU32_rpad_and_clip_length_axis1", lenstarts);
         return awkward_ListArrayU32_rpad_and_clip_length_axis1(
           tolength,
           fromstarts,
@@ -12756,6 +14054,7 @@ namespace awkward {
       int64_t target,
       int64_t lenstarts) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_ListArray64_rpad_and_clip_length_axis1", lenstarts);
         return awkward_ListArray64_rpad_and_clip_length_axis1(
           tolength,
           fromstarts,
@@ -12786,6 +14085,7 @@ namespace awkward {
       int64_t target,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_ListArray32_rpad_axis1_64", length);
         return awkward_ListArray32_rpad_axis1_64(
           toindex,
           fromstarts,
@@ -12818,6 +14118,7 @@ namespace awkward {
       int64_t target,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_ListArrayU32_rpad_axis1_64", length);
         return awkward_ListArrayU32_rpad_axis1_64(
           toindex,
           fromstarts,
@@ -12850,6 +14151,7 @@ namespace awkward {
       int64_t target,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_ListArray64_rpad_axis1_64", length);
         return awkward_ListArray64_rpad_axis1_64(
           toindex,
           fromstarts,
@@ -12879,6 +14181,7 @@ namespace awkward {
       int64_t length,
       int64_t target) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_ListOffsetArray32_rpad_and_clip_axis1_64", length);
         return awkward_ListOffsetArray32_rpad_and_clip_axis1_64(
           toindex,
           fromoffsets,
@@ -12905,6 +14208,7 @@ namespace awkward {
       int64_t length,
       int64_t target) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_ListOffsetArrayU32_rpad_and_clip_axis1_64", length);
         return awkward_ListOffsetArrayU32_rpad_and_clip_axis1_64(
           toindex,
           fromoffsets,
@@ -12931,6 +14235,7 @@ namespace awkward {
       int64_t length,
       int64_t target) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_ListOffsetArray64_rpad_and_clip_axis1_64", length);
         return awkward_ListOffsetArray64_rpad_and_clip_axis1_64(
           toindex,
           fromoffsets,
@@ -12958,6 +14263,7 @@ namespace awkward {
       int64_t length,
       int64_t *tocount) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_ListOffsetArray32_rpad_length_axis1", length);
         return awkward_ListOffsetArray32_rpad_length_axis1(
           tooffsets,
           fromoffsets,
@@ -12986,6 +14292,7 @@ namespace awkward {
       int64_t length,
       int64_t *tocount) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_ListOffsetArrayU32_rpad_length_axis1", length);
         return awkward_ListOffsetArrayU32_rpad_length_axis1(
           tooffsets,
           fromoffsets,
@@ -13014,6 +14321,7 @@ namespace awkward {
       int64_t length,
       int64_t *tocount) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_ListOffsetArray64_rpad_length_axis1", length);
         return awkward_ListOffsetArray64_rpad_length_axis1(
           tooffsets,
           fromoffsets,
@@ -13041,6 +14349,7 @@ namespace awkward {
       int64_t fromlength,
       int64_t target) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_ListOffsetArray32_rpad_axis1_64", fromlength);
         return awkward_ListOffsetArray32_rpad_axis1_64(
           toindex,
           fromoffsets,
@@ -13067,6 +14376,7 @@ namespace awkward {
       int64_t fromlength,
       int64_t target) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_ListOffsetArrayU32_rpad_axis1_64", fromlength);
         return awkward_ListOffsetArrayU32_rpad_axis1_64(
           toindex,
           fromoffsets,
@@ -13093,6 +14403,7 @@ namespace awkward {
       int64_t fromlength,
       int64_t target) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_ListOffsetArray64_rpad_axis1_64", fromlength);
         return awkward_ListOffsetArray64_rpad_axis1_64(
           toindex,
           fromoffsets,
@@ -13116,6 +14427,7 @@ namespace awkward {
       int64_t *toindex,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_localindex_64", length);
         return awkward_localindex_64(
           toindex,
           length);
@@ -13140,10 +14452,15 @@ namespace awkward {
       const int32_t *offsets,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
-        return awkward_ListArray32_localindex_64(
-          toindex,
-          offsets,
-          length);
+        ProfileScope profile("awkward_ListArray32_localindex_64", length);
+        return parallel_for(
+          length,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_ListArray32_localindex_64(
+              toindex,
+              offsets + start,
+              stop - start);
+          });
       }
       else if (ptr_lib == kernel::lib::cuda) {
         throw std::runtime_error(
@@ -13164,10 +14481,15 @@ namespace awkward {
       const uint32_t *offsets,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
-        return awkward_ListArrayU32_localindex_64(
-          toindex,
-          offsets,
-          length);
+        ProfileScope profile("awkward_ListArrayU32_localindex_64", length);
+        return parallel_for(
+          length,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_ListArrayU32_localindex_64(
+              toindex,
+              offsets + start,
+              stop - start);
+          });
       }
       else if (ptr_lib == kernel::lib::cuda) {
         throw std::runtime_error(
@@ -13188,10 +14510,15 @@ namespace awkward {
       const int64_t *offsets,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
-        return awkward_ListArray64_localindex_64(
-          toindex,
-          offsets,
-          length);
+        ProfileScope profile("awkward_ListArray64_localindex_64", length);
+        return parallel_for(
+          length,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_ListArray64_localindex_64(
+              toindex,
+              offsets + start,
+              stop - start);
+          });
       }
       else if (ptr_lib == kernel::lib::cuda) {
         throw std::runtime_error(
@@ -13211,6 +14538,7 @@ namespace awkward {
       int64_t size,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_RegularArray_localindex_64", length);
         return awkward_RegularArray_localindex_64(
           toindex,
           size,
@@ -13236,6 +14564,7 @@ namespace awkward {
       const int64_t* fromcarry,
       int64_t carrylen) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_carry_SliceJagged64_offsets", carrylen);
         return awkward_carry_SliceJagged64_offsets(
           tooffsets,
           fromoffsets,
@@ -13262,6 +14591,7 @@ namespace awkward {
       const int64_t* fromcarry,
       int64_t carrylen) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_carry_SliceJagged64_nextcarry", carrylen);
         return awkward_carry_SliceJagged64_nextcarry(
           tocarry,
           fromoffsets,
@@ -13287,6 +14617,7 @@ namespace awkward {
       const int64_t* fromindex,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_carry_SliceMissing64_outindex", length);
         return awkward_carry_SliceMissing64_outindex(
           toindex,
           fromindex,
@@ -13312,6 +14643,7 @@ namespace awkward {
       bool replacement,
       int64_t singlelen) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_combinations_64", n);
         return awkward_combinations_64(
           toindex,
           n,
@@ -13344,6 +14676,7 @@ namespace awkward {
       const int32_t *stops,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_ListArray32_combinations_length_64", length);
         return awkward_ListArray32_combinations_length_64(
           totallen,
           tooffsets,
@@ -13376,6 +14709,7 @@ namespace awkward {
       const uint32_t *stops,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_ListArrayU32_combinations_length_64", length);
         return awkward_ListArrayU32_combinations_length_64(
           totallen,
           tooffsets,
@@ -13408,6 +14742,7 @@ namespace awkward {
       const int64_t *stops,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_ListArray64_combinations_length_64", length);
         return awkward_ListArray64_combinations_length_64(
           totallen,
           tooffsets,
@@ -13441,6 +14776,7 @@ namespace awkward {
       const int32_t *stops,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_ListArray32_combinations_64", length);
         return awkward_ListArray32_combinations_64(
           tocarry,
           toindex,
@@ -13475,6 +14811,7 @@ namespace awkward {
       const uint32_t *stops,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_ListArrayU32_combinations_64", length);
         return awkward_ListArrayU32_combinations_64(
           tocarry,
           toindex,
@@ -13509,6 +14846,7 @@ namespace awkward {
       const int64_t *stops,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_ListArray64_combinations_64", length);
         return awkward_ListArray64_combinations_64(
           tocarry,
           toindex,
@@ -13541,6 +14879,7 @@ namespace awkward {
       int64_t size,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_RegularArray_combinations_64", length);
         return awkward_RegularArray_combinations_64(
           tocarry,
           toindex,
@@ -13570,6 +14909,7 @@ namespace awkward {
       int64_t length,
       bool validwhen) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_ByteMaskedArray_overlay_mask8", length);
         return awkward_ByteMaskedArray_overlay_mask8(
           tomask,
           theirmask,
@@ -13597,6 +14937,7 @@ namespace awkward {
       bool validwhen,
       bool lsb_order) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_BitMaskedArray_to_ByteMaskedArray", bitmasklength);
         return awkward_BitMaskedArray_to_ByteMaskedArray(
           tobytemask,
           frombitmask,
@@ -13624,6 +14965,7 @@ namespace awkward {
       bool validwhen,
       bool lsb_order) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_BitMaskedArray_to_IndexedOptionArray64", bitmasklength);
         return awkward_BitMaskedArray_to_IndexedOptionArray64(
           toindex,
           frombitmask,
@@ -13652,6 +14994,7 @@ namespace awkward {
       int64_t lenparents,
       int64_t outlength) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_reduce_count_64", lenparents);
         return awkward_reduce_count_64(
           toptr,
           parents,
@@ -13679,6 +15022,7 @@ namespace awkward {
       int64_t lenparents,
       int64_t outlength) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_reduce_countnonzero_bool_64", lenparents);
         return awkward_reduce_countnonzero_bool_64(
           toptr,
           fromptr,
@@ -13707,6 +15051,7 @@ namespace awkward {
       int64_t lenparents,
       int64_t outlength) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_reduce_countnonzero_uint8_64", lenparents);
         return awkward_reduce_countnonzero_uint8_64(
           toptr,
           fromptr,
@@ -13735,6 +15080,7 @@ namespace awkward {
       int64_t lenparents,
       int64_t outlength) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_reduce_countnonzero_int8_64", lenparents);
         return awkward_reduce_countnonzero_int8_64(
           toptr,
           fromptr,
@@ -13763,6 +15109,7 @@ namespace awkward {
       int64_t lenparents,
       int64_t outlength) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_reduce_countnonzero_int16_64", lenparents);
         return awkward_reduce_countnonzero_int16_64(
           toptr,
           fromptr,
@@ -13791,6 +15138,7 @@ namespace awkward {
       int64_t lenparents,
       int64_t outlength) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_reduce_countnonzero_uint16_64", lenparents);
         return awkward_reduce_countnonzero_uint16_64(
           toptr,
           fromptr,
@@ -13819,6 +15167,7 @@ namespace awkward {
       int64_t lenparents,
       int64_t outlength) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_reduce_countnonzero_int32_64", lenparents);
         return awkward_reduce_countnonzero_int32_64(
           toptr,
           fromptr,
@@ -13847,6 +15196,7 @@ namespace awkward {
       int64_t lenparents,
       int64_t outlength) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_reduce_countnonzero_uint32_64", lenparents);
         return awkward_reduce_countnonzero_uint32_64(
           toptr,
           fromptr,
@@ -13875,6 +15225,7 @@ namespace awkward {
       int64_t lenparents,
       int64_t outlength) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_reduce_countnonzero_int64_64", lenparents);
         return awkward_reduce_countnonzero_int64_64(
           toptr,
           fromptr,
@@ -13903,6 +15254,7 @@ namespace awkward {
       int64_t lenparents,
       int64_t outlength) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_reduce_countnonzero_uint64_64", lenparents);
         return awkward_reduce_countnonzero_uint64_64(
           toptr,
           fromptr,
@@ -13931,6 +15283,7 @@ namespace awkward {
       int64_t lenparents,
       int64_t outlength) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_reduce_countnonzero_float32_64", lenparents);
         return awkward_reduce_countnonzero_float32_64(
           toptr,
           fromptr,
@@ -13959,6 +15312,7 @@ namespace awkward {
       int64_t lenparents,
       int64_t outlength) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_reduce_countnonzero_float64_64", lenparents);
         return awkward_reduce_countnonzero_float64_64(
           toptr,
           fromptr,
@@ -13987,6 +15341,7 @@ namespace awkward {
       int64_t lenparents,
       int64_t outlength) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_reduce_countnonzero_complex64_64", lenparents);
         return awkward_reduce_countnonzero_complex64_64(
           toptr,
           reinterpret_cast<const float*>(fromptr),
@@ -14015,6 +15370,7 @@ namespace awkward {
       int64_t lenparents,
       int64_t outlength) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_reduce_countnonzero_complex128_64", lenparents);
         return awkward_reduce_countnonzero_complex128_64(
           toptr,
           reinterpret_cast<const double*>(fromptr),
@@ -14043,6 +15399,7 @@ namespace awkward {
       int64_t lenparents,
       int64_t outlength) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_reduce_sum_int64_bool_64", lenparents);
         return awkward_reduce_sum_int64_bool_64(
           toptr,
           fromptr,
@@ -14071,6 +15428,7 @@ namespace awkward {
       int64_t lenparents,
       int64_t outlength) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_reduce_sum_int64_int8_64", lenparents);
         return awkward_reduce_sum_int64_int8_64(
           toptr,
           fromptr,
@@ -14099,6 +15457,7 @@ namespace awkward {
       int64_t lenparents,
       int64_t outlength) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_reduce_sum_uint64_uint8_64", lenparents);
         return awkward_reduce_sum_uint64_uint8_64(
           toptr,
           fromptr,
@@ -14127,6 +15486,7 @@ namespace awkward {
       int64_t lenparents,
       int64_t outlength) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_reduce_sum_int64_int16_64", lenparents);
         return awkward_reduce_sum_int64_int16_64(
           toptr,
           fromptr,
@@ -14155,6 +15515,7 @@ namespace awkward {
       int64_t lenparents,
       int64_t outlength) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_reduce_sum_uint64_uint16_64", lenparents);
         return awkward_reduce_sum_uint64_uint16_64(
           toptr,
           fromptr,
@@ -14183,6 +15544,7 @@ namespace awkward {
       int64_t lenparents,
       int64_t outlength) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_reduce_sum_int64_int32_64", lenparents);
         return awkward_reduce_sum_int64_int32_64(
           toptr,
           fromptr,
@@ -14211,6 +15573,7 @@ namespace awkward {
       int64_t lenparents,
       int64_t outlength) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_reduce_sum_uint64_uint32_64", lenparents);
         return awkward_reduce_sum_uint64_uint32_64(
           toptr,
           fromptr,
@@ -14239,6 +15602,7 @@ namespace awkward {
       int64_t lenparents,
       int64_t outlength) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_reduce_sum_int64_int64_64", lenparents);
         return awkward_reduce_sum_int64_int64_64(
           toptr,
           fromptr,
@@ -14267,6 +15631,7 @@ namespace awkward {
       int64_t lenparents,
       int64_t outlength) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_reduce_sum_uint64_uint64_64", lenparents);
         return awkward_reduce_sum_uint64_uint64_64(
           toptr,
           fromptr,
@@ -14295,6 +15660,7 @@ namespace awkward {
       int64_t lenparents,
       int64_t outlength) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_reduce_sum_float32_float32_64", lenparents);
         return awkward_reduce_sum_float32_float32_64(
           toptr,
           fromptr,
@@ -14323,6 +15689,7 @@ namespace awkward {
       int64_t lenparents,
       int64_t outlength) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_reduce_sum_complex64_complex64_64", lenparents);
         return awkward_reduce_sum_complex64_complex64_64(
           reinterpret_cast<float*>(toptr),
           reinterpret_cast<const float*>(fromptr),
@@ -14351,6 +15718,7 @@ namespace awkward {
       int64_t lenparents,
       int64_t outlength) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_reduce_sum_complex128_complex128_64", lenparents);
         return awkward_reduce_sum_complex128_complex128_64(
           reinterpret_cast<double*>(toptr),
           reinterpret_cast<const double*>(fromptr),
@@ -14379,6 +15747,7 @@ namespace awkward {
       int64_t lenparents,
       int64_t outlength) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_reduce_sum_float64_float64_64", lenparents);
         return awkward_reduce_sum_float64_float64_64(
           toptr,
           fromptr,
@@ -14407,6 +15776,7 @@ namespace awkward {
       int64_t lenparents,
       int64_t outlength) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_reduce_sum_int32_bool_64", lenparents);
         return awkward_reduce_sum_int32_bool_64(
           toptr,
           fromptr,
@@ -14435,6 +15805,7 @@ namespace awkward {
       int64_t lenparents,
       int64_t outlength) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_reduce_sum_int32_int8_64", lenparents);
         return awkward_reduce_sum_int32_int8_64(
           toptr,
           fromptr,
@@ -14463,6 +15834,7 @@ namespace awkward {
       int64_t lenparents,
       int64_t outlength) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_reduce_sum_uint32_uint8_64", lenparents);
         return awkward_reduce_sum_uint32_uint8_64(
           toptr,
           fromptr,
@@ -14491,6 +15863,7 @@ namespace awkward {
       int64_t lenparents,
       int64_t outlength) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_reduce_sum_int32_int16_64", lenparents);
         return awkward_reduce_sum_int32_int16_64(
           toptr,
           fromptr,
@@ -14519,6 +15892,7 @@ namespace awkward {
       int64_t lenparents,
       int64_t outlength) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_reduce_sum_uint32_uint16_64", lenparents);
         return awkward_reduce_sum_uint32_uint16_64(
           toptr,
           fromptr,
@@ -14547,6 +15921,7 @@ namespace awkward {
       int64_t lenparents,
       int64_t outlength) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_reduce_sum_int32_int32_64", lenparents);
         return awkward_reduce_sum_int32_int32_64(
           toptr,
           fromptr,
@@ -14575,6 +15950,7 @@ namespace awkward {
       int64_t lenparents,
       int64_t outlength) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_reduce_sum_uint32_uint32_64", lenparents);
         return awkward_reduce_sum_uint32_uint32_64(
           toptr,
           fromptr,
@@ -14603,6 +15979,7 @@ namespace awkward {
       int64_t lenparents,
       int64_t outlength) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_reduce_sum_bool_bool_64", lenparents);
         return awkward_reduce_sum_bool_bool_64(
           toptr,
           fromptr,
@@ -14631,6 +16008,7 @@ namespace awkward {
       int64_t lenparents,
       int64_t outlength) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_reduce_sum_bool_int8_64", lenparents);
         return awkward_reduce_sum_bool_int8_64(
           toptr,
           fromptr,
@@ -14659,6 +16037,7 @@ namespace awkward {
       int64_t lenparents,
       int64_t outlength) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_reduce_sum_bool_uint8_64", lenparents);
         return awkward_reduce_sum_bool_uint8_64(
           toptr,
           fromptr,
@@ -14687,6 +16066,7 @@ namespace awkward {
       int64_t lenparents,
       int64_t outlength) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_reduce_sum_bool_int16_64", lenparents);
         return awkward_reduce_sum_bool_int16_64(
           toptr,
           fromptr,
@@ -14715,6 +16095,7 @@ namespace awkward {
       int64_t lenparents,
       int64_t outlength) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_reduce_sum_bool_uint16_64", lenparents);
         return awkward_reduce_sum_bool_uint16_64(
           toptr,
           fromptr,
@@ -14743,6 +16124,7 @@ namespace awkward {
       int64_t lenparents,
       int64_t outlength) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_reduce_sum_bool_int32_64", lenparents);
         return awkward_reduce_sum_bool_int32_64(
           toptr,
           fromptr,
@@ -14771,6 +16153,7 @@ namespace awkward {
       int64_t lenparents,
       int64_t outlength) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_reduce_sum_bool_uint32_64", lenparents);
         return awkward_reduce_sum_bool_uint32_64(
           toptr,
           fromptr,
@@ -14799,6 +16182,7 @@ namespace awkward {
       int64_t lenparents,
       int64_t outlength) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_reduce_sum_bool_int64_64", lenparents);
         return awkward_reduce_sum_bool_int64_64(
           toptr,
           fromptr,
@@ -14827,6 +16211,7 @@ namespace awkward {
       int64_t lenparents,
       int64_t outlength) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_reduce_sum_bool_uint64_64", lenparents);
         return awkward_reduce_sum_bool_uint64_64(
           toptr,
           fromptr,
@@ -14855,6 +16240,7 @@ namespace awkward {
       int64_t lenparents,
       int64_t outlength) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_reduce_sum_bool_float32_64", lenparents);
         return awkward_reduce_sum_bool_float32_64(
           toptr,
           fromptr,
@@ -14883,6 +16269,7 @@ namespace awkward {
       int64_t lenparents,
       int64_t outlength) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_reduce_sum_bool_float64_64", lenparents);
         return awkward_reduce_sum_bool_float64_64(
           toptr,
           fromptr,
@@ -14911,6 +16298,7 @@ namespace awkward {
       int64_t lenparents,
       int64_t outlength) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_reduce_sum_bool_complex64_64", lenparents);
         return awkward_reduce_sum_bool_complex64_64(
           toptr,
           reinterpret_cast<const float*>(fromptr),
@@ -14939,6 +16327,7 @@ namespace awkward {
       int64_t lenparents,
       int64_t outlength) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_reduce_sum_bool_complex128_64", lenparents);
         return awkward_reduce_sum_bool_complex128_64(
           toptr,
           reinterpret_cast<const double*>(fromptr),
@@ -14967,6 +16356,7 @@ namespace awkward {
       int64_t lenparents,
       int64_t outlength) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_reduce_prod_int64_bool_64", lenparents);
         return awkward_reduce_prod_int64_bool_64(
           toptr,
           fromptr,
@@ -14995,6 +16385,7 @@ namespace awkward {
       int64_t lenparents,
       int64_t outlength) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_reduce_prod_int64_int8_64", lenparents);
         return awkward_reduce_prod_int64_int8_64(
           toptr,
           fromptr,
@@ -15023,6 +16414,7 @@ namespace awkward {
       int64_t lenparents,
       int64_t outlength) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_reduce_prod_uint64_uint8_64", lenparents);
         return awkward_reduce_prod_uint64_uint8_64(
           toptr,
           fromptr,
@@ -15051,6 +16443,7 @@ namespace awkward {
       int64_t lenparents,
       int64_t outlength) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_reduce_prod_int64_int16_64", lenparents);
         return awkward_reduce_prod_int64_int16_64(
           toptr,
           fromptr,
@@ -15079,6 +16472,7 @@ namespace awkward {
       int64_t lenparents,
       int64_t outlength) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_reduce_prod_uint64_uint16_64", lenparents);
         return awkward_reduce_prod_uint64_uint16_64(
           toptr,
           fromptr,
@@ -15107,6 +16501,7 @@ namespace awkward {
       int64_t lenparents,
       int64_t outlength) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_reduce_prod_int64_int32_64", lenparents);
         return awkward_reduce_prod_int64_int32_64(
           toptr,
           fromptr,
@@ -15135,6 +16530,7 @@ namespace awkward {
       int64_t lenparents,
       int64_t outlength) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_reduce_prod_uint64_uint32_64", lenparents);
         return awkward_reduce_prod_uint64_uint32_64(
           toptr,
           fromptr,
@@ -15163,6 +16559,7 @@ namespace awkward {
       int64_t lenparents,
       int64_t outlength) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_reduce_prod_int64_int64_64", lenparents);
         return awkward_reduce_prod_int64_int64_64(
           toptr,
           fromptr,
@@ -15191,6 +16588,7 @@ namespace awkward {
       int64_t lenparents,
       int64_t outlength) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_reduce_prod_uint64_uint64_64", lenparents);
         return awkward_reduce_prod_uint64_uint64_64(
           toptr,
           fromptr,
@@ -15219,6 +16617,7 @@ namespace awkward {
       int64_t lenparents,
       int64_t outlength) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_reduce_prod_float32_float32_64", lenparents);
         return awkward_reduce_prod_float32_float32_64(
           toptr,
           fromptr,
@@ -15247,6 +16646,7 @@ namespace awkward {
       int64_t lenparents,
       int64_t outlength) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_reduce_prod_float64_float64_64", lenparents);
         return awkward_reduce_prod_float64_float64_64(
           toptr,
           fromptr,
@@ -15274,6 +16674,7 @@ namespace awkward {
       int64_t lenparents,
       int64_t outlength) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_reduce_prod_complex64_complex64_64", lenparents);
         return awkward_reduce_prod_complex64_complex64_64(
           reinterpret_cast<float*>(toptr),
           reinterpret_cast<const float*>(fromptr),
@@ -15302,6 +16703,7 @@ namespace awkward {
       int64_t lenparents,
       int64_t outlength) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_reduce_prod_complex128_complex128_64", lenparents);
         return awkward_reduce_prod_complex128_complex128_64(
           reinterpret_cast<double*>(toptr),
           reinterpret_cast<const double*>(fromptr),
@@ -15330,6 +16732,7 @@ namespace awkward {
       int64_t lenparents,
       int64_t outlength) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_reduce_prod_int32_bool_64", lenparents);
         return awkward_reduce_prod_int32_bool_64(
           toptr,
           fromptr,
@@ -15358,6 +16761,7 @@ namespace awkward {
       int64_t lenparents,
       int64_t outlength) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_reduce_prod_int32_int8_64", lenparents);
         return awkward_reduce_prod_int32_int8_64(
           toptr,
           fromptr,
@@ -15386,6 +16790,7 @@ namespace awkward {
       int64_t lenparents,
       int64_t outlength) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_reduce_prod_uint32_uint8_64", lenparents);
         return awkward_reduce_prod_uint32_uint8_64(
           toptr,
           fromptr,
@@ -15414,6 +16819,7 @@ namespace awkward {
       int64_t lenparents,
       int64_t outlength) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_reduce_prod_int32_int16_64", lenparents);
         return awkward_reduce_prod_int32_int16_64(
           toptr,
           fromptr,
@@ -15442,6 +16848,7 @@ namespace awkward {
       int64_t lenparents,
       int64_t outlength) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_reduce_prod_uint32_uint16_64", lenparents);
         return awkward_reduce_prod_uint32_uint16_64(
           toptr,
           fromptr,
@@ -15470,6 +16877,7 @@ namespace awkward {
       int64_t lenparents,
       int64_t outlength) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_reduce_prod_int32_int32_64", lenparents);
         return awkward_reduce_prod_int32_int32_64(
           toptr,
           fromptr,
@@ -15498,6 +16906,7 @@ namespace awkward {
       int64_t lenparents,
       int64_t outlength) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_reduce_prod_uint32_uint32_64", lenparents);
         return awkward_reduce_prod_uint32_uint32_64(
           toptr,
           fromptr,
@@ -15526,6 +16935,7 @@ namespace awkward {
       int64_t lenparents,
       int64_t outlength) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_reduce_prod_bool_bool_64", lenparents);
         return awkward_reduce_prod_bool_bool_64(
           toptr,
           fromptr,
@@ -15554,6 +16964,7 @@ namespace awkward {
       int64_t lenparents,
       int64_t outlength) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_reduce_prod_bool_int8_64", lenparents);
         return awkward_reduce_prod_bool_int8_64(
           toptr,
           fromptr,
@@ -15582,6 +16993,7 @@ namespace awkward {
       int64_t lenparents,
       int64_t outlength) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_reduce_prod_bool_uint8_64", lenparents);
         return awkward_reduce_prod_bool_uint8_64(
           toptr,
           fromptr,
@@ -15610,6 +17022,7 @@ namespace awkward {
       int64_t lenparents,
       int64_t outlength) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_reduce_prod_bool_int16_64", lenparents);
         return awkward_reduce_prod_bool_int16_64(
           toptr,
           fromptr,
@@ -15638,6 +17051,7 @@ namespace awkward {
       int64_t lenparents,
       int64_t outlength) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_reduce_prod_bool_uint16_64", lenparents);
         return awkward_reduce_prod_bool_uint16_64(
           toptr,
           fromptr,
@@ -15666,6 +17080,7 @@ namespace awkward {
       int64_t lenparents,
       int64_t outlength) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_reduce_prod_bool_int32_64", lenparents);
         return awkward_reduce_prod_bool_int32_64(
           toptr,
           fromptr,
@@ -15694,6 +17109,7 @@ namespace awkward {
       int64_t lenparents,
       int64_t outlength) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_reduce_prod_bool_uint32_64", lenparents);
         return awkward_reduce_prod_bool_uint32_64(
           toptr,
           fromptr,
@@ -15722,6 +17138,7 @@ namespace awkward {
       int64_t lenparents,
       int64_t outlength) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_reduce_prod_bool_int64_64", lenparents);
         return awkward_reduce_prod_bool_int64_64(
           toptr,
           fromptr,
@@ -15750,6 +17167,7 @@ namespace awkward {
       int64_t lenparents,
       int64_t outlength) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_reduce_prod_bool_uint64_64", lenparents);
         return awkward_reduce_prod_bool_uint64_64(
           toptr,
           fromptr,
@@ -15778,6 +17196,7 @@ namespace awkward {
       int64_t lenparents,
       int64_t outlength) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_reduce_prod_bool_float32_64", lenparents);
         return awkward_reduce_prod_bool_float32_64(
           toptr,
           fromptr,
@@ -15806,6 +17225,7 @@ namespace awkward {
       int64_t lenparents,
       int64_t outlength) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_reduce_prod_bool_float64_64", lenparents);
         return awkward_reduce_prod_bool_float64_64(
           toptr,
           fromptr,
@@ -15834,6 +17254,7 @@ namespace awkward {
       int64_t lenparents,
       int64_t outlength) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_reduce_prod_bool_complex64_64", lenparents);
         return awkward_reduce_prod_bool_complex64_64(
           toptr,
           reinterpret_cast<const float*>(fromptr),
@@ -15862,6 +17283,7 @@ namespace awkward {
       int64_t lenparents,
       int64_t outlength) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_reduce_prod_bool_complex128_64", lenparents);
         return awkward_reduce_prod_bool_complex128_64(
           toptr,
           reinterpret_cast<const double*>(fromptr),
@@ -15891,6 +17313,7 @@ namespace awkward {
       int64_t outlength,
       int8_t identity) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_reduce_min_int8_int8_64", lenparents);
         return awkward_reduce_min_int8_int8_64(
           toptr,
           fromptr,
@@ -15921,6 +17344,7 @@ namespace awkward {
       int64_t outlength,
       uint8_t identity) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_reduce_min_uint8_uint8_64", lenparents);
         return awkward_reduce_min_uint8_uint8_64(
           toptr,
           fromptr,
@@ -15951,6 +17375,7 @@ namespace awkward {
       int64_t outlength,
       int16_t identity) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_reduce_min_int16_int16_64", lenparents);
         return awkward_reduce_min_int16_int16_64(
           toptr,
           fromptr,
@@ -15981,6 +17406,7 @@ namespace awkward {
       int64_t outlength,
       uint16_t identity) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_reduce_min_uint16_uint16_64", lenparents);
         return awkward_reduce_min_uint16_uint16_64(
           toptr,
           fromptr,
@@ -16011,6 +17437,7 @@ namespace awkward {
       int64_t outlength,
       int32_t identity) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_reduce_min_int32_int32_64", lenparents);
         return awkward_reduce_min_int32_int32_64(
           toptr,
           fromptr,
@@ -16041,6 +17468,7 @@ namespace awkward {
       int64_t outlength,
       uint32_t identity) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_reduce_min_uint32_uint32_64", lenparents);
         return awkward_reduce_min_uint32_uint32_64(
           toptr,
           fromptr,
@@ -16071,6 +17499,7 @@ namespace awkward {
       int64_t outlength,
       int64_t identity) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_reduce_min_int64_int64_64", lenparents);
         return awkward_reduce_min_int64_int64_64(
           toptr,
           fromptr,
@@ -16101,6 +17530,7 @@ namespace awkward {
       int64_t outlength,
       uint64_t identity) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_reduce_min_uint64_uint64_64", lenparents);
         return awkward_reduce_min_uint64_uint64_64(
           toptr,
           fromptr,
@@ -16131,6 +17561,7 @@ namespace awkward {
       int64_t outlength,
       float identity) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_reduce_min_float32_float32_64", lenparents);
         return awkward_reduce_min_float32_float32_64(
           toptr,
           fromptr,
@@ -16161,6 +17592,7 @@ namespace awkward {
       int64_t outlength,
       double identity) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_reduce_min_float64_float64_64", lenparents);
         return awkward_reduce_min_float64_float64_64(
           toptr,
           fromptr,
@@ -16191,6 +17623,7 @@ namespace awkward {
       int64_t outlength,
       std::complex<float> identity) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_reduce_min_complex64_complex64_64", lenparents);
         return awkward_reduce_min_complex64_complex64_64(
           reinterpret_cast<float*>(toptr),
           reinterpret_cast<const float*>(fromptr),
@@ -16221,6 +17654,7 @@ namespace awkward {
       int64_t outlength,
       std::complex<double> identity) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_reduce_min_complex128_complex128_64", lenparents);
         return awkward_reduce_min_complex128_complex128_64(
           reinterpret_cast<double*>(toptr),
           reinterpret_cast<const double*>(fromptr),
@@ -16251,6 +17685,7 @@ namespace awkward {
       int64_t outlength,
       int8_t identity) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_reduce_max_int8_int8_64", lenparents);
         return awkward_reduce_max_int8_int8_64(
           toptr,
           fromptr,
@@ -16281,6 +17716,7 @@ namespace awkward {
       int64_t outlength,
       uint8_t identity) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_reduce_max_uint8_uint8_64", lenparents);
         return awkward_reduce_max_uint8_uint8_64(
           toptr,
           fromptr,
@@ -16311,6 +17747,7 @@ namespace awkward {
       int64_t outlength,
       int16_t identity) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_reduce_max_int16_int16_64", lenparents);
         return awkward_reduce_max_int16_int16_64(
           toptr,
           fromptr,
@@ -16341,6 +17778,7 @@ namespace awkward {
       int64_t outlength,
       uint16_t identity) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_reduce_max_uint16_uint16_64", lenparents);
         return awkward_reduce_max_uint16_uint16_64(
           toptr,
           fromptr,
@@ -16371,6 +17809,7 @@ namespace awkward {
       int64_t outlength,
       int32_t identity) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_reduce_max_int32_int32_64", lenparents);
         return awkward_reduce_max_int32_int32_64(
           toptr,
           fromptr,
@@ -16401,6 +17840,7 @@ namespace awkward {
       int64_t outlength,
       uint32_t identity) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_reduce_max_uint32_uint32_64", lenparents);
         return awkward_reduce_max_uint32_uint32_64(
           toptr,
           fromptr,
@@ -16431,6 +17871,7 @@ namespace awkward {
       int64_t outlength,
       int64_t identity) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_reduce_max_int64_int64_64", lenparents);
         return awkward_reduce_max_int64_int64_64(
           toptr,
           fromptr,
@@ -16461,6 +17902,7 @@ namespace awkward {
       int64_t outlength,
       uint64_t identity) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_reduce_max_uint64_uint64_64", lenparents);
         return awkward_reduce_max_uint64_uint64_64(
           toptr,
           fromptr,
@@ -16491,6 +17933,7 @@ namespace awkward {
       int64_t outlength,
       float identity) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_reduce_max_float32_float32_64", lenparents);
         return awkward_reduce_max_float32_float32_64(
           toptr,
           fromptr,
@@ -16521,6 +17964,7 @@ namespace awkward {
       int64_t outlength,
       double identity) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_reduce_max_float64_float64_64", lenparents);
         return awkward_reduce_max_float64_float64_64(
           toptr,
           fromptr,
@@ -16551,6 +17995,7 @@ namespace awkward {
       int64_t outlength,
       std::complex<float> identity) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_reduce_max_complex64_complex64_64", lenparents);
         return awkward_reduce_max_complex64_complex64_64(
           reinterpret_cast<float*>(toptr),
           reinterpret_cast<const float*>(fromptr),
@@ -16581,6 +18026,7 @@ namespace awkward {
       int64_t outlength,
       std::complex<double> identity) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_reduce_max_complex128_complex128_64", lenparents);
         return awkward_reduce_max_complex128_complex128_64(
           reinterpret_cast<double*>(toptr),
           reinterpret_cast<const double*>(fromptr),
@@ -16610,6 +18056,7 @@ namespace awkward {
       int64_t lenparents,
       int64_t outlength) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_reduce_argmin_bool_64", lenparents);
         return awkward_reduce_argmin_bool_64(
           toptr,
           fromptr,
@@ -16638,6 +18085,7 @@ namespace awkward {
       int64_t lenparents,
       int64_t outlength) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_reduce_argmin_int8_64", lenparents);
         return awkward_reduce_argmin_int8_64(
           toptr,
           fromptr,
@@ -16666,6 +18114,7 @@ namespace awkward {
       int64_t lenparents,
       int64_t outlength) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_reduce_argmin_uint8_64", lenparents);
         return awkward_reduce_argmin_uint8_64(
           toptr,
           fromptr,
@@ -16694,6 +18143,7 @@ namespace awkward {
       int64_t lenparents,
       int64_t outlength) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_reduce_argmin_int16_64", lenparents);
         return awkward_reduce_argmin_int16_64(
           toptr,
           fromptr,
@@ -16722,6 +18172,7 @@ namespace awkward {
       int64_t lenparents,
       int64_t outlength) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_reduce_argmin_uint16_64", lenparents);
         return awkward_reduce_argmin_uint16_64(
           toptr,
           fromptr,
@@ -16750,6 +18201,7 @@ namespace awkward {
       int64_t lenparents,
       int64_t outlength) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_reduce_argmin_int32_64", lenparents);
         return awkward_reduce_argmin_int32_64(
           toptr,
           fromptr,
@@ -16778,6 +18230,7 @@ namespace awkward {
       int64_t lenparents,
       int64_t outlength) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_reduce_argmin_uint32_64", lenparents);
         return awkward_reduce_argmin_uint32_64(
           toptr,
           fromptr,
@@ -16806,6 +18259,7 @@ namespace awkward {
       int64_t lenparents,
       int64_t outlength) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_reduce_argmin_int64_64", lenparents);
         return awkward_reduce_argmin_int64_64(
           toptr,
           fromptr,
@@ -16834,6 +18288,7 @@ namespace awkward {
       int64_t lenparents,
       int64_t outlength) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_reduce_argmin_uint64_64", lenparents);
         return awkward_reduce_argmin_uint64_64(
           toptr,
           fromptr,
@@ -16862,6 +18317,7 @@ namespace awkward {
       int64_t lenparents,
       int64_t outlength) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_reduce_argmin_float32_64", lenparents);
         return awkward_reduce_argmin_float32_64(
           toptr,
           fromptr,
@@ -16890,6 +18346,7 @@ namespace awkward {
       int64_t lenparents,
       int64_t outlength) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_reduce_argmin_float64_64", lenparents);
         return awkward_reduce_argmin_float64_64(
           toptr,
           fromptr,
@@ -16918,6 +18375,7 @@ namespace awkward {
       int64_t lenparents,
       int64_t outlength) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_reduce_argmin_complex64_64", lenparents);
         return awkward_reduce_argmin_complex64_64(
           toptr,
           reinterpret_cast<const float*>(fromptr),
@@ -16946,6 +18404,7 @@ namespace awkward {
       int64_t lenparents,
       int64_t outlength) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_reduce_argmin_complex128_64", lenparents);
         return awkward_reduce_argmin_complex128_64(
           toptr,
           reinterpret_cast<const double*>(fromptr),
@@ -16974,6 +18433,7 @@ namespace awkward {
       int64_t lenparents,
       int64_t outlength) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_reduce_argmax_bool_64", lenparents);
         return awkward_reduce_argmax_bool_64(
           toptr,
           fromptr,
@@ -17002,6 +18462,7 @@ namespace awkward {
       int64_t lenparents,
       int64_t outlength) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_reduce_argmax_int8_64", lenparents);
         return awkward_reduce_argmax_int8_64(
           toptr,
           fromptr,
@@ -17030,6 +18491,7 @@ namespace awkward {
       int64_t lenparents,
       int64_t outlength) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_reduce_argmax_uint8_64", lenparents);
         return awkward_reduce_argmax_uint8_64(
           toptr,
           fromptr,
@@ -17058,6 +18520,7 @@ namespace awkward {
       int64_t lenparents,
       int64_t outlength) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_reduce_argmax_int16_64", lenparents);
         return awkward_reduce_argmax_int16_64(
           toptr,
           fromptr,
@@ -17086,6 +18549,7 @@ namespace awkward {
       int64_t lenparents,
       int64_t outlength) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_reduce_argmax_uint16_64", lenparents);
         return awkward_reduce_argmax_uint16_64(
           toptr,
           fromptr,
@@ -17114,6 +18578,7 @@ namespace awkward {
       int64_t lenparents,
       int64_t outlength) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_reduce_argmax_int32_64", lenparents);
         return awkward_reduce_argmax_int32_64(
           toptr,
           fromptr,
@@ -17142,6 +18607,7 @@ namespace awkward {
       int64_t lenparents,
       int64_t outlength) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_reduce_argmax_uint32_64", lenparents);
         return awkward_reduce_argmax_uint32_64(
           toptr,
           fromptr,
@@ -17170,6 +18636,7 @@ namespace awkward {
       int64_t lenparents,
       int64_t outlength) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_reduce_argmax_int64_64", lenparents);
         return awkward_reduce_argmax_int64_64(
           toptr,
           fromptr,
@@ -17198,6 +18665,7 @@ namespace awkward {
       int64_t lenparents,
       int64_t outlength) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_reduce_argmax_uint64_64", lenparents);
         return awkward_reduce_argmax_uint64_64(
           toptr,
           fromptr,
@@ -17226,6 +18694,7 @@ namespace awkward {
       int64_t lenparents,
       int64_t outlength) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_reduce_argmax_float32_64", lenparents);
         return awkward_reduce_argmax_float32_64(
           toptr,
           fromptr,
@@ -17254,6 +18723,7 @@ namespace awkward {
       int64_t lenparents,
       int64_t outlength) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_reduce_argmax_float64_64", lenparents);
         return awkward_reduce_argmax_float64_64(
           toptr,
           fromptr,
@@ -17282,6 +18752,7 @@ namespace awkward {
       int64_t lenparents,
       int64_t outlength) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_reduce_argmax_complex64_64", lenparents);
         return awkward_reduce_argmax_complex64_64(
           toptr,
           reinterpret_cast<const float*>(fromptr),
@@ -17310,6 +18781,7 @@ namespace awkward {
       int64_t lenparents,
       int64_t outlength) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_reduce_argmax_complex128_64", lenparents);
         return awkward_reduce_argmax_complex128_64(
           toptr,
           reinterpret_cast<const double*>(fromptr),
@@ -17334,6 +18806,7 @@ namespace awkward {
       int64_t *toparents,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_content_reduce_zeroparents_64", length);
         return awkward_content_reduce_zeroparents_64(
           toparents,
           length);
@@ -17358,6 +18831,7 @@ namespace awkward {
       const int64_t *offsets,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_ListOffsetArray_reduce_global_startstop_64", length);
         return awkward_ListOffsetArray_reduce_global_startstop_64(
           globalstart,
           globalstop,
@@ -17386,6 +18860,7 @@ namespace awkward {
       const int64_t *offsets,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_ListOffsetArray_reduce_nonlocal_maxcount_offsetscopy_64", length);
         return awkward_ListOffsetArray_reduce_nonlocal_maxcount_offsetscopy_64(
           maxcount,
           offsetscopy,
@@ -17421,6 +18896,7 @@ namespace awkward {
       const int64_t *parents,
       int64_t maxcount) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_ListOffsetArray_reduce_nonlocal_preparenext_64", length);
         return awkward_ListOffsetArray_reduce_nonlocal_preparenext_64(
           nextcarry,
           nextparents,
@@ -17452,6 +18928,7 @@ namespace awkward {
       const int64_t *nextparents,
       int64_t nextlen) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_ListOffsetArray_reduce_nonlocal_nextstarts_64", nextlen);
         return awkward_ListOffsetArray_reduce_nonlocal_nextstarts_64(
           nextstarts,
           nextparents,
@@ -17471,44 +18948,20 @@ namespace awkward {
       }
     }
 
-    ERROR ListOffsetArray_reduce_nonlocal_findgaps_64(
-      kernel::lib ptr_lib,
-      int64_t *gaps,
-      const int64_t *parents,
-      int64_t lenparents) {
-      if (ptr_lib == kernel::lib::cpu) {
-        return awkward_ListOffsetArray_reduce_nonlocal_findgaps_64(
-          gaps,
-          parents,
-          lenparents);
-      }
-      else if (ptr_lib == kernel::lib::cuda) {
-        throw std::runtime_error(
-          std::string("not implemented: ptr_lib == cuda_kernels for ListOffsetArray_reduce_nonlocal_findgaps_64")
-          + FILENAME(__LINE__));
-      }
-      else {
-        throw std::runtime_error(
-          std::string("unrecognized ptr_lib for ListOffsetArray_reduce_nonlocal_findgaps_64")
-          + FILENAME(__LINE__));
-      }
-    }
-
     ERROR ListOffsetArray_reduce_nonlocal_outstartsstops_64(
       kernel::lib ptr_lib,
       int64_t *outstarts,
       int64_t *outstops,
       const int64_t *distincts,
       int64_t lendistincts,
-      const int64_t *gaps,
       int64_t outlength) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_ListOffsetArray_reduce_nonlocal_outstartsstops_64", lendistincts);
         return awkward_ListOffsetArray_reduce_nonlocal_outstartsstops_64(
           outstarts,
           outstops,
           distincts,
           lendistincts,
-          gaps,
           outlength);
       }
       else if (ptr_lib == kernel::lib::cuda) {
@@ -17536,6 +18989,7 @@ namespace awkward {
       int64_t nextlen,
       const int64_t* nextcarry) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_ListOffsetArray_reduce_nonlocal_nextshifts_64", length);
         return awkward_ListOffsetArray_reduce_nonlocal_nextshifts_64(
           nummissing,
           missing,
@@ -17566,6 +19020,7 @@ namespace awkward {
       const int64_t *offsets,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_ListOffsetArray_reduce_local_nextparents_64", length);
         return awkward_ListOffsetArray_reduce_local_nextparents_64(
           nextparents,
           offsets,
@@ -17590,6 +19045,7 @@ namespace awkward {
       int64_t lenparents,
       int64_t outlength) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_ListOffsetArray_reduce_local_outoffsets_64", lenparents);
         return awkward_ListOffsetArray_reduce_local_outoffsets_64(
           outoffsets,
           parents,
@@ -17608,6 +19064,1218 @@ namespace awkward {
       }
     }
 
+    ERROR ListOffsetArray_reduce_segmented_count_64(
+      kernel::lib ptr_lib,
+      int64_t *toptr,
+      const int64_t *offsets,
+      int64_t outlength) {
+      if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_ListOffsetArray_reduce_segmented_count_64", outlength);
+        return parallel_for(
+          outlength,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_ListOffsetArray_reduce_segmented_count_64(
+              toptr + start,
+              offsets + start,
+              stop - start);
+          });
+      }
+      else if (ptr_lib == kernel::lib::cuda) {
+        throw std::runtime_error(
+          std::string("not implemented: ptr_lib == cuda_kernels for ListOffsetArray_reduce_segmented_count_64")
+          + FILENAME(__LINE__));
+      }
+      else {
+        throw std::runtime_error(
+          std::string("unrecognized ptr_lib for ListOffsetArray_reduce_segmented_count_64")
+          + FILENAME(__LINE__));
+      }
+    }
+
+    ERROR ListOffsetArray_reduce_segmented_mask_ByteMaskedArray_64(
+      kernel::lib ptr_lib,
+      int8_t *toptr,
+      const int64_t *offsets,
+      int64_t outlength) {
+      if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_ListOffsetArray_reduce_segmented_mask_ByteMaskedArray_64", outlength);
+        return parallel_for(
+          outlength,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_ListOffsetArray_reduce_segmented_mask_ByteMaskedArray_64(
+              toptr + start,
+              offsets + start,
+              stop - start);
+          });
+      }
+      else if (ptr_lib == kernel::lib::cuda) {
+        throw std::runtime_error(
+          std::string("not implemented: ptr_lib == cuda_kernels for ListOffsetArray_reduce_segmented_mask_ByteMaskedArray_64")
+          + FILENAME(__LINE__));
+      }
+      else {
+        throw std::runtime_error(
+          std::string("unrecognized ptr_lib for ListOffsetArray_reduce_segmented_mask_ByteMaskedArray_64")
+          + FILENAME(__LINE__));
+      }
+    }
+
+    template<>
+    ERROR ListOffsetArray_reduce_segmented_sum_64(
+      kernel::lib ptr_lib,
+      int32_t *toptr,
+      const int8_t *fromptr,
+      const int64_t *offsets,
+      int64_t outlength) {
+      if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_ListOffsetArray_reduce_segmented_sum_int32_int8_64", outlength);
+        return parallel_for(
+          outlength,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_ListOffsetArray_reduce_segmented_sum_int32_int8_64(
+              toptr + start,
+              fromptr,
+              offsets + start,
+              stop - start);
+          });
+      }
+      else if (ptr_lib == kernel::lib::cuda) {
+        throw std::runtime_error(
+          std::string("not implemented: ptr_lib == cuda_kernels for ListOffsetArray_reduce_segmented_sum_64")
+          + FILENAME(__LINE__));
+      }
+      else {
+        throw std::runtime_error(
+          std::string("unrecognized ptr_lib for ListOffsetArray_reduce_segmented_sum_64")
+          + FILENAME(__LINE__));
+      }
+    }
+
+    template<>
+    ERROR ListOffsetArray_reduce_segmented_sum_64(
+      kernel::lib ptr_lib,
+      int32_t *toptr,
+      const int16_t *fromptr,
+      const int64_t *offsets,
+      int64_t outlength) {
+      if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_ListOffsetArray_reduce_segmented_sum_int32_int16_64", outlength);
+        return parallel_for(
+          outlength,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_ListOffsetArray_reduce_segmented_sum_int32_int16_64(
+              toptr + start,
+              fromptr,
+              offsets + start,
+              stop - start);
+          });
+      }
+      else if (ptr_lib == kernel::lib::cuda) {
+        throw std::runtime_error(
+          std::string("not implemented: ptr_lib == cuda_kernels for ListOffsetArray_reduce_segmented_sum_64")
+          + FILENAME(__LINE__));
+      }
+      else {
+        throw std::runtime_error(
+          std::string("unrecognized ptr_lib for ListOffsetArray_reduce_segmented_sum_64")
+          + FILENAME(__LINE__));
+      }
+    }
+
+    template<>
+    ERROR ListOffsetArray_reduce_segmented_sum_64(
+      kernel::lib ptr_lib,
+      int32_t *toptr,
+      const int32_t *fromptr,
+      const int64_t *offsets,
+      int64_t outlength) {
+      if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_ListOffsetArray_reduce_segmented_sum_int32_int32_64", outlength);
+        return parallel_for(
+          outlength,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_ListOffsetArray_reduce_segmented_sum_int32_int32_64(
+              toptr + start,
+              fromptr,
+              offsets + start,
+              stop - start);
+          });
+      }
+      else if (ptr_lib == kernel::lib::cuda) {
+        throw std::runtime_error(
+          std::string("not implemented: ptr_lib == cuda_kernels for ListOffsetArray_reduce_segmented_sum_64")
+          + FILENAME(__LINE__));
+      }
+      else {
+        throw std::runtime_error(
+          std::string("unrecognized ptr_lib for ListOffsetArray_reduce_segmented_sum_64")
+          + FILENAME(__LINE__));
+      }
+    }
+
+    template<>
+    ERROR ListOffsetArray_reduce_segmented_sum_64(
+      kernel::lib ptr_lib,
+      int64_t *toptr,
+      const int8_t *fromptr,
+      const int64_t *offsets,
+      int64_t outlength) {
+      if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_ListOffsetArray_reduce_segmented_sum_int64_int8_64", outlength);
+        return parallel_for(
+          outlength,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_ListOffsetArray_reduce_segmented_sum_int64_int8_64(
+              toptr + start,
+              fromptr,
+              offsets + start,
+              stop - start);
+          });
+      }
+      else if (ptr_lib == kernel::lib::cuda) {
+        throw std::runtime_error(
+          std::string("not implemented: ptr_lib == cuda_kernels for ListOffsetArray_reduce_segmented_sum_64")
+          + FILENAME(__LINE__));
+      }
+      else {
+        throw std::runtime_error(
+          std::string("unrecognized ptr_lib for ListOffsetArray_reduce_segmented_sum_64")
+          + FILENAME(__LINE__));
+      }
+    }
+
+    template<>
+    ERROR ListOffsetArray_reduce_segmented_sum_64(
+      kernel::lib ptr_lib,
+      int64_t *toptr,
+      const int16_t *fromptr,
+      const int64_t *offsets,
+      int64_t outlength) {
+      if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_ListOffsetArray_reduce_segmented_sum_int64_int16_64", outlength);
+        return parallel_for(
+          outlength,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_ListOffsetArray_reduce_segmented_sum_int64_int16_64(
+              toptr + start,
+              fromptr,
+              offsets + start,
+              stop - start);
+          });
+      }
+      else if (ptr_lib == kernel::lib::cuda) {
+        throw std::runtime_error(
+          std::string("not implemented: ptr_lib == cuda_kernels for ListOffsetArray_reduce_segmented_sum_64")
+          + FILENAME(__LINE__));
+      }
+      else {
+        throw std::runtime_error(
+          std::string("unrecognized ptr_lib for ListOffsetArray_reduce_segmented_sum_64")
+          + FILENAME(__LINE__));
+      }
+    }
+
+    template<>
+    ERROR ListOffsetArray_reduce_segmented_sum_64(
+      kernel::lib ptr_lib,
+      int64_t *toptr,
+      const int32_t *fromptr,
+      const int64_t *offsets,
+      int64_t outlength) {
+      if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_ListOffsetArray_reduce_segmented_sum_int64_int32_64", outlength);
+        return parallel_for(
+          outlength,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_ListOffsetArray_reduce_segmented_sum_int64_int32_64(
+              toptr + start,
+              fromptr,
+              offsets + start,
+              stop - start);
+          });
+      }
+      else if (ptr_lib == kernel::lib::cuda) {
+        throw std::runtime_error(
+          std::string("not implemented: ptr_lib == cuda_kernels for ListOffsetArray_reduce_segmented_sum_64")
+          + FILENAME(__LINE__));
+      }
+      else {
+        throw std::runtime_error(
+          std::string("unrecognized ptr_lib for ListOffsetArray_reduce_segmented_sum_64")
+          + FILENAME(__LINE__));
+      }
+    }
+
+    template<>
+    ERROR ListOffsetArray_reduce_segmented_sum_64(
+      kernel::lib ptr_lib,
+      int64_t *toptr,
+      const int64_t *fromptr,
+      const int64_t *offsets,
+      int64_t outlength) {
+      if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_ListOffsetArray_reduce_segmented_sum_int64_int64_64", outlength);
+        return parallel_for(
+          outlength,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_ListOffsetArray_reduce_segmented_sum_int64_int64_64(
+              toptr + start,
+              fromptr,
+              offsets + start,
+              stop - start);
+          });
+      }
+      else if (ptr_lib == kernel::lib::cuda) {
+        throw std::runtime_error(
+          std::string("not implemented: ptr_lib == cuda_kernels for ListOffsetArray_reduce_segmented_sum_64")
+          + FILENAME(__LINE__));
+      }
+      else {
+        throw std::runtime_error(
+          std::string("unrecognized ptr_lib for ListOffsetArray_reduce_segmented_sum_64")
+          + FILENAME(__LINE__));
+      }
+    }
+
+    template<>
+    ERROR ListOffsetArray_reduce_segmented_sum_64(
+      kernel::lib ptr_lib,
+      uint32_t *toptr,
+      const uint8_t *fromptr,
+      const int64_t *offsets,
+      int64_t outlength) {
+      if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_ListOffsetArray_reduce_segmented_sum_uint32_uint8_64", outlength);
+        return parallel_for(
+          outlength,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_ListOffsetArray_reduce_segmented_sum_uint32_uint8_64(
+              toptr + start,
+              fromptr,
+              offsets + start,
+              stop - start);
+          });
+      }
+      else if (ptr_lib == kernel::lib::cuda) {
+        throw std::runtime_error(
+          std::string("not implemented: ptr_lib == cuda_kernels for ListOffsetArray_reduce_segmented_sum_64")
+          + FILENAME(__LINE__));
+      }
+      else {
+        throw std::runtime_error(
+          std::string("unrecognized ptr_lib for ListOffsetArray_reduce_segmented_sum_64")
+          + FILENAME(__LINE__));
+      }
+    }
+
+    template<>
+    ERROR ListOffsetArray_reduce_segmented_sum_64(
+      kernel::lib ptr_lib,
+      uint32_t *toptr,
+      const uint16_t *fromptr,
+      const int64_t *offsets,
+      int64_t outlength) {
+      if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_ListOffsetArray_reduce_segmented_sum_uint32_uint16_64", outlength);
+        return parallel_for(
+          outlength,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_ListOffsetArray_reduce_segmented_sum_uint32_uint16_64(
+              toptr + start,
+              fromptr,
+              offsets + start,
+              stop - start);
+          });
+      }
+      else if (ptr_lib == kernel::lib::cuda) {
+        throw std::runtime_error(
+          std::string("not implemented: ptr_lib == cuda_kernels for ListOffsetArray_reduce_segmented_sum_64")
+          + FILENAME(__LINE__));
+      }
+      else {
+        throw std::runtime_error(
+          std::string("unrecognized ptr_lib for ListOffsetArray_reduce_segmented_sum_64")
+          + FILENAME(__LINE__));
+      }
+    }
+
+    template<>
+    ERROR ListOffsetArray_reduce_segmented_sum_64(
+      kernel::lib ptr_lib,
+      uint32_t *toptr,
+      const uint32_t *fromptr,
+      const int64_t *offsets,
+      int64_t outlength) {
+      if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_ListOffsetArray_reduce_segmented_sum_uint32_uint32_64", outlength);
+        return parallel_for(
+          outlength,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_ListOffsetArray_reduce_segmented_sum_uint32_uint32_64(
+              toptr + start,
+              fromptr,
+              offsets + start,
+              stop - start);
+          });
+      }
+      else if (ptr_lib == kernel::lib::cuda) {
+        throw std::runtime_error(
+          std::string("not implemented: ptr_lib == cuda_kernels for ListOffsetArray_reduce_segmented_sum_64")
+          + FILENAME(__LINE__));
+      }
+      else {
+        throw std::runtime_error(
+          std::string("unrecognized ptr_lib for ListOffsetArray_reduce_segmented_sum_64")
+          + FILENAME(__LINE__));
+      }
+    }
+
+    template<>
+    ERROR ListOffsetArray_reduce_segmented_sum_64(
+      kernel::lib ptr_lib,
+      uint64_t *toptr,
+      const uint8_t *fromptr,
+      const int64_t *offsets,
+      int64_t outlength) {
+      if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_ListOffsetArray_reduce_segmented_sum_uint64_uint8_64", outlength);
+        return parallel_for(
+          outlength,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_ListOffsetArray_reduce_segmented_sum_uint64_uint8_64(
+              toptr + start,
+              fromptr,
+              offsets + start,
+              stop - start);
+          });
+      }
+      else if (ptr_lib == kernel::lib::cuda) {
+        throw std::runtime_error(
+          std::string("not implemented: ptr_lib == cuda_kernels for ListOffsetArray_reduce_segmented_sum_64")
+          + FILENAME(__LINE__));
+      }
+      else {
+        throw std::runtime_error(
+          std::string("unrecognized ptr_lib for ListOffsetArray_reduce_segmented_sum_64")
+          + FILENAME(__LINE__));
+      }
+    }
+
+    template<>
+    ERROR ListOffsetArray_reduce_segmented_sum_64(
+      kernel::lib ptr_lib,
+      uint64_t *toptr,
+      const uint16_t *fromptr,
+      const int64_t *offsets,
+      int64_t outlength) {
+      if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_ListOffsetArray_reduce_segmented_sum_uint64_uint16_64", outlength);
+        return parallel_for(
+          outlength,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_ListOffsetArray_reduce_segmented_sum_uint64_uint16_64(
+              toptr + start,
+              fromptr,
+              offsets + start,
+              stop - start);
+          });
+      }
+      else if (ptr_lib == kernel::lib::cuda) {
+        throw std::runtime_error(
+          std::string("not implemented: ptr_lib == cuda_kernels for ListOffsetArray_reduce_segmented_sum_64")
+          + FILENAME(__LINE__));
+      }
+      else {
+        throw std::runtime_error(
+          std::string("unrecognized ptr_lib for ListOffsetArray_reduce_segmented_sum_64")
+          + FILENAME(__LINE__));
+      }
+    }
+
+    template<>
+    ERROR ListOffsetArray_reduce_segmented_sum_64(
+      kernel::lib ptr_lib,
+      uint64_t *toptr,
+      const uint32_t *fromptr,
+      const int64_t *offsets,
+      int64_t outlength) {
+      if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_ListOffsetArray_reduce_segmented_sum_uint64_uint32_64", outlength);
+        return parallel_for(
+          outlength,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_ListOffsetArray_reduce_segmented_sum_uint64_uint32_64(
+              toptr + start,
+              fromptr,
+              offsets + start,
+              stop - start);
+          });
+      }
+      else if (ptr_lib == kernel::lib::cuda) {
+        throw std::runtime_error(
+          std::string("not implemented: ptr_lib == cuda_kernels for ListOffsetArray_reduce_segmented_sum_64")
+          + FILENAME(__LINE__));
+      }
+      else {
+        throw std::runtime_error(
+          std::string("unrecognized ptr_lib for ListOffsetArray_reduce_segmented_sum_64")
+          + FILENAME(__LINE__));
+      }
+    }
+
+    template<>
+    ERROR ListOffsetArray_reduce_segmented_sum_64(
+      kernel::lib ptr_lib,
+      uint64_t *toptr,
+      const uint64_t *fromptr,
+      const int64_t *offsets,
+      int64_t outlength) {
+      if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_ListOffsetArray_reduce_segmented_sum_uint64_uint64_64", outlength);
+        return parallel_for(
+          outlength,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_ListOffsetArray_reduce_segmented_sum_uint64_uint64_64(
+              toptr + start,
+              fromptr,
+              offsets + start,
+              stop - start);
+          });
+      }
+      else if (ptr_lib == kernel::lib::cuda) {
+        throw std::runtime_error(
+          std::string("not implemented: ptr_lib == cuda_kernels for ListOffsetArray_reduce_segmented_sum_64")
+          + FILENAME(__LINE__));
+      }
+      else {
+        throw std::runtime_error(
+          std::string("unrecognized ptr_lib for ListOffsetArray_reduce_segmented_sum_64")
+          + FILENAME(__LINE__));
+      }
+    }
+
+    template<>
+    ERROR ListOffsetArray_reduce_segmented_sum_64(
+      kernel::lib ptr_lib,
+      float *toptr,
+      const float *fromptr,
+      const int64_t *offsets,
+      int64_t outlength) {
+      if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_ListOffsetArray_reduce_segmented_sum_float32_float32_64", outlength);
+        return parallel_for(
+          outlength,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_ListOffsetArray_reduce_segmented_sum_float32_float32_64(
+              toptr + start,
+              fromptr,
+              offsets + start,
+              stop - start);
+          });
+      }
+      else if (ptr_lib == kernel::lib::cuda) {
+        throw std::runtime_error(
+          std::string("not implemented: ptr_lib == cuda_kernels for ListOffsetArray_reduce_segmented_sum_64")
+          + FILENAME(__LINE__));
+      }
+      else {
+        throw std::runtime_error(
+          std::string("unrecognized ptr_lib for ListOffsetArray_reduce_segmented_sum_64")
+          + FILENAME(__LINE__));
+      }
+    }
+
+    template<>
+    ERROR ListOffsetArray_reduce_segmented_sum_64(
+      kernel::lib ptr_lib,
+      double *toptr,
+      const double *fromptr,
+      const int64_t *offsets,
+      int64_t outlength) {
+      if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_ListOffsetArray_reduce_segmented_sum_float64_float64_64", outlength);
+        return parallel_for(
+          outlength,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_ListOffsetArray_reduce_segmented_sum_float64_float64_64(
+              toptr + start,
+              fromptr,
+              offsets + start,
+              stop - start);
+          });
+      }
+      else if (ptr_lib == kernel::lib::cuda) {
+        throw std::runtime_error(
+          std::string("not implemented: ptr_lib == cuda_kernels for ListOffsetArray_reduce_segmented_sum_64")
+          + FILENAME(__LINE__));
+      }
+      else {
+        throw std::runtime_error(
+          std::string("unrecognized ptr_lib for ListOffsetArray_reduce_segmented_sum_64")
+          + FILENAME(__LINE__));
+      }
+    }
+
+    template<>
+    ERROR ListOffsetArray_reduce_segmented_min_64(
+      kernel::lib ptr_lib,
+      int8_t *toptr,
+      const int8_t *fromptr,
+      const int64_t *offsets,
+      int64_t outlength,
+      int8_t identity) {
+      if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_ListOffsetArray_reduce_segmented_min_int8_int8_64", outlength);
+        return parallel_for(
+          outlength,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_ListOffsetArray_reduce_segmented_min_int8_int8_64(
+              toptr + start,
+              fromptr,
+              offsets + start,
+              stop - start,
+              identity);
+          });
+      }
+      else if (ptr_lib == kernel::lib::cuda) {
+        throw std::runtime_error(
+          std::string("not implemented: ptr_lib == cuda_kernels for ListOffsetArray_reduce_segmented_min_64")
+          + FILENAME(__LINE__));
+      }
+      else {
+        throw std::runtime_error(
+          std::string("unrecognized ptr_lib for ListOffsetArray_reduce_segmented_min_64")
+          + FILENAME(__LINE__));
+      }
+    }
+
+    template<>
+    ERROR ListOffsetArray_reduce_segmented_min_64(
+      kernel::lib ptr_lib,
+      uint8_t *toptr,
+      const uint8_t *fromptr,
+      const int64_t *offsets,
+      int64_t outlength,
+      uint8_t identity) {
+      if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_ListOffsetArray_reduce_segmented_min_uint8_uint8_64", outlength);
+        return parallel_for(
+          outlength,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_ListOffsetArray_reduce_segmented_min_uint8_uint8_64(
+              toptr + start,
+              fromptr,
+              offsets + start,
+              stop - start,
+              identity);
+          });
+      }
+      else if (ptr_lib == kernel::lib::cuda) {
+        throw std::runtime_error(
+          std::string("not implemented: ptr_lib == cuda_kernels for ListOffsetArray_reduce_segmented_min_64")
+          + FILENAME(__LINE__));
+      }
+      else {
+        throw std::runtime_error(
+          std::string("unrecognized ptr_lib for ListOffsetArray_reduce_segmented_min_64")
+          + FILENAME(__LINE__));
+      }
+    }
+
+    template<>
+    ERROR ListOffsetArray_reduce_segmented_min_64(
+      kernel::lib ptr_lib,
+      int16_t *toptr,
+      const int16_t *fromptr,
+      const int64_t *offsets,
+      int64_t outlength,
+      int16_t identity) {
+      if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_ListOffsetArray_reduce_segmented_min_int16_int16_64", outlength);
+        return parallel_for(
+          outlength,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_ListOffsetArray_reduce_segmented_min_int16_int16_64(
+              toptr + start,
+              fromptr,
+              offsets + start,
+              stop - start,
+              identity);
+          });
+      }
+      else if (ptr_lib == kernel::lib::cuda) {
+        throw std::runtime_error(
+          std::string("not implemented: ptr_lib == cuda_kernels for ListOffsetArray_reduce_segmented_min_64")
+          + FILENAME(__LINE__));
+      }
+      else {
+        throw std::runtime_error(
+          std::string("unrecognized ptr_lib for ListOffsetArray_reduce_segmented_min_64")
+          + FILENAME(__LINE__));
+      }
+    }
+
+    template<>
+    ERROR ListOffsetArray_reduce_segmented_min_64(
+      kernel::lib ptr_lib,
+      uint16_t *toptr,
+      const uint16_t *fromptr,
+      const int64_t *offsets,
+      int64_t outlength,
+      uint16_t identity) {
+      if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_ListOffsetArray_reduce_segmented_min_uint16_uint16_64", outlength);
+        return parallel_for(
+          outlength,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_ListOffsetArray_reduce_segmented_min_uint16_uint16_64(
+              toptr + start,
+              fromptr,
+              offsets + start,
+              stop - start,
+              identity);
+          });
+      }
+      else if (ptr_lib == kernel::lib::cuda) {
+        throw std::runtime_error(
+          std::string("not implemented: ptr_lib == cuda_kernels for ListOffsetArray_reduce_segmented_min_64")
+          + FILENAME(__LINE__));
+      }
+      else {
+        throw std::runtime_error(
+          std::string("unrecognized ptr_lib for ListOffsetArray_reduce_segmented_min_64")
+          + FILENAME(__LINE__));
+      }
+    }
+
+    template<>
+    ERROR ListOffsetArray_reduce_segmented_min_64(
+      kernel::lib ptr_lib,
+      int32_t *toptr,
+      const int32_t *fromptr,
+      const int64_t *offsets,
+      int64_t outlength,
+      int32_t identity) {
+      if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_ListOffsetArray_reduce_segmented_min_int32_int32_64", outlength);
+        return parallel_for(
+          outlength,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_ListOffsetArray_reduce_segmented_min_int32_int32_64(
+              toptr + start,
+              fromptr,
+              offsets + start,
+              stop - start,
+              identity);
+          });
+      }
+      else if (ptr_lib == kernel::lib::cuda) {
+        throw std::runtime_error(
+          std::string("not implemented: ptr_lib == cuda_kernels for ListOffsetArray_reduce_segmented_min_64")
+          + FILENAME(__LINE__));
+      }
+      else {
+        throw std::runtime_error(
+          std::string("unrecognized ptr_lib for ListOffsetArray_reduce_segmented_min_64")
+          + FILENAME(__LINE__));
+      }
+    }
+
+    template<>
+    ERROR ListOffsetArray_reduce_segmented_min_64(
+      kernel::lib ptr_lib,
+      uint32_t *toptr,
+      const uint32_t *fromptr,
+      const int64_t *offsets,
+      int64_t outlength,
+      uint32_t identity) {
+      if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_ListOffsetArray_reduce_segmented_min_uint32_uint32_64", outlength);
+        return parallel_for(
+          outlength,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_ListOffsetArray_reduce_segmented_min_uint32_uint32_64(
+              toptr + start,
+              fromptr,
+              offsets + start,
+              stop - start,
+              identity);
+          });
+      }
+      else if (ptr_lib == kernel::lib::cuda) {
+        throw std::runtime_error(
+          std::string("not implemented: ptr_lib == cuda_kernels for ListOffsetArray_reduce_segmented_min_64")
+          + FILENAME(__LINE__));
+      }
+      else {
+        throw std::runtime_error(
+          std::string("unrecognized ptr_lib for ListOffsetArray_reduce_segmented_min_64")
+          + FILENAME(__LINE__));
+      }
+    }
+
+    template<>
+    ERROR ListOffsetArray_reduce_segmented_min_64(
+      kernel::lib ptr_lib,
+      int64_t *toptr,
+      const int64_t *fromptr,
+      const int64_t *offsets,
+      int64_t outlength,
+      int64_t identity) {
+      if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_ListOffsetArray_reduce_segmented_min_int64_int64_64", outlength);
+        return parallel_for(
+          outlength,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_ListOffsetArray_reduce_segmented_min_int64_int64_64(
+              toptr + start,
+              fromptr,
+              offsets + start,
+              stop - start,
+              identity);
+          });
+      }
+      else if (ptr_lib == kernel::lib::cuda) {
+        throw std::runtime_error(
+          std::string("not implemented: ptr_lib == cuda_kernels for ListOffsetArray_reduce_segmented_min_64")
+          + FILENAME(__LINE__));
+      }
+      else {
+        throw std::runtime_error(
+          std::string("unrecognized ptr_lib for ListOffsetArray_reduce_segmented_min_64")
+          + FILENAME(__LINE__));
+      }
+    }
+
+    template<>
+    ERROR ListOffsetArray_reduce_segmented_min_64(
+      kernel::lib ptr_lib,
+      uint64_t *toptr,
+      const uint64_t *fromptr,
+      const int64_t *offsets,
+      int64_t outlength,
+      uint64_t identity) {
+      if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_ListOffsetArray_reduce_segmented_min_uint64_uint64_64", outlength);
+        return parallel_for(
+          outlength,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_ListOffsetArray_reduce_segmented_min_uint64_uint64_64(
+              toptr + start,
+              fromptr,
+              offsets + start,
+              stop - start,
+              identity);
+          });
+      }
+      else if (ptr_lib == kernel::lib::cuda) {
+        throw std::runtime_error(
+          std::string("not implemented: ptr_lib == cuda_kernels for ListOffsetArray_reduce_segmented_min_64")
+          + FILENAME(__LINE__));
+      }
+      else {
+        throw std::runtime_error(
+          std::string("unrecognized ptr_lib for ListOffsetArray_reduce_segmented_min_64")
+          + FILENAME(__LINE__));
+      }
+    }
+
+    template<>
+    ERROR ListOffsetArray_reduce_segmented_min_64(
+      kernel::lib ptr_lib,
+      float *toptr,
+      const float *fromptr,
+      const int64_t *offsets,
+      int64_t outlength,
+      float identity) {
+      if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_ListOffsetArray_reduce_segmented_min_float32_float32_64", outlength);
+        return parallel_for(
+          outlength,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_ListOffsetArray_reduce_segmented_min_float32_float32_64(
+              toptr + start,
+              fromptr,
+              offsets + start,
+              stop - start,
+              identity);
+          });
+      }
+      else if (ptr_lib == kernel::lib::cuda) {
+        throw std::runtime_error(
+          std::string("not implemented: ptr_lib == cuda_kernels for ListOffsetArray_reduce_segmented_min_64")
+          + FILENAME(__LINE__));
+      }
+      else {
+        throw std::runtime_error(
+          std::string("unrecognized ptr_lib for ListOffsetArray_reduce_segmented_min_64")
+          + FILENAME(__LINE__));
+      }
+    }
+
+    template<>
+    ERROR ListOffsetArray_reduce_segmented_min_64(
+      kernel::lib ptr_lib,
+      double *toptr,
+      const double *fromptr,
+      const int64_t *offsets,
+      int64_t outlength,
+      double identity) {
+      if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_ListOffsetArray_reduce_segmented_min_float64_float64_64", outlength);
+        return parallel_for(
+          outlength,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_ListOffsetArray_reduce_segmented_min_float64_float64_64(
+              toptr + start,
+              fromptr,
+              offsets + start,
+              stop - start,
+              identity);
+          });
+      }
+      else if (ptr_lib == kernel::lib::cuda) {
+        throw std::runtime_error(
+          std::string("not implemented: ptr_lib == cuda_kernels for ListOffsetArray_reduce_segmented_min_64")
+          + FILENAME(__LINE__));
+      }
+      else {
+        throw std::runtime_error(
+          std::string("unrecognized ptr_lib for ListOffsetArray_reduce_segmented_min_64")
+          + FILENAME(__LINE__));
+      }
+    }
+
+    template<>
+    ERROR ListOffsetArray_reduce_segmented_max_64(
+      kernel::lib ptr_lib,
+      int8_t *toptr,
+      const int8_t *fromptr,
+      const int64_t *offsets,
+      int64_t outlength,
+      int8_t identity) {
+      if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_ListOffsetArray_reduce_segmented_max_int8_int8_64", outlength);
+        return parallel_for(
+          outlength,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_ListOffsetArray_reduce_segmented_max_int8_int8_64(
+              toptr + start,
+              fromptr,
+              offsets + start,
+              stop - start,
+              identity);
+          });
+      }
+      else if (ptr_lib == kernel::lib::cuda) {
+        throw std::runtime_error(
+          std::string("not implemented: ptr_lib == cuda_kernels for ListOffsetArray_reduce_segmented_max_64")
+          + FILENAME(__LINE__));
+      }
+      else {
+        throw std::runtime_error(
+          std::string("unrecognized ptr_lib for ListOffsetArray_reduce_segmented_max_64")
+          + FILENAME(__LINE__));
+      }
+    }
+
+    template<>
+    ERROR ListOffsetArray_reduce_segmented_max_64(
+      kernel::lib ptr_lib,
+      uint8_t *toptr,
+      const uint8_t *fromptr,
+      const int64_t *offsets,
+      int64_t outlength,
+      uint8_t identity) {
+      if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_ListOffsetArray_reduce_segmented_max_uint8_uint8_64", outlength);
+        return parallel_for(
+          outlength,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_ListOffsetArray_reduce_segmented_max_uint8_uint8_64(
+              toptr + start,
+              fromptr,
+              offsets + start,
+              stop - start,
+              identity);
+          });
+      }
+      else if (ptr_lib == kernel::lib::cuda) {
+        throw std::runtime_error(
+          std::string("not implemented: ptr_lib == cuda_kernels for ListOffsetArray_reduce_segmented_max_64")
+          + FILENAME(__LINE__));
+      }
+      else {
+        throw std::runtime_error(
+          std::string("unrecognized ptr_lib for ListOffsetArray_reduce_segmented_max_64")
+          + FILENAME(__LINE__));
+      }
+    }
+
+    template<>
+    ERROR ListOffsetArray_reduce_segmented_max_64(
+      kernel::lib ptr_lib,
+      int16_t *toptr,
+      const int16_t *fromptr,
+      const int64_t *offsets,
+      int64_t outlength,
+      int16_t identity) {
+      if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_ListOffsetArray_reduce_segmented_max_int16_int16_64", outlength);
+        return parallel_for(
+          outlength,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_ListOffsetArray_reduce_segmented_max_int16_int16_64(
+              toptr + start,
+              fromptr,
+              offsets + start,
+              stop - start,
+              identity);
+          });
+      }
+      else if (ptr_lib == kernel::lib::cuda) {
+        throw std::runtime_error(
+          std::string("not implemented: ptr_lib == cuda_kernels for ListOffsetArray_reduce_segmented_max_64")
+          + FILENAME(__LINE__));
+      }
+      else {
+        throw std::runtime_error(
+          std::string("unrecognized ptr_lib for ListOffsetArray_reduce_segmented_max_64")
+          + FILENAME(__LINE__));
+      }
+    }
+
+    template<>
+    ERROR ListOffsetArray_reduce_segmented_max_64(
+      kernel::lib ptr_lib,
+      uint16_t *toptr,
+      const uint16_t *fromptr,
+      const int64_t *offsets,
+      int64_t outlength,
+      uint16_t identity) {
+      if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_ListOffsetArray_reduce_segmented_max_uint16_uint16_64", outlength);
+        return parallel_for(
+          outlength,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_ListOffsetArray_reduce_segmented_max_uint16_uint16_64(
+              toptr + start,
+              fromptr,
+              offsets + start,
+              stop - start,
+              identity);
+          });
+      }
+      else if (ptr_lib == kernel::lib::cuda) {
+        throw std::runtime_error(
+          std::string("not implemented: ptr_lib == cuda_kernels for ListOffsetArray_reduce_segmented_max_64")
+          + FILENAME(__LINE__));
+      }
+      else {
+        throw std::runtime_error(
+          std::string("unrecognized ptr_lib for ListOffsetArray_reduce_segmented_max_64")
+          + FILENAME(__LINE__));
+      }
+    }
+
+    template<>
+    ERROR ListOffsetArray_reduce_segmented_max_64(
+      kernel::lib ptr_lib,
+      int32_t *toptr,
+      const int32_t *fromptr,
+      const int64_t *offsets,
+      int64_t outlength,
+      int32_t identity) {
+      if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_ListOffsetArray_reduce_segmented_max_int32_int32_64", outlength);
+        return parallel_for(
+          outlength,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_ListOffsetArray_reduce_segmented_max_int32_int32_64(
+              toptr + start,
+              fromptr,
+              offsets + start,
+              stop - start,
+              identity);
+          });
+      }
+      else if (ptr_lib == kernel::lib::cuda) {
+        throw std::runtime_error(
+          std::string("not implemented: ptr_lib == cuda_kernels for ListOffsetArray_reduce_segmented_max_64")
+          + FILENAME(__LINE__));
+      }
+      else {
+        throw std::runtime_error(
+          std::string("unrecognized ptr_lib for ListOffsetArray_reduce_segmented_max_64")
+          + FILENAME(__LINE__));
+      }
+    }
+
+    template<>
+    ERROR ListOffsetArray_reduce_segmented_max_64(
+      kernel::lib ptr_lib,
+      uint32_t *toptr,
+      const uint32_t *fromptr,
+      const int64_t *offsets,
+      int64_t outlength,
+      uint32_t identity) {
+      if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_ListOffsetArray_reduce_segmented_max_uint32_uint32_64", outlength);
+        return parallel_for(
+          outlength,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_ListOffsetArray_reduce_segmented_max_uint32_uint32_64(
+              toptr + start,
+              fromptr,
+              offsets + start,
+              stop - start,
+              identity);
+          });
+      }
+      else if (ptr_lib == kernel::lib::cuda) {
+        throw std::runtime_error(
+          std::string("not implemented: ptr_lib == cuda_kernels for ListOffsetArray_reduce_segmented_max_64")
+          + FILENAME(__LINE__));
+      }
+      else {
+        throw std::runtime_error(
+          std::string("unrecognized ptr_lib for ListOffsetArray_reduce_segmented_max_64")
+          + FILENAME(__LINE__));
+      }
+    }
+
+    template<>
+    ERROR ListOffsetArray_reduce_segmented_max_64(
+      kernel::lib ptr_lib,
+      int64_t *toptr,
+      const int64_t *fromptr,
+      const int64_t *offsets,
+      int64_t outlength,
+      int64_t identity) {
+      if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_ListOffsetArray_reduce_segmented_max_int64_int64_64", outlength);
+        return parallel_for(
+          outlength,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_ListOffsetArray_reduce_segmented_max_int64_int64_64(
+              toptr + start,
+              fromptr,
+              offsets + start,
+              stop - start,
+              identity);
+          });
+      }
+      else if (ptr_lib == kernel::lib::cuda) {
+        throw std::runtime_error(
+          std::string("not implemented: ptr_lib == cuda_kernels for ListOffsetArray_reduce_segmented_max_64")
+          + FILENAME(__LINE__));
+      }
+      else {
+        throw std::runtime_error(
+          std::string("unrecognized ptr_lib for ListOffsetArray_reduce_segmented_max_64")
+          + FILENAME(__LINE__));
+      }
+    }
+
+    template<>
+    ERROR ListOffsetArray_reduce_segmented_max_64(
+      kernel::lib ptr_lib,
+      uint64_t *toptr,
+      const uint64_t *fromptr,
+      const int64_t *offsets,
+      int64_t outlength,
+      uint64_t identity) {
+      if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_ListOffsetArray_reduce_segmented_max_uint64_uint64_64", outlength);
+        return parallel_for(
+          outlength,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_ListOffsetArray_reduce_segmented_max_uint64_uint64_64(
+              toptr + start,
+              fromptr,
+              offsets + start,
+              stop - start,
+              identity);
+          });
+      }
+      else if (ptr_lib == kernel::lib::cuda) {
+        throw std::runtime_error(
+          std::string("not implemented: ptr_lib == cuda_kernels for ListOffsetArray_reduce_segmented_max_64")
+          + FILENAME(__LINE__));
+      }
+      else {
+        throw std::runtime_error(
+          std::string("unrecognized ptr_lib for ListOffsetArray_reduce_segmented_max_64")
+          + FILENAME(__LINE__));
+      }
+    }
+
+    template<>
+    ERROR ListOffsetArray_reduce_segmented_max_64(
+      kernel::lib ptr_lib,
+      float *toptr,
+      const float *fromptr,
+      const int64_t *offsets,
+      int64_t outlength,
+      float identity) {
+      if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_ListOffsetArray_reduce_segmented_max_float32_float32_64", outlength);
+        return parallel_for(
+          outlength,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_ListOffsetArray_reduce_segmented_max_float32_float32_64(
+              toptr + start,
+              fromptr,
+              offsets + start,
+              stop - start,
+              identity);
+          });
+      }
+      else if (ptr_lib == kernel::lib::cuda) {
+        throw std::runtime_error(
+          std::string("not implemented: ptr_lib == cuda_kernels for ListOffsetArray_reduce_segmented_max_64")
+          + FILENAME(__LINE__));
+      }
+      else {
+        throw std::runtime_error(
+          std::string("unrecognized ptr_lib for ListOffsetArray_reduce_segmented_max_64")
+          + FILENAME(__LINE__));
+      }
+    }
+
+    template<>
+    ERROR ListOffsetArray_reduce_segmented_max_64(
+      kernel::lib ptr_lib,
+      double *toptr,
+      const double *fromptr,
+      const int64_t *offsets,
+      int64_t outlength,
+      double identity) {
+      if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_ListOffsetArray_reduce_segmented_max_float64_float64_64", outlength);
+        return parallel_for(
+          outlength,
+          [&](int64_t start, int64_t stop) -> ERROR {
+            return awkward_ListOffsetArray_reduce_segmented_max_float64_float64_64(
+              toptr + start,
+              fromptr,
+              offsets + start,
+              stop - start,
+              identity);
+          });
+      }
+      else if (ptr_lib == kernel::lib::cuda) {
+        throw std::runtime_error(
+          std::string("not implemented: ptr_lib == cuda_kernels for ListOffsetArray_reduce_segmented_max_64")
+          + FILENAME(__LINE__));
+      }
+      else {
+        throw std::runtime_error(
+          std::string("unrecognized ptr_lib for ListOffsetArray_reduce_segmented_max_64")
+          + FILENAME(__LINE__));
+      }
+    }
+
     template<>
     ERROR IndexedArray_reduce_next_64<int32_t>(
       kernel::lib ptr_lib,
@@ -17618,6 +20286,7 @@ namespace awkward {
       int64_t *parents,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_IndexedArray32_reduce_next_64", length);
         return awkward_IndexedArray32_reduce_next_64(
           nextcarry,
           nextparents,
@@ -17648,6 +20317,7 @@ namespace awkward {
       int64_t *parents,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_IndexedArrayU32_reduce_next_64", length);
         return awkward_IndexedArrayU32_reduce_next_64(
           nextcarry,
           nextparents,
@@ -17678,6 +20348,7 @@ namespace awkward {
       int64_t *parents,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_IndexedArray64_reduce_next_64", length);
         return awkward_IndexedArray64_reduce_next_64(
           nextcarry,
           nextparents,
@@ -17705,6 +20376,7 @@ namespace awkward {
       const int32_t* index,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_IndexedArray32_reduce_next_nonlocal_nextshifts_64", length);
         return awkward_IndexedArray32_reduce_next_nonlocal_nextshifts_64(
           nextshifts,
           index,
@@ -17729,6 +20401,7 @@ namespace awkward {
       const uint32_t* index,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_IndexedArrayU32_reduce_next_nonlocal_nextshifts_64", length);
         return awkward_IndexedArrayU32_reduce_next_nonlocal_nextshifts_64(
           nextshifts,
           index,
@@ -17753,6 +20426,7 @@ namespace awkward {
       const int64_t* index,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_IndexedArray64_reduce_next_nonlocal_nextshifts_64", length);
         return awkward_IndexedArray64_reduce_next_nonlocal_nextshifts_64(
           nextshifts,
           index,
@@ -17778,6 +20452,7 @@ namespace awkward {
       int64_t length,
       const int64_t* shifts) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_IndexedArray32_reduce_next_nonlocal_nextshifts_fromshifts_64", length);
         return awkward_IndexedArray32_reduce_next_nonlocal_nextshifts_fromshifts_64(
           nextshifts,
           index,
@@ -17804,6 +20479,7 @@ namespace awkward {
       int64_t length,
       const int64_t* shifts) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_IndexedArrayU32_reduce_next_nonlocal_nextshifts_fromshifts_64", length);
         return awkward_IndexedArrayU32_reduce_next_nonlocal_nextshifts_fromshifts_64(
           nextshifts,
           index,
@@ -17830,6 +20506,7 @@ namespace awkward {
       int64_t length,
       const int64_t* shifts) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_IndexedArray64_reduce_next_nonlocal_nextshifts_fromshifts_64", length);
         return awkward_IndexedArray64_reduce_next_nonlocal_nextshifts_fromshifts_64(
           nextshifts,
           index,
@@ -17855,6 +20532,7 @@ namespace awkward {
       int64_t startslength,
       int64_t outindexlength) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_IndexedArray_reduce_next_fix_offsets_64", startslength);
         return awkward_IndexedArray_reduce_next_fix_offsets_64(
           outoffsets,
           starts,
@@ -17883,6 +20561,7 @@ namespace awkward {
       const int64_t* parents,
       const int64_t* starts) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_NumpyArray_reduce_adjust_starts_64", outlength);
         return awkward_NumpyArray_reduce_adjust_starts_64(
           toptr,
           outlength,
@@ -17909,6 +20588,7 @@ namespace awkward {
       const int64_t* starts,
       const int64_t* shifts) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_NumpyArray_reduce_adjust_starts_shifts_64", outlength);
         return awkward_NumpyArray_reduce_adjust_starts_shifts_64(
           toptr,
           outlength,
@@ -17935,6 +20615,7 @@ namespace awkward {
       int64_t lenparents,
       int64_t outlength) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_NumpyArray_reduce_mask_ByteMaskedArray_64", lenparents);
         return awkward_NumpyArray_reduce_mask_ByteMaskedArray_64(
           toptr,
           parents,
@@ -17963,6 +20644,7 @@ namespace awkward {
       int64_t length,
       bool valid_when) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_ByteMaskedArray_reduce_next_64", length);
         return awkward_ByteMaskedArray_reduce_next_64(
           nextcarry,
           nextparents,
@@ -17991,6 +20673,7 @@ namespace awkward {
       int64_t length,
       bool valid_when) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_ByteMaskedArray_reduce_next_nonlocal_nextshifts_64", length);
         return awkward_ByteMaskedArray_reduce_next_nonlocal_nextshifts_64(
           nextshifts,
           mask,
@@ -18017,6 +20700,7 @@ namespace awkward {
       bool valid_when,
       const int64_t* shifts) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_ByteMaskedArray_reduce_next_nonlocal_nextshifts_fromshifts_64", length);
         return awkward_ByteMaskedArray_reduce_next_nonlocal_nextshifts_fromshifts_64(
           nextshifts,
           mask,
@@ -18045,6 +20729,7 @@ namespace awkward {
       const int64_t *parents,
       int64_t parentslength) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_sorting_ranges", tolength);
         return awkward_sorting_ranges(
           toindex,
           tolength,
@@ -18069,6 +20754,7 @@ namespace awkward {
       const int64_t *parents,
       int64_t parentslength) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_sorting_ranges_length", parentslength);
         return awkward_sorting_ranges_length(
           tolength,
           parents,
@@ -18097,6 +20783,7 @@ namespace awkward {
       int64_t* tostops,
       int64_t* tolength) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_IndexedArray32_ranges_next_64", length);
         return awkward_IndexedArray32_ranges_next_64(
           index,
           fromstarts,
@@ -18129,6 +20816,7 @@ namespace awkward {
       int64_t* tostops,
       int64_t* tolength) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_IndexedArrayU32_ranges_next_64", length);
         return awkward_IndexedArrayU32_ranges_next_64(
           index,
           fromstarts,
@@ -18161,6 +20849,7 @@ namespace awkward {
       int64_t* tostops,
       int64_t* tolength) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_IndexedArray64_ranges_next_64", length);
         return awkward_IndexedArray64_ranges_next_64(
           index,
           fromstarts,
@@ -18191,6 +20880,7 @@ namespace awkward {
       int64_t length,
       int64_t* tocarry) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_IndexedArray32_ranges_carry_next_64", length);
         return awkward_IndexedArray32_ranges_carry_next_64(
           index,
           fromstarts,
@@ -18219,6 +20909,7 @@ namespace awkward {
       int64_t length,
       int64_t* tocarry) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_IndexedArrayU32_ranges_carry_next_64", length);
         return awkward_IndexedArrayU32_ranges_carry_next_64(
           index,
           fromstarts,
@@ -18247,6 +20938,7 @@ namespace awkward {
       int64_t length,
       int64_t* tocarry) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_IndexedArray64_ranges_carry_next_64", length);
         return awkward_IndexedArray64_ranges_carry_next_64(
           index,
           fromstarts,
@@ -18273,6 +20965,7 @@ namespace awkward {
       int64_t length,
       int64_t* tolength) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_unique_bool", length);
         return awkward_unique_bool(
           toptr,
           length,
@@ -18297,6 +20990,7 @@ namespace awkward {
       int64_t length,
       int64_t* tolength) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_unique_uint8", length);
         return awkward_unique_uint8(
           toptr,
           length,
@@ -18321,6 +21015,7 @@ namespace awkward {
       int64_t length,
       int64_t* tolength) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_unique_int8", length);
         return awkward_unique_int8(
           toptr,
           length,
@@ -18345,6 +21040,7 @@ namespace awkward {
       int64_t length,
       int64_t* tolength) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_unique_uint16", length);
         return awkward_unique_uint16(
           toptr,
           length,
@@ -18369,6 +21065,7 @@ namespace awkward {
       int64_t length,
       int64_t* tolength) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_unique_int16", length);
         return awkward_unique_int16(
           toptr,
           length,
@@ -18393,6 +21090,7 @@ namespace awkward {
       int64_t length,
       int64_t* tolength) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_unique_uint32", length);
         return awkward_unique_uint32(
           toptr,
           length,
@@ -18417,6 +21115,7 @@ namespace awkward {
       int64_t length,
       int64_t* tolength) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_unique_int32", length);
         return awkward_unique_int32(
           toptr,
           length,
@@ -18441,6 +21140,7 @@ namespace awkward {
       int64_t length,
       int64_t* tolength) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_unique_uint64", length);
         return awkward_unique_uint64(
           toptr,
           length,
@@ -18465,6 +21165,7 @@ namespace awkward {
       int64_t length,
       int64_t* tolength) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_unique_int64", length);
         return awkward_unique_int64(
           toptr,
           length,
@@ -18489,6 +21190,7 @@ namespace awkward {
       int64_t length,
       int64_t* tolength) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_unique_float32", length);
         return awkward_unique_float32(
           toptr,
           length,
@@ -18513,6 +21215,7 @@ namespace awkward {
       int64_t length,
       int64_t* tolength) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_unique_float64", length);
         return awkward_unique_float64(
           toptr,
           length,
@@ -18539,6 +21242,7 @@ namespace awkward {
       int64_t length,
       bool* toequal) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_NumpyArray_subrange_equal_bool", length);
         return awkward_NumpyArray_subrange_equal_bool(
           tmpptr,
           fromstarts,
@@ -18567,6 +21271,7 @@ namespace awkward {
       int64_t length,
       bool* toequal) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_NumpyArray_subrange_equal_uint8", length);
         return awkward_NumpyArray_subrange_equal_uint8(
           tmpptr,
           fromstarts,
@@ -18595,6 +21300,7 @@ namespace awkward {
       int64_t length,
       bool* toequal) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_NumpyArray_subrange_equal_int8", length);
         return awkward_NumpyArray_subrange_equal_int8(
           tmpptr,
           fromstarts,
@@ -18623,6 +21329,7 @@ namespace awkward {
       int64_t length,
       bool* toequal) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_NumpyArray_subrange_equal_uint16", length);
         return awkward_NumpyArray_subrange_equal_uint16(
           tmpptr,
           fromstarts,
@@ -18651,6 +21358,7 @@ namespace awkward {
       int64_t length,
       bool* toequal) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_NumpyArray_subrange_equal_int16", length);
         return awkward_NumpyArray_subrange_equal_int16(
           tmpptr,
           fromstarts,
@@ -18679,6 +21387,7 @@ namespace awkward {
       int64_t length,
       bool* toequal) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_NumpyArray_subrange_equal_uint32", length);
         return awkward_NumpyArray_subrange_equal_uint32(
           tmpptr,
           fromstarts,
@@ -18707,6 +21416,7 @@ namespace awkward {
       int64_t length,
       bool* toequal) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_NumpyArray_subrange_equal_int32", length);
         return awkward_NumpyArray_subrange_equal_int32(
           tmpptr,
           fromstarts,
@@ -18735,6 +21445,7 @@ namespace awkward {
       int64_t length,
       bool* toequal) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_NumpyArray_subrange_equal_uint64", length);
         return awkward_NumpyArray_subrange_equal_uint64(
           tmpptr,
           fromstarts,
@@ -18763,6 +21474,7 @@ namespace awkward {
       int64_t length,
       bool* toequal) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_NumpyArray_subrange_equal_int64", length);
         return awkward_NumpyArray_subrange_equal_int64(
           tmpptr,
           fromstarts,
@@ -18791,6 +21503,7 @@ namespace awkward {
       int64_t length,
       bool* toequal) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_NumpyArray_subrange_equal_float32", length);
         return awkward_NumpyArray_subrange_equal_float32(
           tmpptr,
           fromstarts,
@@ -18819,6 +21532,7 @@ namespace awkward {
       int64_t length,
       bool* toequal) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_NumpyArray_subrange_equal_float64", length);
         return awkward_NumpyArray_subrange_equal_float64(
           tmpptr,
           fromstarts,
@@ -18850,6 +21564,7 @@ namespace awkward {
       int64_t length,
       int64_t maxlevels) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_quick_sort_bool", length);
         return awkward_quick_sort_bool(
           tmpptr,
           tmpbeg,
@@ -18884,6 +21599,7 @@ namespace awkward {
       int64_t length,
       int64_t maxlevels) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_quick_sort_uint8", length);
         return awkward_quick_sort_uint8(
           tmpptr,
           tmpbeg,
@@ -18918,6 +21634,7 @@ namespace awkward {
       int64_t length,
       int64_t maxlevels) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_quick_sort_int8", length);
         return awkward_quick_sort_int8(
           tmpptr,
           tmpbeg,
@@ -18952,6 +21669,7 @@ namespace awkward {
       int64_t length,
       int64_t maxlevels) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_quick_sort_uint16", length);
         return awkward_quick_sort_uint16(
           tmpptr,
           tmpbeg,
@@ -18986,6 +21704,7 @@ namespace awkward {
       int64_t length,
       int64_t maxlevels) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_quick_sort_int16", length);
         return awkward_quick_sort_int16(
           tmpptr,
           tmpbeg,
@@ -19020,6 +21739,7 @@ namespace awkward {
       int64_t length,
       int64_t maxlevels) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_quick_sort_uint32", length);
         return awkward_quick_sort_uint32(
           tmpptr,
           tmpbeg,
@@ -19054,6 +21774,7 @@ namespace awkward {
       int64_t length,
       int64_t maxlevels) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_quick_sort_int32", length);
         return awkward_quick_sort_int32(
           tmpptr,
           tmpbeg,
@@ -19088,6 +21809,7 @@ namespace awkward {
       int64_t length,
       int64_t maxlevels) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_quick_sort_uint64", length);
         return awkward_quick_sort_uint64(
           tmpptr,
           tmpbeg,
@@ -19122,6 +21844,7 @@ namespace awkward {
       int64_t length,
       int64_t maxlevels) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_quick_sort_int64", length);
         return awkward_quick_sort_int64(
           tmpptr,
           tmpbeg,
@@ -19156,6 +21879,7 @@ namespace awkward {
       int64_t length,
       int64_t maxlevels) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_quick_sort_float32", length);
         return awkward_quick_sort_float32(
           tmpptr,
           tmpbeg,
@@ -19190,6 +21914,7 @@ namespace awkward {
       int64_t length,
       int64_t maxlevels) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_quick_sort_float64", length);
         return awkward_quick_sort_float64(
           tmpptr,
           tmpbeg,
@@ -19223,6 +21948,7 @@ namespace awkward {
       bool ascending,
       bool stable) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_argsort_bool", length);
         return awkward_argsort_bool(
           toptr,
           fromptr,
@@ -19255,6 +21981,7 @@ namespace awkward {
       bool ascending,
       bool stable) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_argsort_int8", length);
         return awkward_argsort_int8(
           toptr,
           fromptr,
@@ -19287,6 +22014,7 @@ namespace awkward {
       bool ascending,
       bool stable) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_argsort_uint8", length);
         return awkward_argsort_uint8(
           toptr,
           fromptr,
@@ -19319,6 +22047,7 @@ namespace awkward {
       bool ascending,
       bool stable) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_argsort_int16", length);
         return awkward_argsort_int16(
           toptr,
           fromptr,
@@ -19351,6 +22080,7 @@ namespace awkward {
       bool ascending,
       bool stable) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_argsort_uint16", length);
         return awkward_argsort_uint16(
           toptr,
           fromptr,
@@ -19383,6 +22113,7 @@ namespace awkward {
       bool ascending,
       bool stable) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_argsort_int32", length);
         return awkward_argsort_int32(
           toptr,
           fromptr,
@@ -19415,6 +22146,7 @@ namespace awkward {
       bool ascending,
       bool stable) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_argsort_uint32", length);
         return awkward_argsort_uint32(
           toptr,
           fromptr,
@@ -19447,6 +22179,7 @@ namespace awkward {
       bool ascending,
       bool stable) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_argsort_int64", length);
         return awkward_argsort_int64(
           toptr,
           fromptr,
@@ -19479,6 +22212,7 @@ namespace awkward {
       bool ascending,
       bool stable) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_argsort_uint64", length);
         return awkward_argsort_uint64(
           toptr,
           fromptr,
@@ -19511,6 +22245,7 @@ namespace awkward {
       bool ascending,
       bool stable) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_argsort_float32", length);
         return awkward_argsort_float32(
           toptr,
           fromptr,
@@ -19543,6 +22278,7 @@ namespace awkward {
       bool ascending,
       bool stable) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_argsort_float64", length);
         return awkward_argsort_float64(
           toptr,
           fromptr,
@@ -19578,6 +22314,7 @@ namespace awkward {
       bool stable,
       int64_t maxlevels) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_quick_argsort_bool", length);
         return awkward_quick_argsort_bool(
           toptr,
           fromptr,
@@ -19616,6 +22353,7 @@ namespace awkward {
       bool stable,
       int64_t maxlevels) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_quick_argsort_int8", length);
         return awkward_quick_argsort_int8(
           toptr,
           fromptr,
@@ -19654,6 +22392,7 @@ namespace awkward {
       bool stable,
       int64_t maxlevels) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_quick_argsort_uint8", length);
         return awkward_quick_argsort_uint8(
           toptr,
           fromptr,
@@ -19692,6 +22431,7 @@ namespace awkward {
       bool stable,
       int64_t maxlevels) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_quick_argsort_int16", length);
         return awkward_quick_argsort_int16(
           toptr,
           fromptr,
@@ -19730,6 +22470,7 @@ namespace awkward {
       bool stable,
       int64_t maxlevels) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_quick_argsort_uint16", length);
         return awkward_quick_argsort_uint16(
           toptr,
           fromptr,
@@ -19768,6 +22509,7 @@ namespace awkward {
       bool stable,
       int64_t maxlevels) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_quick_argsort_int32", length);
         return awkward_quick_argsort_int32(
           toptr,
           fromptr,
@@ -19806,6 +22548,7 @@ namespace awkward {
       bool stable,
       int64_t maxlevels) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_quick_argsort_uint32", length);
         return awkward_quick_argsort_uint32(
           toptr,
           fromptr,
@@ -19844,6 +22587,7 @@ namespace awkward {
       bool stable,
       int64_t maxlevels) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_quick_argsort_int64", length);
         return awkward_quick_argsort_int64(
           toptr,
           fromptr,
@@ -19882,6 +22626,7 @@ namespace awkward {
       bool stable,
       int64_t maxlevels) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_quick_argsort_uint64", length);
         return awkward_quick_argsort_uint64(
           toptr,
           fromptr,
@@ -19920,6 +22665,7 @@ namespace awkward {
       bool stable,
       int64_t maxlevels) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_quick_argsort_float32", length);
         return awkward_quick_argsort_float32(
           toptr,
           fromptr,
@@ -19958,6 +22704,7 @@ namespace awkward {
       bool stable,
       int64_t maxlevels) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_quick_argsort_float64", length);
         return awkward_quick_argsort_float64(
           toptr,
           fromptr,
@@ -19994,6 +22741,7 @@ namespace awkward {
       bool ascending,
       bool stable) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_sort_bool", length);
         return awkward_sort_bool(
           toptr,
           fromptr,
@@ -20028,6 +22776,7 @@ namespace awkward {
       bool ascending,
       bool stable) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_sort_uint8", length);
         return awkward_sort_uint8(
           toptr,
           fromptr,
@@ -20062,6 +22811,7 @@ namespace awkward {
       bool ascending,
       bool stable) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_sort_int8", length);
         return awkward_sort_int8(
           toptr,
           fromptr,
@@ -20096,6 +22846,7 @@ namespace awkward {
       bool ascending,
       bool stable) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_sort_uint16", length);
         return awkward_sort_uint16(
           toptr,
           fromptr,
@@ -20130,6 +22881,7 @@ namespace awkward {
       bool ascending,
       bool stable) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_sort_int16", length);
         return awkward_sort_int16(
           toptr,
           fromptr,
@@ -20164,6 +22916,7 @@ namespace awkward {
       bool ascending,
       bool stable) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_sort_uint32", length);
         return awkward_sort_uint32(
           toptr,
           fromptr,
@@ -20198,6 +22951,7 @@ namespace awkward {
       bool ascending,
       bool stable) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_sort_int32", length);
         return awkward_sort_int32(
           toptr,
           fromptr,
@@ -20232,6 +22986,7 @@ namespace awkward {
       bool ascending,
       bool stable) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_sort_uint64", length);
         return awkward_sort_uint64(
           toptr,
           fromptr,
@@ -20266,6 +23021,7 @@ namespace awkward {
       bool ascending,
       bool stable) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_sort_int64", length);
         return awkward_sort_int64(
           toptr,
           fromptr,
@@ -20300,6 +23056,7 @@ namespace awkward {
       bool ascending,
       bool stable) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_sort_float32", length);
         return awkward_sort_float32(
           toptr,
           fromptr,
@@ -20334,6 +23091,7 @@ namespace awkward {
       bool ascending,
       bool stable) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_sort_float64", length);
         return awkward_sort_float64(
           toptr,
           fromptr,
@@ -20368,6 +23126,7 @@ namespace awkward {
       bool is_ascending,
       bool is_local) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_ListOffsetArray_argsort_strings", length);
         return awkward_ListOffsetArray_argsort_strings(
           tocarry,
           fromparents,
@@ -20402,6 +23161,7 @@ namespace awkward {
       bool ascending,
       bool stable) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_NumpyArray_sort_asstrings_uint8", offsetslength);
         return awkward_NumpyArray_sort_asstrings_uint8(
           toptr,
           fromptr,
@@ -20432,6 +23192,7 @@ namespace awkward {
       int64_t *outoffsets,
       int64_t* tolength) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_NumpyArray_unique_strings_uint8", offsetslength);
         return awkward_NumpyArray_unique_strings_uint8(
           toptr,
           offsets,
@@ -20457,6 +23218,7 @@ namespace awkward {
       const int64_t *fromindex,
       int64_t length) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_ListOffsetArray_local_preparenext_64", length);
         return awkward_ListOffsetArray_local_preparenext_64(
           tocarry,
           fromindex,
@@ -20483,6 +23245,7 @@ namespace awkward {
       const int64_t *nextparents,
       const int64_t nextlen) {
       if (ptr_lib == kernel::lib::cpu) {
+        ProfileScope profile("awkward_IndexedArray_local_preparenext_64", parentslength);
         return awkward_IndexedArray_local_preparenext_64(
           tocarry,
           starts,
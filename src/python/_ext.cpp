@@ -31,6 +31,9 @@ PYBIND11_MODULE(_ext, m) {
   ////////// kernel_utils.h
 
   make_lib_enum(m, "kernel_lib");
+  make_kernel_parallel(m, "kernel_parallel");
+  make_kernel_profiling(m, "kernel_profiling");
+  make_kernel_profile(m, "kernel_profile");
 
   ////////// index.h
 
@@ -48,6 +51,7 @@ PYBIND11_MODULE(_ext, m) {
   ////////// content.h
 
   make_Iterator(m, "Iterator");
+  make_growablebuffer_stats(m, "growablebuffer_stats");
   make_ArrayBuilder(m, "ArrayBuilder");
   make_LayoutBuilder(m, "LayoutBuilder");
   make_PersistentSharedPtr(m, "_PersistentSharedPtr");
@@ -134,6 +138,7 @@ PYBIND11_MODULE(_ext, m) {
 
   make_fromjson(m, "fromjson");
   make_fromjsonfile(m, "fromjsonfile");
+  make_FromJsonIterator(m, "FromJsonIterator");
   make_uproot_issue_90(m);
 
   ////////// forth.h
@@ -2,6 +2,9 @@
 
 #define FILENAME(line) FILENAME_FOR_EXCEPTIONS("src/python/content.cpp", line)
 
+#include <functional>
+#include <limits>
+
 #include <pybind11/numpy.h>
 #include <pybind11/complex.h>
 #include <pybind11/chrono.h>
@@ -9,6 +12,7 @@
 #include "awkward/type/Type.h"
 #include "awkward/Reducer.h"
 #include "awkward/builder/ArrayBuilderOptions.h"
+#include "awkward/builder/GrowableBuffer.h"
 
 #include "awkward/python/identities.h"
 #include "awkward/python/util.h"
@@ -872,6 +876,115 @@ builder_timedelta(ak::ArrayBuilder& self, const py::handle& obj) {
   }
 }
 
+void
+builder_fromiter(ak::ArrayBuilder& self, const py::handle& obj);
+
+void
+builder_extend_numpy(ak::ArrayBuilder& self,
+                     const py::array& values,
+                     const py::object& counts) {
+  if (values.ndim() == 0) {
+    throw std::invalid_argument(
+      std::string("cannot extend an ArrayBuilder with a zero-dimensional array")
+      + FILENAME(__LINE__));
+  }
+  int64_t length = (int64_t)values.shape(0);
+  bool lists = !counts.is(py::none());
+  std::vector<int64_t> offsets = { 0 };
+  if (lists) {
+    py::array_t<int64_t, py::array::c_style | py::array::forcecast> countsarray =
+      counts.cast<py::array_t<int64_t, py::array::c_style | py::array::forcecast>>();
+    if (countsarray.ndim() != 1) {
+      throw std::invalid_argument(
+        std::string("counts must be one-dimensional") + FILENAME(__LINE__));
+    }
+    const int64_t* rawcounts = countsarray.data();
+    for (ssize_t i = 0;  i < countsarray.shape(0);  i++) {
+      if (rawcounts[i] < 0) {
+        throw std::invalid_argument(
+          std::string("counts must be non-negative") + FILENAME(__LINE__));
+      }
+      offsets.push_back(offsets.back() + rawcounts[i]);
+    }
+    if (offsets.back() != length) {
+      throw std::invalid_argument(
+        std::string("counts add up to ") + std::to_string(offsets.back())
+        + std::string(" but there are ") + std::to_string(length)
+        + std::string(" values") + FILENAME(__LINE__));
+    }
+  }
+  else {
+    offsets.push_back(length);
+  }
+
+  // one-dimensional booleans, integers, and reals are copied in bulk;
+  // everything else goes through builder_fromiter item by item
+  char kind = values.dtype().kind();
+  py::object keepalive;
+  std::function<void(int64_t, int64_t)> fill;
+  if (values.ndim() == 1  &&  kind == 'b') {
+    py::array_t<bool, py::array::c_style | py::array::forcecast> array =
+      values.cast<py::array_t<bool, py::array::c_style | py::array::forcecast>>();
+    keepalive = array;
+    const bool* raw = array.data();
+    fill = [&self, raw](int64_t start, int64_t stop) -> void {
+      self.booleans(raw + start, stop - start);
+    };
+  }
+  else if (values.ndim() == 1  &&  (kind == 'i'  ||  kind == 'u')) {
+    if (kind == 'u'  &&  values.dtype().itemsize() == 8) {
+      // the builder's integers are int64, which can't hold 2**63 or more
+      py::array_t<uint64_t, py::array::c_style | py::array::forcecast> unsigned_array =
+        values.cast<py::array_t<uint64_t, py::array::c_style | py::array::forcecast>>();
+      const uint64_t* raw = unsigned_array.data();
+      for (int64_t i = 0;  i < length;  i++) {
+        if (raw[i] > (uint64_t)std::numeric_limits<int64_t>::max()) {
+          throw std::invalid_argument(
+            std::string("cannot extend an ArrayBuilder with unsigned integer ")
+            + std::to_string(raw[i])
+            + std::string(", which does not fit in int64")
+            + FILENAME(__LINE__));
+        }
+      }
+    }
+    py::array_t<int64_t, py::array::c_style | py::array::forcecast> array =
+      values.cast<py::array_t<int64_t, py::array::c_style | py::array::forcecast>>();
+    keepalive = array;
+    const int64_t* raw = array.data();
+    fill = [&self, raw](int64_t start, int64_t stop) -> void {
+      self.integers(raw + start, stop - start);
+    };
+  }
+  else if (values.ndim() == 1  &&  kind == 'f') {
+    py::array_t<double, py::array::c_style | py::array::forcecast> array =
+      values.cast<py::array_t<double, py::array::c_style | py::array::forcecast>>();
+    keepalive = array;
+    const double* raw = array.data();
+    fill = [&self, raw](int64_t start, int64_t stop) -> void {
+      self.reals(raw + start, stop - start);
+    };
+  }
+  else {
+    py::list items = (values.ndim() == 1 ? values.attr("tolist")()
+                                         : py::list(values));
+    fill = [&self, items](int64_t start, int64_t stop) -> void {
+      for (int64_t i = start;  i < stop;  i++) {
+        builder_fromiter(self, items[(size_t)i]);
+      }
+    };
+  }
+
+  for (size_t i = 0;  i + 1 < offsets.size();  i++) {
+    if (lists) {
+      self.beginlist();
+    }
+    fill(offsets[i], offsets[i + 1]);
+    if (lists) {
+      self.endlist();
+    }
+  }
+}
+
 void
 builder_fromiter(ak::ArrayBuilder& self, const py::handle& obj) {
   if (obj.is(py::none())) {
@@ -928,7 +1041,15 @@ builder_fromiter(ak::ArrayBuilder& self, const py::handle& obj) {
     self.endlist();
   }
   else if (py::isinstance<py::array>(obj)) {
-    builder_fromiter(self, obj.attr("tolist")());
+    py::array array = obj.cast<py::array>();
+    if (array.ndim() == 0) {
+      builder_fromiter(self, obj.attr("tolist")());
+    }
+    else {
+      self.beginlist();
+      builder_extend_numpy(self, array, py::none());
+      self.endlist();
+    }
   }
   else if (py::isinstance(obj, py::module::import("numpy").attr("datetime64"))) {
     builder_datetime(self, obj);
@@ -955,12 +1076,34 @@ builder_fromiter(ak::ArrayBuilder& self, const py::handle& obj) {
   }
 }
 
+void
+make_growablebuffer_stats(py::module& m, const std::string& name) {
+  m.def(name.c_str(), [](bool reset) -> py::dict {
+    ak::GrowableBufferStats stats = ak::growablebuffer_stats();
+    if (reset) {
+      ak::reset_growablebuffer_stats();
+    }
+    py::dict out;
+    out["current_bytes"] = stats.current_bytes;
+    out["peak_bytes"] = stats.peak_bytes;
+    out["copies"] = stats.copies;
+    out["copied_bytes"] = stats.copied_bytes;
+    return out;
+  }, py::arg("reset") = false);
+}
+
 py::class_<ak::ArrayBuilder>
 make_ArrayBuilder(const py::handle& m, const std::string& name) {
   return (py::class_<ak::ArrayBuilder>(m, name.c_str())
-      .def(py::init([](int64_t initial, double resize) -> ak::ArrayBuilder {
-        return ak::ArrayBuilder(ak::ArrayBuilderOptions(initial, resize));
-      }), py::arg("initial") = 1024, py::arg("resize") = 1.5)
+      .def(py::init([](int64_t initial,
+                       double resize,
+                       bool chunked) -> ak::ArrayBuilder {
+        return ak::ArrayBuilder(ak::ArrayBuilderOptions(initial,
+                                                        resize,
+                                                        chunked));
+      }), py::arg("initial") = 1024,
+          py::arg("resize") = 1.5,
+          py::arg("chunked") = false)
       .def_property_readonly("_ptr",
                              [](const ak::ArrayBuilder* self) -> size_t {
         return reinterpret_cast<size_t>(self);
@@ -972,6 +1115,11 @@ make_ArrayBuilder(const py::handle& m, const std::string& name) {
       .def("snapshot", [](const ak::ArrayBuilder& self) -> py::object {
         return box(self.snapshot());
       })
+      .def("snapshot_range", [](const ak::ArrayBuilder& self,
+                                int64_t start,
+                                int64_t stop) -> py::object {
+        return box(self.snapshot_range(start, stop));
+      }, py::arg("start"), py::arg("stop"))
       .def("__getitem__", &getitem<ak::ArrayBuilder>)
       .def("__iter__", [](const ak::ArrayBuilder& self) -> ak::Iterator {
         return ak::Iterator(self.snapshot());
@@ -1020,6 +1168,8 @@ make_ArrayBuilder(const py::handle& m, const std::string& name) {
               const std::shared_ptr<ak::Content>& array) {
         self.extend(array);
       })
+      .def("extend_numpy", &builder_extend_numpy,
+           py::arg("values"), py::arg("counts") = py::none())
       .def("fromiter", &builder_fromiter)
   );
 }
@@ -1270,6 +1420,371 @@ setparameter(T& self, const std::string& key, const py::object& value) {
   self.setparameter(key, valuestr.cast<std::string>());
 }
 
+////////// tolist
+
+// Converts all of `layout` into a Python list, visiting each node once and
+// reading its buffers directly. Nodes that can't be read here (datetimes,
+// buffers that aren't on the CPU, strings of non-NumpyArray characters)
+// are passed to `fallback`, which returns a list.
+
+py::list
+content_tolist(const ak::ContentPtr& layout, const py::object& fallback);
+
+py::list
+content_tolist_fallback(const ak::ContentPtr& layout,
+                        const py::object& fallback) {
+  if (fallback.is(py::none())) {
+    throw std::invalid_argument(
+      std::string("cannot convert ") + layout.get()->classname()
+      + std::string(" to Python objects without a fallback")
+      + FILENAME(__LINE__));
+  }
+  return fallback(box(layout)).cast<py::list>();
+}
+
+// The range [low, high) that a node references is converted in one pass and
+// sliced if it isn't much larger than what is referenced; otherwise only the
+// referenced items are carried into a packed content and converted.
+
+bool
+content_tolist_isdense(int64_t span, int64_t total) {
+  return span <= 2*total + 64;
+}
+
+py::list
+content_tolist_lists(const ak::ContentPtr& layout,
+                     const ak::ContentPtr& content,
+                     const std::vector<int64_t>& starts,
+                     const std::vector<int64_t>& stops,
+                     const py::object& fallback) {
+  size_t length = starts.size();
+  py::list out(length);
+
+  bool isstring = layout.get()->parameter_equals("__array__", "\"string\"");
+  bool isbytes = layout.get()->parameter_equals("__array__", "\"bytestring\"");
+  if (isstring  ||  isbytes) {
+    ak::NumpyArray* raw = dynamic_cast<ak::NumpyArray*>(content.get());
+    if (raw == nullptr  ||  raw->ndim() != 1  ||  raw->itemsize() != 1  ||
+        !raw->iscontiguous()) {
+      return content_tolist_fallback(layout, fallback);
+    }
+    const char* chars = reinterpret_cast<const char*>(raw->data());
+    for (size_t i = 0;  i < length;  i++) {
+      PyObject* item;
+      if (isstring) {
+        item = PyUnicode_DecodeUTF8(chars + starts[i],
+                                    (Py_ssize_t)(stops[i] - starts[i]),
+                                    "surrogateescape");
+      }
+      else {
+        item = PyBytes_FromStringAndSize(chars + starts[i],
+                                         (Py_ssize_t)(stops[i] - starts[i]));
+      }
+      if (item == nullptr) {
+        throw py::error_already_set();
+      }
+      out[i] = py::reinterpret_steal<py::object>(item);
+    }
+    return out;
+  }
+
+  int64_t low = -1;
+  int64_t high = -1;
+  int64_t total = 0;
+  for (size_t i = 0;  i < length;  i++) {
+    if (starts[i] != stops[i]) {
+      if (low == -1  ||  starts[i] < low) {
+        low = starts[i];
+      }
+      if (high == -1  ||  stops[i] > high) {
+        high = stops[i];
+      }
+      total += stops[i] - starts[i];
+    }
+  }
+  bool dense = (low == -1  ||  content_tolist_isdense(high - low, total));
+  py::list items;
+  if (low != -1  &&  dense) {
+    items = content_tolist(content.get()->getitem_range_nowrap(low, high),
+                           fallback);
+  }
+  else if (low != -1) {
+    // a few lists from a large content: convert only what they contain,
+    // in order, and slice from the packed result
+    ak::Index64 carry(total);
+    int64_t* ptr = carry.data();
+    int64_t k = 0;
+    for (size_t i = 0;  i < length;  i++) {
+      for (int64_t j = starts[i];  j < stops[i];  j++) {
+        ptr[k++] = j;
+      }
+    }
+    items = content_tolist(content.get()->carry(carry, false), fallback);
+  }
+  int64_t packed = 0;
+  for (size_t i = 0;  i < length;  i++) {
+    if (starts[i] == stops[i]) {
+      out[i] = py::list();
+    }
+    else {
+      int64_t start = starts[i] - low;
+      if (!dense) {
+        start = packed;
+        packed += stops[i] - starts[i];
+      }
+      PyObject* item = PyList_GetSlice(items.ptr(),
+                                       (Py_ssize_t)start,
+                                       (Py_ssize_t)(start + stops[i] - starts[i]));
+      if (item == nullptr) {
+        throw py::error_already_set();
+      }
+      out[i] = py::reinterpret_steal<py::object>(item);
+    }
+  }
+  return out;
+}
+
+template <typename T>
+py::list
+content_tolist_gather(const ak::ContentPtr& content,
+                      const T* index,
+                      int64_t length,
+                      const py::object& fallback) {
+  // negative index values are None
+  int64_t low = -1;
+  int64_t high = -1;
+  int64_t total = 0;
+  for (int64_t i = 0;  i < length;  i++) {
+    int64_t j = (int64_t)index[i];
+    if (j >= 0) {
+      if (low == -1  ||  j < low) {
+        low = j;
+      }
+      if (high == -1  ||  j + 1 > high) {
+        high = j + 1;
+      }
+      total++;
+    }
+  }
+  bool dense = (low == -1  ||  content_tolist_isdense(high - low, total));
+  py::list items;
+  if (low != -1  &&  dense) {
+    items = content_tolist(content.get()->getitem_range_nowrap(low, high),
+                           fallback);
+  }
+  else if (low != -1) {
+    // a few items from a large content: convert only those, in order
+    ak::Index64 carry(total);
+    int64_t* ptr = carry.data();
+    int64_t k = 0;
+    for (int64_t i = 0;  i < length;  i++) {
+      if ((int64_t)index[i] >= 0) {
+        ptr[k++] = (int64_t)index[i];
+      }
+    }
+    items = content_tolist(content.get()->carry(carry, false), fallback);
+  }
+  py::list out(length);
+  int64_t packed = 0;
+  for (int64_t i = 0;  i < length;  i++) {
+    int64_t j = (int64_t)index[i];
+    if (j < 0) {
+      out[(size_t)i] = py::none();
+    }
+    else if (dense) {
+      out[(size_t)i] = items[(size_t)(j - low)];
+    }
+    else {
+      out[(size_t)i] = items[(size_t)packed++];
+    }
+  }
+  return out;
+}
+
+template <typename T>
+bool
+content_tolist_listarray(const ak::ContentPtr& layout,
+                         const py::object& fallback,
+                         py::list& out) {
+  if (ak::ListArrayOf<T>* raw = dynamic_cast<ak::ListArrayOf<T>*>(layout.get())) {
+    int64_t length = raw->length();
+    const T* starts = raw->starts().data();
+    const T* stops = raw->stops().data();
+    std::vector<int64_t> starts64(starts, starts + length);
+    std::vector<int64_t> stops64(stops, stops + length);
+    out = content_tolist_lists(layout, raw->content(), starts64, stops64, fallback);
+    return true;
+  }
+  else if (ak::ListOffsetArrayOf<T>* raw =
+           dynamic_cast<ak::ListOffsetArrayOf<T>*>(layout.get())) {
+    int64_t length = raw->length();
+    const T* offsets = raw->offsets().data();
+    std::vector<int64_t> starts64(offsets, offsets + length);
+    std::vector<int64_t> stops64(offsets + 1, offsets + length + 1);
+    out = content_tolist_lists(layout, raw->content(), starts64, stops64, fallback);
+    return true;
+  }
+  return false;
+}
+
+template <typename T, bool ISOPTION>
+bool
+content_tolist_indexedarray(const ak::ContentPtr& layout,
+                            const py::object& fallback,
+                            py::list& out) {
+  if (ak::IndexedArrayOf<T, ISOPTION>* raw =
+      dynamic_cast<ak::IndexedArrayOf<T, ISOPTION>*>(layout.get())) {
+    out = content_tolist_gather<T>(raw->content(),
+                                   raw->index().data(),
+                                   raw->length(),
+                                   fallback);
+    return true;
+  }
+  return false;
+}
+
+template <typename I>
+bool
+content_tolist_unionarray(const ak::ContentPtr& layout,
+                          const py::object& fallback,
+                          py::list& out) {
+  if (ak::UnionArrayOf<int8_t, I>* raw =
+      dynamic_cast<ak::UnionArrayOf<int8_t, I>*>(layout.get())) {
+    int64_t length = raw->length();
+    const int8_t* tags = raw->tags().data();
+    const I* index = raw->index().data();
+    out = py::list(length);
+    for (int64_t tag = 0;  tag < raw->numcontents();  tag++) {
+      std::vector<int64_t> selected(length, -1);
+      for (int64_t i = 0;  i < length;  i++) {
+        if (tags[i] == tag) {
+          selected[(size_t)i] = (int64_t)index[i];
+        }
+      }
+      py::list items = content_tolist_gather<int64_t>(raw->content(tag),
+                                                      selected.data(),
+                                                      length,
+                                                      fallback);
+      for (int64_t i = 0;  i < length;  i++) {
+        if (tags[i] == tag) {
+          out[(size_t)i] = items[(size_t)i];
+        }
+      }
+    }
+    return true;
+  }
+  return false;
+}
+
+py::list
+content_tolist(const ak::ContentPtr& layout, const py::object& fallback) {
+  py::list out;
+  if (layout.get()->kernels() != ak::kernel::lib::cpu) {
+    return content_tolist_fallback(layout, fallback);
+  }
+
+  else if (ak::NumpyArray* raw = dynamic_cast<ak::NumpyArray*>(layout.get())) {
+    if (raw->dtype() == ak::util::dtype::datetime64  ||
+        raw->dtype() == ak::util::dtype::timedelta64) {
+      return content_tolist_fallback(layout, fallback);
+    }
+    return py::module::import("numpy").attr("asarray")(box(layout))
+                                       .attr("tolist")().cast<py::list>();
+  }
+
+  else if (dynamic_cast<ak::EmptyArray*>(layout.get())) {
+    return py::list();
+  }
+
+  else if (ak::RegularArray* raw = dynamic_cast<ak::RegularArray*>(layout.get())) {
+    int64_t length = raw->length();
+    int64_t size = raw->size();
+    std::vector<int64_t> starts(length);
+    std::vector<int64_t> stops(length);
+    for (int64_t i = 0;  i < length;  i++) {
+      starts[(size_t)i] = i*size;
+      stops[(size_t)i] = (i + 1)*size;
+    }
+    return content_tolist_lists(layout, raw->content(), starts, stops, fallback);
+  }
+
+  else if (content_tolist_listarray<int32_t>(layout, fallback, out)  ||
+           content_tolist_listarray<uint32_t>(layout, fallback, out)  ||
+           content_tolist_listarray<int64_t>(layout, fallback, out)  ||
+           content_tolist_indexedarray<int32_t, false>(layout, fallback, out)  ||
+           content_tolist_indexedarray<uint32_t, false>(layout, fallback, out)  ||
+           content_tolist_indexedarray<int64_t, false>(layout, fallback, out)  ||
+           content_tolist_indexedarray<int32_t, true>(layout, fallback, out)  ||
+           content_tolist_indexedarray<int64_t, true>(layout, fallback, out)  ||
+           content_tolist_unionarray<int32_t>(layout, fallback, out)  ||
+           content_tolist_unionarray<uint32_t>(layout, fallback, out)  ||
+           content_tolist_unionarray<int64_t>(layout, fallback, out)) {
+    return out;
+  }
+
+  else if (ak::RecordArray* raw = dynamic_cast<ak::RecordArray*>(layout.get())) {
+    int64_t length = raw->length();
+    std::vector<py::list> fields;
+    for (auto content : raw->contents()) {
+      fields.push_back(content_tolist(content.get()->getitem_range_nowrap(0, length),
+                                      fallback));
+    }
+    out = py::list(length);
+    if (raw->istuple()) {
+      for (int64_t i = 0;  i < length;  i++) {
+        py::tuple item(fields.size());
+        for (size_t j = 0;  j < fields.size();  j++) {
+          item[j] = fields[j][(size_t)i];
+        }
+        out[(size_t)i] = item;
+      }
+    }
+    else {
+      std::vector<py::str> keys;
+      for (auto key : raw->keys()) {
+        keys.push_back(py::str(key));
+      }
+      for (int64_t i = 0;  i < length;  i++) {
+        py::dict item;
+        for (size_t j = 0;  j < fields.size();  j++) {
+          item[keys[j]] = fields[j][(size_t)i];
+        }
+        out[(size_t)i] = item;
+      }
+    }
+    return out;
+  }
+
+  else if (ak::ByteMaskedArray* raw =
+           dynamic_cast<ak::ByteMaskedArray*>(layout.get())) {
+    return content_tolist(raw->toIndexedOptionArray64(), fallback);
+  }
+
+  else if (ak::BitMaskedArray* raw =
+           dynamic_cast<ak::BitMaskedArray*>(layout.get())) {
+    return content_tolist(raw->toIndexedOptionArray64(), fallback);
+  }
+
+  else if (ak::UnmaskedArray* raw =
+           dynamic_cast<ak::UnmaskedArray*>(layout.get())) {
+    return content_tolist(raw->content(), fallback);
+  }
+
+  else if (ak::VirtualArray* raw = dynamic_cast<ak::VirtualArray*>(layout.get())) {
+    return content_tolist(raw->array(), fallback);
+  }
+
+  else {
+    return content_tolist_fallback(layout, fallback);
+  }
+}
+
+template <typename T>
+py::list
+tolist(const T& self, const py::object& fallback) {
+  return content_tolist(self.shallow_copy(), fallback);
+}
+
 template <typename T>
 py::object
 withparameter(T& self, const std::string& key, const py::object& value) {
@@ -1363,6 +1878,7 @@ content_methods(py::class_<T, std::shared_ptr<T>, ak::Content>& x) {
                py::arg("minus_infinity_string") = nullptr,
                py::arg("complex_real_string") = nullptr,
                py::arg("complex_imag_string") = nullptr)
+          .def("tolist", &tolist<T>, py::arg("fallback") = py::none())
           .def_property_readonly("nbytes", &T::nbytes)
           .def("deep_copy",
                &T::deep_copy,
@@ -10,19 +10,16 @@
 #include "awkward/python/content.h"
 #include "awkward/python/forth.h"
 
-template <typename T, typename I>
-py::object maybe_throw(const ak::ForthMachineOf<T, I>& self,
-                       ak::util::ForthError err,
-                       bool raise_user_halt,
-                       bool raise_recursion_depth_exceeded,
-                       bool raise_stack_underflow,
-                       bool raise_stack_overflow,
-                       bool raise_read_beyond,
-                       bool raise_seek_beyond,
-                       bool raise_skip_beyond,
-                       bool raise_rewind_beyond,
-                       bool raise_division_by_zero,
-                       bool raise_varint_too_big) {
+std::set<ak::util::ForthError> ignored_errors(bool raise_user_halt,
+                                              bool raise_recursion_depth_exceeded,
+                                              bool raise_stack_underflow,
+                                              bool raise_stack_overflow,
+                                              bool raise_read_beyond,
+                                              bool raise_seek_beyond,
+                                              bool raise_skip_beyond,
+                                              bool raise_rewind_beyond,
+                                              bool raise_division_by_zero,
+                                              bool raise_varint_too_big) {
   std::set<ak::util::ForthError> ignore;
   if (!raise_user_halt) {
     ignore.insert(ak::util::ForthError::user_halt);
@@ -54,7 +51,32 @@ py::object maybe_throw(const ak::ForthMachineOf<T, I>& self,
   if (!raise_varint_too_big) {
     ignore.insert(ak::util::ForthError::varint_too_big);
   }
-  self.maybe_throw(err, ignore);
+  return ignore;
+}
+
+template <typename T, typename I>
+py::object maybe_throw(const ak::ForthMachineOf<T, I>& self,
+                       ak::util::ForthError err,
+                       bool raise_user_halt,
+                       bool raise_recursion_depth_exceeded,
+                       bool raise_stack_underflow,
+                       bool raise_stack_overflow,
+                       bool raise_read_beyond,
+                       bool raise_seek_beyond,
+                       bool raise_skip_beyond,
+                       bool raise_rewind_beyond,
+                       bool raise_division_by_zero,
+                       bool raise_varint_too_big) {
+  self.maybe_throw(err, ignored_errors(raise_user_halt,
+                                       raise_recursion_depth_exceeded,
+                                       raise_stack_underflow,
+                                       raise_stack_overflow,
+                                       raise_read_beyond,
+                                       raise_seek_beyond,
+                                       raise_skip_beyond,
+                                       raise_rewind_beyond,
+                                       raise_division_by_zero,
+                                       raise_varint_too_big));
 
   switch (err) {
     case ak::util::ForthError::none:
@@ -90,6 +112,25 @@ py::object maybe_throw(const ak::ForthMachineOf<T, I>& self,
   }
 }
 
+template <typename T, typename I>
+std::map<std::string, std::shared_ptr<ak::ForthInputBuffer>>
+forth_inputs(const ak::ForthMachineOf<T, I>& self, const py::dict& inputs) {
+  std::map<std::string, std::shared_ptr<ak::ForthInputBuffer>> ins;
+  for (auto pair : inputs) {
+    std::string name = pair.first.cast<std::string>();
+    py::buffer obj = pair.second.cast<py::buffer>();
+    py::buffer_info info = obj.request(self.input_must_be_writable(name));
+    int64_t length = info.itemsize;
+    for (auto x : info.shape) {
+      length *= x;
+    }
+    std::shared_ptr<void> ptr = std::shared_ptr<uint8_t>(
+        reinterpret_cast<uint8_t*>(info.ptr), pyobject_deleter<uint8_t>(obj.ptr()));
+    ins[name] = std::make_shared<ak::ForthInputBuffer>(ptr, 0, length);
+  }
+  return ins;
+}
+
 template <typename T, typename I>
 py::class_<ak::ForthMachineOf<T, I>, std::shared_ptr<ak::ForthMachineOf<T, I>>>
 make_ForthMachineOf(const py::handle& m, const std::string& name) {
@@ -99,19 +140,22 @@ make_ForthMachineOf(const py::handle& m, const std::string& name) {
                            int64_t stack_size,
                            int64_t recursion_depth,
                            int64_t output_initial_size,
-                           double output_resize_factor)
+                           double output_resize_factor,
+                           bool optimize)
                         -> std::shared_ptr<ak::ForthMachineOf<T, I>> {
             return std::make_shared<ak::ForthMachineOf<T, I>>(source,
                                                               stack_size,
                                                               recursion_depth,
                                                               output_initial_size,
-                                                              output_resize_factor);
+                                                              output_resize_factor,
+                                                              optimize);
           }),
                py::arg("source"),
                py::arg("stack_size") = 1024,
                py::arg("recursion_depth") = 1024,
                py::arg("output_initial_size") = 1024,
-               py::arg("output_resize_factor") = 1.5)
+               py::arg("output_resize_factor") = 1.5,
+               py::arg("optimize") = false)
           .def("__getitem__", [](const std::shared_ptr<ak::ForthMachineOf<T, I>>& self,
                                  const std::string& key)
                                  -> py::object {
@@ -155,6 +199,8 @@ make_ForthMachineOf(const py::handle& m, const std::string& name) {
               &ak::ForthMachineOf<T, I>::output_initial_size)
           .def_property_readonly("output_resize_factor",
               &ak::ForthMachineOf<T, I>::output_resize_factor)
+          .def_property_readonly("optimize",
+              &ak::ForthMachineOf<T, I>::optimize)
           .def_property_readonly("stack",
               &ak::ForthMachineOf<T, I>::stack)
           .def("stack_push", [](ak::ForthMachineOf<T, I>& self, T value) -> void {
@@ -223,19 +269,8 @@ make_ForthMachineOf(const py::handle& m, const std::string& name) {
           .def("reset", &ak::ForthMachineOf<T, I>::reset)
           .def("begin", [](ak::ForthMachineOf<T, I>& self,
                            const py::dict& inputs) -> void {
-              std::map<std::string, std::shared_ptr<ak::ForthInputBuffer>> ins;
-              for (auto pair : inputs) {
-                std::string name = pair.first.cast<std::string>();
-                py::buffer obj = pair.second.cast<py::buffer>();
-                py::buffer_info info = obj.request(self.input_must_be_writable(name));
-                int64_t length = info.itemsize;
-                for (auto x : info.shape) {
-                  length *= x;
-                }
-                std::shared_ptr<void> ptr = std::shared_ptr<uint8_t>(
-                    reinterpret_cast<uint8_t*>(info.ptr), pyobject_deleter<uint8_t>(obj.ptr()));
-                ins[name] = std::make_shared<ak::ForthInputBuffer>(ptr, 0, length);
-              }
+              std::map<std::string, std::shared_ptr<ak::ForthInputBuffer>> ins =
+                  forth_inputs<T, I>(self, inputs);
               self.begin(ins);
           }, py::arg("inputs") = py::dict())
           .def("step", [](ak::ForthMachineOf<T, I>& self,
@@ -284,19 +319,8 @@ make_ForthMachineOf(const py::handle& m, const std::string& name) {
                          bool raise_rewind_beyond,
                          bool raise_division_by_zero,
                          bool raise_varint_too_big) -> py::object {
-              std::map<std::string, std::shared_ptr<ak::ForthInputBuffer>> ins;
-              for (auto pair : inputs) {
-                std::string name = pair.first.cast<std::string>();
-                py::buffer obj = pair.second.cast<py::buffer>();
-                py::buffer_info info = obj.request(self.input_must_be_writable(name));
-                int64_t length = info.itemsize;
-                for (auto x : info.shape) {
-                  length *= x;
-                }
-                std::shared_ptr<void> ptr = std::shared_ptr<uint8_t>(
-                    reinterpret_cast<uint8_t*>(info.ptr), pyobject_deleter<uint8_t>(obj.ptr()));
-                ins[name] = std::make_shared<ak::ForthInputBuffer>(ptr, 0, length);
-              }
+              std::map<std::string, std::shared_ptr<ak::ForthInputBuffer>> ins =
+                  forth_inputs<T, I>(self, inputs);
               self.begin(ins);
               py::gil_scoped_release release;
               ak::util::ForthError err = self.resume();
@@ -324,6 +348,82 @@ make_ForthMachineOf(const py::handle& m, const std::string& name) {
            , py::arg("raise_rewind_beyond") = true
            , py::arg("raise_division_by_zero") = true
            , py::arg("raise_varint_too_big") = true)
+          .def("run_parallel", [](const ak::ForthMachineOf<T, I>& self,
+                                  const py::iterable& input_sets,
+                                  int64_t num_threads,
+                                  bool partitioned,
+                                  const std::vector<std::string>& offsets,
+                                  bool raise_user_halt,
+                                  bool raise_recursion_depth_exceeded,
+                                  bool raise_stack_underflow,
+                                  bool raise_stack_overflow,
+                                  bool raise_read_beyond,
+                                  bool raise_seek_beyond,
+                                  bool raise_skip_beyond,
+                                  bool raise_rewind_beyond,
+                                  bool raise_division_by_zero,
+                                  bool raise_varint_too_big) -> py::object {
+              std::vector<std::map<std::string, std::shared_ptr<ak::ForthInputBuffer>>> ins;
+              for (auto inputs : input_sets) {
+                ins.push_back(forth_inputs<T, I>(self, inputs.cast<py::dict>()));
+              }
+              std::set<ak::util::ForthError> ignore = ignored_errors(
+                  raise_user_halt,
+                  raise_recursion_depth_exceeded,
+                  raise_stack_underflow,
+                  raise_stack_overflow,
+                  raise_read_beyond,
+                  raise_seek_beyond,
+                  raise_skip_beyond,
+                  raise_rewind_beyond,
+                  raise_division_by_zero,
+                  raise_varint_too_big);
+
+              std::vector<ak::ForthRunResultOf<T>> results;
+              std::vector<std::shared_ptr<ak::ForthOutputBuffer>> concatenated;
+              {
+                py::gil_scoped_release release;
+                results = self.run_parallel(ins, num_threads, ignore);
+                if (!partitioned) {
+                  concatenated = self.concatenate_outputs(
+                      results, std::set<std::string>(offsets.begin(), offsets.end()));
+                }
+              }
+
+              std::vector<std::string> names = self.output_index();
+              if (partitioned) {
+                py::list out;
+                for (auto& result : results) {
+                  py::dict outputs;
+                  for (size_t i = 0;  i < names.size();  i++) {
+                    outputs[py::cast(names[i])] =
+                        box(result.outputs[i].get()->toNumpyArray());
+                  }
+                  out.append(outputs);
+                }
+                return out;
+              }
+              else {
+                py::dict out;
+                for (size_t i = 0;  i < names.size();  i++) {
+                  out[py::cast(names[i])] = box(concatenated[i].get()->toNumpyArray());
+                }
+                return out;
+              }
+          }, py::arg("input_sets")
+           , py::arg("num_threads") = 0
+           , py::arg("partitioned") = false
+           , py::arg("offsets") = std::vector<std::string>()
+           , py::arg("raise_user_halt") = true
+           , py::arg("raise_recursion_depth_exceeded") = true
+           , py::arg("raise_stack_underflow") = true
+           , py::arg("raise_stack_overflow") = true
+           , py::arg("raise_read_beyond") = true
+           , py::arg("raise_seek_beyond") = true
+           , py::arg("raise_skip_beyond") = true
+           , py::arg("raise_rewind_beyond") = true
+           , py::arg("raise_division_by_zero") = true
+           , py::arg("raise_varint_too_big") = true)
           .def("resume", [](ak::ForthMachineOf<T, I>& self,
                           bool raise_user_halt,
                           bool raise_recursion_depth_exceeded,
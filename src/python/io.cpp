@@ -2,6 +2,8 @@
 
 #define FILENAME(line) FILENAME_FOR_EXCEPTIONS("src/python/io.cpp", line)
 
+#include <cstdio>
+#include <memory>
 #include <string>
 
 #include "awkward/Content.h"
@@ -27,12 +29,27 @@ make_fromjson(py::module& m, const std::string& name) {
            const char* minus_infinity_string,
            int64_t initial,
            double resize,
-           int64_t buffersize) -> py::object {
-    ak::ContentPtr out = ak::FromJsonString(source.c_str(),
-                                            ak::ArrayBuilderOptions(initial, resize),
-                                            nan_string,
-                                            infinity_string,
-                                            minus_infinity_string);
+           int64_t buffersize,
+           const ak::FormPtr& form) -> py::object {
+    ak::ContentPtr out(nullptr);
+    {
+      py::gil_scoped_release release;
+      if (form.get() == nullptr) {
+        out = ak::FromJsonString(source.c_str(),
+                                 ak::ArrayBuilderOptions(initial, resize),
+                                 nan_string,
+                                 infinity_string,
+                                 minus_infinity_string);
+      }
+      else {
+        out = ak::FromJsonString(source.c_str(),
+                                 form,
+                                 ak::ArrayBuilderOptions(initial, resize),
+                                 nan_string,
+                                 infinity_string,
+                                 minus_infinity_string);
+      }
+    }
     return box(out);
   }, py::arg("source"),
      py::arg("nan_string") = nullptr,
@@ -40,7 +57,8 @@ make_fromjson(py::module& m, const std::string& name) {
      py::arg("minus_infinity_string") = nullptr,
      py::arg("initial") = 1024,
      py::arg("resize") = 1.5,
-     py::arg("buffersize") = 65536);
+     py::arg("buffersize") = 65536,
+     py::arg("form") = nullptr);
 }
 
 void
@@ -52,7 +70,8 @@ make_fromjsonfile(py::module& m, const std::string& name) {
            const char* minus_infinity_string,
            int64_t initial,
            double resize,
-           int64_t buffersize) -> py::object {
+           int64_t buffersize,
+           const ak::FormPtr& form) -> py::object {
 #ifdef _MSC_VER
       FILE* file;
       if (fopen_s(&file, source.c_str(), "rb") != 0) {
@@ -67,12 +86,24 @@ make_fromjsonfile(py::module& m, const std::string& name) {
       }
       std::shared_ptr<ak::Content> out(nullptr);
       try {
-        out = FromJsonFile(file,
-                           ak::ArrayBuilderOptions(initial, resize),
-                           buffersize,
-                           nan_string,
-                           infinity_string,
-                           minus_infinity_string);
+        py::gil_scoped_release release;
+        if (form.get() == nullptr) {
+          out = FromJsonFile(file,
+                             ak::ArrayBuilderOptions(initial, resize),
+                             buffersize,
+                             nan_string,
+                             infinity_string,
+                             minus_infinity_string);
+        }
+        else {
+          out = FromJsonFile(file,
+                             form,
+                             ak::ArrayBuilderOptions(initial, resize),
+                             buffersize,
+                             nan_string,
+                             infinity_string,
+                             minus_infinity_string);
+        }
       }
       catch (...) {
         fclose(file);
@@ -86,11 +117,146 @@ make_fromjsonfile(py::module& m, const std::string& name) {
      py::arg("minus_infinity_string") = nullptr,
      py::arg("initial") = 1024,
      py::arg("resize") = 1.5,
-     py::arg("buffersize") = 65536);
+     py::arg("buffersize") = 65536,
+     py::arg("form") = nullptr);
 }
 
 ////////// Uproot connector
 
+/// @brief Owns the source (a copy of the string or an open file) of an
+/// ak::FromJsonIterator, which only borrows it.
+class PyFromJsonIterator {
+public:
+  PyFromJsonIterator(const std::string& source,
+                     bool isfile,
+                     const char* nan_string,
+                     const char* infinity_string,
+                     const char* minus_infinity_string,
+                     int64_t initial,
+                     double resize,
+                     int64_t buffersize)
+      : source_(source)
+      , nan_string_(nan_string == nullptr ? "" : nan_string)
+      , infinity_string_(infinity_string == nullptr ? "" : infinity_string)
+      , minus_infinity_string_(minus_infinity_string == nullptr ? "" : minus_infinity_string)
+      , has_nan_string_(nan_string != nullptr)
+      , has_infinity_string_(infinity_string != nullptr)
+      , has_minus_infinity_string_(minus_infinity_string != nullptr)
+      , file_(nullptr, &fclose) {
+    if (isfile) {
+#ifdef _MSC_VER
+      FILE* file;
+      if (fopen_s(&file, source_.c_str(), "rb") != 0) {
+#else
+      FILE* file = fopen(source_.c_str(), "rb");
+      if (file == nullptr) {
+#endif
+        throw std::invalid_argument(
+          std::string("file \"") + source_
+          + std::string("\" could not be opened for reading")
+          + FILENAME(__LINE__));
+      }
+      // owned before anything else can throw, so that it's closed if the
+      // constructor doesn't finish
+      file_.reset(file);
+      iterator_ = std::make_shared<ak::FromJsonIterator>(
+        file_.get(),
+        ak::ArrayBuilderOptions(initial, resize),
+        buffersize,
+        has_nan_string_ ? nan_string_.c_str() : nullptr,
+        has_infinity_string_ ? infinity_string_.c_str() : nullptr,
+        has_minus_infinity_string_ ? minus_infinity_string_.c_str() : nullptr);
+    }
+    else {
+      iterator_ = std::make_shared<ak::FromJsonIterator>(
+        source_.c_str(),
+        ak::ArrayBuilderOptions(initial, resize),
+        has_nan_string_ ? nan_string_.c_str() : nullptr,
+        has_infinity_string_ ? infinity_string_.c_str() : nullptr,
+        has_minus_infinity_string_ ? minus_infinity_string_.c_str() : nullptr);
+    }
+  }
+
+  ~PyFromJsonIterator() {
+    close();
+  }
+
+  py::object
+  next(int64_t max_records, int64_t max_bytes) {
+    if (iterator_.get() == nullptr) {
+      return py::none();
+    }
+    ak::ContentPtr out = iterator_.get()->next(max_records, max_bytes);
+    if (out.get() == nullptr) {
+      close();
+      return py::none();
+    }
+    return box(out);
+  }
+
+  int64_t
+  bytes_read() const {
+    return bytes_read_ + (iterator_.get() == nullptr ? 0 : iterator_.get()->bytes_read());
+  }
+
+  void
+  close() {
+    if (iterator_.get() != nullptr) {
+      bytes_read_ = iterator_.get()->bytes_read();
+      iterator_ = nullptr;
+    }
+    file_.reset();
+  }
+
+private:
+  const std::string source_;
+  const std::string nan_string_;
+  const std::string infinity_string_;
+  const std::string minus_infinity_string_;
+  const bool has_nan_string_;
+  const bool has_infinity_string_;
+  const bool has_minus_infinity_string_;
+  // declared before #iterator_, which borrows it, so that it's closed after
+  std::unique_ptr<FILE, int(*)(FILE*)> file_;
+  std::shared_ptr<ak::FromJsonIterator> iterator_;
+  int64_t bytes_read_ = 0;
+};
+
+void
+make_FromJsonIterator(py::module& m, const std::string& name) {
+  py::class_<PyFromJsonIterator, std::shared_ptr<PyFromJsonIterator>>(m, name.c_str())
+      .def(py::init([](const std::string& source,
+                       bool isfile,
+                       const char* nan_string,
+                       const char* infinity_string,
+                       const char* minus_infinity_string,
+                       int64_t initial,
+                       double resize,
+                       int64_t buffersize) -> std::shared_ptr<PyFromJsonIterator> {
+        return std::make_shared<PyFromJsonIterator>(source,
+                                                    isfile,
+                                                    nan_string,
+                                                    infinity_string,
+                                                    minus_infinity_string,
+                                                    initial,
+                                                    resize,
+                                                    buffersize);
+      }), py::arg("source"),
+          py::arg("isfile"),
+          py::arg("nan_string") = nullptr,
+          py::arg("infinity_string") = nullptr,
+          py::arg("minus_infinity_string") = nullptr,
+          py::arg("initial") = 1024,
+          py::arg("resize") = 1.5,
+          py::arg("buffersize") = 65536)
+      .def("next", &PyFromJsonIterator::next,
+           py::arg("max_records") = 0,
+           py::arg("max_bytes") = 0)
+      .def_property_readonly("bytes_read", &PyFromJsonIterator::bytes_read)
+      .def("close", &PyFromJsonIterator::close);
+}
+
+
 void
 make_uproot_issue_90(py::module& m) {
   m.def("uproot_issue_90", &ak::uproot_issue_90);
@@ -11,3 +11,100 @@ make_lib_enum(const py::handle& m, const std::string& name) {
     .value("cuda", ak::kernel::lib::cuda)
     .export_values());
 }
+
+void
+make_kernel_parallel(py::module& m, const std::string& name) {
+  m.def(name.c_str(),
+        [](const py::object& threads,
+           const py::object& threshold) -> py::tuple {
+    py::tuple out = py::make_tuple(ak::kernel::parallel_threads(),
+                                   ak::kernel::parallel_threshold());
+    if (!threads.is(py::none())) {
+      ak::kernel::set_parallel_threads(threads.cast<int64_t>());
+    }
+    if (!threshold.is(py::none())) {
+      ak::kernel::set_parallel_threshold(threshold.cast<int64_t>());
+    }
+    return out;
+  }, py::arg("threads") = py::none(), py::arg("threshold") = py::none(),
+  R"(Configures how CPU kernels split their work across threads.
+
+Args:
+    threads (None or int): Number of threads that embarrassingly parallel
+        CPU kernels (fills, carries, ``num``, ``local_index``, contiguous
+        copies) may use. ``1`` runs every kernel serially (the default) and
+        ``0`` uses all hardware threads. If None, the setting is unchanged.
+    threshold (None or int): Number of items (outer lists or elements) a
+        kernel must process before it is split across threads; smaller
+        calls stay serial. If None, the setting is unchanged.
+
+Returns the previous ``(threads, threshold)`` so that it can be restored.
+)");
+}
+
+void
+make_kernel_profiling(py::module& m, const std::string& name) {
+  m.def(name.c_str(),
+        [](const py::object& enabled,
+           const py::object& max_events) -> py::tuple {
+    py::tuple out = py::make_tuple(ak::kernel::profiling(),
+                                   ak::kernel::profile_max_events());
+    if (!max_events.is(py::none())) {
+      ak::kernel::set_profile_max_events(max_events.cast<int64_t>());
+    }
+    if (!enabled.is(py::none())) {
+      ak::kernel::set_profiling(enabled.cast<bool>());
+    }
+    return out;
+  }, py::arg("enabled") = py::none(), py::arg("max_events") = py::none(),
+  R"(Turns per-kernel profiling of the CPU dispatch on or off.
+
+Args:
+    enabled (None or bool): If True, every CPU kernel call is timed and
+        counted until profiling is turned off again. If None, the setting is
+        unchanged.
+    max_events (None or int): Maximum number of individual calls to keep
+        (for traces); totals per kernel are not limited. If None, the
+        setting is unchanged.
+
+Returns the previous ``(enabled, max_events)`` so that it can be restored.
+Recorded data accumulate until ``kernel_profile(reset=True)``.
+)");
+}
+
+void
+make_kernel_profile(py::module& m, const std::string& name) {
+  m.def(name.c_str(), [](bool reset) -> py::dict {
+    py::list counts;
+    for (auto const& x : ak::kernel::profile_counts()) {
+      counts.append(py::make_tuple(x.name, x.calls, x.elements, x.nanoseconds));
+    }
+    py::list events;
+    for (auto const& x : ak::kernel::profile_events()) {
+      events.append(py::make_tuple(x.name,
+                                   x.thread,
+                                   x.start,
+                                   x.duration,
+                                   x.elements));
+    }
+    int64_t dropped = ak::kernel::profile_events_dropped();
+    if (reset) {
+      ak::kernel::reset_profile();
+    }
+    py::dict out;
+    out["counts"] = counts;
+    out["events"] = events;
+    out["dropped"] = dropped;
+    return out;
+  }, py::arg("reset") = false,
+  R"(Returns the data recorded while ``kernel_profiling`` was on, as a dict:
+
+    * ``"counts"``: list of ``(name, calls, elements, nanoseconds)`` per kernel;
+    * ``"events"``: list of ``(name, thread, start, duration, elements)`` per
+      call, with times in nanoseconds;
+    * ``"dropped"``: number of calls not kept in ``"events"`` because
+      ``max_events`` was reached.
+
+If ``reset``, the recorded data are discarded afterward.
+)");
+}
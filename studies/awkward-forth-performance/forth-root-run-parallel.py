@@ -0,0 +1,65 @@
+import time
+import sys
+
+import uproot
+import awkward.forth
+
+num_threads = int(sys.argv[1])
+
+print(f"prepare {num_threads}")
+
+jagged3 = awkward.forth.ForthMachine32(
+    """
+input data
+input byte_offsets
+output offsets2 int32
+output offsets1 int32
+output offsets0 int32
+output content float32
+
+0 offsets2 <- stack
+0 offsets1 <- stack
+0 offsets0 <- stack
+
+begin
+  byte_offsets i-> stack
+  6 + data seek
+  data !i-> stack
+  dup offsets2 +<- stack
+  0 do
+    data !i-> stack
+    dup offsets1 +<- stack
+    0 do
+      data !i-> stack
+      dup offsets0 +<- stack
+      data #!f-> content
+    loop
+  loop
+again
+"""
+)
+
+branch = uproot.open(
+    "/home/jpivarski/storage/data/chep-2021-jagged-jagged-jagged/zlib0-jagged3.root:tree/branch"
+)
+baskets = [branch.basket(i) for i in range(72)]
+input_sets = [
+    {"data": basket.data, "byte_offsets": basket.byte_offsets} for basket in baskets
+]
+
+print("begin")
+begin = time.time()
+
+outputs = jagged3.run_parallel(
+    input_sets,
+    num_threads=num_threads,
+    offsets=["offsets2", "offsets1", "offsets0"],
+    raise_read_beyond=False,
+    raise_seek_beyond=False,
+    raise_skip_beyond=False,
+)
+
+end = time.time()
+print("end")
+
+print(f"Forth run_parallel {num_threads} threads {end - begin} seconds")
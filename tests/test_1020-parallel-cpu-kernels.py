@@ -0,0 +1,72 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+from __future__ import absolute_import
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+
+@pytest.fixture
+def parallel():
+    previous = ak.layout.kernel_parallel(threads=4, threshold=0)
+    yield
+    ak.layout.kernel_parallel(*previous)
+
+
+def test_settings():
+    previous = ak.layout.kernel_parallel()
+    assert ak.layout.kernel_parallel(threads=3, threshold=123) == previous
+    assert ak.layout.kernel_parallel(*previous) == (3, 123)
+    assert ak.layout.kernel_parallel() == previous
+
+    with pytest.raises(ValueError):
+        ak.layout.kernel_parallel(threads=-1)
+    with pytest.raises(ValueError):
+        ak.layout.kernel_parallel(threshold=-1)
+
+
+def test_num_and_local_index(parallel):
+    array = ak.Array([[0.0, 1.1, 2.2], [], [3.3, 4.4], [5.5], [6.6, 7.7, 8.8, 9.9]] * 7)
+    assert ak.to_list(ak.num(array)) == [3, 0, 2, 1, 4] * 7
+    assert (
+        ak.to_list(ak.local_index(array))
+        == [
+            [0, 1, 2],
+            [],
+            [0, 1],
+            [0],
+            [0, 1, 2, 3],
+        ]
+        * 7
+    )
+
+
+def test_carry(parallel):
+    array = ak.Array([[0.0, 1.1, 2.2], [], [3.3, 4.4], [5.5], [6.6, 7.7, 8.8, 9.9]])
+    assert ak.to_list(array[[4, 0, 3, 3, 1, 2]]) == [
+        [6.6, 7.7, 8.8, 9.9],
+        [0.0, 1.1, 2.2],
+        [5.5],
+        [5.5],
+        [],
+        [3.3, 4.4],
+    ]
+    assert ak.to_list(array[[4, 0, 2], 1:]) == [[7.7, 8.8, 9.9], [1.1, 2.2], [4.4]]
+
+    numpy = ak.Array(np.arange(20).reshape(10, 2))
+    assert ak.to_list(numpy[[9, 0, 5]]) == [[18, 19], [0, 1], [10, 11]]
+
+    with pytest.raises(ValueError):
+        array[[0, 1, 100]]
+
+
+def test_fill(parallel):
+    one = ak.Array(np.arange(10, dtype=np.int32))
+    two = ak.Array(np.arange(10, 15, dtype=np.float64))
+    three = ak.Array(np.array([True, False, True]))
+    assert ak.to_list(ak.concatenate([one, two, three])) == list(range(15)) + [
+        1.0,
+        0.0,
+        1.0,
+    ]
@@ -0,0 +1,63 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+from __future__ import absolute_import
+
+import json
+import os
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+
+lines = [
+    {"x": 1, "y": [1.1]},
+    {"x": 2, "y": []},
+    {"x": 3, "y": [3.3, 3.3]},
+    {"x": 4, "y": [4.4]},
+    {"x": 5, "y": [5.5, 5.5, 5.5]},
+]
+
+
+def test_string():
+    source = "\n".join(json.dumps(x) for x in lines) + "\n"
+
+    chunks = list(ak.iter_json(source, max_records=2))
+    assert [len(x) for x in chunks] == [2, 2, 1]
+    assert sum((ak.to_list(x) for x in chunks), []) == lines
+
+    (chunk,) = ak.iter_json(source, max_records=None, max_bytes=None)
+    assert ak.to_list(chunk) == lines
+
+    chunks = list(ak.iter_json(source, max_bytes=1))
+    assert [len(x) for x in chunks] == [1, 1, 1, 1, 1]
+
+
+def test_file(tmp_path):
+    filename = os.path.join(str(tmp_path), "tmp.jsonl")
+    with open(filename, "w") as f:
+        for x in lines:
+            f.write(json.dumps(x) + "\n")
+
+    chunks = list(ak.iter_json(filename, max_records=3, buffersize=16))
+    assert [len(x) for x in chunks] == [3, 2]
+    assert isinstance(chunks[0], ak.Array)
+    assert sum((ak.to_list(x) for x in chunks), []) == lines
+
+    partitioned = ak.partitioned(list(ak.iter_json(filename, max_records=2)))
+    assert ak.partitions(partitioned) == [2, 2, 1]
+    assert ak.to_list(partitioned.x) == [1, 2, 3, 4, 5]
+
+
+def test_errors(tmp_path):
+    with pytest.raises(ValueError):
+        list(ak.iter_json('{"x": 1}\n{"x": 2', max_records=1))
+
+    with pytest.raises(IOError):
+        ak.iter_json(os.path.join(str(tmp_path), "nonexistent.jsonl"))
+
+
+def test_complex():
+    source = '{"r": 1, "i": 2}\n{"r": 3, "i": 4}\n'
+    (chunk,) = ak.iter_json(source, complex_record_fields=("r", "i"))
+    assert ak.to_list(chunk) == [1 + 2j, 3 + 4j]
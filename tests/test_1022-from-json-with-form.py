@@ -0,0 +1,208 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+from __future__ import absolute_import
+
+import os
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+
+def test_numbers_and_lists():
+    array = ak.Array([[1.1, 2.2, 3.3], [], [4.4, 5.5]])
+    result = ak.from_json(ak.to_json(array), form=array.layout.form)
+    assert ak.to_list(result) == [[1.1, 2.2, 3.3], [], [4.4, 5.5]]
+    assert result.layout.form == array.layout.form
+
+    form = ak.forms.ListOffsetForm("i64", ak.forms.NumpyForm([], 4, "i"))
+    result = ak.from_json("[[1, 2, 3], [], [4, 5]]", form=form)
+    assert ak.to_list(result) == [[1, 2, 3], [], [4, 5]]
+    assert str(ak.type(result)) == "3 * var * int32"
+
+    result = ak.from_json("[1, 2, 3]\n[]\n[4, 5]\n", form=form.tojson())
+    assert ak.to_list(result) == [[1, 2, 3], [], [4, 5]]
+
+    result = ak.from_json("[[1, 2, 3]]", form=form)
+    assert ak.to_list(result) == [[1, 2, 3]]
+
+    with pytest.raises(ValueError):
+        ak.from_json("[[1, 2.2]]", form=form)
+    with pytest.raises(ValueError):
+        ak.from_json('[[1, "two"]]', form=form)
+
+
+def test_regular():
+    array = ak.to_regular(ak.Array([[1, 2, 3], [4, 5, 6]]), axis=1)
+    result = ak.from_json("[[1, 2, 3], [4, 5, 6]]", form=array.layout.form)
+    assert str(ak.type(result)) == "2 * 3 * int64"
+    assert ak.to_list(result) == [[1, 2, 3], [4, 5, 6]]
+
+    with pytest.raises(ValueError):
+        ak.from_json("[[1, 2, 3], [4, 5]]", form=array.layout.form)
+
+    numpy = ak.layout.NumpyArray(np.arange(6, dtype=np.float32).reshape(3, 2))
+    result = ak.from_json("[[0, 1], [2, 3], [4, 5]]", form=numpy.form)
+    assert str(ak.type(result)) == "3 * 2 * float32"
+    assert ak.to_list(result) == [[0, 1], [2, 3], [4, 5]]
+
+
+def test_records():
+    array = ak.Array(
+        [
+            {"x": 1, "y": [1.1], "z": "one"},
+            {"x": 2, "y": [], "z": None},
+            {"x": 3, "y": [3.3, 3.3], "z": "three"},
+        ]
+    )
+    source = """
+        {"z": "one", "x": 1, "ignored": {"a": [1, {"b": 2}]}, "y": [1.1]}
+        {"x": 2, "y": [], "ignored": null}
+        {"ignored": [[]], "y": [3.3, 3.3], "x": 3, "z": "three"}
+    """
+    result = ak.from_json(source, form=array.layout.form)
+    assert ak.to_list(result) == ak.to_list(array)
+    assert ak.type(result) == ak.type(array)
+
+    with pytest.raises(ValueError):
+        ak.from_json('{"y": [], "z": null}', form=array.layout.form)
+    with pytest.raises(ValueError):
+        ak.from_json('{"x": 1, "x": 2, "y": []}', form=array.layout.form)
+
+
+def test_options():
+    array = ak.Array([[1, None, 3], None, [4]])
+    result = ak.from_json("[[1, null, 3], null, [4]]", form=array.layout.form)
+    assert ak.to_list(result) == [[1, None, 3], None, [4]]
+    assert ak.type(result) == ak.type(array)
+
+    result = ak.from_json(
+        '[1.1, "nan", "inf", "-inf"]',
+        form=ak.layout.NumpyArray(np.array([1.1])).form,
+        nan_string="nan",
+        infinity_string="inf",
+        minus_infinity_string="-inf",
+    )
+    assert ak.to_list(result)[0] == 1.1
+    assert np.isnan(ak.to_list(result)[1])
+    assert ak.to_list(result)[2:] == [np.inf, -np.inf]
+
+
+def test_masked_options():
+    source = '[{"x": 1, "y": [1.1]}, null, {"x": 3, "y": [3.3, 3.3]}, {"y": []}]'
+    expected = [
+        {"x": 1, "y": [1.1]},
+        None,
+        {"x": 3, "y": [3.3, 3.3]},
+        {"x": None, "y": []},
+    ]
+    record = ak.forms.RecordForm(
+        {
+            "x": ak.forms.ByteMaskedForm("i8", ak.forms.NumpyForm([], 8, "l"), False),
+            "y": ak.forms.ListOffsetForm("i64", ak.forms.NumpyForm([], 8, "d")),
+        }
+    )
+
+    for form in [
+        ak.forms.ByteMaskedForm("i8", record, True),
+        ak.forms.ByteMaskedForm("i8", record, False),
+        ak.forms.BitMaskedForm("u8", record, True, True),
+        ak.forms.BitMaskedForm("u8", record, False, False),
+    ]:
+        result = ak.from_json(source, form=form)
+        assert result.layout.form == form
+        assert ak.to_list(result) == expected
+
+    form = ak.forms.BitMaskedForm("u8", ak.forms.NumpyForm([], 8, "d"), True, False)
+    source = "[" + ", ".join("null" if i % 3 == 0 else str(i) for i in range(20)) + "]"
+    result = ak.from_json(source, form=form)
+    assert result.layout.form == form
+    assert ak.to_list(result) == [None if i % 3 == 0 else i for i in range(20)]
+
+    form = ak.forms.UnmaskedForm(ak.forms.NumpyForm([], 8, "l"))
+    result = ak.from_json("[1, 2, 3]", form=form)
+    assert result.layout.form == form
+    assert ak.to_list(result) == [1, 2, 3]
+    with pytest.raises(ValueError):
+        ak.from_json("[1, null, 3]", form=form)
+
+
+def test_single_value():
+    form = {
+        "class": "RecordArray",
+        "contents": {"x": "int64", "y": "float64"},
+    }
+    result = ak.from_json('{"x": 1, "y": 1.1}', form=form)
+    assert isinstance(result, ak.Record)
+    assert ak.to_list(result) == {"x": 1, "y": 1.1}
+    assert isinstance(ak.from_json('{"x": 1, "y": 1.1}'), ak.Record)
+
+    form = ak.forms.ListOffsetForm("i64", ak.forms.NumpyForm([], 8, "l"))
+    result = ak.from_json("[1, 2, 3]", form=form)
+    assert ak.to_list(result) == [[1, 2, 3]]
+    assert str(result.type) == "1 * var * int64"
+    result = ak.from_json("[[1, 2, 3]]", form=form)
+    assert ak.to_list(result) == [[1, 2, 3]]
+    assert str(result.type) == "1 * var * int64"
+
+    result = ak.from_json("3", form=ak.forms.NumpyForm([], 8, "l"))
+    assert ak.to_list(result) == [3]
+    assert str(result.type) == "1 * int64"
+
+
+def test_masked_empty():
+    for form in [
+        ak.forms.ByteMaskedForm("i8", ak.forms.EmptyForm(), True),
+        ak.forms.BitMaskedForm("u8", ak.forms.EmptyForm(), False, True),
+    ]:
+        result = ak.from_json("[null, null, null]", form=form)
+        assert ak.to_list(result) == [None, None, None]
+        assert str(result.type) == "3 * ?unknown"
+
+    form = ak.forms.ListOffsetForm(
+        "i64", ak.forms.ByteMaskedForm("i8", ak.forms.EmptyForm(), True)
+    )
+    result = ak.from_json("[[null], [], [null, null]]", form=form)
+    assert ak.to_list(result) == [[None], [], [None, None]]
+    assert str(result.type) == "3 * var * ?unknown"
+
+
+@pytest.mark.parametrize(
+    "dtype,good,bad",
+    [
+        (np.int8, [-128, 127], [128, -129]),
+        (np.uint8, [0, 255], [256, -1]),
+        (np.int16, [-(2 ** 15), 2 ** 15 - 1], [2 ** 15]),
+        (np.uint16, [0, 2 ** 16 - 1], [2 ** 16, -1]),
+        (np.int32, [-(2 ** 31), 2 ** 31 - 1], [2 ** 31, -(2 ** 31) - 1]),
+        (np.uint32, [0, 2 ** 32 - 1], [2 ** 32, -1]),
+        (np.uint64, [0, 2 ** 63 - 1], [-1]),
+    ],
+)
+def test_integer_range(dtype, good, bad):
+    form = ak.layout.NumpyArray(np.zeros(1, dtype)).form
+    result = ak.from_json(str(good), form=form)
+    assert result.layout.form == form
+    assert ak.to_list(result) == good
+    for value in bad:
+        with pytest.raises(ValueError):
+            ak.from_json("[0, {0}]".format(value), form=form)
+
+
+def test_file(tmp_path):
+    filename = os.path.join(str(tmp_path), "tmp.json")
+    with open(filename, "w") as f:
+        f.write('{"x": 1.1, "y": true}\n{"x": 2.2, "y": false}\n')
+
+    form = {
+        "class": "RecordArray",
+        "contents": {"x": "float64", "y": "bool"},
+    }
+    result = ak.from_json(filename, form=form, buffersize=16)
+    assert ak.to_list(result) == [{"x": 1.1, "y": True}, {"x": 2.2, "y": False}]
+
+
+def test_unsupported():
+    array = ak.Array([1, "two"])
+    with pytest.raises(ValueError):
+        ak.from_json('[1, "two"]', form=array.layout.form)
@@ -0,0 +1,86 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+from __future__ import absolute_import
+
+import os
+import threading
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+
+def write(tmp_path):
+    filenames = []
+    for i, text in enumerate(
+        [
+            '{"x": 1, "y": [1.1]}\n{"x": 2, "y": []}\n',
+            '[{"x": 3, "y": [3.3, 3.3]}]',
+            '{"x": 4, "y": [4.4]}\n',
+            "",
+            '{"x": 5, "y": [5.5, 5.5, 5.5]}\n{"x": 6, "y": []}\n',
+        ]
+    ):
+        filenames.append(os.path.join(str(tmp_path), "part{0}.json".format(i)))
+        with open(filenames[-1], "w") as f:
+            f.write(text)
+    return filenames
+
+
+def test_list(tmp_path):
+    filenames = write(tmp_path)
+    for threads in (None, 1, 3):
+        array = ak.from_json(filenames, threads=threads)
+        assert isinstance(array.layout, ak.partition.IrregularlyPartitionedArray)
+        assert ak.partitions(array) == [2, 1, 1, 2]
+        assert ak.to_list(array.x) == [1, 2, 3, 4, 5, 6]
+        assert ak.to_list(array.y) == [[1.1], [], [3.3, 3.3], [4.4], [5.5] * 3, []]
+
+    array = ak.from_json(filenames[:1])
+    assert ak.partitions(array) is None
+    assert ak.to_list(array.x) == [1, 2]
+
+
+def test_glob(tmp_path):
+    write(tmp_path)
+    array = ak.from_json(os.path.join(str(tmp_path), "part*.json"))
+    assert ak.partitions(array) == [2, 1, 1, 2]
+    assert ak.to_list(array.x) == [1, 2, 3, 4, 5, 6]
+
+    with pytest.raises(IOError):
+        ak.from_json(os.path.join(str(tmp_path), "nothing*.json"))
+
+
+def test_form(tmp_path):
+    filenames = write(tmp_path)
+    form = ak.Array([{"x": 1}]).layout.form
+    array = ak.from_json(filenames, form=form, threads=2)
+    assert str(ak.type(array)) == '6 * {"x": int64}'
+    assert ak.to_list(array.x) == [1, 2, 3, 4, 5, 6]
+
+
+def test_errors(tmp_path):
+    filenames = write(tmp_path)
+
+    with pytest.raises(ValueError):
+        ak.from_json([])
+
+    with pytest.raises(IOError):
+        ak.from_json(filenames + [os.path.join(str(tmp_path), "missing.json")])
+
+    scalar = os.path.join(str(tmp_path), "scalar.json")
+    with open(scalar, "w") as f:
+        f.write("123")
+    with pytest.raises(ValueError):
+        ak.from_json(filenames + [scalar], threads=2)
+
+
+def test_no_threads_left_behind(tmp_path):
+    filenames = write(tmp_path)
+    before = threading.active_count()
+    ak.from_json(filenames, threads=3)
+    with pytest.raises(IOError):
+        ak.from_json(
+            filenames + [os.path.join(str(tmp_path), "missing.json")], threads=3
+        )
+    assert threading.active_count() == before
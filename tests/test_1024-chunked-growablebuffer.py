@@ -0,0 +1,96 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+from __future__ import absolute_import
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+
+def fill(builder, n):
+    for i in range(n):
+        builder.begin_record()
+        builder.field("x")
+        builder.integer(i)
+        builder.field("y")
+        builder.begin_list()
+        for j in range(i % 4):
+            builder.real(j * 1.1)
+        builder.end_list()
+        builder.end_record()
+
+
+def expected(n):
+    return [{"x": i, "y": [j * 1.1 for j in range(i % 4)]} for i in range(n)]
+
+
+def test_chunked():
+    builder = ak.ArrayBuilder(initial=8, resize=2, chunked=True)
+    fill(builder, 100)
+    assert ak.to_list(builder) == expected(100)
+
+    fill(builder, 3)
+    assert ak.to_list(builder.snapshot())[100:] == expected(3)
+    assert len(builder) == 103
+
+
+def test_snapshots_stay_valid():
+    builder = ak.ArrayBuilder(initial=8, chunked=True)
+    fill(builder, 10)
+    first = builder.snapshot()
+    fill(builder, 1000)
+    assert ak.to_list(first) == expected(10)
+    assert ak.to_list(builder.snapshot()[:10]) == expected(10)
+
+
+def test_type_changes():
+    builder = ak.ArrayBuilder(initial=4, chunked=True)
+    for i in range(20):
+        builder.integer(i)
+    builder.real(20.5)
+    builder.complex(21 + 1j)
+    assert ak.to_list(builder) == list(range(20)) + [20.5, 21 + 1j]
+
+
+def test_stats():
+    n = 10000
+
+    ak.layout.growablebuffer_stats(reset=True)
+    builder = ak.ArrayBuilder(initial=8, resize=2)
+    for i in range(n):
+        builder.integer(i)
+    contiguous = ak.layout.growablebuffer_stats(reset=True)
+
+    builder = ak.ArrayBuilder(initial=8, resize=2, chunked=True)
+    for i in range(n):
+        builder.integer(i)
+    before_snapshot = ak.layout.growablebuffer_stats()
+    assert ak.to_list(builder.snapshot()) == list(range(n))
+    chunked = ak.layout.growablebuffer_stats()
+
+    assert before_snapshot["copies"] == 0
+    assert chunked["copies"] == 1
+    assert chunked["copied_bytes"] == n * 8
+    assert contiguous["copies"] > 1
+    assert contiguous["copied_bytes"] > chunked["copied_bytes"]
+    assert set(chunked) == set(
+        ["current_bytes", "peak_bytes", "copies", "copied_bytes"]
+    )
+
+
+def test_snapshots_leave_panels():
+    builder = ak.ArrayBuilder(initial=8, resize=2, chunked=True)
+    for i in range(100):
+        builder.integer(i)
+
+    ak.layout.growablebuffer_stats(reset=True)
+    first = builder.snapshot()
+    second = builder.snapshot()
+    stats = ak.layout.growablebuffer_stats()
+    assert stats["copies"] == 2
+    assert stats["copied_bytes"] == 2 * 100 * 8
+
+    builder.integer(100)
+    assert ak.to_list(first) == list(range(100))
+    assert ak.to_list(second) == list(range(100))
+    assert ak.to_list(builder.snapshot()) == list(range(101))
@@ -0,0 +1,95 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+from __future__ import absolute_import
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+
+data = [
+    {"x": 1, "y": [1, "one"], "z": None},
+    {"x": 2, "y": [], "z": [2.2]},
+    {"x": 3, "y": ["three", 3, None], "z": None},
+    {"x": 4, "y": [4], "z": [4.4, 4.4]},
+    {"x": 5, "y": [None, "five"], "z": []},
+    5,
+    None,
+    [6, "six"],
+]
+
+
+@pytest.mark.parametrize("chunked", [False, True])
+def test_incremental(chunked):
+    builder = ak.ArrayBuilder(initial=2, chunked=chunked)
+    pieces = []
+    for i, x in enumerate(data):
+        builder.append(x)
+        if i % 3 == 2:
+            pieces.append(builder.incremental_snapshot())
+    pieces.append(builder.incremental_snapshot())
+    pieces.append(builder.incremental_snapshot())
+
+    assert [len(x) for x in pieces] == [3, 3, 2, 0]
+    assert sum((ak.to_list(x) for x in pieces), []) == data
+    assert ak.to_list(builder.snapshot()) == data
+
+
+def test_snapshot_range():
+    builder = ak.ArrayBuilder()
+    for x in data:
+        builder.append(x)
+    layout = builder._layout
+    for start in range(len(data) + 1):
+        for stop in range(start, len(data) + 1):
+            assert ak.to_list(layout.snapshot_range(start, stop)) == data[start:stop]
+
+    with pytest.raises(ValueError):
+        layout.snapshot_range(3, 2)
+    with pytest.raises(ValueError):
+        layout.snapshot_range(0, len(data) + 1)
+
+
+def test_clear():
+    builder = ak.ArrayBuilder()
+    builder.integer(1)
+    builder.integer(2)
+    assert ak.to_list(builder.incremental_snapshot()) == [1, 2]
+    builder._layout.clear()
+    builder.integer(3)
+    assert ak.to_list(builder.incremental_snapshot()) == [3]
+
+
+def test_chunked_panels():
+    builder = ak.ArrayBuilder(initial=4, resize=2, chunked=True)
+    expected = []
+    pieces = []
+    for i in range(200):
+        x = {"x": i, "y": str(i) * (i % 3), "z": [0.5] * (i % 4), "b": i % 2 == 0}
+        builder.append(x)
+        expected.append(x)
+        if i % 7 == 6:
+            pieces.append(builder.incremental_snapshot())
+    pieces.append(builder.incremental_snapshot())
+    assert sum((ak.to_list(x) for x in pieces), []) == expected
+
+    builder = ak.ArrayBuilder(initial=4, resize=2, chunked=True)
+    for i in range(1020):
+        builder.integer(i)
+    builder.incremental_snapshot()
+    for i in range(1020, 1030):
+        builder.integer(i)
+
+    # the last panel ends at 1024, so only these 10 are copied
+    ak.layout.growablebuffer_stats(reset=True)
+    assert ak.to_list(builder.incremental_snapshot()) == list(range(1020, 1030))
+    stats = ak.layout.growablebuffer_stats()
+    assert stats["copies"] == 1
+    assert stats["copied_bytes"] == 10 * 8
+
+    # within a panel, the range shares its buffer
+    for i in range(1030, 1040):
+        builder.integer(i)
+    ak.layout.growablebuffer_stats(reset=True)
+    assert ak.to_list(builder.incremental_snapshot()) == list(range(1030, 1040))
+    assert ak.layout.growablebuffer_stats()["copies"] == 0
@@ -0,0 +1,90 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+from __future__ import absolute_import
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+
+@pytest.mark.parametrize("chunked", [False, True])
+def test_flat(chunked):
+    builder = ak.ArrayBuilder(initial=4, chunked=chunked)
+    builder.extend(np.arange(10, dtype=np.int32))
+    builder.extend(np.arange(10, 20, dtype=np.uint8))
+    assert str(builder.type) == "20 * int64"
+    assert ak.to_list(builder) == list(range(20))
+
+    builder.extend(np.array([20.5, 21.5], dtype=np.float32))
+    assert str(builder.type) == "22 * float64"
+    assert ak.to_list(builder) == list(range(20)) + [20.5, 21.5]
+
+    builder = ak.ArrayBuilder()
+    builder.null()
+    builder.extend(np.array([True, False]))
+    builder.extend(np.array([], dtype=np.float64))
+    assert ak.to_list(builder) == [None, True, False]
+    assert str(builder.type) == "3 * ?bool"
+
+
+def test_uint64():
+    builder = ak.ArrayBuilder()
+    builder.extend(np.array([0, 2 ** 63 - 1], np.uint64))
+    assert ak.to_list(builder) == [0, 2 ** 63 - 1]
+
+    with pytest.raises(ValueError):
+        builder.extend(np.array([1, np.uint64(2 ** 63)], np.uint64))
+    with pytest.raises(ValueError):
+        builder.extend(np.array([2 ** 64 - 1], np.uint64), counts=[1])
+    assert ak.to_list(builder) == [0, 2 ** 63 - 1]
+
+
+def test_counts():
+    builder = ak.ArrayBuilder()
+    builder.extend(np.array([1.1, 2.2, 3.3, 4.4, 5.5]), counts=[3, 0, 2])
+    builder.extend(np.array([6, 7]), counts=np.array([1, 1], dtype=np.int32))
+    assert ak.to_list(builder) == [[1.1, 2.2, 3.3], [], [4.4, 5.5], [6], [7]]
+    assert str(builder.type) == "5 * var * float64"
+
+    with pytest.raises(ValueError):
+        builder.extend(np.array([1, 2, 3]), counts=[1, 1])
+    with pytest.raises(ValueError):
+        builder.extend(np.array([1, 2, 3]), counts=[4, -1])
+    with pytest.raises(TypeError):
+        builder.extend(ak.Array([1, 2, 3]), counts=[1, 2])
+    with pytest.raises(TypeError):
+        builder.extend([1, 2, 3])
+
+
+def test_records():
+    builder = ak.ArrayBuilder()
+    for i in range(3):
+        builder.begin_record()
+        builder.field("x").integer(i)
+        builder.field("y").append(np.arange(i, dtype=np.int64))
+        builder.field("z").append(np.full(i, i * 1.1))
+        builder.end_record()
+    assert ak.to_list(builder) == [
+        {"x": 0, "y": [], "z": []},
+        {"x": 1, "y": [0], "z": [1.1]},
+        {"x": 2, "y": [0, 1], "z": [2.2, 2.2]},
+    ]
+
+    builder = ak.ArrayBuilder()
+    with builder.list():
+        builder.extend(np.array([[1, 2], [3, 4]]))
+    builder.append(np.array([True, False]))
+    builder.append("hello")
+    assert ak.to_list(builder) == [[[1, 2], [3, 4]], [True, False], "hello"]
+
+
+def test_unconverted_dtypes():
+    builder = ak.ArrayBuilder()
+    builder.extend(np.array([1 + 1j, 2 + 2j]))
+    builder.extend(np.array(["one", "two"]), counts=[0, 2])
+    assert ak.to_list(builder) == [1 + 1j, 2 + 2j, [], ["one", "two"]]
+
+    assert ak.to_list(ak.from_iter([np.arange(3), np.arange(2) * 1.5])) == [
+        [0, 1, 2],
+        [0.0, 1.5],
+    ]
@@ -0,0 +1,99 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+from __future__ import absolute_import
+
+import os
+import threading
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+
+pytest.importorskip("pyarrow.parquet")
+
+
+def data(n):
+    return [{"x": i, "y": [i * 1.1] * (i % 3)} for i in range(n)]
+
+
+def test_file(tmp_path):
+    filename = os.path.join(str(tmp_path), "test.parquet")
+    ak.to_parquet(ak.repartition(data(20), 3), filename)
+
+    serial = ak.from_parquet(filename)
+    for threads in (1, 2, 8):
+        array = ak.from_parquet(filename, threads=threads)
+        assert ak.partitions(array) == [3, 3, 3, 3, 3, 3, 2]
+        assert array.tolist() == data(20)
+        assert ak.type(array) == ak.type(serial)
+
+    array = ak.from_parquet(filename, row_groups=[4, 1], threads=2)
+    assert ak.partitions(array) == [3, 3]
+    assert array.tolist() == data(15)[12:] + data(6)[3:]
+
+    array = ak.from_parquet(filename, row_groups=[2], threads=2)
+    assert ak.partitions(array) is None
+    assert array.tolist() == data(9)[6:]
+
+    with pytest.raises(ValueError):
+        ak.from_parquet(filename, threads=0)
+    with pytest.raises(ValueError):
+        ak.from_parquet(filename, threads=2, lazy=True)
+
+
+def test_no_threads_left_behind(tmp_path, monkeypatch):
+    filename = os.path.join(str(tmp_path), "test.parquet")
+    ak.to_parquet(ak.repartition(data(20), 3), filename)
+
+    before = threading.active_count()
+    ak.from_parquet(filename, threads=4)
+    assert threading.active_count() == before
+
+    def broken(tables):
+        raise ZeroDivisionError
+
+    monkeypatch.setattr(ak.operations.convert, "_parquet_tables_to_layout", broken)
+    with pytest.raises(ZeroDivisionError):
+        ak.from_parquet(filename, threads=4)
+    assert threading.active_count() == before
+
+
+def test_file_like(tmp_path):
+    filename = os.path.join(str(tmp_path), "test.parquet")
+    ak.to_parquet(ak.repartition(list(range(100)), 7), filename)
+
+    with open(filename, "rb") as file:
+        array = ak.from_parquet(file, threads=4)
+    assert array.tolist() == list(range(100))
+    assert len(ak.partitions(array)) == 15
+
+
+def test_dataset(tmp_path):
+    ak.to_parquet(ak.repartition(data(5), 2), os.path.join(str(tmp_path), "1.parquet"))
+    ak.to_parquet(ak.Array(data(8)[5:]), os.path.join(str(tmp_path), "2.parquet"))
+
+    array = ak.from_parquet(tmp_path, threads=2)
+    assert ak.partitions(array) == [2, 2, 1, 3]
+    assert array.tolist() == data(8)
+
+    ak.to_parquet.dataset(tmp_path)
+    array = ak.from_parquet(tmp_path, threads=2)
+    assert ak.partitions(array) == [2, 2, 1, 3]
+    assert array.tolist() == data(8)
+
+
+def test_partition_columns(tmp_path):
+    os.mkdir(os.path.join(str(tmp_path), "z=a"))
+    os.mkdir(os.path.join(str(tmp_path), "z=b"))
+    ak.to_parquet(
+        ak.repartition(data(3), 2), os.path.join(str(tmp_path), "z=a", "part.parquet")
+    )
+    ak.to_parquet(
+        ak.Array(data(5)[3:]), os.path.join(str(tmp_path), "z=b", "part.parquet")
+    )
+
+    array = ak.from_parquet(tmp_path, threads=2)
+    assert ak.partitions(array) == [2, 1, 2]
+    assert array.z.tolist() == ["a", "a", "a", "b", "b"]
+    assert array[["x", "y"]].tolist() == data(5)
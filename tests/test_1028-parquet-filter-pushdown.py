@@ -0,0 +1,103 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+from __future__ import absolute_import
+
+import os
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+
+pytest.importorskip("pyarrow.parquet")
+
+
+def data(n):
+    return [
+        {"run": i, "muons": [{"pt": i * 10.0 + j} for j in range(i % 3)]}
+        for i in range(n)
+    ]
+
+
+@pytest.fixture
+def filename(tmp_path):
+    out = os.path.join(str(tmp_path), "test.parquet")
+    ak.to_parquet(ak.repartition(data(20), 4), out)
+    return out
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+def test_top_level(filename, lazy):
+    array = ak.from_parquet(filename, filter=("run", ">=", 10), lazy=lazy)
+    assert array.tolist() == data(20)[8:]
+
+    array = ak.from_parquet(filename, filter=[("run", ">", 4), ("run", "<", 9)])
+    assert array.tolist() == data(20)[4:12]
+
+    array = ak.from_parquet(filename, filter=[[("run", "==", 1)], [("run", "=", 17)]])
+    assert array.tolist() == data(20)[:4] + data(20)[16:]
+
+    array = ak.from_parquet(filename, filter=("run", "in", [5, 6, 100]), lazy=lazy)
+    assert array.tolist() == data(20)[4:8]
+
+    array = ak.from_parquet(filename, filter=("run", "!=", 3))
+    assert array.tolist() == data(20)
+
+
+def test_nested(filename):
+    array = ak.from_parquet(filename, filter=("muons.pt", ">", 150))
+    assert array.tolist() == data(20)[16:]
+
+    array = ak.from_parquet(filename, filter=("muons.pt", "<", 40), threads=2)
+    assert ak.partitions(array) is None
+    assert array.tolist() == data(20)[:4]
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+def test_nothing_selected(filename, lazy):
+    expected = ak.from_parquet(filename)
+    array = ak.from_parquet(filename, filter=("run", ">", 100), lazy=lazy)
+    assert isinstance(array, ak.Array)
+    assert len(array) == 0
+    assert str(array.type) == "0 * " + str(expected.type.type)
+    assert array.tolist() == []
+
+    array = ak.from_parquet(filename, filter=("run", ">", 100), highlevel=False)
+    assert isinstance(array, ak.layout.Content)
+
+
+def test_errors(filename):
+    with pytest.raises(ValueError):
+        ak.from_parquet(filename, filter=("nope", ">", 1))
+    with pytest.raises(ValueError):
+        ak.from_parquet(filename, filter=("run", "~", 1))
+
+
+def test_partition_columns(tmp_path):
+    os.mkdir(os.path.join(str(tmp_path), "z=a"))
+    os.mkdir(os.path.join(str(tmp_path), "z=b"))
+    ak.to_parquet(
+        ak.repartition(data(6), 2), os.path.join(str(tmp_path), "z=a", "part.parquet")
+    )
+    ak.to_parquet(
+        ak.repartition(data(12)[6:], 2),
+        os.path.join(str(tmp_path), "z=b", "part.parquet"),
+    )
+
+    expected = [dict(x, z="a") for x in data(6)[2:]] + [
+        dict(x, z="b") for x in data(12)[6:8]
+    ]
+    for lazy in (False, True):
+        array = ak.from_parquet(
+            tmp_path, filter=[("run", ">=", 2), ("run", "<", 8)], lazy=lazy
+        )
+        assert array.tolist() == expected
+
+    array = ak.from_parquet(tmp_path, filter=("run", ">", 100))
+    assert isinstance(array, ak.Array)
+    assert len(array) == 0
+    assert array.fields == ["z", "run", "muons"]
+    assert (
+        str(array.type)
+        == '0 * {"z": string, "run": int64, "muons": var * {"pt": float64}}'
+    )
@@ -0,0 +1,87 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+from __future__ import absolute_import
+
+import os
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+
+pytest.importorskip("pyarrow.parquet")
+
+
+def data(n):
+    return [{"x": i, "y": [i * 1.1] * (i % 3)} for i in range(n)]
+
+
+@pytest.fixture
+def filename(tmp_path):
+    out = os.path.join(str(tmp_path), "test.parquet")
+    ak.to_parquet(ak.repartition(data(20), 6), out)
+    return out
+
+
+@pytest.mark.parametrize("prefetch", [0, 1, 3])
+def test_row_groups(filename, prefetch):
+    batches = list(ak.iter_parquet(filename, prefetch=prefetch))
+    assert [len(x) for x in batches] == [6, 6, 6, 2]
+    assert sum((x.tolist() for x in batches), []) == data(20)
+    assert all(isinstance(x, ak.Array) for x in batches)
+
+
+@pytest.mark.parametrize("prefetch", [0, 2])
+def test_batch_size(filename, prefetch):
+    for batch_size in (1, 4, 6, 7, 20, 100):
+        batches = list(
+            ak.iter_parquet(filename, batch_size=batch_size, prefetch=prefetch)
+        )
+        lengths = [len(x) for x in batches]
+        assert all(x == batch_size for x in lengths[:-1])
+        assert 0 < lengths[-1] <= batch_size
+        assert sum((x.tolist() for x in batches), []) == data(20)
+
+
+def test_options(filename):
+    batches = list(
+        ak.iter_parquet(
+            filename,
+            columns=["x"],
+            row_groups=[3, 1],
+            batch_size=5,
+            highlevel=False,
+        )
+    )
+    assert all(isinstance(x, ak.layout.Content) for x in batches)
+    assert [ak.to_list(x.field("x")) for x in batches] == [
+        [18, 19, 6, 7, 8],
+        [9, 10, 11],
+    ]
+
+    batches = list(ak.iter_parquet(filename, filter=("x", ">=", 15)))
+    assert [x.x.tolist() for x in batches] == [[12, 13, 14, 15, 16, 17], [18, 19]]
+
+    with pytest.raises(ValueError):
+        ak.iter_parquet(filename, batch_size=0)
+    with pytest.raises(ValueError):
+        ak.iter_parquet(filename, prefetch=-1)
+
+
+def test_stop_early(filename):
+    iterator = ak.iter_parquet(filename, batch_size=1, prefetch=2)
+    assert next(iterator).tolist() == data(1)
+    iterator.close()
+
+
+def test_partition_columns(tmp_path):
+    os.mkdir(os.path.join(str(tmp_path), "z=a"))
+    os.mkdir(os.path.join(str(tmp_path), "z=b"))
+    ak.to_parquet(ak.Array(data(3)), os.path.join(str(tmp_path), "z=a", "p.parquet"))
+    ak.to_parquet(
+        ak.Array(data(5)[3:]), os.path.join(str(tmp_path), "z=b", "p.parquet")
+    )
+
+    batches = list(ak.iter_parquet(tmp_path, batch_size=2))
+    assert [x.z.tolist() for x in batches] == [["a", "a"], ["a", "b"], ["b"]]
+    assert sum((x[["x", "y"]].tolist() for x in batches), []) == data(5)
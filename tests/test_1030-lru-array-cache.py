@@ -0,0 +1,79 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+from __future__ import absolute_import
+
+import os
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+
+def test_mapping():
+    cache = ak.cache.LRUArrayCache(250)
+    cache["a"] = np.zeros(10)
+    cache["b"] = np.zeros(10)
+    cache["c"] = np.zeros(10)
+    assert list(cache) == ["a", "b", "c"]
+    assert cache.current_bytes == 240
+
+    assert cache["a"].tolist() == [0.0] * 10
+    cache["d"] = np.zeros(5)
+    assert list(cache) == ["c", "a", "d"]
+    assert cache.current_bytes == 200
+    assert (cache.hits, cache.misses, cache.evictions) == (1, 0, 1)
+
+    with pytest.raises(KeyError):
+        cache["b"]
+    assert cache.misses == 1
+    assert "b" not in cache and "c" in cache
+    assert cache.misses == 1
+
+    cache["big"] = np.zeros(100)
+    assert "big" not in cache
+    cache["c"] = np.zeros(1)
+    del cache["a"]
+    assert cache.current_bytes == 48
+    assert len(cache) == 2
+    assert "LRUArrayCache" in repr(cache)
+
+    with pytest.raises(ValueError):
+        ak.cache.LRUArrayCache(-1)
+
+
+def test_virtual():
+    cache = ak.cache.LRUArrayCache(2 * 80)
+    calls = []
+
+    def generate(i):
+        calls.append(i)
+        return ak.layout.NumpyArray(np.arange(10, dtype=np.int64) + i)
+
+    arrays = [
+        ak.virtual(generate, args=(i,), length=10, cache=cache, cache_key=str(i))
+        for i in range(3)
+    ]
+    assert [ak.sum(x) for x in arrays] == [45, 55, 65]
+    assert calls == [0, 1, 2]
+    assert list(cache) == ["1", "2"]
+    assert cache.evictions == 1
+
+    assert ak.sum(arrays[2]) == 65
+    assert calls == [0, 1, 2]
+    assert ak.sum(arrays[0]) == 45
+    assert calls == [0, 1, 2, 0]
+    assert list(cache) == ["2", "0"]
+
+
+def test_parquet(tmp_path):
+    pytest.importorskip("pyarrow.parquet")
+
+    filename = os.path.join(str(tmp_path), "test.parquet")
+    ak.to_parquet(ak.repartition(np.arange(1000, dtype=np.float64), 100), filename)
+
+    cache = ak.cache.LRUArrayCache(3 * 800)
+    array = ak.from_parquet(filename, lazy=True, lazy_cache=cache)
+    assert ak.sum(array) == 499500
+    assert len(cache) == 3
+    assert cache.current_bytes <= cache.limit_bytes
+    assert cache.evictions == 7
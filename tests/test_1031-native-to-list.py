@@ -0,0 +1,160 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+from __future__ import absolute_import
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+
+def test_numpy():
+    assert ak.layout.NumpyArray(np.arange(5)).tolist() == [0, 1, 2, 3, 4]
+    assert ak.to_list(np.arange(6).reshape(2, 3)[:, 1:]) == [[1, 2], [4, 5]]
+    assert ak.to_list(ak.layout.NumpyArray(np.array([True, False]))) == [True, False]
+
+    array = ak.layout.NumpyArray(np.array(["2020-01-01", "2021-02-03"], dtype="M8[D]"))
+    with pytest.raises(ValueError):
+        array.tolist()
+    assert ak.to_list(array) == list(
+        np.array(["2020-01-01", "2021-02-03"], dtype="M8[D]")
+    )
+
+
+def test_lists():
+    data = [[1.1, 2.2, 3.3], [], [4.4, 5.5], [], []]
+    array = ak.Array(data)
+    assert ak.to_list(array) == data
+    assert ak.to_list(array[1:]) == data[1:]
+    assert ak.to_list(array[[4, 2, 2, 0]]) == [data[4], data[2], data[2], data[0]]
+    assert ak.to_list(array[[1, 3]]) == [[], []]
+
+    listarray = ak.layout.ListArray32(
+        ak.layout.Index32(np.array([3, 0, 3], np.int32)),
+        ak.layout.Index32(np.array([5, 2, 3], np.int32)),
+        ak.layout.NumpyArray(np.arange(5)),
+    )
+    assert ak.to_list(listarray) == [[3, 4], [0, 1], []]
+
+    regular = ak.to_regular(ak.Array([[[1, 2], [3, 4]], [[5, 6], [7, 8]]]), axis=2)
+    assert ak.to_list(regular) == [[[1, 2], [3, 4]], [[5, 6], [7, 8]]]
+    assert ak.to_list(ak.layout.RegularArray(ak.layout.EmptyArray(), 0, 3)) == [
+        [],
+        [],
+        [],
+    ]
+
+
+def test_strings():
+    data = ["one", "", "three", None, "five"]
+    assert ak.to_list(ak.Array(data)) == data
+    assert ak.to_list(ak.Array([b"one", b"\xff"])) == [b"one", b"\xff"]
+    assert ak.to_list(ak.Array([["a", "bc"], [], ["d"]])) == [["a", "bc"], [], ["d"]]
+    assert ak.to_list(ak.Array(data)[[4, 0]]) == ["five", "one"]
+    assert ak.to_list(ak.to_categorical(ak.Array(["a", "b", "a"]))) == ["a", "b", "a"]
+
+
+def test_records():
+    data = [{"x": 1, "y": [1.1]}, {"x": 2, "y": []}, {"x": 3, "y": [3.3, 4.4]}]
+    array = ak.Array(data)
+    assert ak.to_list(array) == data
+    assert ak.to_list(array[1:]) == data[1:]
+    assert ak.to_list(array[2]) == data[2]
+    assert ak.to_list(array.layout[2]) == data[2]
+
+    tuples = ak.Array([(1, "a"), (2, "b")])
+    assert ak.to_list(tuples) == [(1, "a"), (2, "b")]
+    assert ak.to_list(ak.Array([{}, {}])) == [{}, {}]
+
+
+def test_options():
+    data = [1, None, 3, None, 5]
+    assert ak.to_list(ak.Array(data)) == data
+    assert ak.to_list(ak.Array([None, None])) == [None, None]
+
+    content = ak.layout.NumpyArray(np.arange(5))
+    bytemasked = ak.layout.ByteMaskedArray(
+        ak.layout.Index8(np.array([0, 1, 0, 1, 1], np.int8)), content, valid_when=True
+    )
+    assert ak.to_list(bytemasked) == [None, 1, None, 3, 4]
+
+    bitmasked = ak.layout.BitMaskedArray(
+        ak.layout.IndexU8(np.array([0b00010110], np.uint8)),
+        content,
+        valid_when=False,
+        length=5,
+        lsb_order=True,
+    )
+    assert ak.to_list(bitmasked) == [0, None, None, 3, None]
+
+    unmasked = ak.layout.UnmaskedArray(content)
+    assert ak.to_list(unmasked) == [0, 1, 2, 3, 4]
+
+
+def test_unions():
+    data = [1, "two", [3.3], None, {"x": 5}, "six"]
+    assert ak.to_list(ak.Array(data)) == data
+    assert ak.to_list(ak.Array(data)[::-1]) == data[::-1]
+
+
+def test_few_from_large():
+    # only the referenced items are converted, not the range between them
+    converted = []
+
+    def fallback(layout):
+        converted.append(len(layout))
+        return ak.to_list(ak.Array(layout))
+
+    dates = np.arange(1000000).astype("M8[s]")
+    content = ak.layout.NumpyArray(dates)
+
+    big = ak.layout.ListOffsetArray64(
+        ak.layout.Index64(np.arange(0, 1000001, 10)), content
+    )
+    assert big[[0, -1]].tolist(fallback) == [
+        list(dates[:10]),
+        list(dates[-10:]),
+    ]
+    assert converted == [20]
+
+    del converted[:]
+    indexed = ak.layout.IndexedArray64(
+        ak.layout.Index64(np.array([999999, 0, 500000], np.int64)), content
+    )
+    assert indexed.tolist(fallback) == [dates[999999], dates[0], dates[500000]]
+    assert converted == [3]
+
+    del converted[:]
+    option = ak.layout.IndexedOptionArray64(
+        ak.layout.Index64(np.array([5, -1, 999999], np.int64)), content
+    )
+    assert option.tolist(fallback) == [dates[5], None, dates[999999]]
+    assert converted == [2]
+
+    # nearby items are still converted as one range
+    del converted[:]
+    assert big[[3, 4, 6]].tolist(fallback) == [
+        list(dates[30:40]),
+        list(dates[40:50]),
+        list(dates[60:70]),
+    ]
+    assert converted == [40]
+
+
+def test_partitioned_and_virtual():
+    array = ak.repartition(ak.Array([[1, 2], [], [3], None, [4, 5]]), 2)
+    assert ak.to_list(array) == [[1, 2], [], [3], None, [4, 5]]
+
+    virtual = ak.virtual(lambda: ak.Array([[1.1], [2.2, 3.3]]), length=2)
+    assert ak.to_list(virtual) == [[1.1], [2.2, 3.3]]
+
+
+def test_behavior():
+    class ToListPoint(ak.Record):
+        pass
+
+    array = ak.Array(
+        [{"x": 1, "y": 2}],
+        with_name="ToListPoint",
+        behavior={"ToListPoint": ToListPoint},
+    )
+    assert ak.to_list(array) == [{"x": 1, "y": 2}]
@@ -0,0 +1,119 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+from __future__ import absolute_import
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+pyarrow = pytest.importorskip("pyarrow")
+
+
+def strip(layout):
+    while isinstance(layout, ak.layout.UnmaskedArray):
+        layout = layout.content
+    return layout
+
+
+def address(array):
+    return np.asarray(strip(array)).ctypes.data
+
+
+def test_to_arrow():
+    content = ak.layout.NumpyArray(np.arange(10, dtype=np.int64))
+    offsets = ak.layout.Index32(np.array([0, 3, 3, 5, 10], np.int32))
+    layout = ak.layout.ListOffsetArray32(offsets, content)
+
+    report = []
+    arrow = ak.to_arrow(layout, copy_report=report)
+    assert report == []
+    assert arrow.to_pylist() == ak.to_list(layout)
+    assert arrow.buffers()[1].address == address(offsets)
+    assert arrow.buffers()[3].address == address(content)
+
+    offsets64 = ak.layout.Index64(np.array([0, 3, 3, 5, 10], np.int64))
+    layout = ak.layout.ListOffsetArray64(offsets64, content)
+    report = []
+    arrow = ak.to_arrow(layout, copy_report=report)
+    assert report == []
+    assert arrow.buffers()[1].address == address(offsets64)
+
+    arrow = ak.to_arrow(layout, list_to32=True, copy_report=report)
+    assert report == [("", "ListOffsetArray64", "offsets narrowed to 32 bits")]
+
+    mask = ak.layout.IndexU8(np.array([0b00010110], np.uint8))
+    bitmasked = ak.layout.BitMaskedArray(mask, content, True, 5, True)
+    report = []
+    arrow = ak.to_arrow(bitmasked, copy_report=report)
+    assert report == []
+    assert arrow.to_pylist() == [None, 1, 2, None, 4]
+    assert arrow.buffers()[0].address == address(mask)
+    assert arrow.buffers()[1].address == address(content)
+
+    ak.to_arrow(
+        ak.layout.BitMaskedArray(mask, content, False, 5, False), copy_report=report
+    )
+    assert report == [
+        ("", "BitMaskedArray", "bit order reversed"),
+        ("", "BitMaskedArray", "mask inverted"),
+    ]
+
+
+def test_to_arrow_records():
+    array = ak.Array(
+        [{"x": 1.1, "y": [{"z": True}]}, {"x": 2.2, "y": []}, {"x": 3.3, "y": []}]
+    )
+    report = []
+    ak.to_arrow(array[1:], copy_report=report)
+    assert report == [("y.z", "NumpyArray", "booleans packed into bits")]
+
+    report = []
+    ak.to_arrow_table(array, copy_report=report)
+    assert report == [("y.z", "NumpyArray", "booleans packed into bits")]
+
+    report = []
+    strided = ak.layout.NumpyArray(np.arange(10.0))[::2]
+    assert ak.to_arrow(strided, copy_report=report).to_pylist() == [0, 2, 4, 6, 8]
+    assert report == [("", "NumpyArray", "non-contiguous data made contiguous")]
+
+
+def test_from_arrow():
+    arrow = pyarrow.array([[1.1, 2.2], None, [3.3]])
+    report = []
+    layout = ak.from_arrow(arrow, highlevel=False, copy_report=report)
+    assert report == []
+    assert ak.to_list(layout) == [[1.1, 2.2], None, [3.3]]
+    assert address(layout.mask) == arrow.buffers()[0].address
+    assert address(layout.content.offsets) == arrow.buffers()[1].address
+    assert address(strip(layout.content).content) == arrow.buffers()[3].address
+
+    arrow = pyarrow.array(["one", "two", "three"])[1:]
+    layout = ak.from_arrow(arrow, highlevel=False, copy_report=report)
+    assert report == []
+    assert ak.to_list(layout) == ["two", "three"]
+
+    batch = pyarrow.RecordBatch.from_arrays(
+        [pyarrow.array([1, 2]), pyarrow.array([True, False])], ["x", "y"]
+    )
+    layout = ak.from_arrow(batch, highlevel=False, copy_report=report)
+    assert ak.to_list(layout) == [{"x": 1, "y": True}, {"x": 2, "y": False}]
+    assert address(layout["x"]) == batch.column(0).buffers()[1].address
+    assert report == [("y", "bool", "bits unpacked into booleans")]
+
+    report = []
+    ak.from_arrow(pyarrow.Table.from_batches([batch, batch]), copy_report=report)
+    assert report == [
+        ("x", "int64", "chunks concatenated"),
+        ("y", "bool", "chunks concatenated"),
+        ("y", "bool", "bits unpacked into booleans"),
+    ]
+
+
+def test_round_trip():
+    array = ak.Array([{"x": [1, 2, 3], "y": "one"}, {"x": [], "y": "two"}])
+    report = []
+    arrow = ak.to_arrow(array, string_to32=False, copy_report=report)
+    back = ak.from_arrow(arrow, highlevel=False, copy_report=report)
+    assert report == []
+    assert ak.to_list(back) == array.tolist()
+    assert address(strip(back["y"]).content) == address(array.layout["y"].content)
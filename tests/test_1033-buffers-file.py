@@ -0,0 +1,63 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+from __future__ import absolute_import
+
+import os
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+
+data = [
+    {"x": [1, 2, 3], "y": "one", "z": None},
+    {"x": [], "y": "", "z": 2.2},
+    {"x": [4, 5], "y": "three", "z": 3.3},
+]
+
+
+def test_round_trip(tmp_path):
+    filename = os.path.join(str(tmp_path), "test.akb")
+    ak.to_buffers_file(ak.Array(data), filename)
+    assert os.path.getsize(filename) % 64 == 0
+
+    array = ak.from_buffers_file(filename)
+    assert array.tolist() == data
+    assert str(array.type) == str(ak.Array(data).type)
+
+    assert np.asarray(array.layout.field("x").content).ctypes.data % 64 == 0
+
+    # the buffers are views of the file, not copies
+    with open(filename, "rb") as file:
+        position = file.read().index(np.array([1, 2, 3, 4, 5]).tobytes())
+    with open(filename, "r+b") as file:
+        file.seek(position)
+        file.write(np.array([100]).tobytes())
+    assert array.x.tolist() == [[100, 2, 3], [], [4, 5]]
+
+
+def test_partitioned_and_lazy(tmp_path):
+    filename = os.path.join(str(tmp_path), "test.akb")
+    ak.to_buffers_file(ak.repartition(data, 2), filename)
+
+    array = ak.from_buffers_file(filename)
+    assert ak.partitions(array) == [2, 1]
+    assert array.tolist() == data
+
+    array = ak.from_buffers_file(filename, lazy=True)
+    assert isinstance(array.layout.partition(0), ak.layout.VirtualArray)
+    assert array.x.tolist() == [x["x"] for x in data]
+
+
+def test_empty(tmp_path):
+    filename = os.path.join(str(tmp_path), "test.akb")
+    ak.to_buffers_file(ak.Array([[], []]), filename)
+    assert ak.from_buffers_file(filename).tolist() == [[], []]
+
+
+def test_not_a_buffers_file(tmp_path):
+    filename = os.path.join(str(tmp_path), "test.akb")
+    with open(filename, "wb") as file:
+        file.write(b"PAR1" + b"\x00" * 100)
+    with pytest.raises(ValueError):
+        ak.from_buffers_file(filename)
@@ -0,0 +1,86 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+from __future__ import absolute_import
+
+import os
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+
+def data(n):
+    return [
+        {
+            "x": list(range(i % 7)),
+            "y": str(i),
+            "z": [1, "two", None][i % 3],
+            "w": None if i % 5 == 0 else i * 1.5,
+        }
+        for i in range(n)
+    ]
+
+
+@pytest.mark.parametrize("compression", ["none", "zlib", "bz2", "lzma", "lz4", "zstd"])
+def test_round_trip(compression):
+    if compression == "lzma":
+        pytest.importorskip("lzma")
+    elif compression == "lz4":
+        pytest.importorskip("lz4.frame")
+    elif compression == "zstd":
+        pytest.importorskip("zstandard")
+
+    array = ak.Array(data(1000))
+    form, length, container = ak.to_buffers(array, compression=compression)
+    assert all(isinstance(x, bytes) for x in container.values())
+
+    out = ak.from_buffers(form, length, container, compressed=True)
+    assert out.tolist() == array.tolist()
+
+    out = ak.from_buffers(form, length, container, compressed=True, lazy=True)
+    assert out.tolist() == array.tolist()
+
+
+def test_filters():
+    array = ak.Array(data(1000))
+    _, _, raw = ak.to_buffers(array)
+    _, _, encoded = ak.to_buffers(array, compression="none")
+    _, _, compressed = ak.to_buffers(array, compression="zlib", compression_level=9)
+
+    offsets = "part0-node1-offsets"
+    assert np.asarray(raw[offsets]).nbytes == 8008
+    assert len(compressed[offsets]) < 100
+
+    tags = [x for x in raw if x.endswith("-tags")][0]
+    assert len(encoded[tags]) < 0.3 * np.asarray(raw[tags]).nbytes
+
+    assert sum(len(x) for x in compressed.values()) < 0.2 * sum(
+        np.asarray(x).nbytes for x in raw.values()
+    )
+
+
+def test_edge_cases():
+    for array in [
+        ak.Array([[], [], []]),
+        ak.Array([]),
+        ak.Array([1, None, 2]),
+        ak.Array(np.arange(12).reshape(3, 4)),
+        ak.Array([[np.iinfo(np.int64).max, 0, np.iinfo(np.int64).min]]),
+        ak.repartition(ak.Array([[1, 2], [], [3]]), 2),
+    ]:
+        out = ak.from_buffers(
+            *ak.to_buffers(array, compression="zlib"), compressed=True
+        )
+        assert out.tolist() == array.tolist()
+
+    with pytest.raises(ValueError):
+        ak.to_buffers(ak.Array([1, 2, 3]), compression="gzip")
+    with pytest.raises(ValueError):
+        ak.from_buffers(*ak.to_buffers(ak.Array([1, 2, 3])), compressed=True)
+
+
+def test_buffers_file(tmp_path):
+    filename = os.path.join(str(tmp_path), "test.akb")
+    ak.to_buffers_file(ak.Array(data(1000)), filename, compression="zlib")
+    assert ak.from_buffers_file(filename).tolist() == data(1000)
+    assert ak.from_buffers_file(filename, lazy=True).tolist() == data(1000)
@@ -0,0 +1,119 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+from __future__ import absolute_import
+
+import threading
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+futures = pytest.importorskip("concurrent.futures")
+
+
+data = [[1.1, 2.2, 3.3], [], [4.4, 5.5], [6.6], [], [7.7, 8.8, 9.9], [10.0]]
+
+
+@pytest.fixture(params=[None, 4, "futures"])
+def executor(request):
+    if request.param == "futures":
+        executor = futures.ThreadPoolExecutor(4)
+    else:
+        executor = request.param
+    previous = ak.partition.set_executor(executor)
+    try:
+        yield executor
+    finally:
+        ak.partition.set_executor(previous)
+        if request.param == "futures":
+            executor.shutdown()
+
+
+def test_set_executor():
+    previous = ak.partition.set_executor(2)
+    try:
+        assert ak.partition.get_executor() is not None
+        threads = set()
+
+        def record(x):
+            threads.add(threading.current_thread().name)
+            return x
+
+        assert ak.partition.execute(record, range(10)) == list(range(10))
+        assert threading.current_thread().name not in threads
+
+        with pytest.raises(ValueError):
+            ak.partition.set_executor(0)
+        with pytest.raises(TypeError):
+            ak.partition.set_executor("threads")
+    finally:
+        ak.partition.set_executor(previous)
+    assert ak.partition.get_executor() is previous
+
+
+def test_ufuncs(executor):
+    array = ak.repartition(ak.Array(data), 2)
+    assert ak.partitions(array) == [2, 2, 2, 1]
+    assert ak.to_list(array * 10) == [[x * 10 for x in y] for y in data]
+    assert ak.to_list(np.sqrt(array ** 2)) == ak.to_list(array)
+    assert ak.partitions(array + array) == [2, 2, 2, 1]
+
+
+def test_reducers(executor):
+    array = ak.repartition(ak.Array(data), 2)
+    regular = ak.repartition(np.arange(60).reshape(20, 3), 6)
+    flat = [y for x in data for y in x]
+
+    assert ak.sum(array) == pytest.approx(sum(flat))
+    assert ak.count(array) == len(flat)
+    assert ak.count_nonzero(array) == len(flat)
+    assert ak.min(array) == 1.1
+    assert ak.max(array) == 10.0
+    assert ak.prod(ak.repartition(ak.Array([[1, 2], [], [3, 4]]), 1)) == 24
+    assert not ak.any(array > 10)
+    assert ak.all(array > 1)
+    assert ak.mean(array) == pytest.approx(np.mean(flat))
+    assert ak.var(array) == pytest.approx(np.var(flat))
+
+    assert ak.to_list(ak.sum(array, axis=1)) == pytest.approx([sum(x) for x in data])
+    assert (
+        ak.to_list(ak.sum(regular, axis=0))
+        == np.arange(60).reshape(20, 3).sum(axis=0).tolist()
+    )
+    assert ak.to_list(ak.min(regular, axis=0, keepdims=True)) == [[0, 1, 2]]
+    assert ak.to_list(ak.count(regular, axis=0)) == [20, 20, 20]
+
+    jagged = ak.repartition(ak.Array([[1, 2, 3], [], [4], [5, 6]]), 2)
+    assert ak.to_list(ak.sum(jagged, axis=0)) == [10, 8, 3]
+    assert ak.to_list(ak.max(jagged, axis=0)) == [5, 6, 3]
+    assert ak.to_list(ak.count(jagged, axis=0)) == [3, 2, 1]
+    assert ak.to_list(ak.argmax(jagged, axis=0)) == [3, 3, 0]
+    assert ak.to_list(ak.min(ak.repartition(ak.Array([[], [], []]), 1), axis=0)) == []
+
+
+def test_structure(executor):
+    array = ak.repartition(ak.Array(data), 3)
+    assert ak.to_list(ak.num(array)) == [len(x) for x in data]
+    assert ak.num(array, axis=0) == len(data)
+    assert ak.to_list(ak.flatten(array)) == [y for x in data for y in x]
+    assert ak.to_list(ak.combinations(array, 2)) == ak.to_list(
+        ak.combinations(ak.Array(data), 2)
+    )
+    assert ak.to_list(ak.sort(array, ascending=False)) == [
+        sorted(x, reverse=True) for x in data
+    ]
+    assert ak.to_list(ak.fill_none(ak.pad_none(array, 2), 0, axis=-1)) == ak.to_list(
+        ak.fill_none(ak.pad_none(ak.Array(data), 2), 0, axis=-1)
+    )
+
+
+def test_nested(executor):
+    array = ak.repartition(ak.Array(data), 2)
+
+    # reducing a repartitioned partition runs within an executor task
+    def function(x):
+        inner = ak.sum(ak.repartition(x, 1, highlevel=False), axis=1)
+        return inner.layout.toContent()
+
+    out = ak.partition.apply(function, array.layout)
+    assert ak.to_list(out) == pytest.approx([sum(x) for x in data])
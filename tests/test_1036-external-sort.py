@@ -0,0 +1,142 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+from __future__ import absolute_import
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+
+@pytest.fixture
+def small_blocks():
+    previous = ak.partition._merge_block_length
+    ak.partition._merge_block_length = 7
+    try:
+        yield
+    finally:
+        ak.partition._merge_block_length = previous
+
+
+def partitioned(data, lengths):
+    parts = []
+    start = 0
+    for length in lengths:
+        parts.append(ak.layout.NumpyArray(data[start : start + length]))
+        start += length
+    return ak.Array(ak.partition.IrregularlyPartitionedArray(parts))
+
+
+@pytest.mark.parametrize("dtype", [np.int32, np.uint64, np.float64, np.bool_])
+@pytest.mark.parametrize("ascending", [True, False])
+def test_sort(small_blocks, dtype, ascending):
+    data = np.random.RandomState(12345).randint(0, 10, 200).astype(dtype)
+    if dtype == np.float64:
+        data[::9] = np.nan
+    array = partitioned(data, [37, 50, 13, 100])
+
+    out = ak.sort(array, axis=0, ascending=ascending)
+    assert isinstance(out.layout, ak.partition.PartitionedArray)
+    assert ak.partitions(out) == [37, 50, 13, 100]
+    expected = ak.sort(ak.Array(data), axis=0, ascending=ascending)
+    assert str(ak.to_list(out)) == str(ak.to_list(expected))
+
+    out = ak.argsort(array, axis=0, ascending=ascending)
+    assert ak.partitions(out) == [37, 50, 13, 100]
+    expected = ak.argsort(ak.Array(data), axis=0, ascending=ascending, stable=True)
+    assert ak.to_list(out) == ak.to_list(expected)
+
+
+def test_lazy(small_blocks):
+    data = np.arange(100)[::-1] % 17
+    form = ak.forms.NumpyForm([], 8, "l")
+    array = ak.Array(
+        ak.partition.IrregularlyPartitionedArray(
+            [
+                ak.virtual(
+                    lambda i=i: data[i * 25 : (i + 1) * 25],
+                    length=25,
+                    form=form,
+                    cache=None,
+                    highlevel=False,
+                )
+                for i in range(4)
+            ]
+        )
+    )
+    assert ak.to_list(ak.sort(array, axis=0)) == sorted(data.tolist())
+    assert ak.to_list(array[ak.argsort(array, axis=0)]) == sorted(data.tolist())
+
+
+def test_lazy_is_not_concatenated(small_blocks, monkeypatch):
+    data = np.arange(100)[::-1] % 17
+    form = ak.forms.NumpyForm([], 8, "l")
+    materialized = []
+
+    def generate(i):
+        materialized.append(i)
+        return data[i * 25 : (i + 1) * 25]
+
+    array = ak.Array(
+        ak.partition.IrregularlyPartitionedArray(
+            [
+                ak.virtual(
+                    generate,
+                    args=(i,),
+                    length=25,
+                    form=form,
+                    cache=None,
+                    highlevel=False,
+                )
+                for i in range(4)
+            ]
+        )
+    )
+
+    def concatenated(self):
+        raise AssertionError("partitions were concatenated in memory")
+
+    monkeypatch.setattr(ak.partition.PartitionedArray, "toContent", concatenated)
+    assert ak.partition._external_sortable(array.layout.partitions)
+    assert materialized == []
+
+    out = ak.sort(array, axis=0)
+    assert sorted(materialized) == [0, 1, 2, 3]
+    assert ak.partitions(out) == [25, 25, 25, 25]
+
+    index = ak.argsort(array, axis=0)
+    assert ak.partitions(index) == [25, 25, 25, 25]
+
+    monkeypatch.undo()
+    assert ak.to_list(out) == sorted(data.tolist())
+    assert ak.to_list(array[index]) == sorted(data.tolist())
+
+    # without a known form, a lazy partition can't be checked without
+    # materializing it, so it falls back to the in-memory sort
+    unknown = ak.partition.IrregularlyPartitionedArray(
+        [
+            ak.virtual(generate, args=(i,), length=25, cache=None, highlevel=False)
+            for i in range(4)
+        ]
+    )
+    assert not ak.partition._external_sortable(unknown.partitions)
+
+
+def test_fallback():
+    array = ak.repartition(ak.Array([[3, 1], [], [2], [0]]), 2)
+    assert ak.to_list(ak.sort(array, axis=0)) == [[0, 1], [], [2], [3]]
+    assert ak.to_list(ak.sort(array, axis=1)) == [[1, 3], [], [2], [0]]
+    assert ak.partitions(ak.sort(array, axis=1)) == [2, 2]
+
+    array = ak.repartition(ak.Array([3, None, 1, 2]), 2)
+    assert ak.to_list(ak.sort(array, axis=0)) == [1, 2, 3, None]
+
+
+def test_parallel_inner_axis():
+    previous = ak.partition.set_executor(2)
+    try:
+        array = ak.repartition(ak.Array([[3, 1, 2], [], [5, 4], [0]]), 2)
+        assert ak.to_list(ak.sort(array, axis=-1)) == [[1, 2, 3], [], [4, 5], [0]]
+        assert ak.to_list(ak.argsort(array, axis=-1)) == [[1, 2, 0], [], [1, 0], [0]]
+        assert ak.to_list(ak.sort(array, axis=0)) == [[0, 1, 2], [], [3, 4], [5]]
+    finally:
+        ak.partition.set_executor(previous)
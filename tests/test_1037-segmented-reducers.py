@@ -0,0 +1,110 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+from __future__ import absolute_import
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+
+def lists(dtype):
+    content = ak.layout.NumpyArray(np.array([3, 1, 4, 1, 5, 9, 2, 6, 5, 3], dtype))
+    offsets = ak.layout.Index64(np.array([0, 3, 3, 5, 6, 10], np.int64))
+    return ak.layout.ListOffsetArray64(offsets, content)
+
+
+expected = [[3, 1, 4], [], [1, 5], [9], [2, 6, 5, 3]]
+
+
+@pytest.mark.parametrize(
+    "dtype",
+    [
+        np.int8,
+        np.uint8,
+        np.int16,
+        np.uint16,
+        np.int32,
+        np.uint32,
+        np.int64,
+        np.uint64,
+        np.float32,
+        np.float64,
+    ],
+)
+def test_dtypes(dtype):
+    array = lists(dtype)
+    assert ak.to_list(ak.sum(array, axis=-1)) == [sum(x) for x in expected]
+    assert ak.to_list(ak.count(array, axis=-1)) == [len(x) for x in expected]
+    assert ak.to_list(ak.min(array, axis=-1)) == [
+        min(x) if x else None for x in expected
+    ]
+    assert ak.to_list(ak.max(array, axis=-1)) == [
+        max(x) if x else None for x in expected
+    ]
+    if issubclass(dtype, np.floating):
+        assert np.asarray(ak.sum(array, axis=-1)).dtype == dtype
+    elif issubclass(dtype, np.signedinteger):
+        assert np.asarray(ak.sum(array, axis=-1)).dtype == np.int64
+    else:
+        assert np.asarray(ak.sum(array, axis=-1)).dtype == np.uint64
+    assert np.asarray(ak.max(array, axis=-1, mask_identity=False)).dtype == dtype
+
+
+def test_options():
+    array = lists(np.int64)
+    assert ak.to_list(ak.min(array, axis=-1, mask_identity=False)) == [
+        1,
+        np.iinfo(np.int64).max,
+        1,
+        9,
+        2,
+    ]
+    assert ak.to_list(ak.max(array, axis=-1, initial=4)) == [4, None, 5, 9, 6]
+    assert ak.to_list(ak.min(array, axis=-1, initial=2)) == [1, None, 1, 2, 2]
+    assert ak.to_list(ak.sum(array, axis=-1, keepdims=True)) == [
+        [8],
+        [0],
+        [6],
+        [9],
+        [16],
+    ]
+    assert ak.to_list(ak.count(array, axis=-1, mask_identity=True)) == [
+        3,
+        None,
+        2,
+        1,
+        4,
+    ]
+
+    floats = ak.Array([[1.5, np.nan, -2.5], [np.nan], [0.5]])
+    assert ak.to_list(ak.min(floats, axis=-1)) == [-2.5, np.inf, 0.5]
+    assert ak.to_list(ak.max(floats, axis=-1)) == [1.5, -np.inf, 0.5]
+
+
+def test_layouts():
+    array = ak.Array([[[1, 2], []], [[3]], [], [[4, 5, 6]]])
+    assert ak.to_list(ak.sum(array, axis=-1)) == [[3, 0], [3], [], [15]]
+    assert ak.to_list(ak.sum(array[1:], axis=-1)) == [[3], [], [15]]
+    assert ak.to_list(ak.sum(array[:, ::-1], axis=-1)) == [[0, 3], [3], [], [15]]
+    assert ak.to_list(ak.max(array[[3, 0]], axis=-1)) == [[6], [2, None]]
+
+    # not segmented: positions, bool, and reductions at other axes
+    assert ak.to_list(ak.argmax(array, axis=-1)) == [[1, None], [0], [], [2]]
+    assert ak.to_list(ak.sum(ak.Array([[True, True], [False]]), axis=-1)) == [2, 0]
+    assert ak.to_list(ak.sum(array, axis=1)) == [[1, 2], [3], [], [4, 5, 6]]
+
+
+def test_parallel():
+    previous = ak.layout.kernel_parallel(threads=4, threshold=0)
+    try:
+        data = np.arange(1000) % 17
+        counts = np.arange(45)
+        array = ak.unflatten(data[: counts.sum()], counts)
+        starts = np.cumsum(counts) - counts
+        assert ak.to_list(ak.sum(array, axis=-1)) == [
+            int(data[start : start + count].sum())
+            for start, count in zip(starts, counts)
+        ]
+        assert ak.to_list(ak.count(array, axis=-1)) == counts.tolist()
+    finally:
+        ak.layout.kernel_parallel(*previous)
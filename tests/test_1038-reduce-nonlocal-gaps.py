@@ -0,0 +1,61 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+from __future__ import absolute_import
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+
+def columnwise_sum(outer):
+    out = []
+    for inner in outer:
+        sums = []
+        for sublist in inner:
+            for i, x in enumerate(sublist):
+                if i < len(sums):
+                    sums[i] += x
+                else:
+                    sums.append(x)
+        out.append(sums)
+    return out
+
+
+def test_empty_lists_between_nonempty():
+    data = [
+        [[1, 2], []],
+        [],
+        [[]],
+        [[3], [4, 5, 6]],
+        [[], []],
+        [],
+        [[7, 8, 9, 10]],
+        [[], [11]],
+        [],
+    ]
+    array = ak.Array(data)
+    assert ak.sum(array, axis=1).tolist() == columnwise_sum(data)
+    assert ak.count(array, axis=1).tolist() == [
+        [1, 1],
+        [],
+        [],
+        [2, 1, 1],
+        [],
+        [],
+        [1, 1, 1, 1],
+        [1],
+        [],
+    ]
+
+
+@pytest.mark.parametrize("seed", [1, 2, 3])
+def test_random(seed):
+    random = np.random.RandomState(seed)
+    counts = random.poisson(2, 500)
+    content = random.randint(0, 100, counts.sum())
+    inner = ak.unflatten(content, counts)
+    outer = random.poisson(2, 300)
+    stops = np.minimum(np.cumsum(outer), len(inner))
+    stops[-1] = len(inner)
+    array = ak.unflatten(inner, np.diff(np.concatenate([[0], stops])))
+    assert ak.sum(array, axis=1).tolist() == columnwise_sum(array.tolist())
@@ -0,0 +1,109 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+from __future__ import absolute_import
+
+import json
+import os
+import subprocess
+import sys
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+
+def test_counts():
+    array = ak.Array([[1.1, 2.2, 3.3], [], [4.4, 5.5]])
+    assert ak.layout.kernel_profiling()[0] is False
+
+    with ak.profiling() as profile:
+        assert ak.layout.kernel_profiling()[0] is True
+        ak.sum(array, axis=1)
+        ak.sum(array, axis=1)
+    assert ak.layout.kernel_profiling()[0] is False
+
+    counts = profile.counts
+    assert set(ak.fields(counts)) == set(["kernel", "calls", "elements", "seconds"])
+    assert counts.seconds.tolist() == sorted(counts.seconds.tolist(), reverse=True)
+
+    rows = dict(zip(counts.kernel.tolist(), counts.tolist()))
+    summed = rows["awkward_ListOffsetArray_reduce_segmented_sum_float64_float64_64"]
+    assert summed["calls"] == 2
+    assert summed["elements"] == 2 * 3
+
+    table = profile.table()
+    assert table.splitlines()[0].split()[:3] == ["kernel", "calls", "elements"]
+    assert "awkward_ListOffsetArray_reduce_segmented_sum_float64_float64_64" in table
+    assert len(profile.table(limit=1).splitlines()) == 2
+
+    # nothing is recorded outside of the context
+    ak.sum(array, axis=1)
+    assert profile.counts.tolist() == counts.tolist()
+
+
+def test_nested():
+    array = ak.Array([[1, 2, 3], [], [4, 5]])
+    with ak.profiling() as outer:
+        ak.num(array)
+        with ak.profiling() as inner:
+            ak.sum(array, axis=1)
+        assert ak.layout.kernel_profiling()[0] is True
+    assert ak.layout.kernel_profiling()[0] is False
+
+    outer_kernels = set(outer.counts.kernel.tolist())
+    inner_kernels = set(inner.counts.kernel.tolist())
+    assert (
+        "awkward_ListOffsetArray_reduce_segmented_sum_int64_int64_64" in inner_kernels
+    )
+    assert inner_kernels.issubset(outer_kernels)
+    assert "awkward_ListOffsetArray_compact_offsets_64" not in inner_kernels
+
+
+def test_chrome_trace(tmp_path):
+    array = ak.Array([[1, 2, 3], [], [4, 5]])
+    with ak.profiling() as profile:
+        ak.sum(array, axis=1)
+
+    trace = profile.chrome_trace()
+    events = trace["traceEvents"]
+    assert len(events) == sum(profile.counts.calls.tolist())
+    for event in events:
+        assert event["ph"] == "X"
+        assert event["name"].startswith("awkward_")
+        assert event["dur"] >= 0
+        assert "elements" in event["args"]
+    assert [x["ts"] for x in events] == sorted(x["ts"] for x in events)
+
+    path = os.path.join(str(tmp_path), "trace.json")
+    profile.to_chrome_trace(path)
+    with open(path) as file:
+        assert json.load(file) == json.loads(json.dumps(trace))
+
+
+def test_max_events():
+    array = ak.Array([[1, 2, 3], [], [4, 5]])
+    with ak.profiling(max_events=2) as profile:
+        for _ in range(5):
+            ak.sum(array, axis=1)
+    assert len(profile.chrome_trace()["traceEvents"]) == 2
+    assert profile.dropped == sum(profile.counts.calls.tolist()) - 2
+
+
+def test_environment_variable(tmp_path):
+    path = os.path.join(str(tmp_path), "process.json")
+    env = dict(os.environ)
+    env["AWKWARD_PROFILE"] = path
+    subprocess.check_call(
+        [
+            sys.executable,
+            "-c",
+            "import awkward as ak; ak.sum(ak.Array([[1, 2, 3], [], [4, 5]]), axis=1)",
+        ],
+        env=env,
+    )
+    with open(path) as file:
+        trace = json.load(file)
+    assert any(
+        x["name"] == "awkward_ListOffsetArray_reduce_segmented_sum_int64_int64_64"
+        for x in trace["traceEvents"]
+    )
@@ -0,0 +1,81 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+from __future__ import absolute_import
+
+import pickle
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+protocol5 = pytest.mark.skipif(
+    not hasattr(pickle, "PickleBuffer"), reason="pickle protocol 5 requires Python 3.8+"
+)
+
+
+@protocol5
+def test_out_of_band():
+    array = ak.Array([[1.1, 2.2, 3.3], [], [4.4, 5.5]] * 1000)
+    form, length, container = ak.to_buffers(array)
+
+    buffers = []
+    data = pickle.dumps(array, protocol=5, buffer_callback=buffers.append)
+    assert len(buffers) == len(container)
+    assert len(data) < 1000
+
+    out = pickle.loads(data, buffers=buffers)
+    assert out.tolist() == array.tolist()
+
+    # the unpickled array views the out-of-band buffers without copying
+    content = np.asarray(out.layout.content)
+    views = [np.frombuffer(x, np.uint8) for x in buffers]
+    assert any(
+        content.ctypes.data == x.ctypes.data and content.nbytes == x.nbytes
+        for x in views
+    )
+
+
+@protocol5
+def test_in_band():
+    array = ak.Array([[1, 2, 3], [], [4, 5]])
+    assert pickle.loads(pickle.dumps(array, protocol=5)).tolist() == array.tolist()
+
+
+def test_older_protocols():
+    array = ak.Array([{"x": 1, "y": [1.1]}, {"x": 2, "y": []}])
+    for protocol in range(2, min(pickle.HIGHEST_PROTOCOL, 4) + 1):
+        assert (
+            pickle.loads(pickle.dumps(array, protocol=protocol)).tolist()
+            == array.tolist()
+        )
+
+
+@protocol5
+def test_record():
+    array = ak.Array([{"x": 1, "y": [1.1]}, {"x": 2, "y": [2.2, 3.3]}])
+    buffers = []
+    data = pickle.dumps(array[1], protocol=5, buffer_callback=buffers.append)
+    assert len(buffers) > 0
+    out = pickle.loads(data, buffers=buffers)
+    assert isinstance(out, ak.Record)
+    assert out.tolist() == {"x": 2, "y": [2.2, 3.3]}
+
+
+def test_not_packed():
+    array = ak.Array([list(range(100))] * 100)[5:6]
+    packed = pickle.dumps(array)
+
+    with ak.pickling(packed=False):
+        unpacked = pickle.dumps(array)
+        with ak.pickling(packed=True):
+            assert len(pickle.dumps(array)) == len(packed)
+        assert len(pickle.dumps(array)) == len(unpacked)
+
+    assert len(unpacked) > len(packed)
+    assert pickle.loads(unpacked).tolist() == array.tolist()
+    assert pickle.loads(packed).tolist() == array.tolist()
+
+    records = ak.Array([{"x": 1, "y": [1.1]}, {"x": 2, "y": [2.2, 3.3]}])
+    with ak.pickling(packed=False):
+        record = pickle.loads(pickle.dumps(records[1]))
+    assert record.tolist() == {"x": 2, "y": [2.2, 3.3]}
@@ -0,0 +1,84 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+from __future__ import absolute_import
+
+import json
+import subprocess
+import sys
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+
+def modules_after(code):
+    return set(
+        json.loads(
+            subprocess.check_output(
+                [
+                    sys.executable,
+                    "-c",
+                    code + "; import sys, json; print(json.dumps(list(sys.modules)))",
+                ]
+            ).decode()
+        )
+    )
+
+
+def test_import_is_lazy():
+    modules = modules_after("import awkward")
+    for name in (
+        "pkg_resources",
+        "distutils.version",
+        "multiprocessing.pool",
+        "numba",
+        "numexpr",
+        "autograd",
+        "jax",
+    ):
+        assert name not in modules
+
+    # before Python 3.7, there's no module-level __getattr__ to defer them
+    if sys.version_info >= (3, 7):
+        for name in (
+            "awkward._v2",
+            "awkward._cpu_kernels",
+            "awkward._kernel_signatures",
+            "awkward._libawkward",
+        ):
+            assert name not in modules
+
+
+def test_lazy_submodules():
+    modules = modules_after(
+        "import awkward; awkward._v2.contents.NumpyArray; awkward._cpu_kernels.kernel"
+    )
+    assert "awkward._v2" in modules
+    assert "awkward._kernel_signatures" in modules
+    assert "_v2" not in dir(ak)
+    with pytest.raises(AttributeError):
+        ak.no_such_attribute
+
+
+def test_nplike_kernels():
+    # a kernel lookup through the nplike doesn't depend on anything having
+    # imported the kernel library first
+    out = subprocess.check_output(
+        [
+            sys.executable,
+            "-c",
+            "import awkward, numpy; "
+            "nplike = awkward.nplike.Numpy.instance(); "
+            "print(type(nplike['awkward_NumpyArray_fill', numpy.int64, numpy.int64]).__name__)",
+        ]
+    ).decode()
+    assert out.strip() == "NumpyKernel"
+
+
+def test_version_tuple():
+    assert ak._util.version_tuple("0.50") == (0, 50)
+    assert ak._util.version_tuple("2.7.1") == (2, 7, 1)
+    assert ak._util.version_tuple("1.21.0rc1") == (1, 21, 0)
+    assert ak._util.version_tuple("0.2.8.dev0") == (0, 2, 8)
+    assert ak._util.version_tuple("0.53.1") >= (0, 50)
+    assert ak._util.version_tuple("0.49.1") < (0, 50)
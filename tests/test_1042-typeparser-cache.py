@@ -0,0 +1,78 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+from __future__ import absolute_import
+
+import json
+import subprocess
+import sys
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+import awkward._typeparser.parser
+
+
+def test_parser_is_not_imported():
+    modules = json.loads(
+        subprocess.check_output(
+            [
+                sys.executable,
+                "-c",
+                "import awkward, sys, json; print(json.dumps(list(sys.modules)))",
+            ]
+        ).decode()
+    )
+    assert "awkward._typeparser.generated_parser" not in modules
+
+
+def test_repeated():
+    text = '[var * float64[parameters={"wonky": "boop"}], parameters={"foo": "bar"}]'
+    one = ak.types.from_datashape(text)
+    assert text in awkward._typeparser.parser._parse_cache
+    two = ak.types.from_datashape(text)
+    assert str(one) == str(two) == text
+    assert one is not two
+
+    # cached types are not shared: modifying one does not modify the next
+    one.setparameter("foo", "baz")
+    assert str(ak.types.from_datashape(text)) == text
+
+    # the same parse tree serves both levels
+    array = ak.Array([[1, 2, 3], [], [4, 5]])
+    text = str(array.type)
+    assert str(ak.types.from_datashape(text, high_level=True)) == text
+    assert str(ak.types.from_datashape(text, high_level=True)) == text
+
+
+def test_bounded(monkeypatch):
+    parser = awkward._typeparser.parser
+    monkeypatch.setattr(parser, "_parse_cache_size", 3)
+    parser._parse_cache.clear()
+
+    for i in range(1, 6):
+        assert str(ak.types.from_datashape("{0} * int64".format(i))) == (
+            "{0} * int64".format(i)
+        )
+    assert list(parser._parse_cache) == ["3 * int64", "4 * int64", "5 * int64"]
+
+    # a hit makes a type string the most recently used
+    ak.types.from_datashape("3 * int64")
+    ak.types.from_datashape("6 * int64")
+    assert list(parser._parse_cache) == ["5 * int64", "3 * int64", "6 * int64"]
+
+    with pytest.raises(Exception, match="Unexpected token"):
+        ak.types.from_datashape("6 * ")
+    assert len(parser._parse_cache) == 3
+
+
+def test_cache_not_modified():
+    parser = awkward._typeparser.parser
+    text = '3 * categorical[type=bool[parameters={"x": [1, 2]}]]'
+    one = ak.types.from_datashape(text, high_level=True)
+    tree = str(parser._parse_cache[text])
+    assert "__categorical__" not in tree
+
+    two = ak.types.from_datashape(text, high_level=True)
+    assert str(parser._parse_cache[text]) == tree
+    assert str(one) == str(two) == text
@@ -0,0 +1,118 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+from __future__ import absolute_import
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+import awkward.forth
+
+jagged = """
+input data
+output offsets int64
+output content float64
+
+0 offsets <- stack
+
+begin
+  data i-> stack
+  dup offsets +<- stack
+  data #d-> content
+again
+"""
+
+
+def chunk(lists):
+    data = []
+    for sublist in lists:
+        data.append(np.array([len(sublist)], np.int32).tobytes())
+        data.append(np.array(sublist, np.float64).tobytes())
+    return {"data": np.frombuffer(b"".join(data), np.uint8)}
+
+
+chunks = [
+    [[1.1, 2.2, 3.3], [], [4.4, 5.5]],
+    [[6.6]],
+    [],
+    [[7.7, 8.8], [9.9], [], [10.0]],
+] * 25
+
+
+def expected():
+    return [sublist for lists in chunks for sublist in lists]
+
+
+@pytest.mark.parametrize("num_threads", [1, 3, 0])
+def test_concatenated(num_threads):
+    vm = awkward.forth.ForthMachine64(jagged)
+    outputs = vm.run_parallel(
+        [chunk(x) for x in chunks],
+        num_threads=num_threads,
+        offsets=["offsets"],
+        raise_read_beyond=False,
+    )
+    assert set(outputs) == set(["offsets", "content"])
+    array = ak.Array(
+        ak.layout.ListOffsetArray64(
+            ak.layout.Index64(np.asarray(outputs["offsets"])), outputs["content"]
+        )
+    )
+    assert array.tolist() == expected()
+
+    # the machine that was given the program is not run
+    assert not vm.is_ready
+
+
+def test_not_offsets():
+    vm = awkward.forth.ForthMachine32(jagged)
+    outputs = vm.run_parallel([chunk(x) for x in chunks[:4]], raise_read_beyond=False)
+    offsets = [0, 3, 3, 5, 0, 1, 0, 0, 2, 3, 3, 4]
+    assert np.asarray(outputs["offsets"]).tolist() == offsets
+
+
+def test_partitioned():
+    vm = awkward.forth.ForthMachine32(jagged)
+    partitions = vm.run_parallel(
+        [chunk(x) for x in chunks[:4]],
+        num_threads=2,
+        partitioned=True,
+        raise_read_beyond=False,
+    )
+    assert len(partitions) == 4
+    for lists, outputs in zip(chunks, partitions):
+        assert np.asarray(outputs["content"]).tolist() == [
+            x for sublist in lists for x in sublist
+        ]
+        assert np.asarray(outputs["offsets"]).tolist() == [0] + list(
+            np.cumsum([len(x) for x in lists])
+        )
+
+
+def test_same_as_run():
+    vm = awkward.forth.ForthMachine64(jagged)
+    inputs = chunk(chunks[3])
+    vm.run(inputs, raise_read_beyond=False)
+    (outputs,) = vm.run_parallel([inputs], partitioned=True, raise_read_beyond=False)
+    for name in vm.outputs:
+        assert (
+            np.asarray(vm.outputs[name]).tolist() == np.asarray(outputs[name]).tolist()
+        )
+
+
+def test_errors():
+    vm = awkward.forth.ForthMachine32(jagged)
+    with pytest.raises(ValueError, match="read beyond"):
+        vm.run_parallel([chunk(x) for x in chunks[:4]])
+
+    with pytest.raises(ValueError, match="not provided"):
+        vm.run_parallel([chunk(chunks[0]), {}], raise_read_beyond=False)
+
+    with pytest.raises(ValueError):
+        vm.run_parallel(
+            [chunk(chunks[0])], offsets=["nonexistent"], raise_read_beyond=False
+        )
+
+    outputs = vm.run_parallel([], offsets=["offsets"])
+    assert np.asarray(outputs["offsets"]).tolist() == []
+    assert vm.run_parallel([], partitioned=True) == []
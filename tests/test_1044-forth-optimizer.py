@@ -0,0 +1,176 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+from __future__ import absolute_import
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+import awkward.forth
+
+programs = [
+    "1 2 + 3 * 5 +",
+    "7 negate abs 1+ 1- 0= invert",
+    "-7 2 / -7 2 mod 7 -2 / 7 -2 mod 3 5 min 3 5 max",
+    "1 2 = 1 2 <> 1 2 > 1 2 >= 1 2 < 1 2 <= 12 10 and 12 10 or 12 10 xor",
+    "5 0 /",
+    "5 0 mod",
+    "2147483647 1 +",
+    "-2147483647 1 - 1 -",
+    "65536 65536 *",
+    "10 3 + 2 - 4 * 3 = 10 3 <> 10 3 > 10 3 >= 10 3 < 10 3 <=",
+    "100 6 and 1 3 lshift 1000 2 rshift",
+    "dup 3 > if 2 * then",
+    "3 dup 3 > if 2 * 1 + then dup 0 > if 1 - else 1 + then",
+    "variable x 3 x ! x @ 1 + 2 * x +! x @",
+    ": f 2 + 3 * ; 4 f 1 f 5 5 + f",
+    "0 begin 1 + dup 10 = until",
+    "0 begin dup 10 < while 2 + repeat",
+    "3 0 do i 1 + 2 * loop",
+    "10 0 do i 3 +loop",
+]
+
+
+@pytest.mark.parametrize("source", programs)
+@pytest.mark.parametrize(
+    "machine", [awkward.forth.ForthMachine32, awkward.forth.ForthMachine64]
+)
+def test_same_as_unoptimized(source, machine):
+    plain = machine(source)
+    optimized = machine(source, optimize=True)
+    assert not plain.optimize
+    assert optimized.optimize
+
+    plain_error = optimized_error = None
+    try:
+        plain.run()
+    except ValueError as err:
+        plain_error = str(err).split("\n")[0]
+    try:
+        optimized.run()
+    except ValueError as err:
+        optimized_error = str(err).split("\n")[0]
+
+    assert plain_error == optimized_error
+    assert plain.stack == optimized.stack
+    assert plain.variables == optimized.variables
+    assert optimized.count_instructions <= plain.count_instructions
+
+    # the optimized bytecode decompiles to equivalent source
+    again = machine(optimized.decompiled)
+    if optimized_error is None:
+        again.run()
+        assert again.stack == optimized.stack
+
+
+def test_constant_folding():
+    vm = awkward.forth.ForthMachine32("1 2 + 3 * 5 +", optimize=True)
+    assert ak.to_list(vm.bytecodes) == [[0, 14]]
+    assert vm.decompiled == "14\n"
+
+    # overflow and division by zero are left to the runtime
+    vm = awkward.forth.ForthMachine32("2147483647 1 + 5 0 /", optimize=True)
+    assert vm.decompiled == "2147483647\n1 +\n5\n0\n/\n"
+
+
+def test_superinstructions():
+    vm = awkward.forth.ForthMachine32(
+        """
+input data
+output offsets int32
+data i-> stack
+dup 0 > if
+  3 -
+then
+dup offsets +<- stack
+dup offsets <- stack
+""",
+        optimize=True,
+    )
+    assert (
+        vm.decompiled
+        == """input data
+output offsets int32
+
+data i-> stack
+dup
+0 >
+if
+  3 -
+then
+dup offsets +<- stack
+dup offsets <- stack
+"""
+    )
+    assert len(ak.to_list(vm.bytecodes)[0]) == 11
+
+    vm.run({"data": np.array([5], np.int32)})
+    assert vm.stack == [2]
+    assert np.asarray(vm["offsets"]).tolist() == [2, 2]
+
+
+jagged = """
+input counts
+input values
+output offsets int64
+output content float32
+0 offsets <- stack
+counts len 4 / 0 do
+  counts i-> stack dup offsets +<- stack
+  0 do values f-> content loop
+loop
+"""
+
+
+def test_counted_read():
+    counts = np.array([3, 0, 2, 1, 4], np.int32)
+    values = np.arange(10, dtype=np.float32)
+
+    plain = awkward.forth.ForthMachine64(jagged)
+    optimized = awkward.forth.ForthMachine64(jagged, optimize=True)
+    assert "do\n    values f-> content\n  loop" in optimized.decompiled
+
+    for vm in (plain, optimized):
+        vm.run({"counts": counts, "values": values})
+        assert np.asarray(vm["offsets"]).tolist() == [0, 3, 3, 5, 6, 10]
+        assert np.asarray(vm["content"]).tolist() == list(range(10))
+        assert vm.count_reads == 15
+        assert vm.count_writes == 16
+    assert optimized.count_instructions < plain.count_instructions
+
+    # running out of input part-way through a loop stops at the same place
+    for vm in (plain, optimized):
+        with pytest.raises(ValueError, match="read beyond"):
+            vm.run({"counts": counts, "values": values[:8]})
+        assert vm.input_position("values") == 8 * 4
+        assert np.asarray(vm["content"]).tolist() == list(range(8))
+        assert np.asarray(vm["offsets"]).tolist() == [0, 3, 3, 5, 6, 10]
+
+
+def test_not_fused():
+    # loops that use 'i', step, or read repeatedly or variable-width items
+    # are left as they are
+    for source in [
+        "input x output y int32 5 0 do x i-> y i drop loop",
+        "input x output y int32 5 0 do x i-> y 1 +loop",
+        "input x output y int32 5 0 do 2 x #i-> y loop",
+        "input x output y int32 5 0 do x varint-> y loop",
+        "input x 5 0 do x i-> stack loop",
+    ]:
+        plain = awkward.forth.ForthMachine32(source)
+        optimized = awkward.forth.ForthMachine32(source, optimize=True)
+        assert plain.decompiled == optimized.decompiled
+
+
+def test_run_parallel():
+    vm = awkward.forth.ForthMachine64(jagged, optimize=True)
+    input_sets = [
+        {
+            "counts": np.array([2, 1], np.int32),
+            "values": np.array([1, 2, 3], np.float32),
+        },
+        {"counts": np.array([3], np.int32), "values": np.array([4, 5, 6], np.float32)},
+    ]
+    outputs = vm.run_parallel(input_sets, offsets=["offsets"])
+    assert np.asarray(outputs["offsets"]).tolist() == [0, 2, 3, 6]
+    assert np.asarray(outputs["content"]).tolist() == [1, 2, 3, 4, 5, 6]